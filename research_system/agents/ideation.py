@@ -242,7 +242,8 @@ Generate 1-2 high-quality strategy ideas matching your persona's perspective.
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
-                max_tokens=4000
+                max_tokens=4000,
+                caller="agents.ideation"
             )
             return response.content
         except Exception as e:
@@ -19,6 +19,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from string import Template
 
+from research_system.core.v4.config import Config, load_config
+from research_system.llm.concurrency import fan_out
 from scripts.utils.logging_config import get_logger
 
 logger = get_logger("persona-runner")
@@ -92,15 +94,32 @@ class PersonaRunner:
     # Personas that need sequential execution
     SEQUENTIAL_PERSONAS = ["contrarian", "report-synthesizer"]
 
-    def __init__(self, llm_client=None):
+    def __init__(
+        self,
+        llm_client=None,
+        max_workers: Optional[int] = None,
+        persona_timeout: Optional[float] = None,
+        config: Optional[Config] = None
+    ):
         """
         Initialize the persona runner.
 
         Args:
             llm_client: LLM client for generating responses
                         (None = offline mode, returns prompts only)
+            max_workers: Parallel personas run at once
+                         (default: api.max_concurrent_personas)
+            persona_timeout: Seconds before a parallel persona is abandoned
+                             (default: api.persona_timeout_seconds)
+            config: Settings to read the defaults from
+                    (None = load research-kit.yaml)
         """
+        api_config = (config or load_config()).api
         self.llm_client = llm_client
+        self.max_workers = max_workers or api_config.max_concurrent_personas
+        self.persona_timeout = persona_timeout
+        if self.persona_timeout is None:
+            self.persona_timeout = api_config.persona_timeout_seconds
         self._load_personas()
         self._load_prompts()
 
@@ -178,7 +197,8 @@ The validation results are provided in the user message. Analyze them directly.
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
-                max_tokens=4000
+                max_tokens=4000,
+                caller="agents.runner"
             )
             return response.content  # Extract string content from LLMResponse
         except Exception as e:
@@ -282,8 +302,15 @@ The validation results are provided in the user message. Analyze them directly.
 
         # Phase 1: Parallel personas
         logger.info("Phase 1: Running parallel personas")
-        for persona in self.PARALLEL_PERSONAS:
-            response = self.run_persona(persona, base_context.copy())
+        outcomes = fan_out(
+            lambda persona: self.run_persona(persona, base_context.copy()),
+            self.PARALLEL_PERSONAS,
+            max_workers=self.max_workers,
+            timeout=self.persona_timeout
+        )
+        for persona, response in zip(self.PARALLEL_PERSONAS, outcomes):
+            if isinstance(response, BaseException):
+                response = PersonaResponse(persona=persona, error=str(response))
             result.responses[persona] = response
 
         # Phase 2: Contrarian (sees all parallel outputs)
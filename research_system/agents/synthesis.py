@@ -462,7 +462,8 @@ CRITICAL INSTRUCTIONS:
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
-                max_tokens=8000
+                max_tokens=8000,
+                caller="agents.synthesis"
             )
             return response.content
         except Exception as e:
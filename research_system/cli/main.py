@@ -266,8 +266,19 @@ def _add_catalog_parser(subparsers):
     stats_parser.set_defaults(func=cmd_catalog_stats)
 
     # catalog search
-    search_parser = catalog_sub.add_parser("search", help="Search entries")
+    search_parser = catalog_sub.add_parser(
+        "search", help="Search entries",
+        description="Full-text search. Words must all match; use word* for a prefix "
+                    "and field:word to search one field (name, summary, hypothesis, tags).")
     search_parser.add_argument("query", help="Search query")
+    search_parser.add_argument("--type", choices=["indicator", "strategy", "idea", "learning", "tool", "data"],
+                               help="Filter by type")
+    search_parser.add_argument("--status", choices=["UNTESTED", "IN_PROGRESS", "VALIDATED", "CONDITIONAL", "INVALIDATED", "BLOCKED"],
+                               help="Filter by status")
+    search_parser.add_argument("--field", dest="fields", action="append",
+                               choices=["name", "summary", "hypothesis", "tags"],
+                               help="Field to search (repeatable; default: all)")
+    search_parser.add_argument("--limit", type=int, default=None, help="Maximum results")
     search_parser.set_defaults(func=cmd_catalog_search)
 
     parser.set_defaults(func=lambda args: parser.print_help())
@@ -831,7 +842,14 @@ Strategies meeting minimum thresholds are created in strategies/pending/.
     parser.add_argument(
         "--force", "-f",
         action="store_true",
-        help="Skip quality checks and create strategies anyway (useful for testing without API key)"
+        help="Skip the duplicate check and quality checks and create strategies anyway (useful for testing without API key)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Read and extract up to N files at once; IDs and saves stay in file order (default: 1)"
     )
     parser.set_defaults(func=cmd_ingest)
 
@@ -1047,6 +1065,7 @@ Examples:
   research run --all                  # Batch process all pending
   research run STRAT-001 --local      # Use local Docker instead of cloud
   research run --all --dry-run        # Preview without running
+  research run --all --jobs 4         # Process 4 pending strategies at once
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -1102,6 +1121,25 @@ Examples:
         action="store_true",
         help="Create a new QC cloud project per backtest (legacy mode). Default reuses a single project to avoid 100/day limit."
     )
+    parser.add_argument(
+        "--max-concurrent",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run up to N walk-forward windows at once, each in its own project slot (default: backtest.max_concurrent from config)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always regenerate code and run backtests, ignoring cached code and results"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --all, process up to N strategies at once (default: 1)"
+    )
     parser.add_argument(
         "--workspace", "-w",
         dest="v4_workspace",
@@ -1165,6 +1203,13 @@ Examples:
   research walkforward STRAT-001           # Run walk-forward validation
   research walkforward STRAT-001 --json    # Output as JSON
   research walkforward STRAT-001 --params  # Show parameter evolution
+  research walkforward STRAT-001 --method bayesian  # Model-based search
+  research walkforward STRAT-001 --method prescreen  # Local sweep, then backtest the best
+
+The prescreen method simulates template strategies (momentum, mean
+reversion, regime adaptive) on daily prices in data/ohlcv/<SYMBOL>.csv
+under the workspace (date and close columns), and falls back to random
+search for other strategies or missing data.
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
@@ -1202,6 +1247,35 @@ Examples:
         default=50,
         help="Max parameter evaluations per period (default: 50)"
     )
+    parser.add_argument(
+        "--method",
+        choices=["grid", "random", "bayesian", "successive_halving", "prescreen"],
+        default="random",
+        help="Parameter search method (default: random)"
+    )
+    parser.add_argument(
+        "--no-incremental",
+        action="store_true",
+        help="Re-optimize every period from scratch instead of warm-starting from the previous period"
+    )
+    parser.add_argument(
+        "--reduced-budget",
+        action="store_true",
+        help="Heuristic: give warm-started periods a budget proportional to their share of new data "
+             "(far fewer backtests, but a narrower search that can change the chosen parameters)"
+    )
+    parser.add_argument(
+        "--regenerate-code",
+        action="store_true",
+        help="Regenerate code for every parameter combination instead of passing values via config.json"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parameter evaluations to backtest concurrently, each in its own project (default: 1)"
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -1212,6 +1286,11 @@ Examples:
         action="store_true",
         help="Show parameter evolution across periods"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always regenerate code and run backtests, ignoring cached code and results"
+    )
     parser.add_argument(
         "--workspace", "-w",
         dest="v4_workspace",
@@ -1232,9 +1311,18 @@ Displays a summary of the workspace including:
   - Ideas count
   - Inbox files waiting to be processed
   - Recent activity
+
+Reports:
+  research status llm    LLM calls by subsystem: p50/p95 latency, tokens, cost
         """,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    parser.add_argument(
+        "report",
+        nargs="?",
+        choices=["llm"],
+        help="Show a detailed report instead of the dashboard"
+    )
     parser.add_argument(
         "--workspace", "-w",
         dest="v4_workspace",
@@ -1268,6 +1356,25 @@ Statuses:
         metavar="TAGS",
         help="Filter by tags (comma-separated)"
     )
+    parser.add_argument(
+        "--sort",
+        choices=["created", "id", "name", "status"],
+        default="created",
+        help="Sort field, descending (default: created)"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Show at most N strategies"
+    )
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Skip the first N strategies"
+    )
     parser.add_argument(
         "--format", "-f",
         choices=["table", "json"],
@@ -1427,6 +1534,8 @@ def cmd_ingest(args):
         llm_client = get_llm_client()
     except Exception:
         llm_client = None
+    _attach_llm_cache(llm_client, workspace)
+    _attach_llm_telemetry(llm_client, workspace)
 
     # Initialize processor
     processor = V4IngestProcessor(workspace, config, llm_client)
@@ -1434,6 +1543,14 @@ def cmd_ingest(args):
     # Check options
     dry_run = getattr(args, 'dry_run', False)
     force = getattr(args, 'force', False)
+    jobs = max(1, getattr(args, 'jobs', 1) or 1)
+
+    def report_progress(i, total, result):
+        if result.duplicate_of:
+            outcome = "DUPLICATE"
+        else:
+            outcome = result.decision.value.upper() if result.decision else "ERROR"
+        print(f"[{i}/{total}] {result.filename} -> {outcome}", flush=True)
 
     if dry_run:
         print("=== DRY RUN MODE ===")
@@ -1441,7 +1558,7 @@ def cmd_ingest(args):
 
     if force:
         print("=== FORCE MODE ===")
-        print("Quality checks bypassed - all files will create strategies.\n")
+        print("Duplicate and quality checks bypassed - all files will create strategies.\n")
 
     # Process specific files or entire inbox
     if args.files:
@@ -1449,6 +1566,7 @@ def cmd_ingest(args):
         results = []
         total_files = len(args.files)
         print(f"Processing {total_files} file(s)...\n")
+        file_paths = []
         for i, file_arg in enumerate(args.files, 1):
             file_path = Path(file_arg)
             if not file_path.exists():
@@ -1457,9 +1575,17 @@ def cmd_ingest(args):
             if not file_path.exists():
                 print(f"[{i}/{total_files}] Error: File not found: {file_arg}")
                 continue
+            if jobs > 1:
+                file_paths.append(file_path)
+                continue
             print(f"[{i}/{total_files}] Processing: {file_path.name}...", flush=True)
             result = processor.process_file(file_path, dry_run=dry_run, force=force)
             results.append(result)
+        if file_paths:
+            print(f"Extracting up to {jobs} file(s) at a time...", flush=True)
+            results = processor.process_files(
+                file_paths, dry_run=dry_run, force=force, jobs=jobs, progress=report_progress
+            ).results
     else:
         # Process entire inbox - first count files
         inbox_files = [
@@ -1477,10 +1603,16 @@ def cmd_ingest(args):
 
         # Process with progress output
         results = []
-        for i, file_path in enumerate(sorted(inbox_files), 1):
-            print(f"[{i}/{total_files}] Processing: {file_path.name}...", flush=True)
-            result = processor.process_file(file_path, dry_run=dry_run, force=force)
-            results.append(result)
+        if jobs > 1:
+            print(f"Extracting up to {jobs} file(s) at a time...", flush=True)
+            results = processor.process_files(
+                sorted(inbox_files), dry_run=dry_run, force=force, jobs=jobs, progress=report_progress
+            ).results
+        else:
+            for i, file_path in enumerate(sorted(inbox_files), 1):
+                print(f"[{i}/{total_files}] Processing: {file_path.name}...", flush=True)
+                result = processor.process_file(file_path, dry_run=dry_run, force=force)
+                results.append(result)
 
         print()  # Blank line after progress
 
@@ -1488,6 +1620,11 @@ def cmd_ingest(args):
     for result in results:
         print(f"Processing: {result.filename}")
 
+        if result.duplicate_of:
+            print(f"  Skipped: {result.error}")
+            print()
+            continue
+
         if result.error and not result.decision:
             print(f"  Error: {result.error}")
             print()
@@ -1530,7 +1667,8 @@ def cmd_ingest(args):
         queued = sum(1 for r in results if r.decision == IngestionDecision.QUEUE)
         archived = sum(1 for r in results if r.decision == IngestionDecision.ARCHIVE)
         rejected = sum(1 for r in results if r.decision == IngestionDecision.REJECT)
-        errors = sum(1 for r in results if r.error and not r.decision)
+        duplicates = sum(1 for r in results if r.duplicate_of)
+        errors = sum(1 for r in results if r.error and not r.decision and not r.duplicate_of)
         processed = accepted + queued + archived + rejected
 
         print("=" * 50)
@@ -1542,9 +1680,12 @@ def cmd_ingest(args):
         print(f"  Queued:     {queued}")
         print(f"  Archived:   {archived}")
         print(f"  Rejected:   {rejected}")
+        if duplicates > 0:
+            print(f"  Duplicates: {duplicates} (already ingested, no LLM call)")
         if errors > 0:
             print(f"  Errors:     {errors}")
 
+    _print_llm_cache_stats(llm_client)
     return 0
 
 
@@ -2191,9 +2332,12 @@ def _cmd_ideate_llm(workspace, max_ideas, dry_run):
         print(f"Warning: Could not initialize LLM client: {e}")
         print("Falling back to template-based ideation. Use --quick explicitly next time.")
         return _cmd_ideate_quick(workspace, max_ideas, dry_run)
+    _attach_llm_cache(llm_client, workspace)
+    _attach_llm_telemetry(llm_client, workspace)
 
     runner = SynthesisRunner(workspace, llm_client)
     result = runner.ideate(max_ideas=max_ideas)
+    _print_llm_cache_stats(llm_client)
 
     if result.offline:
         print("\nNo LLM backend available.")
@@ -2263,9 +2407,12 @@ def cmd_synthesize(args):
         print(f"Error: Could not initialize LLM client: {e}")
         print("Synthesis requires an LLM backend. Set ANTHROPIC_API_KEY or install Claude CLI.")
         return 1
+    _attach_llm_cache(llm_client, workspace)
+    _attach_llm_telemetry(llm_client, workspace)
 
     runner = SynthesisRunner(workspace, llm_client)
     result = runner.synthesize()
+    _print_llm_cache_stats(llm_client)
 
     if result.offline:
         print("\nNo LLM backend available.")
@@ -2325,6 +2472,9 @@ def cmd_run(args):
     num_windows = getattr(args, 'windows', 1)
     no_reuse = getattr(args, 'no_reuse_project', False)
     reuse_project = not no_reuse
+    max_concurrent = getattr(args, 'max_concurrent', None)
+    use_cache = not getattr(args, 'no_cache', False)
+    jobs = max(1, getattr(args, 'jobs', 1) or 1)
 
     if not strategy_id and not run_all:
         print("Error: Strategy ID required or use --all")
@@ -2345,6 +2495,8 @@ def cmd_run(args):
             print("Using Anthropic API backend for code generation.")
     except Exception as e:
         print(f"Note: LLM client not available ({e}). Using templates only.")
+    _attach_llm_cache(llm_client, workspace)
+    _attach_llm_telemetry(llm_client, workspace)
 
     # Initialize runner
     runner = V4Runner(
@@ -2353,6 +2505,8 @@ def cmd_run(args):
         use_local=use_local,
         num_windows=num_windows,
         reuse_project=reuse_project,
+        max_concurrent=max_concurrent,
+        use_cache=use_cache,
     )
 
     print("\n" + "=" * 60)
@@ -2362,12 +2516,21 @@ def cmd_run(args):
     if not use_local:
         print(f"Project mode: {'reuse single project' if reuse_project else 'new project per backtest'}")
     print(f"Walk-forward windows: {num_windows}")
+    if runner.backtest_executor.max_concurrent > 1:
+        print(f"Concurrent windows: {runner.backtest_executor.max_concurrent}")
+    if run_all and jobs > 1:
+        print(f"Concurrent strategies: {jobs}")
     if dry_run:
         print("[DRY RUN] No backtests will be executed")
     print()
 
     if run_all:
-        results = runner.run_all(dry_run=dry_run, force_llm=force_llm, skip_verify=skip_verify, skip_codegen=skip_codegen)
+        results = runner.run_all(
+            dry_run=dry_run, force_llm=force_llm, skip_verify=skip_verify, skip_codegen=skip_codegen, jobs=jobs
+        )
+        _print_codegen_cache_stats(runner.codegen_cache)
+        _print_backtest_cache_stats(runner.result_cache)
+        _print_llm_cache_stats(llm_client)
         if not results:
             return 0
 
@@ -2376,6 +2539,9 @@ def cmd_run(args):
         return 1 if failed_count > 0 else 0
     else:
         result = runner.run(strategy_id, dry_run=dry_run, force_llm=force_llm, skip_verify=skip_verify, force=force, skip_codegen=skip_codegen)
+        _print_codegen_cache_stats(runner.codegen_cache)
+        _print_backtest_cache_stats(runner.result_cache)
+        _print_llm_cache_stats(llm_client)
 
         if not result.success:
             print(f"\nPipeline failed: {result.error}")
@@ -2385,6 +2551,65 @@ def cmd_run(args):
         return 0
 
 
+def _print_codegen_cache_stats(codegen_cache) -> None:
+    """Print code generation cache hit/miss counters if any lookups happened."""
+    if codegen_cache is None:
+        return
+    stats = codegen_cache.stats()
+    if stats["hits"] + stats["misses"] == 0:
+        return
+    print(f"\nCodegen cache: {stats['hits']} hit(s) ({stats['memory_hits']} memory, "
+          f"{stats['disk_hits']} disk), {stats['misses']} miss(es)")
+
+
+def _print_backtest_cache_stats(result_cache) -> None:
+    """Print backtest cache hit/miss counters if any lookups happened."""
+    if result_cache is None:
+        return
+    stats = result_cache.stats()
+    if stats["hits"] + stats["misses"] == 0:
+        return
+    print(f"\nBacktest cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+          f"({stats['hit_rate']*100:.0f}% hit rate)")
+
+
+def _attach_llm_cache(llm_client, workspace) -> None:
+    """Attach the workspace's LLM response cache if enabled in config."""
+    if llm_client is None or getattr(llm_client, "cache", None) is not None:
+        return
+    api_config = workspace.config.api
+    if not api_config.response_cache:
+        return
+    from research_system.llm.cache import ResponseCache
+    llm_client.cache = ResponseCache.for_workspace(
+        workspace.path,
+        ttl_days=api_config.response_cache_ttl_days,
+        max_entries=api_config.response_cache_max_entries,
+    )
+
+
+def _attach_llm_telemetry(llm_client, workspace) -> None:
+    """Attach the workspace's LLM call telemetry log if enabled in config."""
+    if llm_client is None or getattr(llm_client, "telemetry", None) is not None:
+        return
+    if not workspace.config.api.llm_telemetry:
+        return
+    from research_system.llm.telemetry import TelemetryLog
+    llm_client.telemetry = TelemetryLog.for_workspace(workspace.path)
+
+
+def _print_llm_cache_stats(llm_client) -> None:
+    """Print LLM response cache hit/miss counters if any lookups happened."""
+    cache = getattr(llm_client, "cache", None)
+    if cache is None:
+        return
+    stats = cache.stats()
+    if stats["hits"] + stats["misses"] == 0:
+        return
+    print(f"\nLLM cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+          f"({stats['hit_rate']*100:.0f}% hit rate)")
+
+
 def cmd_cleanup(args):
     """Clean up stuck QC backtests ."""
     from research_system.validation.backtest import BacktestExecutor
@@ -2444,6 +2669,9 @@ def cmd_cleanup(args):
 def cmd_walkforward(args):
     """Run true walk-forward optimization ."""
     from research_system.optimization import (
+        OptimizationMethod,
+        PriceCache,
+        VectorizedScreener,
         WalkForwardConfig,
         WalkForwardRunner,
         format_terminal_summary,
@@ -2451,6 +2679,8 @@ def cmd_walkforward(args):
         format_parameter_evolution,
     )
     from research_system.validation.backtest import BacktestExecutor
+    from research_system.validation.result_cache import BacktestResultCache
+    from research_system.codegen.cache import CodeGenCache
     from research_system.codegen.v4_generator import V4CodeGenerator
 
     workspace = get_workspace_from_args(args)
@@ -2491,6 +2721,11 @@ def cmd_walkforward(args):
         initial_train_years=args.train_years,
         test_years=args.test_years,
         max_evaluations=args.max_evals,
+        optimization_method=OptimizationMethod(getattr(args, 'method', 'random')),
+        incremental=not getattr(args, 'no_incremental', False),
+        reduced_budget=getattr(args, 'reduced_budget', False),
+        runtime_parameters=not getattr(args, 'regenerate_code', False),
+        max_workers=max(1, getattr(args, 'jobs', 1)),
     )
 
     # Get periods preview
@@ -2504,20 +2739,41 @@ def cmd_walkforward(args):
         print(f"Periods:  {len(periods)}")
         print(f"Config:   {config.start_year}-{config.end_year}, {config.initial_train_years}yr train, {config.test_years}yr test")
         print(f"Max evals: {config.max_evaluations} per period")
+        if config.max_workers > 1:
+            print(f"Workers:  {config.max_workers} concurrent evaluations")
         print()
 
     # Create executor and code generator
+    backtest_config = workspace.config.backtest
+    result_cache = None
+    if backtest_config.cache_enabled and not getattr(args, 'no_cache', False):
+        result_cache = BacktestResultCache.for_workspace(
+            workspace.path,
+            max_entries=backtest_config.cache_max_entries,
+            max_age_days=backtest_config.cache_max_age_days,
+        )
     backtest_executor = BacktestExecutor(
         workspace_path=workspace.path,
         use_local=False,
-        timeout=workspace.config.backtest.timeout,
+        timeout=backtest_config.timeout,
+        max_concurrent=config.max_workers,
+        result_cache=result_cache,
+        cloud_nodes=backtest_config.cloud_nodes,
     )
-    code_generator = V4CodeGenerator()
+    codegen_cache = None
+    if backtest_config.cache_enabled and not getattr(args, 'no_cache', False):
+        codegen_cache = CodeGenCache.for_workspace(workspace.path)
+    code_generator = V4CodeGenerator(cache=codegen_cache)
+
+    prescreener = None
+    if config.optimization_method == OptimizationMethod.PRESCREEN:
+        prescreener = VectorizedScreener(PriceCache.for_workspace(workspace.path))
 
     # Create runner
     runner = WalkForwardRunner(
         backtest_executor=backtest_executor,
         code_generator=code_generator,
+        prescreener=prescreener,
     )
 
     # Run walk-forward
@@ -2538,6 +2794,10 @@ def cmd_walkforward(args):
     else:
         print(format_terminal_summary(result))
 
+    if not args.json:
+        _print_codegen_cache_stats(codegen_cache)
+        _print_backtest_cache_stats(result_cache)
+
     return 0 if result.success else 1
 
 
@@ -2552,6 +2812,9 @@ def cmd_status(args):
         print("Run 'research init' to initialize a workspace.")
         return 1
 
+    if getattr(args, "report", None) == "llm":
+        return _cmd_status_llm(workspace)
+
     status = workspace.status()
 
     # Header
@@ -2636,6 +2899,52 @@ def cmd_status(args):
     return 0
 
 
+def _cmd_status_llm(workspace):
+    """Show LLM call telemetry aggregated by subsystem."""
+    from research_system.llm.telemetry import TelemetryLog, summarize
+
+    telemetry = TelemetryLog.for_workspace(workspace.path)
+    records = telemetry.read()
+
+    print()
+    print("=" * 60)
+    print("  LLM Call Telemetry")
+    print("=" * 60)
+
+    if not records:
+        print(f"\nNo LLM calls recorded in {telemetry.path}")
+        if not workspace.config.api.llm_telemetry:
+            print("Telemetry is disabled (api.llm_telemetry: false in research-kit.yaml).")
+        print()
+        return 0
+
+    print(f"\n{len(records)} call(s) from {records[0].timestamp[:10]} to {records[-1].timestamp[:10]}")
+    print(f"\n{'Subsystem':<12} {'Calls':>6} {'Hits':>5} {'p50 s':>7} {'p95 s':>7} "
+          f"{'In tok':>9} {'Out tok':>8} {'Cost $':>8}")
+    print("-" * 68)
+
+    summary = summarize(records)
+    for subsystem, stats in summary.items():
+        marker = "~" if stats["estimated"] else " "
+        print(f"{subsystem:<12} {stats['calls']:>6} {stats['cache_hits']:>5} "
+              f"{stats['p50_ms'] / 1000:>7.1f} {stats['p95_ms'] / 1000:>7.1f} "
+              f"{stats['input_tokens']:>8}{marker} {stats['output_tokens']:>8} "
+              f"{stats['cost_usd']:>8.2f}")
+
+    print("-" * 68)
+    total_cost = sum(stats["cost_usd"] for stats in summary.values())
+    print(f"{'Total':<12} {len(records):>6} {'':>5} {'':>7} {'':>7} {'':>9} {'':>8} {total_cost:>8.2f}")
+
+    failures = sum(stats["failures"] for stats in summary.values())
+    retries = sum(stats["retries"] for stats in summary.values())
+    if failures or retries:
+        print(f"\nFailed calls: {failures}, retries: {retries}")
+    if any(stats["estimated"] for stats in summary.values()):
+        print("\n~ token counts include estimates for backends that report no usage (CLI)")
+    print()
+    return 0
+
+
 def cmd_list(args):
     """List strategies ."""
     workspace = get_workspace_from_args(args)
@@ -2658,7 +2967,13 @@ def cmd_list(args):
         tag_list = [t.strip() for t in tags.split(',')]
 
     # Get strategies
-    strategies = workspace.list_strategies(status=status, tags=tag_list)
+    strategies = workspace.list_strategies(
+        status=status,
+        tags=tag_list,
+        sort=getattr(args, 'sort', None) or 'created',
+        limit=getattr(args, 'limit', None),
+        offset=getattr(args, 'offset', None) or 0,
+    )
 
     if not strategies:
         if status:
@@ -3200,7 +3515,13 @@ def cmd_catalog_search(args):
     ws = require_workspace(args.workspace)
     catalog = Catalog(ws.catalog_path)
 
-    results = catalog.search(args.query)
+    results = catalog.search(
+        args.query,
+        fields=getattr(args, "fields", None),
+        entry_type=getattr(args, "type", None),
+        status=getattr(args, "status", None),
+        limit=getattr(args, "limit", None),
+    )
 
     if not results:
         print("No matching entries")
@@ -17,6 +17,7 @@ Example:
     ...     code = gen.generate("STRAT-001")
 """
 
+from research_system.codegen.cache import CodeGenCache
 from research_system.codegen.engine import CodeGenerationError, TemplateEngine
 from research_system.codegen.filters import CUSTOM_FILTERS
 from research_system.codegen.generator import CodeGenerator
@@ -42,6 +43,7 @@ __all__ = [
     "CodeCorrectionResult",
     "V4CodeGenerator",
     "generate_code",
+    "CodeGenCache",
     # V4 codegen (backward-compat aliases)
     "V4CodeGenResult",
     "V4CodeCorrectionResult",
@@ -0,0 +1,283 @@
+"""Memoized code generation results.
+
+Generating code for a strategy is deterministic for templates and
+expensive for the LLM fallback, yet the optimizer and walk-forward runner
+regenerate the same strategy+parameters combination many times (repeated
+grid points, warm-started periods, re-runs of the same command).
+
+Entries are keyed on a canonical hash of the strategy dict (including
+injected parameters), the force_llm flag and a fingerprint of the V4
+template directory, so editing a template invalidates everything rendered
+from the old version. Two tiers:
+- an in-memory LRU for repeats within one process
+- one JSON file per key under the workspace's .state/codegen_cache/
+  directory for repeats across runs
+
+Only successful results are cached.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from research_system.codegen.templates.v4 import V4_TEMPLATE_DIR
+from research_system.core.fileio import write_atomic
+
+if TYPE_CHECKING:
+    from research_system.codegen.strategy_generator import CodeGenResult
+
+logger = logging.getLogger(__name__)
+
+# Cache directory, relative to the workspace root
+CACHE_DIR = Path(".state") / "codegen_cache"
+
+# Bump when generation or post-processing changes in a way templates don't show
+CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def template_fingerprint() -> str:
+    """Hash of every file in the V4 template directory."""
+    digest = hashlib.sha256()
+    for path in sorted(Path(V4_TEMPLATE_DIR).rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            digest.update(str(path.relative_to(V4_TEMPLATE_DIR)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class CodeGenCache:
+    """Two-tier (memory LRU + disk) cache of CodeGenResult.
+
+    Without a cache_dir only the in-memory tier is used.
+
+    Example:
+        cache = CodeGenCache.for_workspace(workspace.path)
+        generator = CodeGenerator(llm_client, cache=cache)
+        generator.generate(strategy)  # renders
+        generator.generate(strategy)  # memory hit
+    """
+
+    # Prune the disk tier once every this many stores
+    PRUNE_EVERY = 100
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_memory_entries: int = 256,
+        max_entries: int = 5000,
+        max_age_days: float = 30,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding disk entries (None: memory only)
+            max_memory_entries: Entries kept in the in-memory LRU
+            max_entries: Maximum number of entries kept on disk
+            max_age_days: Disk entries older than this are treated as misses
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max_memory_entries
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path, **kwargs) -> CodeGenCache:
+        """Create a cache in the standard location under a workspace."""
+        return cls(Path(workspace_path) / CACHE_DIR, **kwargs)
+
+    @staticmethod
+    def make_key(
+        strategy: dict[str, Any],
+        force_llm: bool = False,
+        runtime_parameters: list[str] | None = None,
+    ) -> str:
+        """Build the cache key for a generation request.
+
+        Args:
+            strategy: Strategy document, including any injected parameters
+            force_llm: Whether template matching was skipped
+            runtime_parameters: Parameters requested as config.json reads
+
+        Returns:
+            Hex SHA-256 digest identifying the request
+        """
+        canonical = json.dumps(
+            {
+                "strategy": strategy,
+                "force_llm": force_llm,
+                "runtime_parameters": sorted(runtime_parameters or []),
+                "templates": template_fingerprint(),
+                "version": CACHE_VERSION,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> CodeGenResult | None:
+        """Look up a cached result.
+
+        Returns:
+            A fresh CodeGenResult, or None on a miss.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return _result_from_dict(entry)
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return _result_from_dict(entry)
+
+    def put(self, key: str, result: CodeGenResult) -> bool:
+        """Store a result. Only successful results are cached.
+
+        Returns:
+            True if the result was stored.
+        """
+        if not result.success or not result.code:
+            return False
+
+        entry = result.to_dict()
+        with self._lock:
+            self._remember(key, entry)
+            self.stores += 1
+            prune = self.stores % self.PRUNE_EVERY == 1
+
+        if self.cache_dir is not None:
+            self._write_disk(key, entry)
+            if prune:
+                self.prune()
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "hits": hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "memory_entries": len(self._memory),
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def prune(self) -> int:
+        """Drop expired disk entries, then the oldest beyond max_entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        now = time.time()
+        entries.sort()
+        excess = len(entries) - self.max_entries
+        removed = 0
+        for i, (mtime, path) in enumerate(entries):
+            if i < excess or now - mtime > self.max_age_seconds:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+
+        if removed:
+            logger.debug(f"Evicted {removed} codegen cache entries")
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    def _remember(self, key: str, entry: dict[str, Any]) -> None:
+        """Insert into the memory tier (caller holds the lock)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def _entry_path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.json"
+
+    def _read_disk(self, key: str) -> dict[str, Any] | None:
+        path = self._entry_path(key)
+        if path is None:
+            return None
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("stored_at", 0) > self.max_age_seconds:
+            return None
+        result: dict[str, Any] | None = entry.get("result")
+        return result
+
+    def _write_disk(self, key: str, entry: dict[str, Any]) -> None:
+        path = self._entry_path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            write_atomic(path, json.dumps({"stored_at": time.time(), "result": entry}))
+        except OSError as e:
+            logger.debug(f"Could not write codegen cache entry: {e}")
+
+
+def _result_from_dict(entry: dict[str, Any]) -> CodeGenResult:
+    from research_system.codegen.strategy_generator import CodeGenResult
+
+    return CodeGenResult(
+        success=entry.get("success", True),
+        code=entry.get("code"),
+        template_used=entry.get("template_used"),
+        method=entry.get("method", "template"),
+        error=entry.get("error"),
+        warnings=list(entry.get("warnings", [])),
+        runtime_parameters=list(entry.get("runtime_parameters", [])),
+    )
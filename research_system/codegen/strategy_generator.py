@@ -21,6 +21,7 @@ from typing import Any
 
 import jinja2
 
+from research_system.codegen.cache import CodeGenCache
 from research_system.codegen.templates.v4 import (
     V4_TEMPLATE_DIR,
     get_template_for_v4_strategy,
@@ -41,6 +42,7 @@ class CodeGenResult:
     method: str = "template"  # "template" or "llm"
     error: str | None = None
     warnings: list[str] = field(default_factory=list)
+    runtime_parameters: list[str] = field(default_factory=list)  # Read from config.json
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -51,6 +53,7 @@ class CodeGenResult:
             "method": self.method,
             "error": self.error,
             "warnings": self.warnings,
+            "runtime_parameters": self.runtime_parameters,
         }
 
 
@@ -73,6 +76,56 @@ class CodeCorrectionResult:
         }
 
 
+class _TrackedParameters(dict):
+    """Strategy parameters that record which keys a template reads directly.
+
+    Direct reads (e.g. `{% if strategy.parameters.threshold %}`) can change
+    the structure of the generated code, so those parameters can't be
+    switched to runtime values read from config.json.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.accessed: set[str] = set()
+
+    def __getitem__(self, key):
+        self.accessed.add(key)
+        return super().__getitem__(key)
+
+
+class _ParameterRenderer:
+    """The templates' param(name, default) function.
+
+    Renders the parameter's value (or default, like `| default(x, true)`),
+    or a `self._param(name, value, cast)` call for numeric runtime
+    parameters. cast is the parameter's declared tunable type, so a FLOAT
+    parameter whose current value happens to be integral still reads
+    swept values like 1.5 as floats.
+    """
+
+    def __init__(
+        self,
+        parameters: dict[str, Any],
+        runtime_parameters: list[str],
+        types: dict[str, str] | None = None,
+    ):
+        self.parameters = parameters
+        self.runtime_parameters = set(runtime_parameters)
+        self.types = types or {}
+        self.rendered: set[str] = set()
+
+    def __call__(self, name: str, default: Any) -> Any:
+        value = dict.get(self.parameters, name) or default
+        is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if name in self.runtime_parameters and is_number:
+            self.rendered.add(name)
+            declared = self.types.get(name)
+            if declared == "float" or (declared != "int" and isinstance(value, float)):
+                return f'self._param("{name}", {float(value)!r}, float)'
+            return f'self._param("{name}", {int(value)!r}, int)'
+        return value
+
+
 class CodeGenerator:
     """Generate QuantConnect Python code for V4 strategies.
 
@@ -82,15 +135,21 @@ class CodeGenerator:
     3. If no, fall back to LLM-based generation
 
     Post-processes all generated code to fix common QC API issues.
+
+    With a cache, successful results are memoized on the strategy
+    contents, so regenerating the same strategy+parameters (optimizer
+    repeats, walk-forward periods, re-runs) skips rendering and LLM calls.
     """
 
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, cache: CodeGenCache | None = None):
         """Initialize the code generator.
 
         Args:
             llm_client: Optional LLM client for fallback generation
+            cache: Optional CodeGenCache for memoizing generated code
         """
         self.llm_client = llm_client
+        self.cache = cache
         self._jinja_env = self._setup_jinja_env()
 
     def _setup_jinja_env(self) -> jinja2.Environment:
@@ -106,22 +165,48 @@ class CodeGenerator:
         self,
         strategy: dict[str, Any],
         force_llm: bool = False,
+        runtime_parameters: list[str] | None = None,
     ) -> CodeGenResult:
         """Generate QuantConnect code for a strategy.
 
         Args:
             strategy: Strategy document dictionary
             force_llm: If True, skip template matching and use LLM
+            runtime_parameters: Parameters the algorithm should read from
+                LEAN's config.json instead of having their values inlined.
+                Only template code supports this, and only for numeric
+                parameters that don't change the code's structure; the
+                result's runtime_parameters lists the ones honored.
 
         Returns:
             CodeGenResult with generated code or error
         """
+        if self.cache is None:
+            return self._generate_uncached(strategy, force_llm, runtime_parameters)
+
+        key = self.cache.make_key(strategy, force_llm, runtime_parameters)
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.debug(f"Code generation cache hit for {strategy.get('id', 'unknown')}")
+            return cached
+
+        result = self._generate_uncached(strategy, force_llm, runtime_parameters)
+        self.cache.put(key, result)
+        return result
+
+    def _generate_uncached(
+        self,
+        strategy: dict[str, Any],
+        force_llm: bool,
+        runtime_parameters: list[str] | None = None,
+    ) -> CodeGenResult:
+        """Generate code without consulting the cache."""
         strategy_id = strategy.get("id", "unknown")
         logger.info(f"Generating code for {strategy_id}")
 
         # Try template-based generation first (unless forced to LLM)
         if not force_llm and self._matches_template(strategy):
-            result = self._generate_from_template(strategy)
+            result = self._generate_from_template(strategy, runtime_parameters)
             if result.success:
                 # Post-process to fix common issues
                 result.code = self._fix_qc_api_issues(result.code)
@@ -175,11 +260,16 @@ class CodeGenerator:
         template = get_template_for_v4_strategy(strategy_type, signal_type)
         return template != "base.py.j2"
 
-    def _generate_from_template(self, strategy: dict[str, Any]) -> CodeGenResult:
+    def _generate_from_template(
+        self,
+        strategy: dict[str, Any],
+        runtime_parameters: list[str] | None = None,
+    ) -> CodeGenResult:
         """Generate code using Jinja2 template.
 
         Args:
             strategy: Strategy document
+            runtime_parameters: Parameters to read from config.json at runtime
 
         Returns:
             CodeGenResult with generated code
@@ -199,16 +289,21 @@ class CodeGenerator:
             template = self._jinja_env.get_template(template_name)
 
             # Prepare template context
-            context = self._prepare_template_context(strategy)
+            context = self._prepare_template_context(strategy, runtime_parameters)
 
             # Render template
             code = template.render(**context)
 
+            # Parameters the template also read directly are baked into the code
+            parameters = context["strategy"]["parameters"]
+            runtime = sorted(context["param"].rendered - parameters.accessed)
+
             return CodeGenResult(
                 success=True,
                 code=code,
                 template_used=template_name,
                 method="template",
+                runtime_parameters=runtime,
             )
 
         except jinja2.TemplateNotFound as e:
@@ -227,11 +322,16 @@ class CodeGenerator:
                 error=f"Code generation error: {e}",
             )
 
-    def _prepare_template_context(self, strategy: dict[str, Any]) -> dict[str, Any]:
+    def _prepare_template_context(
+        self,
+        strategy: dict[str, Any],
+        runtime_parameters: list[str] | None = None,
+    ) -> dict[str, Any]:
         """Prepare context variables for template rendering.
 
         Args:
             strategy: Strategy document
+            runtime_parameters: Parameters to read from config.json at runtime
 
         Returns:
             Dictionary of template variables
@@ -242,8 +342,20 @@ class CodeGenerator:
         class_name = "".join(word.capitalize() for word in strategy_id.replace("-", " ").split())
         class_name = f"{class_name}Algorithm"
 
+        parameters = _TrackedParameters(strategy.get("parameters") or {})
+
+        # Declared tunable types decide how runtime parameters are cast
+        tunable = (strategy.get("tunable_parameters") or {}).get("parameters") or {}
+        types = {
+            name: str(getattr(spec.get("type"), "value", spec.get("type")))
+            for name, spec in tunable.items()
+            if isinstance(spec, dict)
+        }
+
         return {
-            "strategy": strategy,
+            "strategy": {**strategy, "parameters": parameters},
+            "param": _ParameterRenderer(parameters, runtime_parameters or [], types),
+            "runtime_parameters": sorted(runtime_parameters or []),
             "class_name": class_name,
             "timestamp": datetime.utcnow().isoformat() + "Z",
         }
@@ -265,10 +377,16 @@ class CodeGenerator:
 
         try:
             prompt = self._build_llm_prompt(strategy)
-            response = self.llm_client.generate(prompt)
+            response = self.llm_client.generate(prompt, caller="codegen.generate")
 
             # Extract code from response (response.content is the text)
             code = self._extract_code_from_response(response.content)
+            if not code and getattr(response, "cached", False) is True:
+                # A cached bad answer would fail the same way forever; ask again
+                response = self.llm_client.generate(
+                    prompt, use_cache=False, caller="codegen.generate", retries=1
+                )
+                code = self._extract_code_from_response(response.content)
             if not code:
                 return CodeGenResult(
                     success=False,
@@ -458,7 +576,9 @@ class CodeGenerator:
 
         try:
             prompt = self._build_correction_prompt(original_code, error_message, strategy)
-            response = self.llm_client.generate(prompt)
+            response = self.llm_client.generate(
+                prompt, caller="codegen.correct", retries=max(attempt - 1, 0)
+            )
             corrected = self._extract_code_from_response(response.content)
 
             if not corrected:
@@ -6,6 +6,12 @@ Template Structure:
 - mean_reversion.py.j2: Z-score based mean reversion
 - regime_adaptive.py.j2: Regime-switching strategies
 - options_income.py.j2: Options income strategies (puts, spreads, covered calls)
+- _runtime_parameters.py.j2: _param() helper included by the templates above
+
+Numeric parameters are rendered with param(name, default). Normally this
+inlines the value; for parameters requested as runtime parameters it emits
+self._param(name, value, cast), which reads the value from LEAN's config.json
+and casts it to the declared tunable type (int or float).
 
 Template Selection:
 Templates are selected based on the strategy's signal_type or strategy_type field.
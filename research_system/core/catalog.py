@@ -3,15 +3,22 @@ Catalog Management
 
 Manages research catalog entries (indicators, strategies, ideas, etc.).
 All entries are immutable after creation and validated against schema.
+
+Queries, text search, stats and ID allocation go through CatalogIndex
+(catalog_index.py), which is updated incrementally as entries are written.
 """
 
 import json
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
+from research_system.core.catalog_index import CatalogIndex
+
 
 @dataclass
 class CatalogStats:
@@ -71,8 +78,9 @@ class CatalogEntry:
 class CatalogQuery:
     """Fluent interface for querying the catalog."""
 
-    def __init__(self, entries_path: Path):
+    def __init__(self, entries_path: Path, index: Optional[CatalogIndex] = None):
         self._entries_path = entries_path
+        self._index = index
         self._filters: Dict[str, Any] = {}
         self._entries: Optional[List[Dict[str, Any]]] = None
 
@@ -120,6 +128,17 @@ class CatalogQuery:
 
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the query and return matching entries."""
+        if self._index is not None:
+            tag_filter = self._filters.get("tags")
+            return self._index.select(
+                entry_type=self._filters.get("type"),
+                status=self._filters.get("status"),
+                entry_id=self._filters.get("id"),
+                tags=tag_filter["values"] if tag_filter else None,
+                match_all_tags=tag_filter["match_all"] if tag_filter else False,
+                has_validation=self._filters.get("has_validation", False),
+            )
+
         entries = self._load_entries()
         results = []
 
@@ -215,6 +234,7 @@ class Catalog:
         self.catalog_path = catalog_path
         self.entries_path = catalog_path / "entries"
         self.index_path = catalog_path / "index.json"
+        self._index = CatalogIndex(catalog_path)
 
     def ensure_structure(self):
         """Ensure catalog directories exist."""
@@ -223,7 +243,7 @@ class Catalog:
 
     def query(self) -> CatalogQuery:
         """Start a query builder."""
-        return CatalogQuery(self.entries_path)
+        return CatalogQuery(self.entries_path, index=self._index)
 
     def get(self, entry_id: str) -> Optional[CatalogEntry]:
         """Get a single entry by ID."""
@@ -250,11 +270,7 @@ class Catalog:
 
     def list_ids(self) -> List[str]:
         """List all entry IDs."""
-        ids = []
-        if self.entries_path.exists():
-            for file in self.entries_path.glob("*.json"):
-                ids.append(file.stem)
-        return sorted(ids)
+        return self._index.ids()
 
     def get_next_id(self, entry_type: str) -> str:
         """Get the next available ID for an entry type."""
@@ -263,18 +279,7 @@ class Catalog:
             raise ValueError(f"Unknown entry type: {entry_type}. "
                            f"Valid types: {list(self.TYPE_PREFIXES.keys())}")
 
-        pattern = re.compile(rf"^{prefix}-(\d{{3}})\.json$")
-        max_num = 0
-
-        if self.entries_path.exists():
-            for file in self.entries_path.iterdir():
-                match = pattern.match(file.name)
-                if match:
-                    num = int(match.group(1))
-                    max_num = max(max_num, num)
-
-        next_num = max_num + 1
-        return f"{prefix}-{next_num:03d}"
+        return f"{prefix}-{self._index.next_number(prefix):03d}"
 
     def add(
         self,
@@ -316,10 +321,35 @@ class Catalog:
         if entry_type not in self.TYPE_PREFIXES:
             raise ValueError(f"Invalid type: {entry_type}. Valid: {list(self.TYPE_PREFIXES.keys())}")
 
-        # Generate or validate ID
+        if entry_id and not re.match(r"^[A-Z]+-\d{3}$", entry_id):
+            raise ValueError(f"Invalid ID format: {entry_id}. Expected: TYPE-NNN")
+
+        # Allocate the ID and write under the catalog lock so concurrent
+        # adds can't pick the same ID
+        with self._index.write_lock():
+            entry_data = self._build_entry(
+                entry_type, name, source_files, summary, hypothesis, tags,
+                data_requirements, related_entries, source_origin, entry_id,
+            )
+            self._write_entry(entry_data)
+
+        return CatalogEntry(entry_data)
+
+    def _build_entry(
+        self,
+        entry_type: str,
+        name: str,
+        source_files: List[str],
+        summary: Optional[str],
+        hypothesis: Optional[str],
+        tags: Optional[List[str]],
+        data_requirements: Optional[List[str]],
+        related_entries: Optional[List[str]],
+        source_origin: Optional[str],
+        entry_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build a new entry's data, generating or checking its ID."""
         if entry_id:
-            if not re.match(r"^[A-Z]+-\d{3}$", entry_id):
-                raise ValueError(f"Invalid ID format: {entry_id}. Expected: TYPE-NNN")
             if self.exists(entry_id):
                 raise ValueError(f"Entry {entry_id} already exists")
         else:
@@ -361,15 +391,7 @@ class Catalog:
         if source_origin:
             entry_data["source"]["origin"] = source_origin
 
-        # Write entry file
-        entry_file = self.entries_path / f"{entry_id}.json"
-        with open(entry_file, 'w') as f:
-            json.dump(entry_data, f, indent=2)
-
-        # Update index
-        self._update_index(entry_data)
-
-        return CatalogEntry(entry_data)
+        return entry_data
 
     def update_status(
         self,
@@ -386,26 +408,21 @@ class Catalog:
         if new_status not in self.VALID_STATUSES:
             raise ValueError(f"Invalid status: {new_status}. Valid: {self.VALID_STATUSES}")
 
-        entry_data = self.get_raw(entry_id)
-        if not entry_data:
-            raise ValueError(f"Entry not found: {entry_id}")
-
-        entry_data["status"] = new_status
-        entry_data["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        with self._index.write_lock():
+            entry_data = self.get_raw(entry_id)
+            if not entry_data:
+                raise ValueError(f"Entry not found: {entry_id}")
 
-        if validation_ref:
-            entry_data["validation_ref"] = validation_ref
+            entry_data["status"] = new_status
+            entry_data["updated_at"] = datetime.utcnow().isoformat() + "Z"
 
-        if blocked_reason:
-            entry_data["blocked_reason"] = blocked_reason
+            if validation_ref:
+                entry_data["validation_ref"] = validation_ref
 
-        # Write
-        entry_file = self.entries_path / f"{entry_id}.json"
-        with open(entry_file, 'w') as f:
-            json.dump(entry_data, f, indent=2)
+            if blocked_reason:
+                entry_data["blocked_reason"] = blocked_reason
 
-        # Update index
-        self._update_index(entry_data)
+            self._write_entry(entry_data)
 
         return CatalogEntry(entry_data)
 
@@ -427,23 +444,21 @@ class Catalog:
             missing_elements: List of what's missing
             steps_needed: Development steps needed
         """
-        entry_data = self.get_raw(entry_id)
-        if not entry_data:
-            raise ValueError(f"Entry not found: {entry_id}")
-
-        entry_data["maturity"] = {
-            "level": maturity_level,
-            "score": maturity_score,
-            "missing": missing_elements,
-            "steps_needed": steps_needed,
-            "classified_at": datetime.utcnow().isoformat() + "Z"
-        }
-        entry_data["updated_at"] = datetime.utcnow().isoformat() + "Z"
+        with self._index.write_lock():
+            entry_data = self.get_raw(entry_id)
+            if not entry_data:
+                raise ValueError(f"Entry not found: {entry_id}")
+
+            entry_data["maturity"] = {
+                "level": maturity_level,
+                "score": maturity_score,
+                "missing": missing_elements,
+                "steps_needed": steps_needed,
+                "classified_at": datetime.utcnow().isoformat() + "Z"
+            }
+            entry_data["updated_at"] = datetime.utcnow().isoformat() + "Z"
 
-        # Write
-        entry_file = self.entries_path / f"{entry_id}.json"
-        with open(entry_file, 'w') as f:
-            json.dump(entry_data, f, indent=2)
+            self._write_entry(entry_data)
 
         return CatalogEntry(entry_data)
 
@@ -490,143 +505,70 @@ class Catalog:
             related_entries=[parent_id]
         )
 
-    def _update_index(self, entry: Dict[str, Any]):
-        """Update the catalog index with a new or modified entry."""
-        if self.index_path.exists():
-            with open(self.index_path, 'r') as f:
-                index = json.load(f)
-        else:
-            index = {
-                "generated_at": None,
-                "total_entries": 0,
-                "by_type": {},
-                "by_status": {},
-                "entries": []
-            }
+    def _write_entry(self, entry: Dict[str, Any]):
+        """Write an entry file atomically and record it in the index.
 
-        # Update entry in index
-        entry_summary = {
-            "id": entry["id"],
-            "name": entry["name"],
-            "type": entry["type"],
-            "status": entry["status"]
-        }
-
-        # Remove existing entry if present
-        index["entries"] = [e for e in index["entries"] if e["id"] != entry["id"]]
-        index["entries"].append(entry_summary)
-
-        # Update counts
-        index["total_entries"] = len(index["entries"])
-        index["generated_at"] = datetime.utcnow().isoformat() + "Z"
-
-        # Recalculate by_type and by_status
-        index["by_type"] = {}
-        index["by_status"] = {}
-        for e in index["entries"]:
-            t = e["type"]
-            s = e["status"]
-            index["by_type"][t] = index["by_type"].get(t, 0) + 1
-            index["by_status"][s] = index["by_status"].get(s, 0) + 1
+        Callers hold the index write lock.
+        """
+        entry_file = self.entries_path / f"{entry['id']}.json"
 
-        # Write index
-        with open(self.index_path, 'w') as f:
-            json.dump(index, f, indent=2)
+        # Atomic write: temp file + rename
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=self.entries_path, suffix=".json.tmp", prefix=f".{entry['id']}_"
+        )
+        try:
+            with os.fdopen(tmp_fd, 'w') as f:
+                json.dump(entry, f, indent=2)
+            os.replace(tmp_path, entry_file)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._index.put(entry)
 
     def rebuild_index(self):
         """Rebuild the index from all entry files."""
-        entries_summary = []
-
-        if self.entries_path.exists():
-            for file in sorted(self.entries_path.glob("*.json")):
-                try:
-                    with open(file, 'r') as f:
-                        entry = json.load(f)
-                    entries_summary.append({
-                        "id": entry["id"],
-                        "name": entry["name"],
-                        "type": entry["type"],
-                        "status": entry["status"]
-                    })
-                except (json.JSONDecodeError, KeyError):
-                    pass  # Skip invalid files
-
-        # Calculate stats
-        by_type: Dict[str, int] = {}
-        by_status: Dict[str, int] = {}
-        for e in entries_summary:
-            t = e["type"]
-            s = e["status"]
-            by_type[t] = by_type.get(t, 0) + 1
-            by_status[s] = by_status.get(s, 0) + 1
-
-        index = {
-            "generated_at": datetime.utcnow().isoformat() + "Z",
-            "total_entries": len(entries_summary),
-            "by_type": by_type,
-            "by_status": by_status,
-            "entries": entries_summary
-        }
-
-        with open(self.index_path, 'w') as f:
-            json.dump(index, f, indent=2)
-
-        return index
+        return self._index.rebuild()
 
     def stats(self) -> CatalogStats:
         """Get catalog statistics."""
-        if self.index_path.exists():
-            with open(self.index_path, 'r') as f:
-                index = json.load(f)
-            return CatalogStats(
-                total_entries=index.get("total_entries", 0),
-                by_type=index.get("by_type", {}),
-                by_status=index.get("by_status", {}),
-                generated_at=index.get("generated_at", "unknown")
-            )
-
-        # Fallback: calculate from entries
-        query = self.query()
-        entries = query._load_entries()
-
-        by_type: Dict[str, int] = {}
-        by_status: Dict[str, int] = {}
-        for e in entries:
-            t = e.get("type", "unknown")
-            s = e.get("status", "unknown")
-            by_type[t] = by_type.get(t, 0) + 1
-            by_status[s] = by_status.get(s, 0) + 1
-
+        total, by_type, by_status, generated_at = self._index.counts()
         return CatalogStats(
-            total_entries=len(entries),
+            total_entries=total,
             by_type=by_type,
             by_status=by_status,
-            generated_at="calculated"
+            generated_at=generated_at
         )
 
-    def search(self, text: str, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    def search(
+        self,
+        text: str,
+        fields: Optional[List[str]] = None,
+        entry_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
-        Search entries by text in specified fields.
+        Full-text search over entries, best match first.
+
+        Every word must match a whole word (case-insensitive). A trailing *
+        matches a prefix ("mom*") and field:word restricts a word to one
+        field ("tags:breadth").
 
         Args:
-            text: Text to search for (case-insensitive)
-            fields: Fields to search in (default: name, summary, hypothesis)
+            text: Search query
+            fields: Fields to search in (default: name, summary, hypothesis, tags)
+            entry_type: Only entries of this type
+            status: Only entries with this status
+            limit: Maximum number of results
 
         Returns:
             Matching entries
         """
-        if fields is None:
-            fields = ["name", "summary", "hypothesis"]
-
-        text_lower = text.lower()
-        entries = self.query()._load_entries()
-        results = []
-
-        for entry in entries:
-            for field in fields:
-                value = entry.get(field, "")
-                if value and text_lower in value.lower():
-                    results.append(entry)
-                    break
-
-        return results
+        hits = self._index.search(
+            text, fields=fields, entry_type=entry_type, status=status, limit=limit
+        )
+        return [entry for entry, _ in hits]
@@ -0,0 +1,474 @@
+"""
+Catalog Index
+
+Incrementally maintained index over the catalog's entries/ directory.
+
+Entry files stay the source of truth. The index keeps every entry in
+memory with inverted indexes by type, status and tag, plus the highest ID
+number used per prefix, so queries, stats and ID allocation don't read the
+entries directory.
+
+On disk the index is two files next to entries/:
+
+- index.json: a snapshot of all entries. It keeps the legacy keys
+  (total_entries, by_type, by_status, entries) so older readers still
+  work.
+- index.log: an append-only log with one JSON line per added or changed
+  entry since the snapshot.
+
+Loading replays the log over the snapshot. Writes append one line instead
+of rewriting the index, and the log is folded into a new snapshot every
+COMPACT_AFTER records. A torn final line from a crash is ignored, and
+replaying a record twice is harmless, so a crash at any point leaves a
+loadable index.
+
+Each log record carries the entries/ directory mtime after its write. If
+the directory changed since then (files added, removed or replaced by
+other tools), the index is rebuilt from the entry files.
+
+The name, summary, hypothesis and tags of every entry are also kept in a
+TextIndex (text_search.py) for ranked full-text search. It is derived
+from the same records, so it follows the snapshot, log and rebuilds
+without any state of its own on disk.
+"""
+
+import fcntl
+import json
+import os
+import re
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from research_system.core.text_search import TextIndex
+
+# Snapshot format version; older index.json files trigger a rebuild
+INDEX_VERSION = 2
+
+# Fold the log into a new snapshot after this many records
+COMPACT_AFTER = 1000
+
+LOG_FILENAME = "index.log"
+LOCK_FILENAME = "index.lock"
+
+# Entry fields covered by full-text search, and their ranking weights
+SEARCH_FIELDS = ("name", "summary", "hypothesis", "tags")
+SEARCH_WEIGHTS = {"name": 2.0, "tags": 1.5}
+
+_ID_PATTERN = re.compile(r"^([A-Z]+)-(\d+)$")
+
+
+def _file_identity(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of a file, or None if missing."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+class CatalogIndex:
+    """
+    In-memory catalog index backed by a snapshot and an update log.
+
+    Example:
+        index = CatalogIndex(catalog_path)
+        index.select(entry_type="strategy", status="VALIDATED")
+        with index.write_lock():
+            number = index.next_number("STRAT")
+            ...  # write entries/STRAT-042.json
+            index.put(entry)
+    """
+
+    def __init__(self, catalog_path: Path):
+        """
+        Initialize the index.
+
+        Args:
+            catalog_path: Catalog directory (contains entries/ and index.json)
+        """
+        self.catalog_path = Path(catalog_path)
+        self.entries_path = self.catalog_path / "entries"
+        self.index_path = self.catalog_path / "index.json"
+        self.log_path = self.catalog_path / LOG_FILENAME
+        self.lock_path = self.catalog_path / LOCK_FILENAME
+
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_status: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._counters: Dict[str, int] = {}
+        self._text = TextIndex(SEARCH_FIELDS, weights=SEARCH_WEIGHTS)
+        self._generated_at: Optional[str] = None
+        self._entries_mtime: Optional[int] = None
+        self._snapshot_identity: Optional[Tuple[int, int, int]] = None
+        self._log_inode: Optional[int] = None
+        self._log_offset = 0
+        self._log_records = 0
+
+    # =========================================================================
+    # READS
+    # =========================================================================
+
+    def get(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """Indexed entry data (a copy), or None."""
+        with self._lock:
+            self.refresh()
+            entry = self._records.get(entry_id)
+            return dict(entry) if entry is not None else None
+
+    def ids(self) -> List[str]:
+        """All entry IDs, sorted."""
+        with self._lock:
+            self.refresh()
+            return sorted(self._records)
+
+    def select(
+        self,
+        entry_type: Optional[str] = None,
+        status: Optional[str] = None,
+        entry_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        match_all_tags: bool = False,
+        has_validation: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Entries matching all given filters, sorted by ID.
+
+        Candidates come from the inverted indexes; only has_validation
+        looks at the entries themselves.
+        """
+        with self._lock:
+            self.refresh()
+            candidates: Optional[Set[str]] = None
+
+            def narrow(ids: Set[str]):
+                nonlocal candidates
+                candidates = set(ids) if candidates is None else candidates & ids
+
+            if entry_id is not None:
+                narrow({entry_id} if entry_id in self._records else set())
+            if entry_type is not None:
+                narrow(self._by_type.get(entry_type, set()))
+            if status is not None:
+                narrow(self._by_status.get(status, set()))
+            if tags is not None:
+                tag_sets = [self._by_tag.get(t, set()) for t in tags]
+                if match_all_tags:
+                    for tag_set in tag_sets:
+                        narrow(tag_set)
+                else:
+                    narrow(set().union(*tag_sets))
+
+            ids = self._records.keys() if candidates is None else candidates
+            results = []
+            for entry_id_ in sorted(ids):
+                entry = self._records[entry_id_]
+                if has_validation and "validation_ref" not in entry:
+                    continue
+                results.append(dict(entry))
+            return results
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        entry_type: Optional[str] = None,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Entries matching a full-text query, best match first.
+
+        Args:
+            query: Query text (words, prefix*, field:word)
+            fields: Fields searched by words without a field: prefix
+                (default: SEARCH_FIELDS)
+            entry_type: Only entries of this type
+            status: Only entries with this status
+            limit: Maximum number of results
+
+        Returns:
+            (entry, score) pairs
+        """
+        with self._lock:
+            self.refresh()
+            candidates: Optional[Set[str]] = None
+            if entry_type is not None:
+                candidates = set(self._by_type.get(entry_type, set()))
+            if status is not None:
+                by_status = self._by_status.get(status, set())
+                candidates = set(by_status) if candidates is None else candidates & by_status
+            hits = self._text.search(query, fields=fields, candidates=candidates, limit=limit)
+            return [(dict(self._records[entry_id]), score) for entry_id, score in hits]
+
+    def counts(self) -> Tuple[int, Dict[str, int], Dict[str, int], str]:
+        """(total, by_type, by_status, generated_at)."""
+        with self._lock:
+            self.refresh()
+            return (
+                len(self._records),
+                {t: len(ids) for t, ids in self._by_type.items() if ids},
+                {s: len(ids) for s, ids in self._by_status.items() if ids},
+                self._generated_at or "unknown",
+            )
+
+    def next_number(self, prefix: str) -> int:
+        """Next unused number for an ID prefix (call under write_lock)."""
+        with self._lock:
+            self.refresh()
+            return self._counters.get(prefix, 0) + 1
+
+    # =========================================================================
+    # WRITES
+    # =========================================================================
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the cross-process catalog write lock, with the index refreshed."""
+        self.catalog_path.mkdir(parents=True, exist_ok=True)
+        self.lock_path.touch(exist_ok=True)
+        with self._lock:
+            with open(self.lock_path, "r+") as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    self.refresh()
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def put(self, entry: Dict[str, Any]):
+        """
+        Record an entry that was just written to entries/.
+
+        Callers hold write_lock() across writing the entry file and put().
+        """
+        with self._lock:
+            self._entries_mtime = _mtime_ns(self.entries_path)
+            record = {
+                "op": "put",
+                "entry": entry,
+                "entries_mtime": self._entries_mtime,
+                "at": datetime.utcnow().isoformat() + "Z",
+            }
+            self._append_log(record)
+            self._apply(entry)
+            self._generated_at = record["at"]
+
+            if self._log_records >= COMPACT_AFTER:
+                self._write_snapshot()
+
+    def rebuild(self) -> Dict[str, Any]:
+        """Rebuild the index from all entry files and write a fresh snapshot."""
+        with self._lock:
+            self._reset()
+            self._entries_mtime = _mtime_ns(self.entries_path)
+            if self.entries_path.exists():
+                for file in sorted(self.entries_path.glob("*.json")):
+                    try:
+                        with open(file, 'r') as f:
+                            entry = json.load(f)
+                    except (OSError, json.JSONDecodeError):
+                        continue  # Skip unreadable files
+                    if isinstance(entry, dict):
+                        entry.setdefault("id", file.stem)
+                        self._apply(entry)
+            self._generated_at = datetime.utcnow().isoformat() + "Z"
+            self._loaded = True
+            if self._entries_mtime is None:
+                # No catalog yet: nothing to persist
+                self._snapshot_identity = _file_identity(self.index_path)
+                return {"version": INDEX_VERSION, "total_entries": 0, "entries": []}
+            return self._write_snapshot()
+
+    # =========================================================================
+    # LOADING
+    # =========================================================================
+
+    def refresh(self):
+        """Pick up changes made by other processes (cheap when there are none)."""
+        with self._lock:
+            if not self._loaded or _file_identity(self.index_path) != self._snapshot_identity:
+                self._load()
+                return
+
+            log_identity = _file_identity(self.log_path)
+            if log_identity is None:
+                if self._log_offset:
+                    self._load()
+                    return
+            elif log_identity[0] != self._log_inode or log_identity[2] < self._log_offset:
+                self._load()
+                return
+            elif log_identity[2] > self._log_offset:
+                self._replay_log()
+
+            if _mtime_ns(self.entries_path) != self._entries_mtime:
+                self.rebuild()
+
+    def _load(self):
+        self._reset()
+        snapshot = None
+        self._snapshot_identity = _file_identity(self.index_path)
+        if self._snapshot_identity is not None:
+            try:
+                with open(self.index_path, 'r') as f:
+                    snapshot = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                snapshot = None
+
+        if not isinstance(snapshot, dict) or snapshot.get("version") != INDEX_VERSION:
+            # Missing, damaged or legacy index
+            self.rebuild()
+            return
+
+        for entry in snapshot.get("entries", []):
+            if isinstance(entry, dict) and "id" in entry:
+                self._apply(entry)
+        self._generated_at = snapshot.get("generated_at")
+        self._entries_mtime = snapshot.get("entries_mtime")
+        self._loaded = True
+
+        self._replay_log()
+        if _mtime_ns(self.entries_path) != self._entries_mtime:
+            self.rebuild()
+
+    def _replay_log(self):
+        """Apply log records past the current offset."""
+        identity = _file_identity(self.log_path)
+        if identity is None:
+            return
+        self._log_inode = identity[0]
+        with open(self.log_path, 'rb') as f:
+            f.seek(self._log_offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Torn write (crash or in progress); retry later
+                self._log_offset += len(raw)
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("op") == "put" and isinstance(record.get("entry"), dict):
+                    self._apply(record["entry"])
+                    self._entries_mtime = record.get("entries_mtime")
+                    self._generated_at = record.get("at", self._generated_at)
+                    self._log_records += 1
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _apply(self, entry: Dict[str, Any]):
+        """Insert or replace an entry in memory, updating inverted indexes."""
+        entry_id = entry["id"]
+        old = self._records.get(entry_id)
+        if old is not None:
+            self._discard(self._by_type, old.get("type"), entry_id)
+            self._discard(self._by_status, old.get("status"), entry_id)
+            for tag in old.get("tags") or []:
+                self._discard(self._by_tag, tag, entry_id)
+
+        self._records[entry_id] = entry
+        for index, key in ((self._by_type, entry.get("type")), (self._by_status, entry.get("status"))):
+            if key is not None:
+                index.setdefault(key, set()).add(entry_id)
+        for tag in entry.get("tags") or []:
+            self._by_tag.setdefault(tag, set()).add(entry_id)
+        self._text.add(entry_id, {
+            "name": entry.get("name"),
+            "summary": entry.get("summary"),
+            "hypothesis": entry.get("hypothesis"),
+            "tags": " ".join(str(t) for t in entry.get("tags") or []),
+        })
+
+        match = _ID_PATTERN.match(str(entry_id))
+        if match:
+            prefix, number = match.group(1), int(match.group(2))
+            if number > self._counters.get(prefix, 0):
+                self._counters[prefix] = number
+
+    @staticmethod
+    def _discard(index: Dict[Any, Set[str]], key: Any, entry_id: str):
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(entry_id)
+            if not ids:
+                del index[key]
+
+    def _append_log(self, record: Dict[str, Any]):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        self.catalog_path.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, 'ab') as f:
+            # Terminate a torn line left by a crash so this record parses
+            if f.tell() > 0:
+                with open(self.log_path, 'rb') as tail:
+                    tail.seek(-1, os.SEEK_END)
+                    if tail.read(1) != b"\n":
+                        line = b"\n" + line
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+            end = f.tell()
+
+        # Our own write: advance past it without re-reading
+        identity = _file_identity(self.log_path)
+        if identity is not None and end >= self._log_offset:
+            self._log_inode = identity[0]
+            self._log_offset = end
+        self._log_records += 1
+
+    def _write_snapshot(self) -> Dict[str, Any]:
+        """Write all entries as a new snapshot and empty the log."""
+        by_type = {t: len(ids) for t, ids in self._by_type.items() if ids}
+        by_status = {s: len(ids) for s, ids in self._by_status.items() if ids}
+        snapshot = {
+            "version": INDEX_VERSION,
+            "generated_at": self._generated_at,
+            "total_entries": len(self._records),
+            "by_type": by_type,
+            "by_status": by_status,
+            "entries_mtime": self._entries_mtime,
+            "entries": [self._records[i] for i in sorted(self._records)],
+        }
+
+        self.catalog_path.mkdir(parents=True, exist_ok=True)
+        # Atomic write: temp file + rename
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=self.catalog_path, suffix=".json.tmp", prefix=".index_"
+        )
+        try:
+            with os.fdopen(tmp_fd, "w") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        # Records are in the snapshot now; replaying them again would be harmless
+        with open(self.log_path, 'wb'):
+            pass
+        self._snapshot_identity = _file_identity(self.index_path)
+        identity = _file_identity(self.log_path)
+        self._log_inode = identity[0] if identity else None
+        self._log_offset = 0
+        self._log_records = 0
+        return snapshot
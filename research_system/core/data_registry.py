@@ -8,15 +8,28 @@ Each data source is tracked with availability across different tiers:
 - Internal Purchased (paid data)
 - Internal Curated (validated free data)
 - Internal Experimental (unverified data)
+
+Lookups go through a parsed copy of registry.json that is shared by all
+DataRegistry instances for the same directory and reloaded only when the
+file changes, with hash maps from IDs and normalized aliases to sources.
+The QC Native recognition rules are compiled once into set lookups and
+anchored regexes.
 """
 
 import json
+import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 
+def normalize_source_id(source_id: str) -> str:
+    """Normalize a data source ID for matching (lowercase, '-'/' ' -> '_')."""
+    return source_id.lower().replace("-", "_").replace(" ", "_")
+
+
 @dataclass
 class DataAvailability:
     """Availability status for a data source."""
@@ -426,45 +439,7 @@ class DataRegistry:
         Returns:
             True if likely available as QC Native data
         """
-        # Normalize
-        source_id = source_id.lower().replace("-", "_").replace(" ", "_")
-
-        # Check known aliases first (vix_index -> VIX, eur_usd -> EURUSD, etc.)
-        if source_id in cls.QC_NATIVE_ALIASES:
-            return True
-
-        # Check special data sources
-        if source_id in cls.QC_NATIVE_SPECIAL:
-            return True
-
-        # Check generic data types (us_equities, forex_data, etc.)
-        if source_id in cls.QC_NATIVE_DATA_TYPES:
-            return True
-
-        # Check for standard market data patterns (spy_prices, aapl_data, etc.)
-        for suffix in cls.QC_STANDARD_DATA_SUFFIXES:
-            if source_id.endswith(suffix):
-                ticker = source_id[:-len(suffix)]
-                # Basic validation: ticker should be 1-6 alphanumeric chars
-                if ticker and len(ticker) <= 6 and ticker.replace("_", "").isalnum():
-                    return True
-
-        # Check for derivable data patterns (historical_volatility, daily_returns, etc.)
-        for suffix in cls.QC_DERIVABLE_SUFFIXES:
-            if source_id.endswith(suffix):
-                return True
-
-        # Check for technical indicator patterns (ema_20, sma_50_day, rsi_14, etc.)
-        for indicator in cls.QC_INDICATOR_PATTERNS:
-            if source_id.startswith(indicator + "_"):
-                return True
-            # Also check without underscore (ema20, sma50)
-            if source_id.startswith(indicator) and len(source_id) > len(indicator):
-                rest = source_id[len(indicator):]
-                if rest.replace("_", "").replace("day", "").isdigit():
-                    return True
-
-        return False
+        return cls._qc_native_matcher().matches(normalize_source_id(source_id))
 
     @classmethod
     def resolve_qc_native_symbol(cls, source_id: str) -> Optional[str]:
@@ -477,20 +452,16 @@ class DataRegistry:
         Returns:
             QC symbol if resolvable, None otherwise
         """
-        source_id = source_id.lower().replace("-", "_").replace(" ", "_")
-
-        # Check known aliases
-        if source_id in cls.QC_NATIVE_ALIASES:
-            return cls.QC_NATIVE_ALIASES[source_id]
+        return cls._qc_native_matcher().symbol(normalize_source_id(source_id))
 
-        # Check for standard market data patterns
-        for suffix in cls.QC_STANDARD_DATA_SUFFIXES:
-            if source_id.endswith(suffix):
-                ticker = source_id[:-len(suffix)]
-                if ticker and len(ticker) <= 6 and ticker.replace("_", "").isalnum():
-                    return ticker.upper()
-
-        return None
+    @classmethod
+    def _qc_native_matcher(cls) -> "_QCNativeMatcher":
+        """The QC Native rules of this class, compiled on first use."""
+        matcher = cls.__dict__.get("_compiled_qc_native")
+        if matcher is None:
+            matcher = _QCNativeMatcher(cls)
+            cls._compiled_qc_native = matcher
+        return matcher
 
     @classmethod
     def create_qc_native_source(cls, source_id: str) -> DataSource:
@@ -509,7 +480,7 @@ class DataRegistry:
             symbol = source_id.upper()
 
         # Determine data type and usage notes based on symbol
-        normalized = source_id.lower().replace("-", "_").replace(" ", "_")
+        normalized = normalize_source_id(source_id)
 
         # Check what type of data this is
         if normalized in cls.QC_NATIVE_ALIASES:
@@ -574,11 +545,26 @@ class DataRegistry:
         with open(self.registry_file, 'r') as f:
             return json.load(f)
 
+    def _index(self) -> "_RegistryIndex":
+        """The lookup index for the current registry file, reloaded if it changed."""
+        try:
+            stat = os.stat(self.registry_file)
+            fingerprint = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            fingerprint = None
+
+        index = _INDEX_CACHE.get(self.registry_file)
+        if index is None or index.fingerprint != fingerprint:
+            index = _RegistryIndex(self._load_registry(), fingerprint)
+            _INDEX_CACHE[self.registry_file] = index
+        return index
+
     def _save_registry(self, registry: Dict[str, Any]):
         """Save the registry file."""
         registry["last_updated"] = datetime.utcnow().isoformat() + "Z"
         with open(self.registry_file, 'w') as f:
             json.dump(registry, f, indent=2)
+        _INDEX_CACHE.pop(self.registry_file, None)
 
     def list(self, available_only: bool = False) -> List[DataSource]:
         """
@@ -590,10 +576,9 @@ class DataRegistry:
         Returns:
             List of DataSource objects
         """
-        registry = self._load_registry()
         sources = []
 
-        for source_data in registry.get("data_sources", []):
+        for source_data in self._index().sources:
             source = self._create_source_from_data(source_data)
 
             if available_only and not source.is_available():
@@ -618,23 +603,30 @@ class DataRegistry:
         Returns:
             DataSource if found or recognized, None otherwise
         """
-        # Normalize for comparison
-        normalized_id = source_id.lower().replace("-", "_").replace(" ", "_")
+        return self._resolve(self._index(), source_id)
 
-        # First check explicit registry
-        registry = self._load_registry()
+    def resolve_many(self, source_ids: Iterable[str]) -> Dict[str, Optional[DataSource]]:
+        """
+        Resolve many data source IDs at once, as get() would.
 
-        for source_data in registry.get("data_sources", []):
-            # Check direct ID match
-            if source_data["id"] == source_id or source_data["id"] == normalized_id:
-                return self._create_source_from_data(source_data)
+        The registry is checked for changes once for the whole batch.
 
-            # Check aliases
-            aliases = source_data.get("aliases", [])
-            for alias in aliases:
-                alias_normalized = alias.lower().replace("-", "_").replace(" ", "_")
-                if alias_normalized == normalized_id:
-                    return self._create_source_from_data(source_data)
+        Args:
+            source_ids: Data source IDs
+
+        Returns:
+            Dict mapping each source ID to its DataSource, or None
+        """
+        index = self._index()
+        return {source_id: self._resolve(index, source_id) for source_id in source_ids}
+
+    def _resolve(self, index: "_RegistryIndex", source_id: str) -> Optional[DataSource]:
+        normalized_id = normalize_source_id(source_id)
+
+        # First check explicit registry (IDs and aliases)
+        source_data = index.find(source_id, normalized_id)
+        if source_data is not None:
+            return self._create_source_from_data(source_data)
 
         # Fall back to QC Native pattern recognition
         if self.is_qc_native_pattern(normalized_id):
@@ -669,8 +661,7 @@ class DataRegistry:
         """
         results = {}
 
-        for source_id in source_ids:
-            source = self.get(source_id)
+        for source_id, source in self.resolve_many(source_ids).items():
             if source:
                 results[source_id] = source.best_source()
             else:
@@ -800,3 +791,109 @@ class DataRegistry:
                 results.append(source)
 
         return results
+
+
+class _RegistryIndex:
+    """
+    Parsed registry.json with hash maps for ID and alias lookup.
+
+    Shared by every DataRegistry for the same file, so the parsed sources
+    must be treated as read-only; writers re-read the file.
+    """
+
+    def __init__(self, registry: Dict[str, Any], fingerprint: Optional[Tuple[int, int, int]]):
+        self.fingerprint = fingerprint
+        self.sources: List[Dict[str, Any]] = registry.get("data_sources", [])
+
+        # Position of the first source with each exact ID, and with each
+        # exact ID or normalized alias, so that lookups pick the same
+        # source as a scan in registry order would
+        self._by_id: Dict[str, int] = {}
+        self._by_name: Dict[str, int] = {}
+        for position, source_data in enumerate(self.sources):
+            self._by_id.setdefault(source_data["id"], position)
+            self._by_name.setdefault(source_data["id"], position)
+            for alias in source_data.get("aliases") or []:
+                self._by_name.setdefault(normalize_source_id(alias), position)
+
+    def find(self, source_id: str, normalized_id: str) -> Optional[Dict[str, Any]]:
+        """First source whose ID is source_id, or whose ID or an alias is normalized_id."""
+        by_id = self._by_id.get(source_id)
+        by_name = self._by_name.get(normalized_id)
+        if by_id is None and by_name is None:
+            return None
+        if by_id is None or (by_name is not None and by_name < by_id):
+            return self.sources[by_name]
+        return self.sources[by_id]
+
+
+# Registry file -> its current index
+_INDEX_CACHE: Dict[Path, _RegistryIndex] = {}
+
+
+def _alternation(words: Iterable[str]) -> str:
+    # Longest first, so a word is never shadowed by its own prefix
+    return "|".join(re.escape(w) for w in sorted(words, key=lambda w: (-len(w), w)))
+
+
+class _QCNativeMatcher:
+    """
+    DataRegistry's QC Native recognition rules, compiled.
+
+    Known names are one set lookup; ticker suffixes, derivable suffixes and
+    indicator prefixes are each one anchored regex instead of a loop over
+    every pattern.
+    """
+
+    def __init__(self, registry_cls: type):
+        self.aliases: Dict[str, str] = dict(registry_cls.QC_NATIVE_ALIASES)
+        self.names = (
+            frozenset(self.aliases)
+            | frozenset(registry_cls.QC_NATIVE_SPECIAL)
+            | frozenset(registry_cls.QC_NATIVE_DATA_TYPES)
+        )
+        # spy_prices, aapl_data: ticker of 1-6 letters, digits or underscores
+        self.standard = re.compile(
+            r"(?P<ticker>\w{1,6})(?:%s)" % _alternation(registry_cls.QC_STANDARD_DATA_SUFFIXES),
+            re.DOTALL,
+        )
+        # historical_volatility, daily_returns
+        self.derivable = re.compile(
+            r".*(?:%s)" % _alternation(registry_cls.QC_DERIVABLE_SUFFIXES),
+            re.DOTALL,
+        )
+        # ema_20, sma50, rsi_14_day
+        self.indicator = re.compile(
+            r"(?:%s)(?P<rest>.+)" % _alternation(registry_cls.QC_INDICATOR_PATTERNS),
+            re.DOTALL,
+        )
+
+    def matches(self, normalized_id: str) -> bool:
+        """Whether a normalized ID is likely available as QC Native data."""
+        if normalized_id in self.names:
+            return True
+        if self._ticker(normalized_id) is not None:
+            return True
+        if self.derivable.fullmatch(normalized_id):
+            return True
+        match = self.indicator.fullmatch(normalized_id)
+        if match:
+            rest = match.group("rest")
+            if rest.startswith("_"):
+                return True
+            if rest.replace("_", "").replace("day", "").isdigit():
+                return True
+        return False
+
+    def symbol(self, normalized_id: str) -> Optional[str]:
+        """QC symbol for a normalized ID (known alias or ticker pattern), or None."""
+        if normalized_id in self.aliases:
+            return self.aliases[normalized_id]
+        ticker = self._ticker(normalized_id)
+        return ticker.upper() if ticker is not None else None
+
+    def _ticker(self, normalized_id: str) -> Optional[str]:
+        match = self.standard.fullmatch(normalized_id)
+        if match and match.group("ticker").strip("_"):
+            return match.group("ticker")
+        return None
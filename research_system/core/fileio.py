@@ -0,0 +1,32 @@
+"""Atomic file writes.
+
+Caches, indexes and reports are read by other processes (or by this one on
+the next run) while they may be rewritten, so they are written to a temp
+file in the same directory and renamed over the target. Readers see either
+the old or the new content, never a partial file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace path's content with text via temp file + rename.
+
+    The parent directory must exist. On failure the temp file is removed
+    and the exception propagates; path is left untouched.
+    """
+    path = Path(path)
+    tmp_fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}_", suffix=".tmp")
+    try:
+        with os.fdopen(tmp_fd, "w") as f:
+            f.write(text)
+        os.replace(tmp_path, path)  # Atomic on POSIX
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
@@ -0,0 +1,232 @@
+"""
+Text Search
+
+Query parsing and an in-memory ranked full-text index shared by the
+catalog's search paths.
+
+Query syntax (the same as the SQLite FTS5 index in research_system.db):
+
+- Words are matched as whole tokens, case-insensitively; every word must
+  match (AND).
+- A trailing * makes a word a prefix: "mom*" matches "momentum".
+- field:word restricts a word to one field: "name:breadth".
+
+Text is tokenized into runs of letters and digits, so "mean-reversion"
+indexes as "mean" and "reversion", and searching for "mean-reversion"
+finds it.
+
+TextIndex ranks matches with BM25 over per-field term frequencies, with
+optional per-field weights.
+"""
+
+import bisect
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_FIELD_PATTERN = re.compile(r"^(\w+):(.+)$")
+
+
+@dataclass(frozen=True)
+class QueryTerm:
+    """One token of a parsed query."""
+    text: str
+    field: Optional[str] = None
+    prefix: bool = False
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased runs of letters and digits in text."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_query(query: str, fields: Optional[Iterable[str]] = None) -> List[QueryTerm]:
+    """
+    Parse a search query into terms.
+
+    Args:
+        query: Query text (see module docstring for syntax)
+        fields: Field names accepted in field:word; a prefix naming any
+            other field is searched as ordinary text
+
+    Returns:
+        Terms in query order (empty if the query has no searchable text)
+    """
+    known = set(fields) if fields is not None else None
+    terms: List[QueryTerm] = []
+    for word in query.split():
+        field = None
+        match = _FIELD_PATTERN.match(word)
+        if match and (known is None or match.group(1).lower() in known):
+            field, word = match.group(1).lower(), match.group(2)
+
+        prefix = word.endswith("*")
+        tokens = tokenize(word)
+        for i, token in enumerate(tokens):
+            terms.append(QueryTerm(token, field, prefix and i == len(tokens) - 1))
+    return terms
+
+
+class TextIndex:
+    """
+    Inverted index over documents with named text fields.
+
+    Example:
+        index = TextIndex(["name", "summary"], weights={"name": 2.0})
+        index.add("IND-001", {"name": "McClellan Oscillator", "summary": "..."})
+        index.search("mcclellan osc*")  # -> [("IND-001", 3.1)]
+    """
+
+    def __init__(self, fields: Sequence[str], weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize an empty index.
+
+        Args:
+            fields: Names of the indexed fields
+            weights: Score multiplier per field (default 1.0)
+        """
+        self.fields = tuple(fields)
+        self.weights = {f: (weights or {}).get(f, 1.0) for f in self.fields}
+        self.clear()
+
+    def clear(self):
+        """Remove all documents."""
+        # field -> token -> doc_id -> term frequency
+        self._postings: Dict[str, Dict[str, Dict[str, int]]] = {f: {} for f in self.fields}
+        # doc_id -> field -> token counts (for removal)
+        self._documents: Dict[str, Dict[str, Counter]] = {}
+        # field -> doc_id -> number of tokens
+        self._lengths: Dict[str, Dict[str, int]] = {f: {} for f in self.fields}
+        self._total_lengths: Dict[str, int] = {f: 0 for f in self.fields}
+        self._vocabulary: Optional[List[str]] = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def add(self, doc_id: str, values: Dict[str, Optional[str]]):
+        """Index a document, replacing any previous version of it."""
+        self.remove(doc_id)
+        document: Dict[str, Counter] = {}
+        for field in self.fields:
+            counts = Counter(tokenize(values.get(field) or ""))
+            document[field] = counts
+            postings = self._postings[field]
+            for token, count in counts.items():
+                docs = postings.get(token)
+                if docs is None:
+                    docs = postings[token] = {}
+                    self._vocabulary = None
+                docs[doc_id] = count
+            length = sum(counts.values())
+            self._lengths[field][doc_id] = length
+            self._total_lengths[field] += length
+        self._documents[doc_id] = document
+
+    def remove(self, doc_id: str):
+        """Drop a document from the index (no-op if absent)."""
+        document = self._documents.pop(doc_id, None)
+        if document is None:
+            return
+        for field, counts in document.items():
+            postings = self._postings[field]
+            for token in counts:
+                docs = postings.get(token)
+                if docs is not None:
+                    docs.pop(doc_id, None)
+                    if not docs:
+                        del postings[token]
+                        self._vocabulary = None
+            self._total_lengths[field] -= self._lengths[field].pop(doc_id, 0)
+
+    def search(
+        self,
+        query: str,
+        fields: Optional[Iterable[str]] = None,
+        candidates: Optional[Set[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Documents matching every term of query, best first.
+
+        Args:
+            query: Query text
+            fields: Fields searched by terms without a field: prefix
+                (default: all)
+            candidates: If given, only these documents can match
+            limit: Maximum number of results
+
+        Returns:
+            (doc_id, score) pairs ordered by descending score, then doc_id
+        """
+        default_fields = [f for f in (fields or self.fields) if f in self._postings]
+        terms = parse_query(query, self.fields)
+        if not terms or not default_fields:
+            return []
+
+        matched: Optional[Set[str]] = candidates
+        scores: Dict[str, float] = {}
+        for term in terms:
+            term_fields = [term.field] if term.field else default_fields
+            term_scores = self._score_term(term, term_fields)
+            docs = set(term_scores)
+            matched = docs if matched is None else matched & docs
+            if not matched:
+                return []
+            for doc_id, score in term_scores.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+
+        ranked = sorted(matched, key=lambda d: (-scores[d], d))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(doc_id, scores[doc_id]) for doc_id in ranked]
+
+    def _score_term(self, term: QueryTerm, fields: List[str]) -> Dict[str, float]:
+        """BM25 contribution of one term per matching document."""
+        tokens = self._expand(term)
+        total_docs = len(self._documents)
+        scores: Dict[str, float] = {}
+        for token in tokens:
+            containing: Set[str] = set()
+            for field in fields:
+                containing.update(self._postings[field].get(token, {}))
+            if not containing:
+                continue
+            df = len(containing)
+            idf = math.log(1 + (total_docs - df + 0.5) / (df + 0.5))
+
+            for field in fields:
+                docs = self._postings[field].get(token)
+                if not docs:
+                    continue
+                lengths = self._lengths[field]
+                average = self._total_lengths[field] / total_docs or 1.0
+                weight = self.weights[field]
+                for doc_id, tf in docs.items():
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average)
+                    score = weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + score
+        return scores
+
+    def _expand(self, term: QueryTerm) -> List[str]:
+        """Tokens in the index that a term matches."""
+        if not term.prefix:
+            return [term.text]
+        if self._vocabulary is None:
+            vocabulary: Set[str] = set()
+            for postings in self._postings.values():
+                vocabulary.update(postings)
+            self._vocabulary = sorted(vocabulary)
+        start = bisect.bisect_left(self._vocabulary, term.text)
+        tokens = []
+        for token in self._vocabulary[start:]:
+            if not token.startswith(term.text):
+                break
+            tokens.append(token)
+        return tokens
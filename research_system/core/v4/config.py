@@ -99,6 +99,16 @@ class IngestionConfig(BaseModel):
     min_trust_score: int = Field(
         50, ge=0, le=100, description="Minimum trust score (0-100 scale)"
     )
+    dedup: bool = Field(
+        True,
+        description="Skip files whose content was already ingested (.state/ingest_index.json)",
+    )
+    near_duplicate_threshold: float | None = Field(
+        None,
+        gt=0,
+        le=1,
+        description="Also skip re-formatted copies at or above this estimated similarity (None = exact matches only)",
+    )
 
 
 class VerificationConfig(BaseModel):
@@ -219,12 +229,32 @@ class RedFlagsConfig(BaseModel):
 class BacktestConfig(BaseModel):
     """Backtest execution configuration.
 
-    Controls timeouts and other execution parameters for backtests.
+    Controls timeouts, concurrency and other execution parameters for backtests.
     """
 
     timeout: int = Field(
         600, ge=60, description="Backtest execution timeout in seconds (default: 600)"
     )
+    max_concurrent: int = Field(
+        1, ge=1, le=5, description="Maximum walk-forward windows to backtest at once (default: 1)"
+    )
+    cache_enabled: bool = Field(
+        True, description="Reuse cached results for identical code, window and engine mode"
+    )
+    cache_max_entries: int = Field(
+        5000, ge=1, description="Maximum number of cached backtest results kept on disk"
+    )
+    cache_max_age_days: int = Field(
+        30, ge=1, description="Cached backtest results older than this are discarded"
+    )
+    cloud_nodes: int | None = Field(
+        None,
+        ge=1,
+        description=(
+            "QC cloud backtest nodes the job scheduler may keep busy at once "
+            "(unset: no scheduler, concurrency is limited only by max_concurrent and --jobs)"
+        ),
+    )
 
 
 class LoggingConfig(BaseModel):
@@ -252,6 +282,34 @@ class APIConfig(BaseModel):
         None,
         description="Anthropic API key (can also be set via ANTHROPIC_API_KEY env var)",
     )
+    response_cache: bool = Field(
+        False,
+        description="Cache deterministic LLM responses in .state/llm_cache.sqlite",
+    )
+    response_cache_ttl_days: float = Field(
+        30,
+        gt=0,
+        description="Days before a cached LLM response expires",
+    )
+    response_cache_max_entries: int = Field(
+        10000,
+        ge=1,
+        description="Maximum cached LLM responses before least recently used are evicted",
+    )
+    llm_telemetry: bool = Field(
+        True,
+        description="Record tokens, latency and cost of every LLM call in logs/llm-calls.jsonl",
+    )
+    max_concurrent_personas: int = Field(
+        5,
+        ge=1,
+        description="Independent synthesis/ideation personas run at once (1 = sequential)",
+    )
+    persona_timeout_seconds: float | None = Field(
+        300,
+        gt=0,
+        description="Give up on a single persona after this many seconds (None = no limit)",
+    )
 
     @model_validator(mode="after")
     def resolve_env_vars(self) -> "APIConfig":
@@ -0,0 +1,416 @@
+"""Persistent index of strategy files.
+
+Listing strategies used to glob every status directory and parse every
+strategy YAML just to show id, name, created date and tags, and finding a
+strategy by ID probed each status directory in turn. Both got slower with
+every ingest.
+
+The index keeps one row per strategy file in a SQLite database under the
+workspace state directory (.state/strategy_index.sqlite):
+
+- Workspace keeps it in sync when it moves a strategy, and writers that
+  save strategy files directly call Workspace.refresh_strategy().
+- Files changed behind the index's back (edited by hand, written by other
+  tools) are picked up lazily: sync() stats the strategy files and only
+  re-parses those whose mtime, size or inode changed since they were
+  indexed, and drops rows for files that are gone.
+- Queries filter by status and tags, sort and paginate in SQL, and
+  locate() maps an ID to its status and path with one primary-key lookup.
+
+If the database can't be opened the index falls back to an in-memory one,
+which behaves the same but is rebuilt by each process.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Index file, relative to the workspace root
+INDEX_FILE = Path(".state") / "strategy_index.sqlite"
+
+# Bump when the schema or the summary fields change
+INDEX_VERSION = 1
+
+# Columns list_strategies can sort by
+SORT_FIELDS = {"created", "id", "name", "status"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS strategies (
+    file TEXT PRIMARY KEY,
+    file_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    created TEXT,
+    created_ts REAL,
+    tags TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    inode INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_strategies_file_id ON strategies(file_id);
+CREATE INDEX IF NOT EXISTS idx_strategies_status ON strategies(status);
+CREATE INDEX IF NOT EXISTS idx_strategies_created ON strategies(created_ts);
+CREATE TABLE IF NOT EXISTS strategy_tags (
+    file TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (file, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_strategy_tags_tag ON strategy_tags(tag);
+"""
+
+
+def summarize_strategy(data: dict[str, Any], file_id: str) -> dict[str, Any]:
+    """Extract the listing fields (id, name, created, tags) from strategy data."""
+    created = data.get("created")
+    strategy_tags = data.get("tags", {})
+
+    # Handle tags - could be dict with 'custom' key or list
+    if isinstance(strategy_tags, dict):
+        tag_list = strategy_tags.get("custom", [])
+    elif isinstance(strategy_tags, list):
+        tag_list = strategy_tags
+    else:
+        tag_list = []
+
+    # Parse created date if string
+    if isinstance(created, str):
+        try:
+            created = datetime.fromisoformat(created.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+
+    return {
+        "id": data.get("id", file_id),
+        "name": data.get("name", "Unknown"),
+        "created": created,
+        "tags": [str(t) for t in tag_list or []],
+    }
+
+
+def _created_timestamp(created: Any) -> float | None:
+    """Sortable timestamp for a created value (naive datetimes as local time)."""
+    if isinstance(created, datetime):
+        return created.timestamp()
+    if hasattr(created, "isoformat"):  # date
+        return datetime(created.year, created.month, created.day).timestamp()
+    return None
+
+
+def _created_text(created: Any) -> str | None:
+    if created is None:
+        return None
+    if hasattr(created, "isoformat"):
+        return created.isoformat()
+    return str(created)
+
+
+def _created_value(text: str | None) -> Any:
+    if text is None:
+        return None
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+
+class StrategyIndex:
+    """SQLite index of strategy files by status.
+
+    Example:
+        index = StrategyIndex.for_workspace(workspace.path, workspace.strategies_path, statuses)
+        index.sync()
+        index.query(status="pending", tags=["momentum"], limit=20)
+        index.locate("STRAT-001")  # ("pending", Path(...))
+    """
+
+    def __init__(self, path: Path, strategies_path: Path, statuses: Iterable[str]):
+        """Initialize the index.
+
+        Args:
+            path: SQLite file holding the index (created on first use)
+            strategies_path: Directory with one subdirectory per status
+            statuses: Status subdirectories to index
+        """
+        self.path = Path(path)
+        self.strategies_path = Path(strategies_path)
+        self.statuses = sorted(statuses)
+
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def for_workspace(
+        cls, workspace_path: Path, strategies_path: Path, statuses: Iterable[str]
+    ) -> "StrategyIndex":
+        """Create an index in the standard location under a workspace."""
+        return cls(Path(workspace_path) / INDEX_FILE, strategies_path, statuses)
+
+    # =========================================================================
+    # MAINTENANCE
+    # =========================================================================
+
+    def sync(self, statuses: Iterable[str] | None = None) -> None:
+        """Bring the index up to date with the strategy files on disk.
+
+        Only files whose mtime, size or inode changed are re-parsed.
+
+        Args:
+            statuses: Limit the check to these status directories
+        """
+        statuses = list(statuses) if statuses is not None else self.statuses
+        with self._lock:
+            conn = self._connect()
+            placeholders = ",".join("?" * len(statuses))
+            known = {
+                row[0]: tuple(row[1:])
+                for row in conn.execute(
+                    f"SELECT file, mtime_ns, size, inode FROM strategies "
+                    f"WHERE status IN ({placeholders})",
+                    statuses,
+                )
+            }
+
+            seen: set[str] = set()
+            changed: list[tuple[str, Path, os.stat_result]] = []
+            for status in statuses:
+                status_dir = self.strategies_path / status
+                try:
+                    entries = list(os.scandir(status_dir))
+                except FileNotFoundError:
+                    continue
+                for entry in entries:
+                    if not entry.name.endswith(".yaml") or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    seen.add(entry.path)
+                    if known.get(entry.path) != (stat.st_mtime_ns, stat.st_size, stat.st_ino):
+                        changed.append((status, Path(entry.path), stat))
+
+            removed = [file for file in known if file not in seen]
+            if not changed and not removed:
+                return
+
+            with conn:
+                for file in removed:
+                    self._delete(conn, file)
+                for status, path, stat in changed:
+                    self._upsert(conn, status, path, stat)
+            logger.debug(f"Strategy index: {len(changed)} updated, {len(removed)} removed")
+
+    def refresh(self, path: Path, status: str) -> None:
+        """Re-index one strategy file, or drop it if it no longer exists."""
+        path = Path(path)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    self._delete(conn, str(path))
+                    return
+                self._upsert(conn, status, path, stat)
+
+    def remove(self, path: Path) -> None:
+        """Drop one strategy file from the index."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._delete(conn, str(Path(path)))
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def locate(self, strategy_id: str) -> tuple[str, Path] | None:
+        """Status and path of the strategy file named strategy_id.
+
+        If a copy of the file sits in more than one status directory, the
+        earliest lifecycle stage wins (pending, validated, invalidated,
+        blocked) rather than whichever status sorts first alphabetically.
+        Rows are trusted as-is; callers check the file still exists.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT status, file FROM strategies WHERE file_id = ? "
+                "ORDER BY CASE status WHEN 'pending' THEN 0 WHEN 'validated' THEN 1 "
+                "WHEN 'invalidated' THEN 2 WHEN 'blocked' THEN 3 ELSE 4 END LIMIT 1",
+                (strategy_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], Path(row[1])
+
+    def query(
+        self,
+        status: str | None = None,
+        tags: list[str] | None = None,
+        sort: str = "created",
+        descending: bool = True,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """Strategy summaries matching the filters.
+
+        Args:
+            status: Only strategies with this status
+            tags: Only strategies having all of these tags
+            sort: Field to sort by (created, id, name or status). Strategies
+                without a created date sort last either way.
+            descending: Sort direction
+            limit: Maximum number of results
+            offset: Results to skip (for paging)
+
+        Returns:
+            Summaries with id, name, status, created, tags and file
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(
+                f"Invalid sort field '{sort}'. Must be one of: {', '.join(sorted(SORT_FIELDS))}"
+            )
+
+        where: list[str] = []
+        params: list[Any] = []
+        if status:
+            where.append("status = ?")
+            params.append(status)
+        if tags:
+            unique = sorted(set(tags))
+            where.append(
+                "file IN (SELECT file FROM strategy_tags WHERE tag IN "
+                f"({','.join('?' * len(unique))}) GROUP BY file HAVING COUNT(*) = ?)"
+            )
+            params.extend(unique)
+            params.append(len(unique))
+
+        direction = "DESC" if descending else "ASC"
+        column = "created_ts" if sort == "created" else sort
+        order = f"{column} IS NULL, {column} {direction}, file_id {direction}"
+
+        sql = "SELECT id, name, status, created, tags, file FROM strategies"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        params.extend([limit if limit is not None else -1, offset])
+
+        with self._lock:
+            rows = self._connect().execute(sql, params).fetchall()
+
+        return [
+            {
+                "id": strategy_id,
+                "name": name,
+                "status": row_status,
+                "created": _created_value(created),
+                "tags": json.loads(row_tags),
+                "file": file,
+            }
+            for strategy_id, name, row_status, created, row_tags, file in rows
+        ]
+
+    def counts(self) -> dict[str, int]:
+        """Number of indexed strategies per status."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT status, COUNT(*) FROM strategies GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in self.statuses}
+        counts.update(dict(rows))
+        return counts
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _upsert(self, conn: sqlite3.Connection, status: str, path: Path, stat: os.stat_result) -> None:
+        file_id = path.stem
+        try:
+            with open(path) as f:
+                data = yaml.safe_load(f) or {}
+            summary = summarize_strategy(data, file_id)
+        except Exception as e:
+            # Keep malformed files visible in listings
+            summary = {"id": file_id, "name": f"<error: {e}>", "created": None, "tags": []}
+
+        file = str(path)
+        conn.execute(
+            "INSERT OR REPLACE INTO strategies "
+            "(file, file_id, status, id, name, created, created_ts, tags, mtime_ns, size, inode) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                file,
+                file_id,
+                status,
+                str(summary["id"]),
+                str(summary["name"]),
+                _created_text(summary["created"]),
+                _created_timestamp(summary["created"]),
+                json.dumps(summary["tags"]),
+                stat.st_mtime_ns,
+                stat.st_size,
+                stat.st_ino,
+            ),
+        )
+        conn.execute("DELETE FROM strategy_tags WHERE file = ?", (file,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO strategy_tags (file, tag) VALUES (?, ?)",
+            [(file, tag) for tag in summary["tags"]],
+        )
+
+    @staticmethod
+    def _delete(conn: sqlite3.Connection, file: str) -> None:
+        conn.execute("DELETE FROM strategies WHERE file = ?", (file,))
+        conn.execute("DELETE FROM strategy_tags WHERE file = ?", (file,))
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database (caller holds the lock)."""
+        if self._conn is not None:
+            return self._conn
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._prepare(conn)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open strategy index at {self.path}, using memory: {e}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._prepare(conn)
+        self._conn = conn
+        return conn
+
+    @staticmethod
+    def _prepare(conn: sqlite3.Connection) -> None:
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != str(INDEX_VERSION):
+            with conn:
+                conn.execute("DELETE FROM strategies")
+                conn.execute("DELETE FROM strategy_tags")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (str(INDEX_VERSION),),
+                )
@@ -12,6 +12,10 @@ A workspace contains all user data separate from the application code:
 - archive/: Archived/rejected strategies
 - logs/: Daily rotating logs
 
+Strategy listing and lookup go through a persistent index
+(.state/strategy_index.sqlite, see strategy_index.py) rather than
+scanning and parsing every strategy file.
+
 The workspace path can be set via:
 1. Explicit path parameter
 2. RESEARCH_WORKSPACE environment variable
@@ -24,13 +28,13 @@ import fcntl
 import json
 import os
 import shutil
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
 from research_system.core.v4.config import V4Config, get_default_config
+from research_system.core.v4.strategy_index import StrategyIndex
 
 
 # =============================================================================
@@ -120,6 +124,7 @@ class Workspace:
         """
         self.path = self._resolve_path(path)
         self._config: V4Config | None = None
+        self._strategy_index: StrategyIndex | None = None
 
     @staticmethod
     def _resolve_path(path: Path | str | None) -> Path:
@@ -470,8 +475,64 @@ class Workspace:
         # Move the file
         shutil.move(str(source_path), str(target_path))
 
+        self.strategy_index.remove(source_path)
+        self.strategy_index.refresh(target_path, to_status)
+
         return target_path
 
+    # =========================================================================
+    # STRATEGY INDEX
+    # =========================================================================
+
+    @property
+    def strategy_index(self) -> StrategyIndex:
+        """Index of strategy files (opened on first use)."""
+        if self._strategy_index is None:
+            self._strategy_index = StrategyIndex.for_workspace(
+                self.path, self.strategies_path, self.VALID_STATUSES
+            )
+        return self._strategy_index
+
+    def refresh_strategy(self, strategy_id: str, status: str = "pending") -> None:
+        """Update the index after writing or deleting a strategy file.
+
+        Code that writes strategy files itself (rather than through
+        move_strategy) calls this so listings see the change without a
+        rescan. Changes it misses are still picked up by the next listing.
+
+        Args:
+            strategy_id: Strategy ID (e.g., "STRAT-001").
+            status: Status directory the file was written to.
+        """
+        self.strategy_index.refresh(self.strategy_path(strategy_id, status), status)
+
+    def strategy_status(self, strategy_id: str) -> str | None:
+        """Get the status directory a strategy is in.
+
+        Args:
+            strategy_id: Strategy ID (e.g., "STRAT-001").
+
+        Returns:
+            Status name, or None if the strategy doesn't exist.
+        """
+        location = self._locate_strategy(strategy_id)
+        return location[0] if location else None
+
+    def _locate_strategy(self, strategy_id: str) -> tuple[str, Path] | None:
+        """Find a strategy file by ID through the index.
+
+        A stale hit (file moved or deleted behind the index's back) or a
+        miss triggers a sync before answering.
+        """
+        location = self.strategy_index.locate(strategy_id)
+        if location is not None and location[1].exists():
+            return location
+        self.strategy_index.sync()
+        location = self.strategy_index.locate(strategy_id)
+        if location is not None and location[1].exists():
+            return location
+        return None
+
     # =========================================================================
     # UTILITY METHODS
     # =========================================================================
@@ -497,13 +558,8 @@ class Workspace:
         self.require_initialized()
 
         # Count strategies by status
-        strategy_counts = {}
-        for status in self.VALID_STATUSES:
-            status_dir = self.strategies_path / status
-            if status_dir.exists():
-                strategy_counts[status] = len(list(status_dir.glob("*.yaml")))
-            else:
-                strategy_counts[status] = 0
+        self.strategy_index.sync()
+        strategy_counts = self.strategy_index.counts()
 
         # Count other items
         idea_count = len(list(self.ideas_path.glob("*.yaml"))) if self.ideas_path.exists() else 0
@@ -530,6 +586,10 @@ class Workspace:
         self,
         status: str | None = None,
         tags: list[str] | None = None,
+        sort: str = "created",
+        descending: bool = True,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[dict[str, Any]]:
         """List strategies in the workspace.
 
@@ -538,79 +598,30 @@ class Workspace:
                     If None, lists all strategies.
             tags: Filter by tags (strategies must have all specified tags).
                   If None, no tag filtering.
+            sort: Field to sort by (created, id, name, status). Defaults to
+                  created date, newest first, with undated strategies last.
+            descending: Sort direction.
+            limit: Maximum number of strategies to return.
+            offset: Number of strategies to skip (for paging).
 
         Returns:
             List of strategy summaries with id, name, status, created, tags.
         """
         self.require_initialized()
 
-        strategies = []
-        statuses_to_check = [status] if status else list(self.VALID_STATUSES)
-
-        for check_status in statuses_to_check:
-            status_dir = self.strategies_path / check_status
-            if not status_dir.exists():
-                continue
-
-            for yaml_file in status_dir.glob("*.yaml"):
-                try:
-                    with open(yaml_file) as f:
-                        data = yaml.safe_load(f) or {}
-
-                    # Extract summary fields
-                    strategy_id = data.get("id", yaml_file.stem)
-                    name = data.get("name", "Unknown")
-                    created = data.get("created")
-                    strategy_tags = data.get("tags", {})
-
-                    # Handle tags - could be dict with 'custom' key or list
-                    if isinstance(strategy_tags, dict):
-                        tag_list = strategy_tags.get("custom", [])
-                    elif isinstance(strategy_tags, list):
-                        tag_list = strategy_tags
-                    else:
-                        tag_list = []
-
-                    # Apply tag filter
-                    if tags:
-                        if not all(t in tag_list for t in tags):
-                            continue
-
-                    # Parse created date if string
-                    if isinstance(created, str):
-                        try:
-                            created = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                        except ValueError:
-                            pass
-
-                    strategies.append({
-                        "id": strategy_id,
-                        "name": name,
-                        "status": check_status,
-                        "created": created,
-                        "tags": tag_list,
-                        "file": str(yaml_file),
-                    })
-
-                except Exception as e:
-                    # Skip malformed files but log them
-                    strategies.append({
-                        "id": yaml_file.stem,
-                        "name": f"<error: {e}>",
-                        "status": check_status,
-                        "created": None,
-                        "tags": [],
-                        "file": str(yaml_file),
-                    })
-
-        # Sort by created date (newest first), with None dates at the end
-        strategies.sort(
-            key=lambda s: (s["created"] is None, s["created"] or datetime.min),
-            reverse=True
+        if status and status not in self.VALID_STATUSES:
+            return []
+
+        self.strategy_index.sync([status] if status else None)
+        return self.strategy_index.query(
+            status=status,
+            tags=tags,
+            sort=sort,
+            descending=descending,
+            limit=limit,
+            offset=offset,
         )
 
-        return strategies
-
     def get_strategy(self, strategy_id: str) -> dict[str, Any] | None:
         """Get a strategy by ID.
 
@@ -622,17 +633,16 @@ class Workspace:
         """
         self.require_initialized()
 
-        # Search all status directories
-        for status in self.VALID_STATUSES:
-            yaml_file = self.strategies_path / status / f"{strategy_id}.yaml"
-            if yaml_file.exists():
-                with open(yaml_file) as f:
-                    data = yaml.safe_load(f) or {}
-                data["_file"] = str(yaml_file)
-                data["_status"] = status
-                return data
+        location = self._locate_strategy(strategy_id)
+        if location is None:
+            return None
 
-        return None
+        status, yaml_file = location
+        with open(yaml_file) as f:
+            data = yaml.safe_load(f) or {}
+        data["_file"] = str(yaml_file)
+        data["_status"] = status
+        return data
 
 
 # =============================================================================
@@ -5,6 +5,14 @@ from datetime import datetime
 from pathlib import Path
 
 from research_system.db.connection import init_database
+from research_system.db.search import (
+    SEARCH_WEIGHTS,
+    build_match_expression,
+    ensure_search_index,
+    index_entry,
+    parse_search_query,
+    rebuild_search_index,
+)
 from research_system.schemas.common import EntryStatus, EntryType
 from research_system.schemas.proposal import Proposal, ProposalStatus
 from research_system.schemas.strategy import StrategyDefinition
@@ -65,6 +73,7 @@ class CatalogManager:
 
         # Initialize database
         self._db = init_database(self.db_path)
+        self._has_fts = ensure_search_index(self._db)
 
     def close(self) -> None:
         """Close database connection."""
@@ -134,11 +143,13 @@ class CatalogManager:
             )
 
             # Add tags
-            for tag in strategy.metadata.tags:
-                cursor.execute(
-                    "INSERT INTO entry_tags (entry_id, tag) VALUES (?, ?)",
-                    (entry_id, tag),
-                )
+            cursor.executemany(
+                "INSERT INTO entry_tags (entry_id, tag) VALUES (?, ?)",
+                [(entry_id, tag) for tag in strategy.metadata.tags],
+            )
+
+            if self._has_fts:
+                index_entry(cursor, entry_id)
 
         return entry_id
 
@@ -366,6 +377,89 @@ class CatalogManager:
 
         return entries
 
+    def search_entries(
+        self,
+        query: str,
+        fields: list[str] | None = None,
+        status: EntryStatus | None = None,
+        entry_type: EntryType | None = None,
+        limit: int = 20,
+    ) -> list[CatalogEntry]:
+        """Full-text search over entries, best match first.
+
+        Every word must match a whole word (case-insensitive). A trailing *
+        matches a prefix ("mom*") and field:word restricts a word to one
+        column ("tags:breadth").
+
+        Args:
+            query: Search query
+            fields: Columns searched by words without a field: prefix
+                (default: name, description, strategy_type, tags)
+            status: Filter by status
+            entry_type: Filter by type
+            limit: Max results
+
+        Returns:
+            List of matching entries
+        """
+        terms = parse_search_query(query)
+        if not terms:
+            return []
+
+        conditions = []
+        params: list = []
+
+        if status:
+            conditions.append("e.status = ?")
+            params.append(status.value)
+
+        if entry_type:
+            conditions.append("e.type = ?")
+            params.append(entry_type.value)
+
+        if self._has_fts:
+            weights = ", ".join(str(w) for w in SEARCH_WEIGHTS)
+            conditions.append("entries_fts MATCH ?")
+            params.append(build_match_expression(terms, fields))
+            sql = f"""
+                SELECT e.* FROM entries_fts
+                JOIN entries e ON e.id = entries_fts.entry_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY bm25(entries_fts, {weights}), e.id
+                LIMIT ?
+            """
+        else:
+            # No FTS5 in this SQLite build: substring match on name/description
+            for term in terms:
+                columns = [term.field] if term.field in ("name", "description") else [
+                    "name", "description"
+                ]
+                conditions.append(
+                    "(" + " OR ".join(f"LOWER(e.{c}) LIKE ?" for c in columns) + ")"
+                )
+                params.extend([f"%{term.text}%"] * len(columns))
+            sql = f"""
+                SELECT e.* FROM entries e
+                WHERE {" AND ".join(conditions)}
+                ORDER BY e.created_at DESC
+                LIMIT ?
+            """
+        params.append(limit)
+
+        rows = self._db.execute(sql, tuple(params)).fetchall()
+        entries = [self.get_entry(row["id"]) for row in rows]
+        return [entry for entry in entries if entry is not None]
+
+    def rebuild_search_index(self) -> int:
+        """Re-create the full-text index from the entries table.
+
+        Returns:
+            Number of entries indexed (0 if full-text search is unavailable)
+        """
+        if not self._has_fts:
+            return 0
+        return rebuild_search_index(self._db)
+
     def count_entries(
         self,
         status: EntryStatus | None = None,
@@ -454,18 +548,18 @@ class CatalogManager:
             assert validation_id is not None  # SQLite guarantees this after INSERT
 
             # Insert window results
-            for window in result.walk_forward_results:
-                cursor.execute(
-                    """
-                    INSERT INTO window_results (
-                        validation_id, window_id, start_date, end_date,
-                        cagr, sharpe, sortino, max_drawdown, win_rate,
-                        profit_factor, trades, volatility,
-                        benchmark_cagr, benchmark_sharpe,
-                        regime_direction, regime_volatility, regime_rates,
-                        regime_sector, regime_cap
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+            cursor.executemany(
+                """
+                INSERT INTO window_results (
+                    validation_id, window_id, start_date, end_date,
+                    cagr, sharpe, sortino, max_drawdown, win_rate,
+                    profit_factor, trades, volatility,
+                    benchmark_cagr, benchmark_sharpe,
+                    regime_direction, regime_volatility, regime_rates,
+                    regime_sector, regime_cap
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
                     (
                         validation_id,
                         window.window_id,
@@ -490,8 +584,10 @@ class CatalogManager:
                         window.regime_tags.cap_leadership.value
                         if window.regime_tags.cap_leadership
                         else None,
-                    ),
-                )
+                    )
+                    for window in result.walk_forward_results
+                ],
+            )
 
             # Update entry status based on validation
             new_status = EntryStatus.VALIDATED if result.is_valid() else EntryStatus.INVALIDATED
@@ -1,6 +1,17 @@
-"""Database connection management for research-kit."""
+"""Database connection management for research-kit.
+
+Each thread gets its own SQLite connection, so one DatabaseConnection can
+be shared by parallel workers. File databases use WAL journaling: readers
+never block on a writer, and writers queue on the busy timeout instead of
+failing with "database is locked". Transactions start with BEGIN IMMEDIATE
+so a writer takes the write lock up front, where the busy timeout applies,
+rather than failing when a read transaction is upgraded. Each connection
+keeps a cache of prepared statements, so repeated queries are not
+re-parsed.
+"""
 
 import sqlite3
+import threading
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -8,40 +19,94 @@ from pathlib import Path
 # Get the schema SQL file path
 SCHEMA_PATH = Path(__file__).parent / "schema.sql"
 
+# Seconds a connection waits for another writer before raising "database is locked"
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# Prepared statements kept per connection
+STATEMENT_CACHE_SIZE = 256
+
+MEMORY_DATABASE = ":memory:"
 
-class DatabaseConnection:
-    """Manages SQLite database connections."""
 
-    def __init__(self, db_path: Path | str):
+class DatabaseConnection:
+    """Manages SQLite database connections (one per thread)."""
+
+    def __init__(
+        self,
+        db_path: Path | str,
+        timeout: float = BUSY_TIMEOUT_SECONDS,
+        wal: bool = True,
+    ):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file
+            timeout: Seconds to wait for a lock held by another connection
+            wal: Use write-ahead-log journaling (file databases only)
         """
         self.db_path = Path(db_path)
-        self._connection: sqlite3.Connection | None = None
+        self.timeout = timeout
+        self.wal = wal
+
+        # An in-memory database exists only within its connection, so all
+        # threads have to share one
+        self._shared = str(db_path) == MEMORY_DATABASE
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get or create a database connection."""
-        if self._connection is None:
-            self._connection = sqlite3.connect(self.db_path)
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
-            # Return rows as dictionaries
-            self._connection.row_factory = sqlite3.Row
-        return self._connection
+        """Get or create the calling thread's database connection."""
+        if self._shared:
+            with self._lock:
+                if self._connections:
+                    return self._connections[0]
+                conn = self._connect()
+                self._connections.append(conn)
+                return conn
+
+        local_conn: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if local_conn is None:
+            local_conn = self._connect()
+            self._local.connection = local_conn
+            with self._lock:
+                self._connections.append(local_conn)
+        return local_conn
+
+    def _connect(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close() can close every thread's
+        # connection; each connection is otherwise used by its own thread
+        conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=self.timeout,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+        )
+        if self.wal and not self._shared:
+            conn.execute("PRAGMA journal_mode = WAL")
+            # Durable at checkpoints; a crash can lose only the last commits
+            conn.execute("PRAGMA synchronous = NORMAL")
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Return rows as dictionaries
+        conn.row_factory = sqlite3.Row
+        return conn
 
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
         """Context manager for database transactions.
 
-        Automatically commits on success, rolls back on error.
+        Automatically commits on success, rolls back on error. The write
+        lock is taken when the transaction starts, waiting up to the busy
+        timeout for other writers.
 
         Example:
             with db.transaction() as cursor:
                 cursor.execute("INSERT INTO ...")
         """
         conn = self._get_connection()
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
         cursor = conn.cursor()
         try:
             yield cursor
@@ -88,21 +153,42 @@ class DatabaseConnection:
         conn = self._get_connection()
         return conn.executemany(sql, params_list)
 
+    def executescript(self, sql: str) -> sqlite3.Cursor:
+        """Execute a SQL script (commits any pending transaction first).
+
+        Args:
+            sql: SQL statements
+
+        Returns:
+            Cursor
+        """
+        conn = self._get_connection()
+        return conn.executescript(sql)
+
     def commit(self) -> None:
-        """Commit current transaction."""
-        if self._connection:
-            self._connection.commit()
+        """Commit the calling thread's current transaction."""
+        conn = self._current_connection()
+        if conn:
+            conn.commit()
 
     def rollback(self) -> None:
-        """Rollback current transaction."""
-        if self._connection:
-            self._connection.rollback()
+        """Rollback the calling thread's current transaction."""
+        conn = self._current_connection()
+        if conn:
+            conn.rollback()
+
+    def _current_connection(self) -> sqlite3.Connection | None:
+        if self._shared:
+            return self._connections[0] if self._connections else None
+        return getattr(self._local, "connection", None)
 
     def close(self) -> None:
-        """Close the database connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
+        """Close the database connections of all threads."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
 
     def __enter__(self) -> "DatabaseConnection":
         """Enter context manager."""
@@ -129,18 +215,19 @@ def init_database(db_path: Path | str, schema_path: Path | None = None) -> Datab
     # Create parent directory if needed
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Check if database already exists
-    db_exists = db_path.exists()
-
     db = DatabaseConnection(db_path)
 
-    if not db_exists:
-        # Apply schema to new database
+    initialized = db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ).fetchone()
+
+    if not initialized:
+        # Apply schema to new database. The schema is idempotent, so a
+        # process that loses the race to initialize applies it as a no-op.
         with open(schema_path) as f:
             schema_sql = f.read()
 
-        with db.transaction() as cursor:
-            cursor.executescript(schema_sql)
+        db.executescript(f"BEGIN IMMEDIATE;\n{schema_sql}\nCOMMIT;")
 
     return db
 
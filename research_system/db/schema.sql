@@ -8,7 +8,7 @@ CREATE TABLE IF NOT EXISTS schema_version (
     description TEXT
 );
 
-INSERT INTO schema_version (version, description) VALUES (1, 'Initial v2.0 schema');
+INSERT OR IGNORE INTO schema_version (version, description) VALUES (1, 'Initial v2.0 schema');
 
 -- Catalog entries
 CREATE TABLE IF NOT EXISTS entries (
@@ -0,0 +1,134 @@
+"""Full-text search index for the catalog database.
+
+Entries are indexed in an FTS5 virtual table, entries_fts, with one row per
+entry covering its name, description, strategy type and tags. The table is
+created on open rather than in schema.sql so that databases created before
+it existed gain it, and so a SQLite build without FTS5 still opens the
+catalog (search then falls back to LIKE matching).
+
+Queries use the syntax of research_system.core.text_search (words,
+prefix*, field:word) and are translated into FTS5 MATCH expressions, so user
+input never reaches the FTS5 query parser directly.
+"""
+
+import sqlite3
+
+from research_system.core.text_search import QueryTerm, parse_query
+from research_system.db.connection import DatabaseConnection
+
+# Searchable columns of entries_fts, in table order after entry_id
+SEARCH_COLUMNS = ("name", "description", "strategy_type", "tags")
+
+# bm25() weight per column, entry_id first
+SEARCH_WEIGHTS = (0.0, 2.0, 1.0, 1.0, 1.5)
+
+SEARCH_SCHEMA_VERSION = 2
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    entry_id UNINDEXED,
+    name,
+    description,
+    strategy_type,
+    tags,
+    tokenize = 'unicode61'
+)
+"""
+
+
+def ensure_search_index(db: DatabaseConnection) -> bool:
+    """Create the full-text index if missing, populating it from entries.
+
+    Args:
+        db: Database connection
+
+    Returns:
+        True if full-text search is available, False if SQLite lacks FTS5
+    """
+    exists = db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entries_fts'"
+    ).fetchone()
+    if exists:
+        return True
+
+    try:
+        with db.transaction() as cursor:
+            cursor.execute(FTS_SCHEMA)
+            cursor.execute(
+                "INSERT OR IGNORE INTO schema_version (version, description) VALUES (?, ?)",
+                (SEARCH_SCHEMA_VERSION, "Full-text search index"),
+            )
+    except sqlite3.OperationalError:
+        return False
+
+    rebuild_search_index(db)
+    return True
+
+
+def index_entry(cursor: sqlite3.Cursor, entry_id: str) -> None:
+    """Replace an entry's row in the full-text index from entries/entry_tags.
+
+    Args:
+        cursor: Cursor inside the caller's transaction
+        entry_id: Entry to (re)index
+    """
+    cursor.execute("DELETE FROM entries_fts WHERE entry_id = ?", (entry_id,))
+    cursor.execute(
+        """
+        INSERT INTO entries_fts (entry_id, name, description, strategy_type, tags)
+        SELECT e.id, e.name, e.description, e.strategy_type,
+               (SELECT group_concat(tag, ' ') FROM entry_tags WHERE entry_id = e.id)
+        FROM entries e
+        WHERE e.id = ?
+        """,
+        (entry_id,),
+    )
+
+
+def rebuild_search_index(db: DatabaseConnection) -> int:
+    """Re-create every row of the full-text index.
+
+    Args:
+        db: Database connection
+
+    Returns:
+        Number of entries indexed
+    """
+    with db.transaction() as cursor:
+        cursor.execute("DELETE FROM entries_fts")
+        cursor.execute(
+            """
+            INSERT INTO entries_fts (entry_id, name, description, strategy_type, tags)
+            SELECT e.id, e.name, e.description, e.strategy_type,
+                   (SELECT group_concat(tag, ' ') FROM entry_tags WHERE entry_id = e.id)
+            FROM entries e
+            """
+        )
+        return cursor.rowcount
+
+
+def build_match_expression(terms: list[QueryTerm], fields: list[str] | None = None) -> str:
+    """Translate parsed query terms into an FTS5 MATCH expression.
+
+    Args:
+        terms: Terms from parse_query()
+        fields: Columns searched by terms without a field (default: all)
+
+    Returns:
+        MATCH expression with every term quoted
+    """
+    default_columns = [c for c in (fields or SEARCH_COLUMNS) if c in SEARCH_COLUMNS]
+    default_columns = default_columns or list(SEARCH_COLUMNS)
+    parts = []
+    for term in terms:
+        columns = [term.field] if term.field else default_columns
+        phrase = '"' + term.text.replace('"', '""') + '"'
+        if term.prefix:
+            phrase += " *"
+        parts.append("{" + " ".join(columns) + "} : " + phrase)
+    return " AND ".join(parts)
+
+
+def parse_search_query(query: str) -> list[QueryTerm]:
+    """Parse a query, recognising field:word for the indexed columns."""
+    return parse_query(query, SEARCH_COLUMNS)
@@ -9,10 +9,12 @@ V4 Ingest:
 - V4IngestProcessor - Process inbox files into V4 strategy documents
 - V4IngestResult - Result of processing a single file
 - V4IngestSummary - Summary of batch ingestion
+- ContentIndex - Content hash -> strategy ID dedup index
 """
 
 from research_system.ingest.processor import IngestProcessor, IngestResult
 from research_system.ingest.extractor import MetadataExtractor
+from research_system.ingest.dedup import ContentIndex
 from research_system.ingest.strategy_processor import (
     V4IngestProcessor,
     V4IngestResult,
@@ -36,4 +38,5 @@ __all__ = [
     "StrategyIngestProcessor",
     "StrategyIngestResult",
     "StrategyIngestSummary",
+    "ContentIndex",
 ]
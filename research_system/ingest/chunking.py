@@ -0,0 +1,234 @@
+"""Streaming document reading and chunking for ingestion.
+
+Long papers and multi-hour transcripts don't fit in a single extraction
+prompt. This module reads documents section by section (PDF pages, HTML
+blocks, text paragraphs) without materialising the whole parsed document,
+and splits the text into chunks small enough for a cheap per-chunk pass.
+
+- iter_sections() yields (label, text) pairs as the file is read: one per
+  PDF page, HTML block element or blank-line separated paragraph. PDF page
+  objects are released as soon as their text is extracted and HTML is
+  parsed in fixed-size reads.
+- read_document() joins sections, optionally stopping at a character limit
+  so callers that only need a prefix never read the rest.
+- chunk_text() splits already-read text into chunks on paragraph (and so
+  page) boundaries.
+"""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Iterable, Iterator
+
+# Default chunk size for per-chunk passes (characters)
+DEFAULT_CHUNK_CHARS = 12000
+
+# Bytes read per step when streaming HTML
+HTML_READ_SIZE = 64 * 1024
+
+PDF_SUFFIXES = {".pdf"}
+HTML_SUFFIXES = {".html", ".htm"}
+
+# Block-level tags that end a section of HTML text
+_HTML_BLOCK_TAGS = {
+    "p", "div", "br", "li", "tr", "section", "article", "blockquote", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6",
+}
+_HTML_SKIP_TAGS = {"script", "style", "head", "noscript", "template"}
+
+
+@dataclass
+class Chunk:
+    """A contiguous piece of a document."""
+
+    index: int
+    text: str
+
+
+class PDFLibraryMissing(ImportError):
+    """Neither pdfplumber nor pypdf is installed."""
+
+
+def iter_sections(file_path: Path, max_pages: int | None = None) -> Iterator[tuple[str, str]]:
+    """Yield (label, text) sections of a document as it is read.
+
+    Args:
+        file_path: Document to read
+        max_pages: For PDFs, stop after this many pages
+
+    Raises:
+        PDFLibraryMissing: For PDFs when no PDF library is installed
+    """
+    suffix = file_path.suffix.lower()
+    if suffix in PDF_SUFFIXES:
+        yield from _iter_pdf_pages(file_path, max_pages)
+    elif suffix in HTML_SUFFIXES:
+        yield from _iter_html_blocks(file_path)
+    else:
+        yield from _iter_paragraphs(file_path)
+
+
+def read_document(
+    file_path: Path,
+    max_chars: int | None = None,
+    max_pages: int | None = None,
+) -> str:
+    """Read a document's text, sections separated by blank lines.
+
+    Args:
+        file_path: Document to read
+        max_chars: Stop reading once at least this many characters are read
+        max_pages: For PDFs, stop after this many pages
+    """
+    parts: list[str] = []
+    total = 0
+    for _, text in iter_sections(file_path, max_pages=max_pages):
+        parts.append(text)
+        total += len(text) + 2
+        if max_chars is not None and total >= max_chars:
+            break
+    return "\n\n".join(parts)
+
+
+def chunk_text(text: str, max_chars: int = DEFAULT_CHUNK_CHARS) -> list[Chunk]:
+    """Split text into chunks of at most max_chars on paragraph boundaries.
+
+    Paragraphs longer than max_chars are split at the last whitespace
+    before the limit (or hard-split if there is none).
+    """
+    paragraphs = (p for p in text.split("\n\n") if p.strip())
+    return list(_pack(paragraphs, max_chars))
+
+
+def _pack(pieces: Iterable[str], max_chars: int) -> Iterator[Chunk]:
+    index = 0
+    buffer: list[str] = []
+    size = 0
+    for piece in pieces:
+        for part in _split_long(piece, max_chars):
+            added = len(part) + (2 if buffer else 0)
+            if buffer and size + added > max_chars:
+                yield Chunk(index, "\n\n".join(buffer))
+                index += 1
+                buffer, size = [], 0
+                added = len(part)
+            buffer.append(part)
+            size += added
+    if buffer:
+        yield Chunk(index, "\n\n".join(buffer))
+
+
+def _split_long(text: str, max_chars: int) -> Iterator[str]:
+    while len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        if cut <= 0:
+            cut = max_chars
+        yield text[:cut].rstrip()
+        text = text[cut:].lstrip()
+    if text.strip():
+        yield text
+
+
+def _iter_pdf_pages(file_path: Path, max_pages: int | None) -> Iterator[tuple[str, str]]:
+    try:
+        import pdfplumber
+    except ImportError:
+        pdfplumber = None
+
+    if pdfplumber is not None:
+        with pdfplumber.open(file_path) as pdf:
+            for number, page in enumerate(itertools.islice(pdf.pages, max_pages), 1):
+                text = page.extract_text() or ""
+                # Drop the page's parsed objects before moving on
+                # (close() on pdfplumber >= 0.10, flush_cache() before)
+                getattr(page, "close", page.flush_cache)()
+                if text.strip():
+                    yield f"page {number}", text
+        return
+
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise PDFLibraryMissing("Install pdfplumber or pypdf to read PDF files") from None
+
+    reader = PdfReader(file_path)
+    for number, page in enumerate(itertools.islice(reader.pages, max_pages), 1):
+        text = page.extract_text() or ""
+        if text.strip():
+            yield f"page {number}", text
+
+
+def _iter_paragraphs(file_path: Path) -> Iterator[tuple[str, str]]:
+    number = 0
+    lines: list[str] = []
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.strip():
+                lines.append(line.rstrip("\n"))
+                continue
+            if lines:
+                number += 1
+                yield f"paragraph {number}", "\n".join(lines)
+                lines = []
+    if lines:
+        number += 1
+        yield f"paragraph {number}", "\n".join(lines)
+
+
+class _BlockTextParser(HTMLParser):
+    """Collects visible text, closing a block at block-level tags."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[str] = []
+        self._current: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in _HTML_BLOCK_TAGS:
+            self._close_block()
+
+    def handle_endtag(self, tag):
+        if tag in _HTML_SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in _HTML_BLOCK_TAGS:
+            self._close_block()
+
+    def handle_data(self, data):
+        if self._skip_depth == 0:
+            text = data.strip()
+            if text:
+                self._current.append(text)
+
+    def _close_block(self):
+        if self._current:
+            self.blocks.append(" ".join(self._current))
+            self._current = []
+
+    def close(self):
+        super().close()
+        self._close_block()
+
+
+def _iter_html_blocks(file_path: Path) -> Iterator[tuple[str, str]]:
+    parser = _BlockTextParser()
+    number = 0
+    with open(file_path, encoding="utf-8", errors="replace") as f:
+        while True:
+            data = f.read(HTML_READ_SIZE)
+            if not data:
+                break
+            parser.feed(data)
+            for block in parser.blocks:
+                number += 1
+                yield f"block {number}", block
+            parser.blocks = []
+    parser.close()
+    for block in parser.blocks:
+        number += 1
+        yield f"block {number}", block
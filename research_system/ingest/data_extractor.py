@@ -2,17 +2,32 @@
 Data file metadata extraction.
 
 Parses data files (.csv, .xlsx, .parquet, .json) to extract:
-- Structural info: columns, row count, date range
+- Structural info: columns, row count, date range, per-column statistics
 - Uses LLM to generate: name, type classification, description, tags
+
+CSV, Parquet and JSON files are profiled without loading them: CSV rows
+are counted over a memory map and only the head and tail are parsed,
+Parquet is read from its footer metadata and row-group statistics, and
+JSON arrays are decoded incrementally (see profiling.py).
 """
 
 import csv
+import itertools
 import json
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from research_system.ingest.profiling import (
+    ColumnProfiler,
+    ColumnStats,
+    count_lines,
+    iter_json_array,
+    merge_statistics,
+    read_head_rows,
+    read_tail_rows,
+)
 from research_system.llm.client import LLMClient
 
 
@@ -36,6 +51,7 @@ Format: {format}
 Columns: {columns}
 Row count: {row_count}
 Date range: {date_range}
+Column ranges: {column_stats}
 
 Sample rows (first 5):
 {sample_rows}
@@ -60,6 +76,10 @@ class DataFileInfo:
     date_column: Optional[str] = None
     date_range: Optional[Tuple[str, str]] = None  # (start, end)
     file_format: str = "csv"
+    # Null counts and min/max per column, and how many rows they cover
+    # (row_count unless only the head and tail of the file were profiled)
+    column_stats: Dict[str, ColumnStats] = field(default_factory=dict)
+    profiled_rows: int = 0
 
 
 @dataclass
@@ -86,7 +106,12 @@ class DataFileExtractor:
 
     # Maximum rows to read for sampling
     MAX_SAMPLE_ROWS = 5
-    MAX_ROWS_FOR_RANGE = 100000  # Read up to this many rows to find date range
+
+    # Rows parsed from each end of a CSV file for sampling and statistics
+    PROFILE_ROWS = 1000
+
+    # Rows per vectorized statistics update when streaming JSON
+    PROFILE_BLOCK_ROWS = 10000
 
     def __init__(self, llm_client: Optional[LLMClient] = None):
         """
@@ -174,50 +199,55 @@ class DataFileExtractor:
         )
 
     def _parse_csv(self, file_path: Path) -> DataFileInfo:
-        """Parse a CSV file."""
+        """
+        Profile a CSV file from its head and tail.
+
+        Files larger than PROFILE_ROWS rows are counted by newlines rather
+        than parsed, so quoted fields containing line breaks inflate the
+        count; smaller files are counted exactly.
+        """
         with open(file_path, 'r', encoding='utf-8', errors='replace', newline='') as f:
             # Try to detect delimiter
             sample = f.read(8192)
-            f.seek(0)
-
-            try:
-                dialect = csv.Sniffer().sniff(sample)
-            except csv.Error:
-                dialect = csv.excel  # Default to comma-separated
-
-            reader = csv.DictReader(f, dialect=dialect)
-            columns = reader.fieldnames or []
-
-            sample_rows = []
-            row_count = 0
-            first_date = None
-            last_date = None
-            date_col = self._detect_date_column(columns, [])
-
-            for row in reader:
-                row_count += 1
-                if len(sample_rows) < self.MAX_SAMPLE_ROWS:
-                    sample_rows.append(dict(row))
-
-                # Track date range
-                if date_col and date_col in row and row_count <= self.MAX_ROWS_FOR_RANGE:
-                    date_val = row[date_col]
-                    if date_val:
-                        if first_date is None:
-                            first_date = date_val
-                        last_date = date_val
 
+        try:
+            dialect = csv.Sniffer().sniff(sample)
+        except csv.Error:
+            dialect = csv.excel  # Default to comma-separated
+
+        columns, head_rows, complete, head_end = read_head_rows(
+            file_path, dialect, self.PROFILE_ROWS
+        )
+        if complete:
+            row_count = len(head_rows)
+            tail_rows = []
+        else:
+            row_count = max(0, count_lines(file_path) - 1)
+            tail_rows = read_tail_rows(
+                file_path, dialect, columns, self.PROFILE_ROWS, after=head_end
+            )
+
+        date_col = self._detect_date_column(columns, [])
         date_range = None
-        if first_date and last_date:
-            date_range = (str(first_date), str(last_date))
+        if date_col:
+            dates = [row.get(date_col) for row in head_rows + tail_rows]
+            first_date = next((d for d in dates if d), None)
+            last_date = next((d for d in reversed(dates) if d), None)
+            if first_date and last_date:
+                date_range = (str(first_date), str(last_date))
+
+        profiler = ColumnProfiler(columns)
+        profiler.update(head_rows + tail_rows)
 
         return DataFileInfo(
             columns=list(columns),
             row_count=row_count,
-            sample_rows=sample_rows,
+            sample_rows=head_rows[:self.MAX_SAMPLE_ROWS],
             date_column=date_col,
             date_range=date_range,
-            file_format="csv"
+            file_format="csv",
+            column_stats=profiler.result(),
+            profiled_rows=profiler.rows,
         )
 
     def _parse_excel(self, file_path: Path) -> DataFileInfo:
@@ -270,72 +300,127 @@ class DataFileExtractor:
         )
 
     def _parse_parquet(self, file_path: Path) -> DataFileInfo:
-        """Parse a Parquet file."""
+        """
+        Profile a Parquet file from its footer.
+
+        Row count and column statistics come from the file metadata; only
+        the first batch of rows is read, for samples. The date range is the
+        date column's min/max, falling back to reading that column from the
+        first and last row groups when statistics weren't written.
+        """
         try:
             import pyarrow.parquet as pq
         except ImportError:
             raise ImportError("pyarrow required for Parquet files: pip install pyarrow")
 
-        table = pq.read_table(file_path)
-        columns = table.column_names
-        row_count = table.num_rows
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        columns = list(parquet_file.schema_arrow.names)
+        row_count = metadata.num_rows
 
-        # Get sample rows
-        sample_table = table.slice(0, min(self.MAX_SAMPLE_ROWS, row_count))
-        sample_rows = sample_table.to_pylist()
+        sample_rows = []
+        if row_count > 0:
+            batches = parquet_file.iter_batches(batch_size=self.MAX_SAMPLE_ROWS)
+            sample_rows = next(batches).to_pylist()
+
+        # Merge row-group statistics per column; leaf columns of nested
+        # types are skipped
+        column_stats = {col: ColumnStats() for col in columns}
+        complete = {col: True for col in columns}
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            for i in range(row_group.num_columns):
+                chunk = row_group.column(i)
+                name = chunk.path_in_schema
+                if name not in column_stats:
+                    continue
+                stats = chunk.statistics
+                if stats is None or not stats.has_min_max:
+                    complete[name] = False
+                    merge_statistics(
+                        column_stats[name],
+                        stats.null_count if stats is not None and stats.has_null_count else None,
+                        None, None,
+                    )
+                    continue
+                merge_statistics(
+                    column_stats[name],
+                    stats.null_count if stats.has_null_count else None,
+                    stats.min, stats.max,
+                )
 
-        # Detect date column and range
         date_col = self._detect_date_column(columns, sample_rows)
         date_range = None
 
         if date_col and row_count > 0:
-            # Read first and last values for date range
-            col_data = table.column(date_col)
-            first_val = col_data[0].as_py() if len(col_data) > 0 else None
-            last_val = col_data[-1].as_py() if len(col_data) > 0 else None
+            if complete[date_col] and column_stats[date_col].min is not None:
+                first_val = column_stats[date_col].min
+                last_val = column_stats[date_col].max
+            else:
+                first_col = parquet_file.read_row_group(0, columns=[date_col]).column(0)
+                last_col = parquet_file.read_row_group(
+                    metadata.num_row_groups - 1, columns=[date_col]
+                ).column(0)
+                first_val = first_col[0].as_py() if len(first_col) > 0 else None
+                last_val = last_col[-1].as_py() if len(last_col) > 0 else None
             if first_val and last_val:
                 date_range = (str(first_val), str(last_val))
 
         return DataFileInfo(
-            columns=list(columns),
+            columns=columns,
             row_count=row_count,
             sample_rows=sample_rows,
             date_column=date_col,
             date_range=date_range,
-            file_format="parquet"
+            file_format="parquet",
+            column_stats=column_stats,
+            profiled_rows=row_count,
         )
 
     def _parse_json(self, file_path: Path) -> DataFileInfo:
         """
         Parse a JSON data file.
 
-        Expects array of objects: [{"col1": val1, ...}, ...]
+        Expects array of objects: [{"col1": val1, ...}, ...]. The array is
+        decoded one element at a time, so memory stays flat however long
+        it is.
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        elements = iter_json_array(file_path)
+        first = next(elements, None)
 
-        if not isinstance(data, list):
-            raise ValueError("JSON data file must be an array of objects")
-
-        if not data:
+        if first is None:
             return DataFileInfo(columns=[], row_count=0, file_format="json")
 
-        if not isinstance(data[0], dict):
+        if not isinstance(first, dict):
             raise ValueError("JSON data file must contain objects (dicts)")
 
         # Get columns from first object
-        columns = list(data[0].keys())
-        row_count = len(data)
-
-        sample_rows = data[:self.MAX_SAMPLE_ROWS]
+        columns = list(first.keys())
+        date_col = self._detect_date_column(columns, [first])
+
+        profiler = ColumnProfiler(columns)
+        sample_rows: List[Dict[str, Any]] = []
+        row_count = 0
+        last = first
+
+        rows = itertools.chain([first], elements)
+        while True:
+            block = list(itertools.islice(rows, self.PROFILE_BLOCK_ROWS))
+            if not block:
+                break
+            for row in block:
+                if not isinstance(row, dict):
+                    raise ValueError("JSON data file must contain objects (dicts)")
+            if len(sample_rows) < self.MAX_SAMPLE_ROWS:
+                sample_rows.extend(block[:self.MAX_SAMPLE_ROWS - len(sample_rows)])
+            profiler.update(block)
+            row_count += len(block)
+            last = block[-1]
 
-        # Detect date column and range
-        date_col = self._detect_date_column(columns, sample_rows)
         date_range = None
-
-        if date_col and row_count > 0:
-            first_val = data[0].get(date_col)
-            last_val = data[-1].get(date_col)
+        if date_col:
+            first_val = first.get(date_col)
+            last_val = last.get(date_col)
             if first_val and last_val:
                 date_range = (str(first_val), str(last_val))
 
@@ -345,7 +430,9 @@ class DataFileExtractor:
             sample_rows=sample_rows,
             date_column=date_col,
             date_range=date_range,
-            file_format="json"
+            file_format="json",
+            column_stats=profiler.result(),
+            profiled_rows=profiler.rows,
         )
 
     def _detect_date_column(self, columns: List[str], sample_rows: List[Dict]) -> Optional[str]:
@@ -390,13 +477,15 @@ class DataFileExtractor:
             columns=", ".join(file_info.columns),
             row_count=file_info.row_count,
             date_range=date_range_str,
+            column_stats=self._format_column_stats(file_info),
             sample_rows=sample_str
         )
 
         response = self.llm_client.generate_haiku(
             user=prompt,
             system=DATA_EXTRACTION_SYSTEM_PROMPT,
-            max_tokens=512
+            max_tokens=512,
+            caller="ingest.data"
         )
 
         if response.offline:
@@ -420,6 +509,27 @@ class DataFileExtractor:
 
         return metadata
 
+    @staticmethod
+    def _format_column_stats(file_info: DataFileInfo, limit: int = 8) -> str:
+        """One-line summary of column ranges for the LLM prompt."""
+        parts = []
+        for col, stats in list(file_info.column_stats.items())[:limit]:
+            if stats.min is None:
+                continue
+            low, high = stats.min, stats.max
+            if stats.numeric:
+                low, high = f"{low:g}", f"{high:g}"
+            part = f"{col} [{low} .. {high}]"
+            if stats.null_count:
+                part += f" ({stats.null_count} null)"
+            parts.append(part)
+        if not parts:
+            return "Unknown"
+        summary = "; ".join(parts)
+        if file_info.profiled_rows < file_info.row_count:
+            summary += f" (from {file_info.profiled_rows} of {file_info.row_count} rows)"
+        return summary
+
 
 def is_data_json(file_path: Path) -> bool:
     """
@@ -430,24 +540,18 @@ def is_data_json(file_path: Path) -> bool:
     - Document files: {"type": "strategy", "name": "..."}
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            # Read just enough to determine structure
-            content = f.read(65536)  # 64KB should be enough
-
-        data = json.loads(content)
+        # Decode just the first two elements; the rest of the file is never read
+        elements = list(itertools.islice(iter_json_array(file_path), 2))
 
         # Data files are arrays of objects
-        if not isinstance(data, list):
-            return False
-
-        if len(data) < 2:
+        if len(elements) < 2:
             return False
 
         # Check if first two elements are dicts with same keys
-        if not isinstance(data[0], dict) or not isinstance(data[1], dict):
+        if not isinstance(elements[0], dict) or not isinstance(elements[1], dict):
             return False
 
-        return set(data[0].keys()) == set(data[1].keys())
+        return set(elements[0].keys()) == set(elements[1].keys())
 
-    except (json.JSONDecodeError, IOError):
+    except (ValueError, IOError):
         return False
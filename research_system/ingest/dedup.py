@@ -0,0 +1,292 @@
+"""Content-hash dedup index for V4 ingestion.
+
+Re-dropping a file that was already ingested would otherwise pay for a
+full LLM extraction again. The index maps the SHA-256 of a file's text to
+the strategy created from it and is checked before extraction, so exact
+duplicates are resolved without any LLM call.
+
+Re-formatted copies (a transcript re-exported with different line
+wrapping, punctuation or capitalisation) hash differently. When a
+near-duplicate threshold is configured, each entry also stores a MinHash
+signature of the normalized text's word shingles, and a new file whose
+estimated Jaccard similarity to an indexed file reaches the threshold is
+treated as a duplicate too. Candidates are found through LSH bands, so a
+lookup touches only the few entries sharing a band rather than the whole
+index.
+
+The index is one JSON file, .state/ingest_index.json. Updates take a file
+lock, re-read the file, merge and replace it atomically, so concurrent
+ingest processes don't lose each other's entries. Only saved strategies
+are indexed; rejected files can be re-ingested, and --force skips the
+index entirely. An entry whose strategy has since been deleted is ignored.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from research_system.core.fileio import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Index file, relative to the workspace root
+INDEX_FILE = Path(".state") / "ingest_index.json"
+LOCK_FILE = Path(".state") / "ingest_index.lock"
+
+# Bump when normalization or signature parameters change
+INDEX_VERSION = 1
+
+# MinHash parameters: NUM_PERM = BANDS * ROWS
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# Universal hashing (a * h + b) mod p over 32-bit shingle hashes; with
+# p < 2**31 every intermediate fits in uint64
+_PRIME = (1 << 31) - 1
+
+# Fixed seed: signatures must be comparable across runs
+_rng = np.random.default_rng(1729)
+_PERM_A = _rng.integers(1, _PRIME, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, _PRIME, size=NUM_PERM, dtype=np.uint64)
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(text: str) -> list[str]:
+    """Lowercase, drop punctuation and split into words."""
+    return _NON_WORD.sub(" ", text.lower()).split()
+
+
+def minhash_signature(text: str) -> list[int]:
+    """MinHash signature of the text's word shingles.
+
+    Texts with fewer words than a shingle are treated as one shingle.
+    """
+    words = normalize_text(text)
+    if len(words) <= SHINGLE_SIZE:
+        shingles = {" ".join(words)}
+    else:
+        shingles = {
+            " ".join(words[i:i + SHINGLE_SIZE])
+            for i in range(len(words) - SHINGLE_SIZE + 1)
+        }
+
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+    # One row per permutation, min over shingles
+    permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _PRIME
+    return [int(v) for v in permuted.min(axis=1)]
+
+
+def estimate_similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity of two signatures."""
+    if not sig_a or len(sig_a) != len(sig_b):
+        return 0.0
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def _band_keys(signature: list[int]) -> list[str]:
+    return [
+        f"{band}:" + ",".join(str(v) for v in signature[band * ROWS:(band + 1) * ROWS])
+        for band in range(BANDS)
+    ]
+
+
+@dataclass
+class DuplicateMatch:
+    """An indexed file matching new content."""
+
+    strategy_id: str
+    content_hash: str
+    filename: str
+    similarity: float = 1.0
+    exact: bool = True
+
+
+class ContentIndex:
+    """Persistent content hash -> strategy ID index.
+
+    Example:
+        index = ContentIndex.for_workspace(workspace.path, near_threshold=0.9)
+        match = index.lookup(content_hash, text)
+        if match is None:
+            ...  # extract and save STRAT-007
+            index.add(content_hash, "STRAT-007", "talk.txt", text)
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        lock_path: Path | None = None,
+        near_threshold: float | None = None,
+    ):
+        """Initialize the index.
+
+        Args:
+            path: JSON file holding the index (created on first add)
+            lock_path: File locked while updating (default: path + ".lock")
+            near_threshold: Estimated Jaccard similarity at or above which
+                content counts as a near-duplicate. None disables
+                near-duplicate detection.
+        """
+        self.path = Path(path)
+        self.lock_path = Path(lock_path) if lock_path else self.path.with_suffix(".lock")
+        self.near_threshold = near_threshold
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._bands: dict[str, set[str]] = {}
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path, **kwargs) -> "ContentIndex":
+        """Create an index in the standard location under a workspace."""
+        workspace_path = Path(workspace_path)
+        return cls(workspace_path / INDEX_FILE, lock_path=workspace_path / LOCK_FILE, **kwargs)
+
+    @property
+    def near_enabled(self) -> bool:
+        return self.near_threshold is not None
+
+    def signature(self, text: str) -> list[int] | None:
+        """Signature to store for text, or None when near-dup detection is off."""
+        return minhash_signature(text) if self.near_enabled else None
+
+    def lookup(
+        self,
+        content_hash: str,
+        text: str | None = None,
+        signature: list[int] | None = None,
+    ) -> DuplicateMatch | None:
+        """Find an indexed file with the same or near-identical content.
+
+        Args:
+            content_hash: SHA-256 of the content
+            text: Content, used for near-duplicate detection if enabled
+            signature: Precomputed signature (saves recomputing it from text)
+
+        Returns:
+            The best match, or None if the content is new
+        """
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(content_hash)
+            if entry is not None:
+                return DuplicateMatch(entry["strategy_id"], content_hash, entry.get("filename", ""))
+
+            if not self.near_enabled:
+                return None
+            if signature is None:
+                if text is None:
+                    return None
+                signature = minhash_signature(text)
+
+            candidates: set[str] = set()
+            for key in _band_keys(signature):
+                candidates.update(self._bands.get(key, ()))
+
+            best: DuplicateMatch | None = None
+            for candidate in candidates:
+                other = entries[candidate]
+                similarity = estimate_similarity(signature, other.get("signature") or [])
+                if similarity >= self.near_threshold and (best is None or similarity > best.similarity):
+                    best = DuplicateMatch(
+                        other["strategy_id"], candidate, other.get("filename", ""),
+                        similarity, exact=False,
+                    )
+            return best
+
+    def add(
+        self,
+        content_hash: str,
+        strategy_id: str,
+        filename: str,
+        text: str | None = None,
+        signature: list[int] | None = None,
+    ) -> None:
+        """Record content as ingested into strategy_id.
+
+        Merges with entries other processes added since the index was
+        loaded, then replaces the file atomically.
+        """
+        if signature is None and text is not None:
+            signature = self.signature(text)
+        entry = {
+            "strategy_id": strategy_id,
+            "filename": filename,
+            "added": datetime.now().isoformat(),
+        }
+        if signature is not None:
+            entry["signature"] = signature
+
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.lock_path.touch(exist_ok=True)
+                with open(self.lock_path, "r+") as lock_file:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                    try:
+                        self._entries = None
+                        entries = self._load()
+                        entries[content_hash] = entry
+                        self._index_bands(content_hash, entry)
+                        self._write(entries)
+                    finally:
+                        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            except OSError as e:
+                logger.warning(f"Could not update ingest index {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load entries from disk once; callers hold self._lock."""
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    entries = data.get("entries", {})
+                else:
+                    logger.info(f"Ignoring ingest index {self.path} from another version")
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read ingest index {self.path}: {e}")
+
+        self._entries = entries
+        self._bands = {}
+        for content_hash, entry in entries.items():
+            self._index_bands(content_hash, entry)
+        return entries
+
+    def _index_bands(self, content_hash: str, entry: dict[str, Any]) -> None:
+        signature = entry.get("signature")
+        if not signature or len(signature) != NUM_PERM:
+            return
+        for key in _band_keys(signature):
+            self._bands.setdefault(key, set()).add(content_hash)
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        write_atomic(self.path, json.dumps({"version": INDEX_VERSION, "entries": entries}))
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+from research_system.ingest.chunking import PDFLibraryMissing, read_document
 from research_system.llm.client import LLMClient
 
 
@@ -145,67 +146,22 @@ class MetadataExtractor:
             return file_path.read_text(encoding="utf-8", errors="replace")
 
     def _read_pdf(self, file_path: Path) -> str:
-        """Read PDF file content."""
+        """Read PDF file content page by page, stopping once enough is read."""
         try:
-            # Try pypdf first
-            from pypdf import PdfReader
-            reader = PdfReader(file_path)
-            text = []
-            for page in reader.pages[:20]:  # Limit to first 20 pages
-                text.append(page.extract_text() or "")
-            return "\n\n".join(text)
-        except ImportError:
-            pass
-
-        try:
-            # Fall back to pdfplumber
-            import pdfplumber
-            with pdfplumber.open(file_path) as pdf:
-                text = []
-                for page in pdf.pages[:20]:
-                    text.append(page.extract_text() or "")
-                return "\n\n".join(text)
-        except ImportError:
-            pass
-
-        # If no PDF library available, return file name only
-        return f"[PDF file: {file_path.name}]\n\nNote: Install pypdf or pdfplumber to extract PDF content."
+            return read_document(
+                file_path, max_chars=self.MAX_CONTENT_LENGTH + 1, max_pages=20
+            )
+        except PDFLibraryMissing:
+            # If no PDF library available, return file name only
+            return f"[PDF file: {file_path.name}]\n\nNote: Install pypdf or pdfplumber to extract PDF content."
 
     def _read_html(self, file_path: Path) -> str:
-        """Read HTML file and extract text."""
-        html_content = file_path.read_text(encoding="utf-8", errors="replace")
-
+        """Read HTML file and extract visible text, stopping once enough is read."""
         try:
-            from html.parser import HTMLParser
-
-            class TextExtractor(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.text = []
-                    self.skip_tags = {"script", "style", "meta", "link"}
-                    self.current_tag = None
-
-                def handle_starttag(self, tag, attrs):
-                    self.current_tag = tag
-
-                def handle_endtag(self, tag):
-                    if tag in ("p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6"):
-                        self.text.append("\n")
-                    self.current_tag = None
-
-                def handle_data(self, data):
-                    if self.current_tag not in self.skip_tags:
-                        text = data.strip()
-                        if text:
-                            self.text.append(text + " ")
-
-            parser = TextExtractor()
-            parser.feed(html_content)
-            return "".join(parser.text)
-
+            return read_document(file_path, max_chars=self.MAX_CONTENT_LENGTH + 1)
         except Exception:
             # Fall back to raw HTML
-            return html_content
+            return file_path.read_text(encoding="utf-8", errors="replace")
 
     def _extract_with_llm(self, content: str, filename: str) -> ExtractionResult:
         """Extract metadata using LLM."""
@@ -222,7 +178,8 @@ class MetadataExtractor:
         response = self.llm_client.generate_haiku(
             user=prompt,
             system=EXTRACTION_SYSTEM_PROMPT,
-            max_tokens=1024
+            max_tokens=1024,
+            caller="ingest.extract"
         )
 
         if response.offline:
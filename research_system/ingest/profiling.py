@@ -0,0 +1,289 @@
+"""Bounded-memory profiling of tabular data files.
+
+Vendor data drops can be several gigabytes. Profiling one for ingestion
+only needs its columns, a row count, a few sample rows, the date range and
+rough per-column statistics, none of which require materialising the file.
+
+- count_lines() counts newlines over a memory map in fixed-size windows.
+- read_head_rows() / read_tail_rows() parse only the start and end of a
+  delimited file, which is where sample rows and the date range live.
+- iter_json_array() streams the elements of a top-level JSON array with
+  incremental decoding, so each element is parsed and dropped in turn.
+- ColumnProfiler accumulates per-column null counts and min/max one block
+  of rows at a time, with one vectorized pass per column per block.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+import numpy as np
+
+# Bytes counted per step when counting lines
+COUNT_WINDOW = 16 * 1024 * 1024
+
+# Bytes read from the end of a file to find its last rows
+TAIL_BYTES = 256 * 1024
+
+# Characters read per step when streaming JSON
+JSON_READ_SIZE = 64 * 1024
+
+_JSON_WHITESPACE = " \t\n\r"
+
+
+@dataclass
+class ColumnStats:
+    """Null count and value range of one column."""
+
+    null_count: int = 0
+    min: Any = None
+    max: Any = None
+    numeric: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "null_count": self.null_count,
+            "min": self.min,
+            "max": self.max,
+            "numeric": self.numeric,
+        }
+
+
+def count_lines(file_path: Path) -> int:
+    """Count lines in a file, including a final line without a newline."""
+    with open(file_path, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        if size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lines = 0
+            for start in range(0, size, COUNT_WINDOW):
+                lines += mm[start:start + COUNT_WINDOW].count(b"\n")
+            if mm[size - 1:size] != b"\n":
+                lines += 1
+    return lines
+
+
+def read_head_rows(
+    file_path: Path,
+    dialect: Any,
+    limit: int,
+) -> tuple[list[str], list[dict[str, Any]], bool, int]:
+    """Parse the header and up to limit rows from the start of a delimited file.
+
+    Returns:
+        (columns, rows, complete, end) where complete is True when the whole
+        file was read and end is the byte offset just past the last row
+        returned, so a tail read can start there instead of re-reading it
+    """
+    consumed = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal consumed
+        for line in f:
+            consumed += len(line)
+            yield line.decode("utf-8", errors="replace")
+
+    with open(file_path, "rb") as f:
+        reader = csv.DictReader(lines(), dialect=dialect)
+        columns = list(reader.fieldnames or [])
+        rows: list[dict[str, Any]] = []
+        end = consumed
+        for row in reader:
+            if len(rows) == limit:
+                return columns, rows, False, end
+            rows.append(dict(row))
+            end = consumed
+    return columns, rows, True, end
+
+
+def read_tail_rows(
+    file_path: Path,
+    dialect: Any,
+    columns: list[str],
+    limit: int,
+    after: int = 0,
+) -> list[dict[str, Any]]:
+    """Parse up to limit rows from the last TAIL_BYTES of a delimited file.
+
+    The window starts no earlier than byte offset after (the end of the
+    head read), so on a file only slightly longer than the head the tail
+    holds just the rows the head didn't. A window starting later drops its
+    first (possibly partial) line. A quoted field spanning that boundary
+    can make the first kept row misaligned, which only affects statistics,
+    never the last row.
+    """
+    with open(file_path, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        start = max(after, size - TAIL_BYTES)
+        f.seek(start)
+        data = f.read()
+
+    text = data.decode("utf-8", errors="replace")
+    if start > after:
+        # Window starts mid-file, possibly mid-line
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+    elif start == 0 and columns:
+        # Window covers the whole file: drop the header
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+
+    rows = [
+        dict(zip(columns, values))
+        for values in csv.reader(io.StringIO(text, newline=""), dialect=dialect)
+        if values
+    ]
+    return rows[-limit:]
+
+
+def iter_json_array(file_path: Path) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array without loading it whole.
+
+    Raises:
+        ValueError: If the document is not an array
+        json.JSONDecodeError: If the document is malformed
+    """
+    decoder = json.JSONDecoder()
+    with open(file_path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(JSON_READ_SIZE)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace() -> bool:
+            """Advance past whitespace; False at end of input."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                    pos += 1
+                if pos < len(buffer):
+                    return True
+                if not fill():
+                    return False
+
+        if not skip_whitespace() or buffer[pos] != "[":
+            raise ValueError("JSON data file must be an array of objects")
+        pos += 1
+
+        expect_value = True
+        first = True
+        while True:
+            if not skip_whitespace():
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+            char = buffer[pos]
+            if char == "]" and (first or not expect_value):
+                return
+            if not expect_value:
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+                pos += 1
+                expect_value = True
+                continue
+
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof or not fill():
+                        raise
+                    continue
+                # A number at the end of the buffer may continue in the next read
+                if end == len(buffer) and not eof and fill():
+                    continue
+                break
+            pos = end
+            first = False
+            expect_value = False
+            yield value
+
+
+class ColumnProfiler:
+    """Accumulates ColumnStats for a set of columns, block by block.
+
+    Empty strings and None count as nulls. A column stays numeric while
+    every non-null value converts to a float; after that its range is
+    compared as text.
+    """
+
+    def __init__(self, columns: Iterable[str]):
+        self.stats: dict[str, ColumnStats] = {col: ColumnStats() for col in columns}
+        self.rows = 0
+
+    def update(self, rows: list[dict[str, Any]]) -> None:
+        """Fold a block of rows into the statistics."""
+        if not rows:
+            return
+        self.rows += len(rows)
+        for col, stats in self.stats.items():
+            values = np.empty(len(rows), dtype=object)
+            values[:] = [row.get(col) for row in rows]
+            nulls = (values == None) | (values == "")  # noqa: E711 - elementwise
+            stats.null_count += int(nulls.sum())
+            present = values[~nulls]
+            if present.size:
+                self._merge_range(stats, present)
+
+    def result(self) -> dict[str, ColumnStats]:
+        return self.stats
+
+    @staticmethod
+    def _merge_range(stats: ColumnStats, values: np.ndarray) -> None:
+        if stats.numeric:
+            try:
+                numbers = values.astype(np.float64)
+            except (TypeError, ValueError):
+                stats.numeric = False
+                if stats.min is not None:
+                    stats.min, stats.max = _text(stats.min), _text(stats.max)
+            else:
+                numbers = numbers[~np.isnan(numbers)]
+                if numbers.size:
+                    low, high = float(numbers.min()), float(numbers.max())
+                    stats.min = low if stats.min is None else min(stats.min, low)
+                    stats.max = high if stats.max is None else max(stats.max, high)
+                return
+
+        ordered = np.sort(values.astype(str))
+        low, high = str(ordered[0]), str(ordered[-1])
+        stats.min = low if stats.min is None else min(stats.min, low)
+        stats.max = high if stats.max is None else max(stats.max, high)
+
+
+def merge_statistics(
+    stats: ColumnStats,
+    null_count: Optional[int],
+    low: Any,
+    high: Any,
+) -> None:
+    """Fold precomputed statistics (e.g. a Parquet row group's) into stats."""
+    stats.null_count += null_count or 0
+    if low is None or high is None:
+        return
+    if not isinstance(low, (int, float)) or isinstance(low, bool):
+        stats.numeric = False
+    try:
+        stats.min = low if stats.min is None else min(stats.min, low)
+        stats.max = high if stats.max is None else max(stats.max, high)
+    except TypeError:
+        stats.min, stats.max = min(_text(stats.min), _text(low)), max(_text(stats.max), _text(high))
+        stats.numeric = False
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
@@ -5,6 +5,14 @@ This module provides the IngestProcessor class that:
 2. Creates V4Strategy documents
 3. Runs ingestion quality scoring (specificity, trust, red flags)
 4. Saves strategies to workspace/strategies/pending/
+
+Files whose content was already ingested are skipped before extraction
+using the workspace's content index (see research_system.ingest.dedup).
+
+Documents longer than a single extraction prompt are split into chunks,
+each chunk is scored for relevance by a cheap concurrent Haiku pass, and
+the final Sonnet extraction sees only the most relevant chunks (see
+research_system.ingest.chunking).
 """
 
 from __future__ import annotations
@@ -13,15 +21,25 @@ import hashlib
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
 from research_system.core.v4 import V4Config, V4Workspace
+from research_system.ingest.chunking import (
+    HTML_SUFFIXES,
+    PDFLibraryMissing,
+    Chunk,
+    chunk_text,
+    read_document,
+)
+from research_system.ingest.dedup import ContentIndex
 from research_system.llm.client import LLMClient
+from research_system.llm.concurrency import fan_out
 from research_system.schemas.v4 import (
     # Strategy models
     V4Strategy,
@@ -89,6 +107,19 @@ IGNORE_PATTERNS = [".DS_Store", ".gitkeep", "*.tmp", "*.log", "*.pyc", "__pycach
 # Maximum retries for LLM calls
 MAX_LLM_RETRIES = 3
 
+# Documents up to this many characters go to extraction in one piece;
+# longer ones are chunked and only relevant chunks (up to this budget) are sent
+MAX_EXTRACTION_CHARS = 50000
+
+# Chunk size for the relevance pass over long documents
+CHUNK_CHARS = 12000
+
+# Relevance calls in flight at once
+RELEVANCE_WORKERS = 4
+
+# Chunks scoring below this (0-10) are left out of extraction
+MIN_CHUNK_RELEVANCE = 3
+
 
 # =============================================================================
 # DATA CLASSES
@@ -110,6 +141,8 @@ class IngestResult:
     saved_path: str | None = None
     dry_run: bool = False
     content_hash: str | None = None
+    duplicate_of: str | None = None
+    content_signature: list[int] | None = field(default=None, repr=False)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -125,6 +158,7 @@ class IngestResult:
             "error": self.error,
             "saved_path": self.saved_path,
             "dry_run": self.dry_run,
+            "duplicate_of": self.duplicate_of,
         }
 
 
@@ -138,6 +172,7 @@ class IngestSummary:
     queued: int = 0
     archived: int = 0
     rejected: int = 0
+    duplicates: int = 0
     errors: int = 0
     results: list[IngestResult] = field(default_factory=list)
 
@@ -150,6 +185,7 @@ class IngestSummary:
             "queued": self.queued,
             "archived": self.archived,
             "rejected": self.rejected,
+            "duplicates": self.duplicates,
             "errors": self.errors,
             "results": [r.to_dict() for r in self.results],
         }
@@ -252,6 +288,26 @@ Content:
 Return ONLY the JSON object with extracted strategy details."""
 
 
+CHUNK_RELEVANCE_SYSTEM_PROMPT = """You screen excerpts of long documents for a trading strategy extractor.
+
+Score how much the excerpt contributes to describing a trading strategy:
+entry/exit rules, instruments or universe, parameters, position sizing,
+economic rationale, risks, or backtest and performance claims.
+
+0 = nothing relevant (intros, ads, small talk, references)
+5 = some relevant context
+10 = core strategy rules or results
+
+Return ONLY JSON: {"score": <0-10>}"""
+
+
+CHUNK_RELEVANCE_USER_PROMPT = """Document: {filename} (excerpt {number} of {total})
+
+---
+{content}
+---"""
+
+
 # =============================================================================
 # INGEST PROCESSOR
 # =============================================================================
@@ -262,10 +318,11 @@ class IngestProcessor:
 
     This processor:
     1. Reads files from the workspace inbox
-    2. Uses LLM to extract strategy metadata
-    3. Scores the extraction for quality (specificity, trust)
-    4. Checks for red flags
-    5. Creates V4Strategy documents in strategies/pending/
+    2. Skips content already ingested (exact or near-duplicate)
+    3. Uses LLM to extract strategy metadata
+    4. Scores the extraction for quality (specificity, trust)
+    5. Checks for red flags
+    6. Creates V4Strategy documents in strategies/pending/
     """
 
     def __init__(
@@ -273,6 +330,7 @@ class IngestProcessor:
         workspace: V4Workspace,
         config: V4Config,
         llm_client: LLMClient | None = None,
+        content_index: ContentIndex | None = None,
     ):
         """Initialize the ingest processor.
 
@@ -280,23 +338,39 @@ class IngestProcessor:
             workspace: V4 workspace instance
             config: V4 configuration
             llm_client: LLM client for extraction. If None, runs in offline mode.
+            content_index: Dedup index. Defaults to the workspace's index
+                when ingestion.dedup is enabled in config.
         """
         self.workspace = workspace
         self.config = config
         self.llm_client = llm_client
+        if content_index is None and config.ingestion.dedup:
+            content_index = ContentIndex.for_workspace(
+                workspace.path,
+                near_threshold=config.ingestion.near_duplicate_threshold,
+            )
+        self.content_index = content_index
 
-    def process_inbox(self, dry_run: bool = False, force: bool = False) -> IngestSummary:
+    def process_inbox(
+        self,
+        dry_run: bool = False,
+        force: bool = False,
+        jobs: int = 1,
+        progress: Callable[[int, int, IngestResult], None] | None = None,
+    ) -> IngestSummary:
         """Process all files in the inbox directory.
 
         Args:
             dry_run: If True, show what would happen without saving files.
-            force: If True, bypass quality checks and create strategies anyway.
+            force: If True, bypass the dedup index and quality checks and
+                create strategies anyway.
+            jobs: Number of files to read and extract concurrently.
+            progress: Called as progress(index, total, result) after each
+                file is finished, in inbox order.
 
         Returns:
             IngestSummary with results for all files.
         """
-        summary = IngestSummary()
-
         # Get all files in inbox (recursive)
         inbox_files = [
             f
@@ -304,27 +378,82 @@ class IngestProcessor:
             if f.is_file() and not self._should_ignore(f)
         ]
 
-        summary.total_files = len(inbox_files)
+        return self.process_files(
+            sorted(inbox_files), dry_run=dry_run, force=force, jobs=jobs, progress=progress
+        )
 
-        for file_path in sorted(inbox_files):
-            result = self.process_file(file_path, dry_run=dry_run, force=force)
-            summary.results.append(result)
+    def process_files(
+        self,
+        file_paths: list[Path],
+        dry_run: bool = False,
+        force: bool = False,
+        jobs: int = 1,
+        progress: Callable[[int, int, IngestResult], None] | None = None,
+    ) -> IngestSummary:
+        """Process a batch of files into V4 strategies.
+
+        With jobs > 1, reading, hashing, LLM extraction and quality scoring
+        run on a pool of worker threads. Strategy ID allocation, saving and
+        archiving stay on the calling thread and happen in input order, so
+        IDs come out the same as a sequential run would assign them.
+
+        Args:
+            file_paths: Files to process, in the order results are wanted.
+            dry_run: If True, show what would happen without saving files.
+            force: If True, bypass the dedup index and quality checks and
+                create strategies anyway.
+            jobs: Number of files to read and extract concurrently.
+            progress: Called as progress(index, total, result) after each
+                file is finished, in input order.
 
-            if result.error:
-                summary.errors += 1
-            elif result.decision:
-                summary.processed += 1
-                if result.decision == IngestionDecision.ACCEPT:
-                    summary.accepted += 1
-                elif result.decision == IngestionDecision.QUEUE:
-                    summary.queued += 1
-                elif result.decision == IngestionDecision.ARCHIVE:
-                    summary.archived += 1
-                elif result.decision == IngestionDecision.REJECT:
-                    summary.rejected += 1
+        Returns:
+            IngestSummary with results in input order.
+        """
+        summary = IngestSummary(total_files=len(file_paths))
+        total = len(file_paths)
+
+        def record(index: int, result: IngestResult) -> None:
+            summary.results.append(result)
+            self._tally(summary, result)
+            if progress is not None:
+                progress(index, total, result)
+
+        jobs = min(max(1, jobs), total) if total else 1
+        if jobs == 1:
+            for i, file_path in enumerate(file_paths, 1):
+                record(i, self.process_file(file_path, dry_run=dry_run, force=force))
+            return summary
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="ingest") as pool:
+            futures = [
+                pool.submit(self._analyze_file_safe, file_path, dry_run, force)
+                for file_path in file_paths
+            ]
+            # Finish files in input order; later files keep extracting meanwhile
+            for i, (file_path, future) in enumerate(zip(file_paths, futures), 1):
+                result, strategy = future.result()
+                record(i, self._finalize_file(file_path, result, strategy, dry_run, force))
 
         return summary
 
+    @staticmethod
+    def _tally(summary: IngestSummary, result: IngestResult) -> None:
+        """Add one file's outcome to the summary counters."""
+        if result.duplicate_of:
+            summary.duplicates += 1
+        elif result.error:
+            summary.errors += 1
+        elif result.decision:
+            summary.processed += 1
+            if result.decision == IngestionDecision.ACCEPT:
+                summary.accepted += 1
+            elif result.decision == IngestionDecision.QUEUE:
+                summary.queued += 1
+            elif result.decision == IngestionDecision.ARCHIVE:
+                summary.archived += 1
+            elif result.decision == IngestionDecision.REJECT:
+                summary.rejected += 1
+
     def process_file(
         self, file_path: Path, dry_run: bool = False, force: bool = False
     ) -> IngestResult:
@@ -333,11 +462,39 @@ class IngestProcessor:
         Args:
             file_path: Path to the file to process.
             dry_run: If True, don't save the strategy or move files.
-            force: If True, bypass quality checks and create strategy anyway.
+            force: If True, bypass the dedup index and quality checks and
+                create strategy anyway.
 
         Returns:
             IngestResult with processing outcome.
         """
+        result, strategy = self._analyze_file(file_path, dry_run=dry_run, force=force)
+        return self._finalize_file(file_path, result, strategy, dry_run, force)
+
+    def _analyze_file_safe(
+        self, file_path: Path, dry_run: bool, force: bool
+    ) -> tuple[IngestResult, V4Strategy | None]:
+        """_analyze_file for worker threads: never raises."""
+        try:
+            return self._analyze_file(file_path, dry_run=dry_run, force=force)
+        except Exception as e:
+            result = IngestResult(
+                filename=file_path.name, file_path=str(file_path), dry_run=dry_run
+            )
+            result.error = f"Failed to process file: {e}"
+            return result, None
+
+    def _analyze_file(
+        self, file_path: Path, dry_run: bool = False, force: bool = False
+    ) -> tuple[IngestResult, V4Strategy | None]:
+        """Read, extract and score a file without touching the workspace.
+
+        Safe to run concurrently for different files.
+
+        Returns:
+            The result so far and the extracted strategy, or None for the
+            strategy if the file failed before a decision was made.
+        """
         result = IngestResult(
             filename=file_path.name,
             file_path=str(file_path),
@@ -350,14 +507,20 @@ class IngestProcessor:
             result.content_hash = self._compute_hash(content)
         except Exception as e:
             result.error = f"Failed to read file: {e}"
-            return result
+            return result, None
+
+        # Skip content that was already ingested, before paying for extraction
+        if self.content_index is not None:
+            result.content_signature = self.content_index.signature(content)
+            if not force and self._check_duplicate(result):
+                return result, None
 
         # Extract strategy using LLM
         try:
             strategy = self._extract_strategy(content, file_path.name)
         except Exception as e:
             result.error = f"Failed to extract strategy: {e}"
-            return result
+            return result, None
 
         result.strategy_name = strategy.name
 
@@ -367,7 +530,7 @@ class IngestProcessor:
             result.quality = quality
         except Exception as e:
             result.error = f"Failed to score quality: {e}"
-            return result
+            return result, None
 
         # Compute decision based on quality scores
         decision = quality.compute_decision(
@@ -381,6 +544,31 @@ class IngestProcessor:
             quality.warnings.append(f"Force mode: overrode {quality.decision.value} decision")
 
         result.decision = decision
+        return result, strategy
+
+    def _finalize_file(
+        self,
+        file_path: Path,
+        result: IngestResult,
+        strategy: V4Strategy | None,
+        dry_run: bool,
+        force: bool = False,
+    ) -> IngestResult:
+        """Act on an analyzed file's decision: save, archive or reject.
+
+        Allocates the strategy ID and moves files, so calls must be
+        serialized.
+        """
+        if result.duplicate_of:
+            if not dry_run:
+                self._archive_file(file_path, "duplicates")
+            return result
+
+        if strategy is None:
+            return result
+
+        decision = result.decision
+        quality = result.quality
 
         # Handle based on decision
         if decision == IngestionDecision.REJECT:
@@ -403,6 +591,12 @@ class IngestProcessor:
             result.strategy_id = "[DRY-RUN] Would create STRAT-XXX"
             return result
 
+        # An earlier file in the same batch may have saved this content
+        if self.content_index is not None and not force and self._check_duplicate(result):
+            result.decision = None
+            self._archive_file(file_path, "duplicates")
+            return result
+
         # Generate strategy ID and save
         try:
             strategy_id = self.workspace.next_strategy_id()
@@ -413,6 +607,14 @@ class IngestProcessor:
             result.saved_path = str(saved_path)
             result.success = True
 
+            if self.content_index is not None and result.content_hash:
+                self.content_index.add(
+                    result.content_hash,
+                    strategy_id,
+                    file_path.name,
+                    signature=result.content_signature,
+                )
+
             # Move processed file to archive
             self._archive_file(file_path, "processed")
 
@@ -422,6 +624,35 @@ class IngestProcessor:
 
         return result
 
+    def _check_duplicate(self, result: IngestResult) -> bool:
+        """Look up the result's content in the index and mark it if seen.
+
+        A match whose strategy no longer exists (deleted by hand, or the
+        workspace was reset) doesn't count; saving the content again
+        re-points the index entry at the new strategy.
+
+        Returns:
+            True if the content was already ingested.
+        """
+        match = self.content_index.lookup(
+            result.content_hash, signature=result.content_signature
+        )
+        if match is None:
+            return False
+        if self.workspace.strategy_status(match.strategy_id) is None:
+            return False
+
+        result.duplicate_of = match.strategy_id
+        result.success = False
+        if match.exact:
+            result.error = f"Duplicate of {match.strategy_id} (same content as {match.filename})"
+        else:
+            result.error = (
+                f"Near-duplicate of {match.strategy_id} "
+                f"({match.similarity:.0%} similar to {match.filename})"
+            )
+        return True
+
     def _should_ignore(self, file_path: Path) -> bool:
         """Check if a file should be ignored."""
         name = file_path.name
@@ -449,21 +680,17 @@ class IngestProcessor:
         if suffix in {".txt", ".md", ".rst", ".py", ".json", ".yaml", ".yml"}:
             return file_path.read_text(encoding="utf-8", errors="replace")
 
-        # PDF files - would need pdfplumber or similar
+        # PDF files - read page by page with pdfplumber or pypdf
         if suffix == ".pdf":
             try:
-                import pdfplumber
-
-                text_parts = []
-                with pdfplumber.open(file_path) as pdf:
-                    for page in pdf.pages:
-                        text = page.extract_text()
-                        if text:
-                            text_parts.append(text)
-                return "\n\n".join(text_parts)
-            except ImportError:
+                return read_document(file_path)
+            except PDFLibraryMissing:
                 return file_path.read_text(encoding="utf-8", errors="replace")
 
+        # HTML - visible text only
+        if suffix in HTML_SUFFIXES:
+            return read_document(file_path)
+
         # Default: try reading as text
         return file_path.read_text(encoding="utf-8", errors="replace")
 
@@ -486,10 +713,15 @@ class IngestProcessor:
             # Offline mode - return minimal strategy
             return self._create_minimal_strategy(content, filename)
 
+        # Long documents: extract from the relevant chunks only
+        document = content
+        if len(content) > MAX_EXTRACTION_CHARS:
+            document = self._select_relevant_chunks(content, filename)
+
         # Prepare prompt
         user_prompt = STRATEGY_EXTRACTION_USER_PROMPT.format(
             filename=filename,
-            content=content[:50000],  # Limit content length
+            content=document,
         )
 
         # Call LLM with retries
@@ -500,6 +732,8 @@ class IngestProcessor:
                     user=user_prompt,
                     system=STRATEGY_EXTRACTION_SYSTEM_PROMPT,
                     max_tokens=8000,
+                    caller="ingest.strategy",
+                    retries=attempt,
                 )
 
                 if response.offline:
@@ -521,6 +755,69 @@ class IngestProcessor:
         # All retries failed - return minimal strategy
         return self._create_minimal_strategy(content, filename, error=last_error)
 
+    def _select_relevant_chunks(self, content: str, filename: str) -> str:
+        """Reduce a long document to its most relevant chunks.
+
+        Every chunk is scored concurrently with Haiku. Chunks at or above
+        MIN_CHUNK_RELEVANCE are kept, highest scores first, until
+        MAX_EXTRACTION_CHARS is reached, then put back in document order.
+        A chunk whose scoring call fails is kept, so a flaky relevance pass
+        can only cost tokens, never coverage.
+
+        Returns:
+            Selected chunks joined with excerpt markers.
+        """
+        chunks = chunk_text(content, CHUNK_CHARS)
+        total = len(chunks)
+
+        def score(chunk: Chunk) -> int:
+            return self._score_chunk_relevance(chunk, total, filename)
+
+        results = fan_out(score, chunks, max_workers=RELEVANCE_WORKERS)
+        scores = [
+            MIN_CHUNK_RELEVANCE if isinstance(r, BaseException) else r for r in results
+        ]
+
+        ranked = sorted(range(total), key=lambda i: (-scores[i], i))
+        candidates = [i for i in ranked if scores[i] >= MIN_CHUNK_RELEVANCE] or ranked
+
+        selected: list[int] = []
+        budget = MAX_EXTRACTION_CHARS
+        for i in candidates:
+            size = len(chunks[i].text)
+            if size > budget:
+                continue
+            selected.append(i)
+            budget -= size
+
+        return "\n\n[...]\n\n".join(
+            f"[Excerpt {i + 1} of {total}]\n{chunks[i].text}" for i in sorted(selected)
+        )
+
+    def _score_chunk_relevance(self, chunk: Chunk, total: int, filename: str) -> int:
+        """Score one chunk's relevance (0-10) with a cheap Haiku call.
+
+        Returns MIN_CHUNK_RELEVANCE when the response can't be used.
+        """
+        response = self.llm_client.generate_haiku(
+            user=CHUNK_RELEVANCE_USER_PROMPT.format(
+                filename=filename,
+                number=chunk.index + 1,
+                total=total,
+                content=chunk.text,
+            ),
+            system=CHUNK_RELEVANCE_SYSTEM_PROMPT,
+            max_tokens=50,
+            caller="ingest.relevance",
+        )
+        if response.offline:
+            return MIN_CHUNK_RELEVANCE
+        parsed = self.llm_client.extract_json(response)
+        try:
+            return max(0, min(10, int(parsed["score"])))
+        except (TypeError, KeyError, ValueError):
+            return MIN_CHUNK_RELEVANCE
+
     def _create_minimal_strategy(
         self, content: str, filename: str, error: str | None = None
     ) -> V4Strategy:
@@ -953,6 +1250,7 @@ class IngestProcessor:
                 pass
             raise
 
+        self.workspace.refresh_strategy(strategy.id, status="pending")
         return strategy_path
 
     def _archive_file(self, file_path: Path, reason: str) -> None:
@@ -1,9 +1,28 @@
 """
 LLM client module for the Research Validation System.
 
-Provides a wrapper around the Anthropic API or Claude CLI with graceful offline fallback.
+Provides a wrapper around the Anthropic API or Claude CLI with graceful offline fallback,
+plus an optional persistent response cache and per-call telemetry.
 """
 
-from research_system.llm.client import LLMClient, LLMResponse, Backend, get_client
+from research_system.llm.client import (
+    LLMClient,
+    LLMResponse,
+    Backend,
+    get_client,
+    text_block,
+    content_text,
+)
+from research_system.llm.cache import ResponseCache
+from research_system.llm.telemetry import TelemetryLog
 
-__all__ = ["LLMClient", "LLMResponse", "Backend", "get_client"]
+__all__ = [
+    "LLMClient",
+    "LLMResponse",
+    "Backend",
+    "get_client",
+    "text_block",
+    "content_text",
+    "ResponseCache",
+    "TelemetryLog",
+]
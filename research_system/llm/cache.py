@@ -0,0 +1,290 @@
+"""
+Persistent LLM response cache.
+
+Re-running ingest, synthesis or code generation sends byte-identical
+prompts again and again. With temperature 0.0 the answer is (for our
+purposes) the same, so repeated requests can be served from disk instead
+of paying for another API call or CLI spawn.
+
+Entries live in a single SQLite file under the workspace
+(.state/llm_cache.sqlite) and are keyed on a SHA-256 of the full request:
+model, system prompt, user prompt, max_tokens and temperature. Entries
+expire after a TTL, and the least recently used entries are evicted once
+the cache grows beyond max_entries.
+
+Only successful (non-offline) responses to temperature 0.0 requests are
+cached.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Cache file, relative to the workspace root
+CACHE_FILE = Path(".state") / "llm_cache.sqlite"
+
+# Bump when the request/response format changes
+CACHE_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    model TEXT NOT NULL,
+    usage TEXT,
+    backend TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of LLM responses.
+
+    Example:
+        cache = ResponseCache.for_workspace(workspace.path)
+        client = LLMClient(cache=cache)
+        client.generate_sonnet(prompt)  # API call, stored
+        client.generate_sonnet(prompt)  # served from cache
+    """
+
+    # Evict once every this many stores
+    PRUNE_EVERY = 100
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_days: float = 30,
+        max_entries: int = 10000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite file holding the entries (created on first store)
+            ttl_days: Entries older than this are treated as misses
+            max_entries: Entries kept before least recently used are evicted
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path, **kwargs) -> "ResponseCache":
+        """Create a cache in the standard location under a workspace."""
+        return cls(Path(workspace_path) / CACHE_FILE, **kwargs)
+
+    @staticmethod
+    def make_key(
+        user: Any,
+        system: Any,
+        max_tokens: int,
+        model: str,
+        temperature: float,
+    ) -> str:
+        """
+        Build the cache key for a request.
+
+        user and system may be text or content blocks; cache_control markers
+        are part of the key, which is harmless since they don't change the
+        answer and the same call site always sends the same markers.
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        canonical = json.dumps(
+            {
+                "user": user,
+                "system": system,
+                "max_tokens": max_tokens,
+                "model": model,
+                "temperature": temperature,
+                "version": CACHE_VERSION,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Dict with content, model, usage and backend, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            row = None
+            conn = self._connect(create=False)
+            if conn is not None:
+                try:
+                    row = conn.execute(
+                        "SELECT content, model, usage, backend, created_at FROM responses WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+                    if row is not None and now - row[4] > self.ttl_seconds:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        conn.commit()
+                        self.evictions += 1
+                        row = None
+                    elif row is not None:
+                        conn.execute(
+                            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"LLM cache read failed: {e}")
+                    row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return {
+            "content": row[0],
+            "model": row[1],
+            "usage": json.loads(row[2]) if row[2] else None,
+            "backend": row[3],
+        }
+
+    def put(
+        self,
+        key: str,
+        content: str,
+        model: str,
+        usage: Optional[Dict[str, int]] = None,
+        backend: str = "api",
+    ) -> bool:
+        """
+        Store a response.
+
+        Returns:
+            True if the response was stored
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect(create=True)
+            if conn is None:
+                return False
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, content, model, usage, backend, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, content, model, json.dumps(usage) if usage else None, backend, now, now),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.debug(f"LLM cache write failed: {e}")
+                return False
+            self.stores += 1
+            if self.stores % self.PRUNE_EVERY == 1:
+                self._prune_locked(conn)
+        return True
+
+    def prune(self) -> int:
+        """
+        Drop expired entries, then the least recently used beyond max_entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return 0
+            return self._prune_locked(conn)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connect(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the database (caller holds the lock).
+
+        Returns None when the file does not exist and create is False, so
+        lookups against an empty workspace don't leave a file behind.
+        """
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.path.exists():
+            return None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute(_SCHEMA)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)"
+            )
+            conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open LLM cache at {self.path}: {e}")
+            return None
+        self._conn = conn
+        return conn
+
+    def _prune_locked(self, conn: sqlite3.Connection) -> int:
+        try:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            removed = cursor.rowcount
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            removed += cursor.rowcount
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"LLM cache prune failed: {e}")
+            return 0
+
+        if removed:
+            self.evictions += removed
+            logger.debug(f"Evicted {removed} LLM cache entries")
+        return removed
@@ -6,16 +6,57 @@ Provides a unified interface for Claude API calls with:
 - Multiple backends: Anthropic API or Claude CLI
 - Graceful offline mode when no backend is available
 - Structured error handling
+- Optional persistent response cache (see research_system.llm.cache)
+- Structured content blocks with provider-side prompt caching breakpoints
+- Optional per-call telemetry (see research_system.llm.telemetry)
 """
 
 import json
 import os
 import subprocess
 import shutil
+import time
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union, TYPE_CHECKING
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from research_system.llm.cache import ResponseCache
+    from research_system.llm.telemetry import TelemetryLog
+
+
+# A prompt is either plain text or a list of Anthropic content blocks
+# ({"type": "text", "text": ..., optionally "cache_control": {...}})
+Content = Union[str, List[Dict[str, Any]]]
+
+
+def text_block(text: str, cache: bool = False) -> Dict[str, Any]:
+    """
+    Build a text content block for a system or user prompt.
+
+    Args:
+        text: Block text
+        cache: Mark the block as a prompt caching breakpoint. The API caches
+               the whole prompt prefix up to and including this block, so
+               put content shared across calls first.
+
+    Returns:
+        Content block dict
+    """
+    block: Dict[str, Any] = {"type": "text", "text": text}
+    if cache:
+        block["cache_control"] = {"type": "ephemeral"}
+    return block
+
+
+def content_text(content: Optional[Content]) -> str:
+    """Flatten a prompt (text or content blocks) to plain text."""
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    return "\n\n".join(block.get("text", "") for block in content)
+
 
 class Backend(Enum):
     """Available LLM backends."""
@@ -32,6 +73,7 @@ class LLMResponse:
     usage: Optional[Dict[str, int]] = None
     offline: bool = False
     backend: str = "api"  # Track which backend was used for reproducibility
+    cached: bool = False  # Served from the response cache
 
 
 class LLMClient:
@@ -57,7 +99,9 @@ class LLMClient:
     def __init__(
         self,
         api_key: Optional[str] = None,
-        backend: Optional[Backend] = None
+        backend: Optional[Backend] = None,
+        cache: Optional["ResponseCache"] = None,
+        telemetry: Optional["TelemetryLog"] = None
     ):
         """
         Initialize the LLM client.
@@ -68,8 +112,12 @@ class LLMClient:
                      1. API (if ANTHROPIC_API_KEY is set)
                      2. CLI (if claude command is available)
                      3. Offline (fallback)
+            cache: Optional response cache for deterministic (temperature 0.0) requests
+            telemetry: Optional log receiving one record per backend call or cache hit
         """
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.cache = cache
+        self.telemetry = telemetry
         self._client = None
         self._backend = Backend.OFFLINE
         self._cli_path: Optional[str] = None
@@ -132,43 +180,123 @@ class LLMClient:
 
     def generate(
         self,
-        user: str,
-        system: Optional[str] = None,
+        user: Content,
+        system: Optional[Content] = None,
         max_tokens: int = 4000,
         model: Optional[str] = None,
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        use_cache: bool = True,
+        caller: Optional[str] = None,
+        retries: int = 0
     ) -> LLMResponse:
         """
         Generate a response from Claude.
 
         Args:
-            user: User message content
-            system: Optional system prompt
+            user: User message content (text or content blocks)
+            system: Optional system prompt (text or content blocks). Blocks
+                    built with text_block(..., cache=True) become prompt
+                    caching breakpoints on the API backend; other backends
+                    receive the flattened text.
             max_tokens: Maximum tokens in response
             model: Model to use (defaults to Sonnet)
             temperature: Sampling temperature (0.0 for deterministic)
+            use_cache: Read from the response cache if one is attached. When
+                       False the request always goes to the backend, but a
+                       successful response still refreshes the cache.
+            caller: Dotted tag naming the call site for telemetry
+                    (e.g. "ingest.extract"); the first component is the
+                    subsystem the call is reported under.
+            retries: How many earlier attempts the caller made for this
+                     request, recorded in telemetry
 
         Returns:
             LLMResponse with content and metadata
         """
         model = model or self.MODEL_SONNET
 
+        if self._backend == Backend.OFFLINE:
+            return self._offline_response(user, system, model)
+
+        started = time.perf_counter()
+        cache_key = None
+        if self.cache is not None and temperature == 0.0:
+            cache_key = self.cache.make_key(user, system, max_tokens, model, temperature)
+            if use_cache:
+                entry = self.cache.get(cache_key)
+                if entry is not None:
+                    response = LLMResponse(
+                        content=entry["content"],
+                        model=entry["model"],
+                        usage=entry["usage"],
+                        backend=entry["backend"],
+                        cached=True
+                    )
+                    self._record_call(response, user, system, started, caller, retries)
+                    return response
+
         if self._backend == Backend.API:
-            return self._generate_api(user, system, max_tokens, model, temperature)
-        elif self._backend == Backend.CLI:
-            return self._generate_cli(user, system, max_tokens, model)
+            response = self._generate_api(user, system, max_tokens, model, temperature)
         else:
-            return self._offline_response(user, system, model)
+            response = self._generate_cli(user, system, max_tokens, model)
+        self._record_call(response, user, system, started, caller, retries)
+
+        if cache_key is not None and not response.offline:
+            self.cache.put(
+                cache_key,
+                content=response.content,
+                model=response.model,
+                usage=response.usage,
+                backend=response.backend
+            )
+        return response
+
+    def _record_call(
+        self,
+        response: LLMResponse,
+        user: Content,
+        system: Optional[Content],
+        started: float,
+        caller: Optional[str],
+        retries: int
+    ) -> None:
+        """Append a telemetry record for a finished call, if telemetry is on."""
+        if self.telemetry is None:
+            return
+        from research_system.llm.telemetry import make_record
+
+        wall_time = time.perf_counter() - started
+        prompt_text = ""
+        if not response.usage and not response.offline:
+            # Only needed to estimate tokens when the backend reported none
+            prompt_text = content_text(system) + content_text(user)
+        self.telemetry.record(make_record(
+            caller=caller,
+            model=response.model,
+            backend=response.backend,
+            wall_time=wall_time,
+            usage=response.usage,
+            prompt_text=prompt_text,
+            response_text="" if response.offline else response.content,
+            retries=retries,
+            cache_hit=response.cached,
+            success=not response.offline,
+        ))
 
     def _generate_api(
         self,
-        user: str,
-        system: Optional[str],
+        user: Content,
+        system: Optional[Content],
         max_tokens: int,
         model: str,
         temperature: float
     ) -> LLMResponse:
-        """Generate using Anthropic API."""
+        """Generate using Anthropic API.
+
+        Content blocks are passed through unchanged, so cache_control
+        breakpoints let repeated calls read a shared prefix from the
+        provider's prompt cache instead of re-billing it.
+        """
         try:
             kwargs = {
                 "model": model,
@@ -182,13 +310,19 @@ class LLMClient:
 
             response = self._client.messages.create(**kwargs)
 
+            usage = {
+                "input_tokens": response.usage.input_tokens,
+                "output_tokens": response.usage.output_tokens
+            }
+            for field_name in ("cache_creation_input_tokens", "cache_read_input_tokens"):
+                value = getattr(response.usage, field_name, None)
+                if isinstance(value, int):
+                    usage[field_name] = value
+
             return LLMResponse(
                 content=response.content[0].text,
                 model=response.model,
-                usage={
-                    "input_tokens": response.usage.input_tokens,
-                    "output_tokens": response.usage.output_tokens
-                },
+                usage=usage,
                 backend="api"
             )
 
@@ -203,14 +337,16 @@ class LLMClient:
 
     def _generate_cli(
         self,
-        user: str,
-        system: Optional[str],
+        user: Content,
+        system: Optional[Content],
         max_tokens: int,
         model: str
     ) -> LLMResponse:
         """Generate using Claude Code CLI."""
         try:
             # Build the prompt - combine system and user prompts
+            system = content_text(system)
+            user = content_text(user)
             if system:
                 full_prompt = f"{system}\n\n---\n\n{user}"
             else:
@@ -280,9 +416,11 @@ class LLMClient:
 
     def generate_haiku(
         self,
-        user: str,
-        system: Optional[str] = None,
-        max_tokens: int = 1024
+        user: Content,
+        system: Optional[Content] = None,
+        max_tokens: int = 1024,
+        caller: Optional[str] = None,
+        retries: int = 0
     ) -> LLMResponse:
         """
         Generate using Haiku for fast, cheap extraction tasks.
@@ -291,6 +429,8 @@ class LLMClient:
             user: User message content
             system: Optional system prompt
             max_tokens: Maximum tokens in response
+            caller: Call site tag for telemetry
+            retries: Earlier attempts for this request, for telemetry
 
         Returns:
             LLMResponse with content and metadata
@@ -300,14 +440,18 @@ class LLMClient:
             system=system,
             max_tokens=max_tokens,
             model=self.MODEL_HAIKU,
-            temperature=0.0
+            temperature=0.0,
+            caller=caller,
+            retries=retries
         )
 
     def generate_sonnet(
         self,
-        user: str,
-        system: Optional[str] = None,
-        max_tokens: int = 4000
+        user: Content,
+        system: Optional[Content] = None,
+        max_tokens: int = 4000,
+        caller: Optional[str] = None,
+        retries: int = 0
     ) -> LLMResponse:
         """
         Generate using Sonnet for complex analysis tasks.
@@ -316,6 +460,8 @@ class LLMClient:
             user: User message content
             system: Optional system prompt
             max_tokens: Maximum tokens in response
+            caller: Call site tag for telemetry
+            retries: Earlier attempts for this request, for telemetry
 
         Returns:
             LLMResponse with content and metadata
@@ -325,16 +471,20 @@ class LLMClient:
             system=system,
             max_tokens=max_tokens,
             model=self.MODEL_SONNET,
-            temperature=0.0
+            temperature=0.0,
+            caller=caller,
+            retries=retries
         )
 
     def _offline_response(
         self,
-        user: str,
-        system: Optional[str],
+        user: Content,
+        system: Optional[Content],
         model: str
     ) -> LLMResponse:
         """Generate offline response for inspection."""
+        system = content_text(system)
+        user = content_text(user)
         return LLMResponse(
             content=json.dumps({
                 "mode": "offline",
@@ -0,0 +1,96 @@
+"""
+Concurrent fan-out of independent LLM calls.
+
+Persona runs are independent, I/O-bound requests (an HTTPS call for the
+API backend, a `claude` subprocess for the CLI backend), so running them on
+a small thread pool makes a multi-persona run take about as long as its
+slowest persona instead of the sum of all of them.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Sequence, TypeVar, Union
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How often to check running calls against their timeout (seconds)
+_POLL_INTERVAL = 0.1
+
+
+def fan_out(
+    func: Callable[[T], R],
+    items: Sequence[T],
+    max_workers: int = 4,
+    timeout: Optional[float] = None,
+) -> List[Union[R, BaseException]]:
+    """
+    Call func on every item concurrently.
+
+    Results come back in the order of items regardless of completion order.
+    A call that raises yields its exception in place of a result; a call
+    still running timeout seconds after it started yields a TimeoutError
+    and is abandoned (its thread finishes in the background, the backend's
+    own timeouts bound how long that takes).
+
+    Args:
+        func: Function to call with each item
+        items: Inputs, one call per item
+        max_workers: Maximum calls in flight at once
+        timeout: Per-call timeout in seconds (None = wait indefinitely)
+
+    Returns:
+        One result or exception per item, in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    results: List[Union[R, BaseException, None]] = [None] * len(items)
+    started: dict = {}
+    started_lock = threading.Lock()
+
+    def call(index: int) -> R:
+        with started_lock:
+            started[index] = time.monotonic()
+        return func(items[index])
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(items))),
+        thread_name_prefix="llm-fan-out",
+    )
+    try:
+        futures = {executor.submit(call, i): i for i in range(len(items))}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(
+                pending,
+                timeout=_POLL_INTERVAL if timeout is not None else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = e
+
+            if timeout is None:
+                continue
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                with started_lock:
+                    start = started.get(index)
+                if start is not None and now - start > timeout:
+                    logger.warning(f"Call for {items[index]!r} timed out after {timeout:g}s")
+                    results[index] = TimeoutError(f"Timed out after {timeout:g}s")
+                    pending.discard(future)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
@@ -0,0 +1,309 @@
+"""
+Per-call LLM telemetry.
+
+Every request that goes through LLMClient.generate can be recorded as one
+JSON line: who asked (a dotted caller tag such as "ingest.extract" or
+"synthesis.director"), which model and backend answered, token counts,
+wall time, retry count and whether the response cache served it. Records
+are appended to logs/llm-calls.jsonl in the workspace, next to the
+LogManager logs, and the file is rotated by size.
+
+The API backend reports exact token counts. The CLI backend reports none,
+so its counts are estimated from prompt and response length and flagged
+with tokens_estimated.
+
+`research status llm` reads the records back and aggregates them by
+subsystem (the first component of the caller tag) with summarize().
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Telemetry file, relative to the workspace root
+TELEMETRY_FILE = Path("logs") / "llm-calls.jsonl"
+
+# Rotate once the file exceeds this size, keeping this many old files
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+
+# Rough characters per token, used when the backend reports no usage
+CHARS_PER_TOKEN = 4
+
+# USD per million tokens: (input, output). Cache writes are billed at 1.25x
+# and cache reads at 0.1x the input price.
+MODEL_PRICING: Dict[str, tuple] = {
+    "claude-3-haiku-20240307": (0.25, 1.25),
+    "claude-sonnet-4-20250514": (3.0, 15.0),
+}
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+UNTAGGED = "untagged"
+
+
+@dataclass
+class CallRecord:
+    """One LLM call."""
+    timestamp: str
+    caller: str
+    model: str
+    backend: str
+    wall_time_ms: float
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    tokens_estimated: bool = False
+    retries: int = 0
+    cache_hit: bool = False
+    success: bool = True
+    cost_usd: Optional[float] = None
+
+    @property
+    def subsystem(self) -> str:
+        """First component of the caller tag (e.g. "ingest")."""
+        return self.caller.split(".", 1)[0] if self.caller else UNTAGGED
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CallRecord":
+        """Build a record from a parsed JSON line, ignoring unknown keys."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate a token count from text length."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    cache_creation_input_tokens: int = 0,
+    cache_read_input_tokens: int = 0,
+) -> Optional[float]:
+    """
+    Estimate the USD cost of a call.
+
+    Returns:
+        Cost in USD, or None for unknown models or missing token counts
+    """
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None or input_tokens is None or output_tokens is None:
+        return None
+    input_price, output_price = pricing
+    total = (
+        input_tokens * input_price
+        + cache_creation_input_tokens * input_price * CACHE_WRITE_MULTIPLIER
+        + cache_read_input_tokens * input_price * CACHE_READ_MULTIPLIER
+        + output_tokens * output_price
+    )
+    return round(total / 1_000_000, 6)
+
+
+class TelemetryLog:
+    """
+    Append-only JSONL log of LLM calls with size-based rotation.
+
+    Example:
+        telemetry = TelemetryLog.for_workspace(workspace.path)
+        client = LLMClient(telemetry=telemetry)
+        client.generate_haiku(prompt, caller="ingest.extract")
+        summarize(telemetry.read())
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+    ):
+        """
+        Initialize the log.
+
+        Args:
+            path: JSONL file receiving records (created on first record)
+            max_bytes: Rotate the file once it grows beyond this size
+            backup_count: Rotated files kept (path.1 is the newest)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path, **kwargs) -> "TelemetryLog":
+        """Create a log in the standard location under a workspace."""
+        return cls(Path(workspace_path) / TELEMETRY_FILE, **kwargs)
+
+    def record(self, record: CallRecord) -> None:
+        """Append a record. Write failures are logged, never raised."""
+        line = json.dumps(asdict(record), separators=(",", ":")) + "\n"
+        with self._lock:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if self._should_rollover(len(line)):
+                    self._rollover()
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError as e:
+                logger.warning(f"Could not write LLM telemetry to {self.path}: {e}")
+
+    def read(self) -> List[CallRecord]:
+        """Read all records, oldest first, including rotated files."""
+        records: List[CallRecord] = []
+        for path in self.files():
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            records.append(CallRecord.from_dict(json.loads(line)))
+                        except (json.JSONDecodeError, TypeError):
+                            continue
+            except OSError:
+                continue
+        return records
+
+    def files(self) -> List[Path]:
+        """Existing log files, oldest first."""
+        candidates = [
+            self._backup_path(i) for i in range(self.backup_count, 0, -1)
+        ] + [self.path]
+        return [p for p in candidates if p.exists()]
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def _should_rollover(self, incoming: int) -> bool:
+        if self.max_bytes <= 0 or not self.path.exists():
+            return False
+        return self.path.stat().st_size + incoming > self.max_bytes
+
+    def _rollover(self) -> None:
+        if self.backup_count <= 0:
+            self.path.unlink()
+            return
+        for i in range(self.backup_count - 1, 0, -1):
+            src = self._backup_path(i)
+            if src.exists():
+                os.replace(src, self._backup_path(i + 1))
+        os.replace(self.path, self._backup_path(1))
+
+
+def make_record(
+    caller: Optional[str],
+    model: str,
+    backend: str,
+    wall_time: float,
+    usage: Optional[Dict[str, int]],
+    prompt_text: str = "",
+    response_text: str = "",
+    retries: int = 0,
+    cache_hit: bool = False,
+    success: bool = True,
+) -> CallRecord:
+    """
+    Build a record for a completed call.
+
+    Token counts come from usage when the backend reported it, otherwise
+    they are estimated from prompt_text and response_text. Cache hits cost
+    nothing, and neither do failed calls: the backend returned no usage, so
+    the row records zero tokens rather than billing an estimated prompt.
+
+    Args:
+        wall_time: Seconds spent in the call
+        success: False when the call errored and fell back to offline
+    """
+    if not success:
+        input_tokens = output_tokens = 0
+        estimated = False
+    elif usage:
+        input_tokens = usage.get("input_tokens")
+        output_tokens = usage.get("output_tokens")
+        estimated = False
+    else:
+        input_tokens = estimate_tokens(prompt_text)
+        output_tokens = estimate_tokens(response_text)
+        estimated = True
+    cache_write = (usage or {}).get("cache_creation_input_tokens", 0)
+    cache_read = (usage or {}).get("cache_read_input_tokens", 0)
+
+    cost = 0.0 if cache_hit or not success else estimate_cost(
+        model, input_tokens, output_tokens, cache_write, cache_read
+    )
+    return CallRecord(
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        caller=caller or UNTAGGED,
+        model=model,
+        backend=backend,
+        wall_time_ms=round(wall_time * 1000, 1),
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=cache_write,
+        cache_read_input_tokens=cache_read,
+        tokens_estimated=estimated,
+        retries=retries,
+        cache_hit=cache_hit,
+        success=success,
+        cost_usd=cost,
+    )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of values (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(records: Iterable[CallRecord]) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate records by subsystem.
+
+    Latency percentiles only count calls that reached a backend; cache hits
+    are reported separately so they don't hide slow paths.
+
+    Returns:
+        Mapping of subsystem to calls, cache_hits, failures, retries,
+        p50_ms, p95_ms, input_tokens, output_tokens, cache_read_tokens and
+        cost_usd, ordered by total wall time (slowest first)
+    """
+    groups: Dict[str, List[CallRecord]] = {}
+    for record in records:
+        groups.setdefault(record.subsystem, []).append(record)
+
+    summary: Dict[str, Dict[str, Any]] = {}
+    for subsystem, group in groups.items():
+        live = [r for r in group if not r.cache_hit]
+        latencies = [r.wall_time_ms for r in live]
+        summary[subsystem] = {
+            "calls": len(group),
+            "cache_hits": len(group) - len(live),
+            "failures": sum(1 for r in group if not r.success),
+            "retries": sum(r.retries for r in group),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "total_ms": sum(latencies),
+            "input_tokens": sum(r.input_tokens or 0 for r in live),
+            "output_tokens": sum(r.output_tokens or 0 for r in live),
+            "cache_read_tokens": sum(r.cache_read_input_tokens for r in live),
+            "estimated": any(r.tokens_estimated for r in live),
+            "cost_usd": round(sum(r.cost_usd or 0.0 for r in group), 4),
+        }
+
+    return dict(sorted(summary.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
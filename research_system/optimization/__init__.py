@@ -5,14 +5,21 @@ This package provides parameter optimization capabilities:
 - OptimizationResult: Results from optimization run
 - WalkForwardRunner: True walk-forward optimization
 - Reporting: Terminal summaries and JSON export
-- Grid search and random search methods
+- Grid, random, Bayesian, successive-halving and pre-screened search methods
+- VectorizedScreener: Local NumPy simulation of template strategies
 """
 
 from research_system.optimization.optimizer import (
+    EvaluationLedger,
     OptimizationMethod,
     OptimizationResult,
     ParameterOptimizer,
 )
+from research_system.optimization.prescreen import (
+    PriceCache,
+    ScreenResult,
+    VectorizedScreener,
+)
 from research_system.optimization.walk_forward import (
     WalkForwardConfig,
     WalkForwardPeriod,
@@ -28,9 +35,13 @@ from research_system.optimization.reporting import (
 )
 
 __all__ = [
+    "EvaluationLedger",
     "OptimizationMethod",
     "OptimizationResult",
     "ParameterOptimizer",
+    "PriceCache",
+    "ScreenResult",
+    "VectorizedScreener",
     "WalkForwardConfig",
     "WalkForwardPeriod",
     "WalkForwardResult",
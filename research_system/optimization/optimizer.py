@@ -3,21 +3,38 @@
 This module provides parameter optimization capabilities:
 - Grid search: Exhaustive search over all parameter combinations
 - Random search: Sample N random combinations from parameter space
+- Bayesian search: Gaussian process surrogate proposes each next combination
+- Successive halving: Screen many combinations on a short recent slice of
+  the range and promote only the best to the full range
+- Pre-screen: Score a large grid with the local vectorized simulator (see
+  prescreen.py) and backtest only the best few
 
 The optimizer integrates with BacktestExecutor to evaluate each
-parameter combination via backtesting.
+parameter combination via backtesting. Evaluations can run on a worker
+pool; each in-flight backtest uses its own LEAN project slot from the
+executor (see BacktestExecutor.max_concurrent).
 """
 
 from __future__ import annotations
 
 import itertools
+import math
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from enum import Enum
+from collections.abc import Callable
 from typing import Any
 
 import logging
 
+from research_system.codegen.cache import CodeGenCache
+from research_system.optimization.search import (
+    BayesianSearch,
+    halving_budget,
+    halving_schedule,
+)
 from research_system.schemas.v4 import (
     ParameterType,
     TunableParameter,
@@ -32,6 +49,9 @@ class OptimizationMethod(str, Enum):
 
     GRID = "grid"
     RANDOM = "random"
+    BAYESIAN = "bayesian"
+    SUCCESSIVE_HALVING = "successive_halving"
+    PRESCREEN = "prescreen"
 
 
 @dataclass
@@ -44,6 +64,8 @@ class ParameterEvaluation:
     max_drawdown: float | None = None
     success: bool = False
     error: str | None = None
+    start_date: str | None = None
+    end_date: str | None = None
 
 
 @dataclass
@@ -59,6 +81,7 @@ class OptimizationResult:
     total_successful: int = 0
     method: OptimizationMethod = OptimizationMethod.RANDOM
     error: str | None = None
+    prescreened: int = 0
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -71,6 +94,7 @@ class OptimizationResult:
             "total_successful": self.total_successful,
             "method": self.method.value,
             "error": self.error,
+            "prescreened": self.prescreened,
             "evaluations": [
                 {
                     "params": e.params,
@@ -79,18 +103,79 @@ class OptimizationResult:
                     "max_drawdown": e.max_drawdown,
                     "success": e.success,
                     "error": e.error,
+                    "start_date": e.start_date,
+                    "end_date": e.end_date,
                 }
                 for e in self.evaluations
             ],
         }
 
 
+class EvaluationLedger:
+    """Successful evaluations of one strategy keyed on (params, date range).
+
+    Shared across walk-forward periods so that an identical parameter set on
+    an identical range is never backtested twice, and so that the best
+    parameter sets of one period can seed the search of the next.
+
+    Failed evaluations are not recorded; they may be transient and are
+    always retried.
+    """
+
+    def __init__(self):
+        """Initialize an empty ledger."""
+        self._entries: dict[tuple, ParameterEvaluation] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    @staticmethod
+    def _key(params: dict[str, Any], start_date: str | None, end_date: str | None) -> tuple:
+        return (tuple(sorted(params.items())), start_date, end_date)
+
+    def get(self, params: dict[str, Any], start_date: str, end_date: str) -> ParameterEvaluation | None:
+        """Look up a previous evaluation of params on a date range."""
+        with self._lock:
+            evaluation = self._entries.get(self._key(params, start_date, end_date))
+            if evaluation is not None:
+                self.hits += 1
+            return evaluation
+
+    def record(self, evaluation: ParameterEvaluation) -> None:
+        """Record an evaluation (ignored unless it succeeded)."""
+        if not evaluation.success:
+            return
+        with self._lock:
+            self._entries[self._key(evaluation.params, evaluation.start_date, evaluation.end_date)] = evaluation
+
+    def top(self, start_date: str, end_date: str, k: int, objective: str = "sharpe") -> list[dict[str, Any]]:
+        """Best k parameter sets evaluated on a date range, best first."""
+        with self._lock:
+            evaluations = [
+                e for e in self._entries.values() if e.start_date == start_date and e.end_date == end_date
+            ]
+        evaluations.sort(key=lambda e: ParameterOptimizer._objective_value(e, objective) or 0.0, reverse=True)
+        return [e.params for e in evaluations[:k]]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class ParameterOptimizer:
     """Optimize strategy parameters via backtesting.
 
-    Supports grid search and random search methods.
+    Supports grid, random, Bayesian and successive-halving search.
     Grid search is exhaustive but expensive for large parameter spaces.
     Random search samples N combinations and is often as effective.
+    Bayesian search spends the same budget where a surrogate model
+    expects improvement. Successive halving screens about twice as many
+    combinations on short date slices within the same backtest budget.
+    Pre-screening sweeps thousands of combinations locally with a
+    VectorizedScreener and spends the backtests on the best of them.
+
+    With max_workers > 1, combinations are evaluated concurrently and the
+    running best is updated as each evaluation completes. The final result
+    is identical to a sequential run (ties go to the earlier combination).
 
     Example:
         optimizer = ParameterOptimizer(backtest_executor, code_generator)
@@ -105,19 +190,50 @@ class ParameterOptimizer:
         print(f"Best Sharpe: {result.best_sharpe}")
     """
 
+    # Successive halving: keep 1/HALVING_ETA of candidates per rung and
+    # never screen on less than HALVING_MIN_DAYS of data
+    HALVING_ETA = 3
+    HALVING_MIN_DAYS = 365
+    HALVING_MAX_RUNGS = 3
+
+    # Pre-screen: combinations scored locally, and how many of the best
+    # are confirmed by backtest (a minimum, and a share of max_evaluations)
+    PRESCREEN_CANDIDATES = 5000
+    PRESCREEN_CONFIRM = 5
+    PRESCREEN_CONFIRM_FRACTION = 0.2
+
     def __init__(
         self,
         backtest_executor=None,
         code_generator=None,
+        max_workers: int = 1,
+        seed: int | None = None,
+        runtime_parameters: bool = False,
+        prescreener=None,
     ):
         """Initialize the optimizer.
 
         Args:
             backtest_executor: BacktestExecutor for running backtests
             code_generator: V4CodeGenerator for generating code
+            max_workers: Default number of evaluations to run concurrently
+            seed: Seed for random sampling and the adaptive search methods
+                (default: unseeded)
+            runtime_parameters: Generate one parameterized algorithm per
+                strategy and pass each combination through config.json,
+                instead of regenerating code per combination
+            prescreener: VectorizedScreener used by the prescreen method
         """
         self.backtest_executor = backtest_executor
         self.code_generator = code_generator
+        self.max_workers = max(1, max_workers)
+        self.seed = seed
+        self.runtime_parameters = runtime_parameters
+        self.prescreener = prescreener
+
+        # Parameterized code per (strategy hash, parameter names)
+        self._runtime_code: dict[tuple[str, tuple[str, ...]], Any] = {}
+        self._runtime_code_lock = threading.Lock()
 
     def optimize(
         self,
@@ -127,6 +243,10 @@ class ParameterOptimizer:
         max_evaluations: int = 50,
         method: OptimizationMethod = OptimizationMethod.RANDOM,
         objective: str = "sharpe",
+        max_workers: int | None = None,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None = None,
+        ledger: EvaluationLedger | None = None,
+        warm_start: list[dict[str, Any]] | None = None,
     ) -> OptimizationResult:
         """Optimize parameters for a strategy.
 
@@ -134,9 +254,17 @@ class ParameterOptimizer:
             strategy: Strategy document with tunable_parameters
             start_date: Backtest start date
             end_date: Backtest end date
-            max_evaluations: Maximum number of parameter combinations to evaluate
-            method: Search method (grid or random)
+            max_evaluations: Maximum number of backtests to run
+            method: Search method (grid, random, bayesian, successive_halving
+                or prescreen)
             objective: Metric to optimize ("sharpe" or "cagr")
+            max_workers: Evaluations to run concurrently (default: self.max_workers)
+            on_evaluation: Optional callback invoked as each evaluation completes
+                with (completed_count, evaluation, running_best)
+            ledger: Evaluations to reuse instead of re-running identical
+                (params, range) backtests; new evaluations are recorded in it
+            warm_start: Parameter sets to evaluate first (e.g. the best of a
+                previous walk-forward period); they count against max_evaluations
 
         Returns:
             OptimizationResult with best parameters found
@@ -150,43 +278,69 @@ class ParameterOptimizer:
                 method=method,
             )
 
-        # Generate parameter combinations
-        if method == OptimizationMethod.GRID:
-            combinations = self._generate_grid_combinations(tunable, max_evaluations)
-        else:
-            combinations = self._generate_random_combinations(tunable, max_evaluations)
+        workers = max_workers or self.max_workers
 
-        if not combinations:
-            return OptimizationResult(
-                success=False,
-                error="No parameter combinations generated",
-                method=method,
+        # Evaluate warm-start parameter sets first
+        warm_evaluations: list[ParameterEvaluation] = []
+        if warm_start:
+            warm_combinations = self._dedupe(warm_start)[:max_evaluations]
+            logger.info(f"Warm-starting with {len(warm_combinations)} parameter combinations")
+            warm_evaluations, _ = self._evaluate_combinations(
+                strategy, warm_combinations, start_date, end_date, objective, workers, on_evaluation, ledger
             )
+        budget = max_evaluations - len(warm_evaluations)
+        on_evaluation = self._offset_callback(on_evaluation, warm_evaluations, objective)
 
-        logger.info(f"Evaluating {len(combinations)} parameter combinations")
-
-        # Evaluate each combination
-        evaluations = []
+        evaluations: list[ParameterEvaluation] = []
         best_result: ParameterEvaluation | None = None
+        prescreened = 0
+        if method == OptimizationMethod.BAYESIAN:
+            evaluations, best_result = self._optimize_bayesian(
+                strategy, tunable, start_date, end_date, budget, objective, workers, on_evaluation,
+                ledger, warm_evaluations,
+            )
+        elif method == OptimizationMethod.SUCCESSIVE_HALVING:
+            evaluations, best_result = self._optimize_successive_halving(
+                strategy, tunable, start_date, end_date, budget, objective, workers, on_evaluation,
+                ledger, warm_evaluations,
+            )
+        elif method == OptimizationMethod.PRESCREEN:
+            evaluations, best_result, prescreened = self._optimize_prescreened(
+                strategy, tunable, start_date, end_date, budget, objective, workers, on_evaluation,
+                ledger, warm_evaluations,
+            )
+        else:
+            # Generate parameter combinations (over-generate to replace warm-start repeats)
+            n_generate = budget + len(warm_evaluations)
+            if method == OptimizationMethod.GRID:
+                combinations = self._generate_grid_combinations(tunable, n_generate)
+            else:
+                combinations = self._generate_random_combinations(tunable, n_generate)
+            combinations = self._exclude(combinations, warm_evaluations)[:budget]
+
+            if combinations:
+                logger.info(f"Evaluating {len(combinations)} parameter combinations")
+                evaluations, best_result = self._evaluate_combinations(
+                    strategy,
+                    combinations,
+                    start_date,
+                    end_date,
+                    objective,
+                    workers,
+                    on_evaluation,
+                    ledger,
+                )
 
-        for i, params in enumerate(combinations):
-            logger.debug(f"Evaluating combination {i + 1}/{len(combinations)}: {params}")
+        # Warm-start results win ties, as they were evaluated first
+        best_result = self._select_best(warm_evaluations + ([best_result] if best_result else []), objective)
+        evaluations = warm_evaluations + evaluations
 
-            eval_result = self._evaluate_parameters(
-                strategy, params, start_date, end_date
+        if not evaluations:
+            return OptimizationResult(
+                success=False,
+                error="No parameter combinations generated",
+                method=method,
             )
-            evaluations.append(eval_result)
-
-            if eval_result.success:
-                # Check if this is the best so far
-                if best_result is None:
-                    best_result = eval_result
-                elif objective == "sharpe":
-                    if (eval_result.sharpe or 0) > (best_result.sharpe or 0):
-                        best_result = eval_result
-                elif objective == "cagr":
-                    if (eval_result.cagr or 0) > (best_result.cagr or 0):
-                        best_result = eval_result
 
         # Compile results
         total_successful = sum(1 for e in evaluations if e.success)
@@ -199,6 +353,7 @@ class ParameterOptimizer:
                 total_successful=total_successful,
                 method=method,
                 error="All parameter combinations failed",
+                prescreened=prescreened,
             )
 
         return OptimizationResult(
@@ -210,7 +365,343 @@ class ParameterOptimizer:
             total_evaluated=len(evaluations),
             total_successful=total_successful,
             method=method,
+            prescreened=prescreened,
+        )
+
+    def _evaluate_combinations(
+        self,
+        strategy: dict[str, Any],
+        combinations: list[dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        objective: str,
+        max_workers: int,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None = None,
+        ledger: EvaluationLedger | None = None,
+    ) -> tuple[list[ParameterEvaluation], ParameterEvaluation | None]:
+        """Evaluate combinations, sequentially or on a worker pool.
+
+        Combinations already in the ledger for this range are not re-run.
+
+        Returns:
+            Tuple of (evaluations in combination order, best evaluation)
+        """
+
+        def evaluate(params: dict[str, Any]) -> ParameterEvaluation:
+            if ledger is not None:
+                previous = ledger.get(params, start_date, end_date)
+                if previous is not None:
+                    logger.debug(f"Reusing ledger evaluation for {params}")
+                    return previous
+            evaluation = self._evaluate_parameters(strategy, params, start_date, end_date)
+            if ledger is not None:
+                ledger.record(evaluation)
+            return evaluation
+
+        evaluations: list[ParameterEvaluation | None] = [None] * len(combinations)
+        best_index: int | None = None
+        completed = 0
+
+        def record(index: int, eval_result: ParameterEvaluation) -> None:
+            nonlocal best_index, completed
+            evaluations[index] = eval_result
+            completed += 1
+            if eval_result.success:
+                # Ties go to the earlier combination, matching sequential order
+                current = evaluations[best_index] if best_index is not None else None
+                if (
+                    best_index is None
+                    or current is None
+                    or self._is_better(eval_result, current, objective)
+                    or (index < best_index and not self._is_better(current, eval_result, objective))
+                ):
+                    best_index = index
+            if on_evaluation is not None:
+                on_evaluation(completed, eval_result, evaluations[best_index] if best_index is not None else None)
+
+        workers = min(max(1, max_workers), len(combinations))
+        if workers == 1:
+            for i, params in enumerate(combinations):
+                logger.debug(f"Evaluating combination {i + 1}/{len(combinations)}: {params}")
+                record(i, evaluate(params))
+        else:
+            logger.info(f"Evaluating with {workers} concurrent workers")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="optimizer") as pool:
+                futures = {
+                    pool.submit(evaluate, params): i
+                    for i, params in enumerate(combinations)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    logger.debug(f"Completed combination {i + 1}/{len(combinations)}: {combinations[i]}")
+                    record(i, future.result())
+
+        best = evaluations[best_index] if best_index is not None else None
+        return [e for e in evaluations if e is not None], best
+
+    def _optimize_bayesian(
+        self,
+        strategy: dict[str, Any],
+        tunable: TunableParameters,
+        start_date: str,
+        end_date: str,
+        max_evaluations: int,
+        objective: str,
+        max_workers: int,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None = None,
+        ledger: EvaluationLedger | None = None,
+        prior: list[ParameterEvaluation] | None = None,
+    ) -> tuple[list[ParameterEvaluation], ParameterEvaluation | None]:
+        """Sequential model-based search over the parameter grid.
+
+        Each round asks the surrogate for one suggestion per worker, so
+        max_workers > 1 trades some sample efficiency for wall-clock time.
+        Prior evaluations on the same range seed the surrogate and are not
+        suggested again.
+
+        Returns:
+            Tuple of (evaluations in suggestion order, best evaluation)
+        """
+        param_values = self._get_param_values(tunable)
+        search = BayesianSearch(
+            param_values,
+            n_initial=max(3, min(10, max_evaluations // 5)),
+            rng=random.Random(self.seed),
+        )
+        for evaluation in prior or []:
+            search.observe(evaluation.params, self._objective_value(evaluation, objective))
+        logger.info(
+            f"Bayesian search: {max_evaluations} evaluations over {search.space_size} combinations"
+        )
+
+        evaluations: list[ParameterEvaluation] = []
+        while len(evaluations) < max_evaluations and not search.exhausted:
+            batch = search.suggest(min(max(1, max_workers), max_evaluations - len(evaluations)))
+            if not batch:
+                break
+            batch_evaluations, _ = self._evaluate_combinations(
+                strategy,
+                batch,
+                start_date,
+                end_date,
+                objective,
+                max_workers,
+                self._offset_callback(on_evaluation, evaluations, objective),
+                ledger,
+            )
+            for evaluation in batch_evaluations:
+                search.observe(evaluation.params, self._objective_value(evaluation, objective))
+            evaluations.extend(batch_evaluations)
+
+        return evaluations, self._select_best(evaluations, objective)
+
+    def _optimize_successive_halving(
+        self,
+        strategy: dict[str, Any],
+        tunable: TunableParameters,
+        start_date: str,
+        end_date: str,
+        max_evaluations: int,
+        objective: str,
+        max_workers: int,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None = None,
+        ledger: EvaluationLedger | None = None,
+        prior: list[ParameterEvaluation] | None = None,
+    ) -> tuple[list[ParameterEvaluation], ParameterEvaluation | None]:
+        """Successive halving over trailing slices of the date range.
+
+        Random candidates are screened on the most recent slice of the
+        range; the top 1/HALVING_ETA of each rung is promoted to a slice
+        HALVING_ETA times longer, ending with the full range. The number of
+        candidates is sized so the total backtest count stays within
+        max_evaluations. The best result is taken from the full-range rung
+        only, so it is comparable with the other methods. Parameter sets in
+        prior (already evaluated on the full range) are not screened again.
+
+        Returns:
+            Tuple of (evaluations from all rungs, best full-range evaluation)
+        """
+        if max_evaluations <= 0:
+            return [], None
+
+        eta = self.HALVING_ETA
+        rungs = halving_schedule(
+            start_date, end_date, 1, eta, self.HALVING_MIN_DAYS, self.HALVING_MAX_RUNGS
+        )
+
+        # Largest first-rung size whose whole schedule fits in the budget
+        n_candidates = max_evaluations
+        while n_candidates > 1 and halving_budget(n_candidates, eta, len(rungs)) > max_evaluations:
+            n_candidates -= 1
+        rungs = halving_schedule(
+            start_date, end_date, n_candidates, eta, self.HALVING_MIN_DAYS, self.HALVING_MAX_RUNGS
+        )
+
+        candidates = self._exclude(
+            self._generate_random_combinations(tunable, n_candidates, random.Random(self.seed)), prior or []
+        )
+        logger.info(
+            f"Successive halving: {len(candidates)} candidates over {len(rungs)} rungs "
+            f"({', '.join(f'{s}..{e}' for s, e, _ in rungs)})"
+        )
+
+        evaluations: list[ParameterEvaluation] = []
+        full_range: list[ParameterEvaluation] = []
+        for rung_start, rung_end, _ in rungs:
+            if not candidates:
+                break
+            rung_evaluations, _ = self._evaluate_combinations(
+                strategy,
+                candidates,
+                rung_start,
+                rung_end,
+                objective,
+                max_workers,
+                self._offset_callback(on_evaluation, evaluations, objective),
+                ledger,
+            )
+            evaluations.extend(rung_evaluations)
+            if rung_start == start_date:
+                full_range = rung_evaluations
+
+            # Promote the top 1/eta (stable sort keeps earlier candidates on ties)
+            survivors = sorted(
+                (e for e in rung_evaluations if e.success),
+                key=lambda e: self._objective_value(e, objective) or 0.0,
+                reverse=True,
+            )
+            candidates = [e.params for e in survivors[: max(1, len(rung_evaluations) // eta)]]
+
+        return evaluations, self._select_best(full_range, objective)
+
+    def _optimize_prescreened(
+        self,
+        strategy: dict[str, Any],
+        tunable: TunableParameters,
+        start_date: str,
+        end_date: str,
+        max_evaluations: int,
+        objective: str,
+        max_workers: int,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None = None,
+        ledger: EvaluationLedger | None = None,
+        prior: list[ParameterEvaluation] | None = None,
+    ) -> tuple[list[ParameterEvaluation], ParameterEvaluation | None, int]:
+        """Local sweep of a large grid, then backtests of its best few.
+
+        Up to PRESCREEN_CANDIDATES grid combinations (stratified over every
+        axis of the full grid) are scored by self.prescreener in one pass.
+        The best PRESCREEN_CONFIRM of them, or PRESCREEN_CONFIRM_FRACTION of
+        max_evaluations if that is more, are backtested.
+        Without a prescreener, or for a strategy it can't simulate, this is
+        a random search. Parameter sets in prior are not screened again.
+
+        Returns:
+            Tuple of (backtest evaluations, best evaluation, number of
+            combinations screened locally)
+        """
+        if max_evaluations <= 0:
+            return [], None, 0
+
+        prior = prior or []
+        candidates = self._exclude(self._generate_grid_combinations(tunable, self.PRESCREEN_CANDIDATES), prior)
+        screen = None
+        if self.prescreener is not None and candidates:
+            screen = self.prescreener.screen(strategy, candidates, start_date, end_date)
+
+        if screen is None:
+            logger.info("Pre-screen unavailable for this strategy; using random search")
+            screened = 0
+            combinations = self._exclude(
+                self._generate_random_combinations(tunable, max_evaluations + len(prior), random.Random(self.seed)),
+                prior,
+            )[:max_evaluations]
+        else:
+            screened = len(candidates)
+            confirm = max(self.PRESCREEN_CONFIRM, int(max_evaluations * self.PRESCREEN_CONFIRM_FRACTION))
+            combinations = screen.top(min(max_evaluations, confirm), objective)
+            logger.info(f"Pre-screened {screened} combinations locally; backtesting the best {len(combinations)}")
+
+        if not combinations:
+            return [], None, screened
+
+        evaluations, best = self._evaluate_combinations(
+            strategy, combinations, start_date, end_date, objective, max_workers, on_evaluation, ledger
         )
+        return evaluations, best, screened
+
+    def _offset_callback(
+        self,
+        on_evaluation: Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None,
+        previous: list[ParameterEvaluation],
+        objective: str,
+    ) -> Callable[[int, ParameterEvaluation, ParameterEvaluation | None], None] | None:
+        """Adapt on_evaluation for a batch so counts and best span all batches."""
+        if on_evaluation is None:
+            return None
+
+        offset = len(previous)
+        previous_best = self._select_best(previous, objective)
+
+        def callback(completed: int, evaluation: ParameterEvaluation, best: ParameterEvaluation | None) -> None:
+            if best is None or (previous_best is not None and not self._is_better(best, previous_best, objective)):
+                best = previous_best
+            on_evaluation(offset + completed, evaluation, best)
+
+        return callback
+
+    @staticmethod
+    def _dedupe(combinations: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Drop repeated parameter sets, keeping first occurrences."""
+        seen: set[tuple] = set()
+        unique = []
+        for params in combinations:
+            key = tuple(sorted(params.items()))
+            if key not in seen:
+                seen.add(key)
+                unique.append(params)
+        return unique
+
+    @staticmethod
+    def _exclude(
+        combinations: list[dict[str, Any]],
+        evaluations: list[ParameterEvaluation],
+    ) -> list[dict[str, Any]]:
+        """Drop parameter sets that already have an evaluation."""
+        done = [e.params for e in evaluations]
+        return [params for params in combinations if params not in done]
+
+    def _select_best(
+        self,
+        evaluations: list[ParameterEvaluation],
+        objective: str,
+    ) -> ParameterEvaluation | None:
+        """Best successful evaluation (ties go to the earlier one)."""
+        best = None
+        for evaluation in evaluations:
+            if evaluation.success and (best is None or self._is_better(evaluation, best, objective)):
+                best = evaluation
+        return best
+
+    @staticmethod
+    def _objective_value(evaluation: ParameterEvaluation, objective: str) -> float | None:
+        """Objective value of an evaluation, or None if it failed."""
+        if not evaluation.success:
+            return None
+        if objective == "cagr":
+            return evaluation.cagr or 0.0
+        return evaluation.sharpe or 0.0
+
+    @staticmethod
+    def _is_better(
+        candidate: ParameterEvaluation,
+        current: ParameterEvaluation,
+        objective: str,
+    ) -> bool:
+        """Check if candidate strictly beats current on the objective."""
+        if objective == "cagr":
+            return (candidate.cagr or 0) > (current.cagr or 0)
+        return (candidate.sharpe or 0) > (current.sharpe or 0)
 
     def _get_tunable_parameters(
         self, strategy: dict[str, Any]
@@ -231,7 +722,14 @@ class ParameterOptimizer:
         tunable: TunableParameters,
         max_evaluations: int,
     ) -> list[dict[str, Any]]:
-        """Generate all grid combinations up to max_evaluations.
+        """Generate grid combinations up to max_evaluations.
+
+        When the full grid is larger than max_evaluations, the sample is
+        stratified per parameter: each parameter takes min(len(values),
+        max_evaluations) evenly spaced values, paired with the other
+        parameters' values in a different order per parameter (a coprime
+        stride), so no parameter is held constant or restricted to a
+        subset of its range.
 
         Args:
             tunable: Tunable parameters configuration
@@ -241,10 +739,7 @@ class ParameterOptimizer:
             List of parameter dictionaries
         """
         # Generate all possible values for each parameter
-        param_values: dict[str, list[Any]] = {}
-
-        for name, param in tunable.parameters.items():
-            param_values[name] = self._get_parameter_values(param)
+        param_values = self._get_param_values(tunable)
 
         # Generate cartesian product
         if not param_values:
@@ -253,33 +748,87 @@ class ParameterOptimizer:
         keys = list(param_values.keys())
         value_lists = [param_values[k] for k in keys]
 
-        combinations = []
-        for values in itertools.product(*value_lists):
-            if len(combinations) >= max_evaluations:
-                break
-            combinations.append(dict(zip(keys, values)))
+        total = 1
+        for values in value_lists:
+            total *= len(values)
+
+        if total <= max_evaluations:
+            return [dict(zip(keys, values, strict=True)) for values in itertools.product(*value_lists)]
 
-        return combinations
+        n = max(0, max_evaluations)
+        lengths = [len(values) for values in value_lists]
+        strides = self._coprime_strides(n, len(value_lists))
+
+        chosen: list[tuple[int, ...]] = []
+        seen: set[tuple[int, ...]] = set()
+        for i in range(n):
+            # Sample i takes slot (i * stride) % n of n evenly spaced
+            # positions along each axis
+            positions = tuple(
+                ((i * stride) % n) * length // n for stride, length in zip(strides, lengths, strict=True)
+            )
+            if positions not in seen:
+                seen.add(positions)
+                chosen.append(positions)
+
+        # Fill collisions (short axes) with unused grid points spread over
+        # the whole product
+        if len(chosen) < n:
+            stride = self._coprime_strides(total, 2)[1]
+            for j in range(total):
+                index = j * stride % total
+                digits: list[int] = []
+                for length in reversed(lengths):
+                    index, position = divmod(index, length)
+                    digits.append(position)
+                positions = tuple(reversed(digits))
+                if positions not in seen:
+                    seen.add(positions)
+                    chosen.append(positions)
+                    if len(chosen) == n:
+                        break
+
+        return [
+            {key: values[position] for key, values, position in zip(keys, value_lists, positions, strict=True)}
+            for positions in chosen
+        ]
+
+    @staticmethod
+    def _coprime_strides(n: int, count: int) -> list[int]:
+        """count distinct strides coprime with n, the first being 1.
+
+        Later strides are spread over (0, n) by the golden ratio, so
+        different axes visit their values in unrelated orders.
+        """
+        strides = [1]
+        golden = (5 ** 0.5 - 1) / 2
+        for k in range(1, count):
+            stride = max(1, int(n * ((k * golden) % 1)))
+            for _ in range(n):
+                if math.gcd(stride, n) == 1 and stride not in strides:
+                    break
+                stride = stride % max(n - 1, 1) + 1
+            strides.append(stride)
+        return strides
 
     def _generate_random_combinations(
         self,
         tunable: TunableParameters,
         max_evaluations: int,
+        rng: random.Random | None = None,
     ) -> list[dict[str, Any]]:
         """Generate random parameter combinations.
 
         Args:
             tunable: Tunable parameters configuration
             max_evaluations: Number of combinations to generate
+            rng: Source of randomness (default: seeded from self.seed)
 
         Returns:
             List of parameter dictionaries
         """
         # Get all possible values for each parameter
-        param_values: dict[str, list[Any]] = {}
-
-        for name, param in tunable.parameters.items():
-            param_values[name] = self._get_parameter_values(param)
+        param_values = self._get_param_values(tunable)
 
         if not param_values:
             return []
@@ -291,19 +840,24 @@ class ParameterOptimizer:
         if total_space <= max_evaluations:
             return self._generate_grid_combinations(tunable, total_space)
 
-        # Generate random combinations (avoiding duplicates)
+        # Generate random combinations (avoiding duplicates, in draw order)
+        rng = rng or random.Random(self.seed)
         keys = list(param_values.keys())
-        combinations = set()
+        combinations: dict[tuple[Any, ...], None] = {}
 
         attempts = 0
         max_attempts = max_evaluations * 10  # Prevent infinite loop
 
         while len(combinations) < max_evaluations and attempts < max_attempts:
-            combo = tuple(random.choice(param_values[k]) for k in keys)
-            combinations.add(combo)
+            combo = tuple(rng.choice(param_values[k]) for k in keys)
+            combinations[combo] = None
             attempts += 1
 
-        return [dict(zip(keys, combo)) for combo in combinations]
+        return [dict(zip(keys, combo, strict=True)) for combo in combinations]
+
+    def _get_param_values(self, tunable: TunableParameters) -> dict[str, list[Any]]:
+        """Get the possible values for every tunable parameter."""
+        return {name: self._get_parameter_values(param) for name, param in tunable.parameters.items()}
 
     def _get_parameter_values(self, param: TunableParameter) -> list[Any]:
         """Get all possible values for a parameter.
@@ -358,40 +912,42 @@ class ParameterOptimizer:
         if not self.backtest_executor or not self.code_generator:
             return ParameterEvaluation(
                 params=params,
+                start_date=start_date,
+                end_date=end_date,
                 success=False,
                 error="No backtest executor or code generator configured",
             )
 
         try:
-            # Create strategy copy with injected parameters
-            strategy_with_params = self._inject_parameters(strategy, params)
-
-            # Generate code
-            code_result = self.code_generator.generate(strategy_with_params)
+            # Generate code (or reuse the parameterized algorithm)
+            code_result, runtime_values = self.prepare_code(strategy, params)
             if not code_result.success:
                 return ParameterEvaluation(
                     params=params,
+                    start_date=start_date,
+                    end_date=end_date,
                     success=False,
                     error=f"Code generation failed: {code_result.error}",
                 )
 
             # Run backtest
-            result = self.backtest_executor.run_single(
-                code=code_result.code,
-                start_date=start_date,
-                end_date=end_date,
-                strategy_id=f"{strategy.get('id', 'opt')}_eval",
+            result = self.run_prepared(
+                code_result, runtime_values, start_date, end_date, f"{strategy.get('id', 'opt')}_eval"
             )
 
             if not result.success:
                 return ParameterEvaluation(
                     params=params,
+                    start_date=start_date,
+                    end_date=end_date,
                     success=False,
                     error=result.error,
                 )
 
             return ParameterEvaluation(
                 params=params,
+                start_date=start_date,
+                end_date=end_date,
                 sharpe=result.sharpe,
                 cagr=result.cagr,
                 max_drawdown=result.max_drawdown,
@@ -402,10 +958,74 @@ class ParameterOptimizer:
             logger.error(f"Error evaluating parameters {params}: {e}")
             return ParameterEvaluation(
                 params=params,
+                start_date=start_date,
+                end_date=end_date,
                 success=False,
                 error=str(e),
             )
 
+    def prepare_code(
+        self,
+        strategy: dict[str, Any],
+        params: dict[str, Any],
+    ) -> tuple[Any, dict[str, Any] | None]:
+        """Get the code to backtest a parameter combination.
+
+        With runtime_parameters enabled, the algorithm is generated once per
+        strategy and set of parameter names and reads the tuned values from
+        config.json, so only the returned values change between
+        evaluations. Falls back to generating code with the values inlined
+        when the generated code can't read every tuned parameter at runtime
+        (LLM-generated code, or parameters that change the code structure).
+
+        Args:
+            strategy: Strategy document
+            params: Parameter values to use
+
+        Returns:
+            (CodeGenResult, values for config.json or None if inlined)
+        """
+        strategy_with_params = self._inject_parameters(strategy, params)
+
+        if self.runtime_parameters and params:
+            names = tuple(sorted(params))
+            key = (CodeGenCache.make_key(strategy), names)
+            with self._runtime_code_lock:
+                code_result = self._runtime_code.get(key)
+            if code_result is None:
+                code_result = self.code_generator.generate(strategy_with_params, runtime_parameters=list(names))
+                if code_result.success:
+                    with self._runtime_code_lock:
+                        code_result = self._runtime_code.setdefault(key, code_result)
+            if code_result.success and set(names) <= set(code_result.runtime_parameters):
+                return code_result, {name: params[name] for name in names}
+
+        return self.code_generator.generate(strategy_with_params), None
+
+    def run_prepared(
+        self,
+        code_result,
+        runtime_values: dict[str, Any] | None,
+        start_date: str,
+        end_date: str,
+        strategy_id: str,
+    ):
+        """Run a backtest for code returned by prepare_code()."""
+        if runtime_values is None:
+            return self.backtest_executor.run_single(
+                code=code_result.code,
+                start_date=start_date,
+                end_date=end_date,
+                strategy_id=strategy_id,
+            )
+        return self.backtest_executor.run_single(
+            code=code_result.code,
+            start_date=start_date,
+            end_date=end_date,
+            strategy_id=strategy_id,
+            parameters=runtime_values,
+        )
+
     def _inject_parameters(
         self,
         strategy: dict[str, Any],
@@ -0,0 +1,658 @@
+"""Local vectorized pre-screening for template strategies.
+
+Every optimizer evaluation is a full LEAN backtest, yet most candidates in
+a large parameter grid are plainly poor. This module re-implements the
+trading rules of the v4 template families (momentum, mean_reversion and
+regime_adaptive in codegen/templates/v4) as NumPy array operations, so
+thousands of parameter sets are scored in one pass over locally cached
+daily prices. Only the best few are then backtested in LEAN (see
+OptimizationMethod.PRESCREEN).
+
+The simulation approximates the generated algorithms closely enough to
+rank candidates, not to report results:
+
+- Signals on day t use closes up to t-1 (LEAN daily history requested
+  after the open); the resulting weights earn the close-to-close returns
+  from day t+1.
+- Positions are held at constant weight between decisions, and trading
+  costs are cost_bps per unit of turnover.
+- A signal needs its full lookback window of data (the templates accept
+  80% of it).
+
+Prices are read from <workspace>/data/ohlcv/<SYMBOL>.csv, one row per
+trading day with at least date and close columns. screen() returns None
+for strategies whose template has no model here, whose tunable parameters
+the model doesn't simulate, or whose symbols have no local data, and
+callers fall back to LEAN-only search.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import math
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from research_system.codegen.templates.v4 import get_template_for_strategy
+
+logger = logging.getLogger(__name__)
+
+# Price directory, relative to the workspace root
+PRICE_DIR = Path("data") / "ohlcv"
+
+TRADING_DAYS = 252
+
+# Trading cost per unit of turnover, in basis points
+DEFAULT_COST_BPS = 5.0
+
+# Upper bound on elements of one (parameter sets x days x assets) array
+CHUNK_ELEMENTS = 4_000_000
+
+
+def _read_closes(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    """(dates, closes) from a daily price CSV, sorted by date."""
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        columns = {name.strip().lower(): name for name in reader.fieldnames or []}
+        if "date" not in columns or "close" not in columns:
+            raise ValueError("expected date and close columns")
+        date_column, close_column = columns["date"], columns["close"]
+        rows = [
+            (row[date_column].strip()[:10], float(row[close_column]))
+            for row in reader
+            if (row.get(close_column) or "").strip()
+        ]
+
+    dates = np.array([d for d, _ in rows], dtype="datetime64[D]")
+    closes = np.array([c for _, c in rows], dtype=float)
+    closes[closes <= 0] = np.nan
+
+    order = np.argsort(dates, kind="stable")
+    dates, closes = dates[order], closes[order]
+    # Keep the last row of any repeated date
+    keep = np.r_[dates[1:] != dates[:-1], True] if len(dates) else np.ones(0, dtype=bool)
+    return dates[keep], closes[keep]
+
+
+@dataclass
+class PricePanel:
+    """Closes of several symbols aligned on common trading days."""
+
+    dates: np.ndarray  # datetime64[D], shape (T,)
+    symbols: list[str]
+    closes: np.ndarray  # shape (T, N); NaN before a symbol's first bar
+
+    def returns(self) -> np.ndarray:
+        """Daily simple returns, shape (T, N); 0 where undefined."""
+        returns = np.zeros_like(self.closes)
+        returns[1:] = self.closes[1:] / self.closes[:-1] - 1.0
+        returns[~np.isfinite(returns)] = 0.0
+        return returns
+
+
+class PriceCache:
+    """Daily closes per symbol, read from CSV files and kept in memory.
+
+    A file is re-read only when its (mtime_ns, size) changes.
+
+    Example:
+        prices = PriceCache.for_workspace(workspace.path)
+        panel = prices.panel(["SPY", "TLT"], "2020-12-31")
+    """
+
+    def __init__(self, directory: Path):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory holding one <SYMBOL>.csv per symbol
+        """
+        self.directory = Path(directory)
+        self._series: dict[str, tuple[tuple[int, int], np.ndarray, np.ndarray]] = {}
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path) -> PriceCache:
+        """Create a cache over the standard price directory of a workspace."""
+        return cls(Path(workspace_path) / PRICE_DIR)
+
+    def path(self, symbol: str) -> Path:
+        """CSV file holding a symbol's prices."""
+        return self.directory / f"{symbol.upper()}.csv"
+
+    def series(self, symbol: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """(dates, closes) of a symbol, or None if it has no readable data."""
+        path = self.path(symbol)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        key = symbol.upper()
+        fp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._series.get(key)
+        if cached is not None and cached[0] == fp:
+            return cached[1], cached[2]
+
+        try:
+            dates, closes = _read_closes(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read prices {path}: {e}")
+            return None
+        self._series[key] = (fp, dates, closes)
+        return dates, closes
+
+    def panel(self, symbols: list[str], end_date: str) -> PricePanel | None:
+        """Closes of symbols on the union of their trading days up to end_date.
+
+        Days a symbol did not trade are forward-filled from its previous
+        close. Returns None if any symbol has no data.
+        """
+        end = np.datetime64(end_date, "D")
+        series = []
+        for symbol in symbols:
+            data = self.series(symbol)
+            if data is None or not len(data[0]):
+                return None
+            series.append(data)
+
+        dates = np.unique(np.concatenate([d[d <= end] for d, _ in series]))
+        closes = np.full((len(dates), len(symbols)), np.nan)
+        for j, (symbol_dates, symbol_closes) in enumerate(series):
+            index = np.searchsorted(symbol_dates, dates, side="right") - 1
+            closes[:, j] = np.where(index >= 0, symbol_closes[np.maximum(index, 0)], np.nan)
+        return PricePanel(dates=dates, symbols=list(symbols), closes=closes)
+
+
+# =============================================================================
+# SIGNAL HELPERS
+# =============================================================================
+
+
+def _trailing_return(closes: np.ndarray, decisions: np.ndarray, lookback: int) -> np.ndarray:
+    """close[t-1] / close[t-lookback] - 1 at each decision day t (NaN if unavailable)."""
+    result = np.full((len(decisions),) + closes.shape[1:], np.nan)
+    first = decisions - lookback
+    ok = (first >= 0) & (lookback >= 2)
+    if ok.any():
+        result[ok] = closes[decisions[ok] - 1] / closes[first[ok]] - 1.0
+    return result
+
+
+def _trailing_mean_std(values: np.ndarray, decisions: np.ndarray, length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Mean and sample std of values[t-length:t] at each decision day t.
+
+    NaN where the window is incomplete or contains NaN.
+    """
+    mean = np.full(len(decisions), np.nan)
+    std = np.full(len(decisions), np.nan)
+    if length < 2:
+        return mean, std
+
+    missing = ~np.isfinite(values)
+    # Centre the data before summing squares to limit cancellation
+    centre = float(values[~missing].mean()) if not missing.all() else 0.0
+    centred = np.where(missing, 0.0, values - centre)
+    sums = np.r_[0.0, np.cumsum(centred)]
+    squares = np.r_[0.0, np.cumsum(centred * centred)]
+    gaps = np.r_[0, np.cumsum(missing)]
+
+    start = decisions - length
+    ok = start >= 0
+    end, start = decisions[ok], start[ok]
+    ok_rows = np.flatnonzero(ok)
+    complete = gaps[end] - gaps[start] == 0
+    total = sums[end] - sums[start]
+    variance = (squares[end] - squares[start] - total * total / length) / (length - 1)
+    window_std = np.sqrt(np.maximum(variance, 0.0))
+
+    rows = ok_rows[complete]
+    mean[rows] = total[complete] / length + centre
+    std[rows] = window_std[complete]
+    return mean, std
+
+
+def _hold(weights: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Carry the last active decision's weights through inactive decisions.
+
+    Args:
+        weights: Target weights, shape (P, D, K)
+        active: Whether each decision trades, shape (P, D)
+    """
+    last = np.where(active, np.arange(active.shape[1]), -1)
+    last = np.maximum.accumulate(last, axis=1)
+    held = np.take_along_axis(weights, np.maximum(last, 0)[..., None], axis=1)
+    held[last < 0] = 0.0
+    return held
+
+
+def _by_value(values: np.ndarray, compute) -> np.ndarray:
+    """compute(v) for each distinct v in values, gathered back per element."""
+    unique, inverse = np.unique(values, return_inverse=True)
+    return np.stack([compute(v) for v in unique])[inverse]
+
+
+# =============================================================================
+# TEMPLATE MODELS
+# =============================================================================
+
+
+def _universe(strategy: dict[str, Any]) -> list[str]:
+    """Symbols of a strategy's universe (a list, or V4 instruments)."""
+    universe = strategy.get("universe")
+    if isinstance(universe, dict):
+        universe = [
+            i.get("symbol") if isinstance(i, dict) else i
+            for i in universe.get("instruments") or []
+        ]
+    if not isinstance(universe, list):
+        return []
+    return [str(symbol) for symbol in universe if symbol]
+
+
+def _schedule(dates: np.ndarray, frequency: str) -> np.ndarray:
+    """Decision days for a LEAN date rule: "daily", "weekly" (Mondays) or "monthly"."""
+    if frequency == "daily":
+        return np.ones(len(dates), dtype=bool)
+    decisions: np.ndarray
+    if frequency == "weekly":
+        # 1970-01-01 was a Thursday
+        decisions = (dates.astype("datetime64[D]").astype(np.int64) + 3) % 7 == 0
+    else:
+        months = dates.astype("datetime64[M]")
+        decisions = np.r_[True, months[1:] != months[:-1]] if len(dates) else np.zeros(0, dtype=bool)
+    return decisions
+
+
+class _TemplateModel(ABC):
+    """Vectorized trading rules of one template family.
+
+    Numeric parameters rendered with param(name, default) vary per
+    candidate and are listed in `defaults`. Everything else that shapes
+    the algorithm (symbols, schedule, template branches) is a hashable
+    `settings` tuple built from the parameters in `setting_names`;
+    candidates are simulated in groups of equal settings.
+    """
+
+    template = ""
+    defaults: dict[str, float] = {}
+    setting_names: frozenset[str] = frozenset()
+
+    @abstractmethod
+    def settings(self, strategy: dict[str, Any], parameters: dict[str, Any]) -> tuple:
+        """Hashable settings shared by candidates simulated together."""
+
+    @abstractmethod
+    def symbols(self, settings: tuple) -> list[str]:
+        """Symbols traded under these settings."""
+
+    @abstractmethod
+    def frequency(self, settings: tuple) -> str:
+        """Rebalance schedule under these settings (see _schedule)."""
+
+    @abstractmethod
+    def weights(
+        self, closes: np.ndarray, decisions: np.ndarray, values: dict[str, np.ndarray], settings: tuple
+    ) -> np.ndarray:
+        """Target weights per candidate and decision, shape (P, D, K)."""
+
+
+class _MomentumModel(_TemplateModel):
+    """momentum.py.j2: hold the top_n symbols with momentum above a threshold."""
+
+    template = "momentum.py.j2"
+    defaults = {"lookback_period": 126, "top_n": 3, "leverage": 1.0}
+    setting_names = frozenset({"defensive_symbol", "threshold", "rebalance_frequency"})
+
+    def settings(self, strategy, parameters):
+        universe = tuple(_universe(strategy) or ["SPY", "QQQ", "IWM", "EFA", "EEM"])
+        return (
+            universe,
+            str(parameters.get("defensive_symbol") or "SHY"),
+            float(parameters.get("threshold") or 0.0),
+            "weekly" if parameters.get("rebalance_frequency") == "weekly" else "monthly",
+        )
+
+    def symbols(self, settings):
+        universe, defensive, _, _ = settings
+        return list(universe) + [defensive]
+
+    def frequency(self, settings):
+        return settings[3]
+
+    def weights(self, closes, decisions, values, settings):
+        threshold = settings[2]
+        n = closes.shape[1] - 1
+        scores = _by_value(
+            values["lookback_period"].astype(int),
+            lambda lookback: _trailing_return(closes[:, :n], decisions, int(lookback)),
+        )  # (P, D, n)
+        valid = np.isfinite(scores)
+
+        # Rank by descending score; like sorted(), ties keep universe order
+        order = np.argsort(-np.where(valid, scores, -np.inf), axis=-1, kind="stable")
+        rank = np.empty_like(order)
+        np.put_along_axis(rank, order, np.broadcast_to(np.arange(n), order.shape), axis=-1)
+
+        top_n = values["top_n"].astype(int)[:, None, None]
+        leverage = values["leverage"][:, None]
+        selected = valid & (rank < top_n) & (scores > threshold)
+        count = selected.sum(axis=-1)
+
+        weights = np.zeros(scores.shape[:2] + (n + 1,))
+        weights[..., :n] = np.where(selected, (leverage / np.maximum(count, 1))[..., None], 0.0)
+        weights[..., n] = np.where(count == 0, leverage, 0.0)
+        return _hold(weights, valid.any(axis=-1))
+
+
+class _MeanReversionModel(_TemplateModel):
+    """mean_reversion.py.j2: trade one symbol on its z-score."""
+
+    template = "mean_reversion.py.j2"
+    defaults = {
+        "lookback_period": 20,
+        "entry_threshold": -2.0,
+        "exit_threshold": 0.0,
+        "short_entry": 2.0,
+        "short_exit": 0.0,
+        "leverage": 1.0,
+    }
+    setting_names = frozenset({"short_enabled", "max_position_size"})
+
+    def settings(self, strategy, parameters):
+        universe = _universe(strategy)
+        return (
+            universe[0] if universe else "SPY",
+            bool(parameters.get("short_enabled")),
+            float(parameters.get("max_position_size") or 1.0),
+        )
+
+    def symbols(self, settings):
+        return [settings[0]]
+
+    def frequency(self, settings):
+        return "daily"
+
+    def weights(self, closes, decisions, values, settings):
+        _, short_enabled, max_position = settings
+        prices = closes[:, 0]
+
+        def z_scores(lookback):
+            mean, std = _trailing_mean_std(prices, decisions, int(lookback))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z = (prices[decisions - 1] - mean) / std
+            z[~(std > 0)] = np.nan
+            return z
+
+        z_all = _by_value(values["lookback_period"].astype(int), z_scores)  # (P, D)
+        entry, exit_ = values["entry_threshold"], values["exit_threshold"]
+        short_entry, short_exit = values["short_entry"], values["short_exit"]
+
+        # The position path depends on its own history: step through days,
+        # updating all candidates at once (same if/elif chain as the template)
+        position = np.zeros(len(z_all))
+        positions = np.zeros(z_all.shape)
+        for d in range(z_all.shape[1]):
+            z = z_all[:, d]
+            pending = np.isfinite(z)
+            long_entry = pending & (z < entry) & (position <= 0)
+            pending &= ~long_entry
+            long_exit = pending & (z > exit_) & (position > 0)
+            pending &= ~long_exit
+            position = np.where(long_entry, 1.0, np.where(long_exit, 0.0, position))
+            if short_enabled:
+                enter_short = pending & (z > short_entry) & (position >= 0)
+                pending &= ~enter_short
+                exit_short = pending & (z < short_exit) & (position < 0)
+                position = np.where(enter_short, -1.0, np.where(exit_short, 0.0, position))
+            positions[:, d] = position
+
+        size = min(max_position, 1.0) * values["leverage"]
+        return (positions * size[:, None])[..., None]
+
+
+class _RegimeAdaptiveModel(_TemplateModel):
+    """regime_adaptive.py.j2: risk-on or risk-off basket from SPY trend and volatility."""
+
+    template = "regime_adaptive.py.j2"
+    defaults = {
+        "regime_lookback": 50,
+        "vol_lookback": 20,
+        "trend_threshold": 0.0,
+        "vol_threshold": 0.20,
+        "leverage": 1.0,
+    }
+    setting_names = frozenset({"risk_on_assets", "risk_off_assets", "rebalance_frequency"})
+
+    def settings(self, strategy, parameters):
+        return (
+            tuple(parameters.get("risk_on_assets") or ["QQQ", "IWM"]),
+            tuple(parameters.get("risk_off_assets") or ["TLT", "GLD"]),
+            "daily" if parameters.get("rebalance_frequency") == "daily" else "weekly",
+        )
+
+    def symbols(self, settings):
+        risk_on, risk_off, _ = settings
+        return ["SPY"] + list(risk_on) + list(risk_off)
+
+    def frequency(self, settings):
+        return settings[2]
+
+    def weights(self, closes, decisions, values, settings):
+        risk_on, risk_off, _ = settings
+        market = closes[:, :1]
+        returns = np.full(len(market), np.nan)
+        returns[1:] = market[1:, 0] / market[:-1, 0] - 1.0
+
+        trend = _by_value(
+            values["regime_lookback"].astype(int),
+            lambda lookback: _trailing_return(market, decisions, int(lookback))[:, 0],
+        )
+        # vol_lookback bars give vol_lookback - 1 returns
+        volatility = _by_value(
+            values["vol_lookback"].astype(int),
+            lambda lookback: _trailing_mean_std(returns, decisions, int(lookback) - 1)[1],
+        ) * math.sqrt(TRADING_DAYS)
+
+        thresholds = values["trend_threshold"][:, None]
+        vol_thresholds = values["vol_threshold"][:, None]
+        on = (trend > thresholds) & ~(volatility > vol_thresholds)
+        active = np.isfinite(trend) & np.isfinite(volatility)
+
+        leverage = values["leverage"][:, None]
+        n_on = len(risk_on)
+        weights = np.zeros(trend.shape + (closes.shape[1],))
+        weights[..., 1:1 + n_on] = np.where(on, leverage / n_on, 0.0)[..., None]
+        weights[..., 1 + n_on:] = np.where(on, 0.0, leverage / len(risk_off))[..., None]
+        return _hold(weights, active)
+
+
+_MODELS = {model.template: model for model in (_MomentumModel(), _MeanReversionModel(), _RegimeAdaptiveModel())}
+
+
+# =============================================================================
+# SCREENER
+# =============================================================================
+
+
+@dataclass
+class ScreenResult:
+    """Metrics of every screened parameter set, in input order."""
+
+    params: list[dict[str, Any]]
+    sharpe: np.ndarray
+    cagr: np.ndarray
+    max_drawdown: np.ndarray
+
+    def top(self, k: int, objective: str = "sharpe") -> list[dict[str, Any]]:
+        """Best k parameter sets, best first (ties keep input order)."""
+        values = self.cagr if objective == "cagr" else self.sharpe
+        order = np.argsort(-np.nan_to_num(values, nan=-np.inf), kind="stable")
+        return [self.params[i] for i in order[: max(0, k)]]
+
+
+def _portfolio_returns(
+    returns: np.ndarray, decisions: np.ndarray, weights: np.ndarray, cost: float
+) -> np.ndarray:
+    """Daily net returns of each candidate, shape (P, T).
+
+    Weights set at decision d earn returns from day decisions[d] + 1 on,
+    and pay cost per unit of turnover on that day.
+    """
+    days = len(returns)
+    current = np.searchsorted(decisions, np.arange(days), side="left") - 1
+    held = weights[:, np.maximum(current, 0), :]
+    held[:, current < 0] = 0.0
+    daily: np.ndarray = np.einsum("ptk,tk->pt", held, returns)
+
+    turnover = np.abs(np.diff(weights, axis=1, prepend=0.0)).sum(axis=-1)
+    charged = decisions + 1 < days
+    daily[:, decisions[charged] + 1] -= turnover[:, charged] * cost
+    return daily
+
+
+def _metrics(daily: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(sharpe, cagr, max_drawdown) of daily returns, shape (P, T) each row."""
+    mean = daily.mean(axis=1)
+    std = daily.std(axis=1, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = np.where(std > 0, mean / std * math.sqrt(TRADING_DAYS), 0.0)
+
+    equity = np.cumprod(1.0 + daily, axis=1)
+    final = equity[:, -1]
+    years = daily.shape[1] / TRADING_DAYS
+    with np.errstate(invalid="ignore"):
+        cagr = np.where(final > 0, np.maximum(final, 0.0) ** (1.0 / years) - 1.0, -1.0)
+
+    peak = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+    max_drawdown = (1.0 - equity / peak).max(axis=1)
+    return sharpe, cagr, max_drawdown
+
+
+class VectorizedScreener:
+    """Score many parameter sets of a template strategy in one local pass.
+
+    Example:
+        screener = VectorizedScreener(PriceCache.for_workspace(workspace.path))
+        result = screener.screen(strategy, combinations, "2015-01-01", "2019-12-31")
+        if result is not None:
+            confirm = result.top(5)
+    """
+
+    def __init__(self, prices: PriceCache, cost_bps: float = DEFAULT_COST_BPS):
+        """Initialize the screener.
+
+        Args:
+            prices: Source of daily closes
+            cost_bps: Trading cost per unit of turnover, in basis points
+        """
+        self.prices = prices
+        self.cost = cost_bps / 10_000
+
+    @staticmethod
+    def model_for(strategy: dict[str, Any]) -> _TemplateModel | None:
+        """Screening model of the template a strategy is generated from."""
+        strategy_type = strategy.get("strategy_type", "")
+        if not strategy_type:
+            hypothesis_types = (strategy.get("tags") or {}).get("hypothesis_type") or []
+            strategy_type = hypothesis_types[0] if hypothesis_types else ""
+        template = get_template_for_strategy(strategy_type, strategy.get("signal_type", ""))
+        return _MODELS.get(template)
+
+    def screen(
+        self,
+        strategy: dict[str, Any],
+        combinations: list[dict[str, Any]],
+        start_date: str,
+        end_date: str,
+    ) -> ScreenResult | None:
+        """Simulate every combination over [start_date, end_date].
+
+        Args:
+            strategy: Strategy document
+            combinations: Parameter sets (merged over strategy["parameters"])
+            start_date: First day of the evaluation range
+            end_date: Last day of the evaluation range
+
+        Returns:
+            ScreenResult, or None if the strategy can't be screened locally,
+            including when a combination varies a parameter the model
+            doesn't simulate (its ranking would ignore that parameter)
+        """
+        model = self.model_for(strategy)
+        if model is None or not combinations:
+            return None
+
+        unknown = {name for params in combinations for name in params}
+        unknown -= model.defaults.keys() | model.setting_names
+        if unknown:
+            logger.info(
+                f"Cannot pre-screen {strategy.get('id', 'strategy')}: "
+                f"{model.template} does not model {', '.join(sorted(unknown))}"
+            )
+            return None
+
+        base = strategy.get("parameters") or {}
+        try:
+            merged = [{**base, **params} for params in combinations]
+            groups: dict[tuple, list[int]] = {}
+            for i, parameters in enumerate(merged):
+                groups.setdefault(model.settings(strategy, parameters), []).append(i)
+            values = {
+                name: np.array([default if p.get(name) is None else float(p[name]) for p in merged])
+                for name, default in model.defaults.items()
+            }
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cannot pre-screen {strategy.get('id', 'strategy')}: {e}")
+            return None
+
+        n = len(combinations)
+        sharpe, cagr, max_drawdown = np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+        for settings, indices in groups.items():
+            metrics = self._screen_group(model, settings, values, np.array(indices), start_date, end_date)
+            if metrics is None:
+                return None
+            sharpe[indices], cagr[indices], max_drawdown[indices] = metrics
+
+        return ScreenResult(params=list(combinations), sharpe=sharpe, cagr=cagr, max_drawdown=max_drawdown)
+
+    def _screen_group(
+        self,
+        model: _TemplateModel,
+        settings: tuple,
+        values: dict[str, np.ndarray],
+        indices: np.ndarray,
+        start_date: str,
+        end_date: str,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """Metrics for the candidates at indices, which share settings."""
+        symbols = model.symbols(settings)
+        panel = self.prices.panel(symbols, end_date)
+        if panel is None:
+            logger.info(f"No local prices for all of {', '.join(symbols)}; skipping pre-screen")
+            return None
+
+        start = int(np.searchsorted(panel.dates, np.datetime64(start_date, "D")))
+        if len(panel.dates) - start < 2:
+            logger.info(f"Not enough local prices in {start_date}..{end_date}; skipping pre-screen")
+            return None
+
+        decisions = np.flatnonzero(_schedule(panel.dates, model.frequency(settings)))
+        decisions = decisions[decisions >= start]
+        returns = panel.returns()[start:]
+
+        chunk = max(1, CHUNK_ELEMENTS // (len(panel.dates) * len(symbols)))
+        results = []
+        for offset in range(0, len(indices), chunk):
+            batch = indices[offset:offset + chunk]
+            weights = model.weights(
+                panel.closes, decisions, {name: v[batch] for name, v in values.items()}, settings
+            )
+            daily = _portfolio_returns(returns, decisions - start, weights, self.cost)
+            results.append(_metrics(daily))
+        sharpe, cagr, max_drawdown = (np.concatenate(parts) for parts in zip(*results, strict=True))
+        return sharpe, cagr, max_drawdown
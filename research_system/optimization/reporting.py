@@ -40,6 +40,9 @@ def format_terminal_summary(result: WalkForwardResult) -> str:
     lines.append(f"  Initial training: {result.config.initial_train_years} years")
     lines.append(f"  Test period: {result.config.test_years} year(s)")
     lines.append(f"  Window type: {'Expanding' if result.config.expanding_window else 'Rolling'}")
+    if result.total_evaluations:
+        reused = f" ({result.reused_evaluations} reused)" if result.reused_evaluations else ""
+        lines.append(f"  Evaluations: {result.total_evaluations}{reused}")
     lines.append("")
 
     # Period details
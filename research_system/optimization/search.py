@@ -0,0 +1,267 @@
+"""Adaptive parameter search strategies.
+
+This module provides the model-based search used by ParameterOptimizer:
+- BayesianSearch: Sequential model-based optimization with a Gaussian
+  process surrogate and expected-improvement acquisition
+- halving_schedule: Date sub-ranges and candidate counts for successive
+  halving, which screens many candidates on a short recent slice of the
+  in-sample range and promotes only the best to longer slices
+
+Both work on discrete parameter grids (the values produced by
+ParameterOptimizer._get_parameter_values), so every suggestion is a
+combination a grid or random search could also have produced.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from datetime import date, timedelta
+from typing import Any
+
+import numpy as np
+
+
+class BayesianSearch:
+    """Suggest parameter combinations from a Gaussian process surrogate.
+
+    Numeric parameters are encoded as their position in the value list,
+    scaled to [0, 1]. Bool and choice parameters are one-hot encoded.
+    The first few suggestions are random; after that each suggestion
+    maximizes expected improvement over the best observed objective.
+
+    Failed evaluations are observed as None and imputed with the worst
+    observed value, which steers the search away from them.
+
+    Example:
+        search = BayesianSearch({"fast": [5, 10, 15], "slow": [50, 100]})
+        while budget_left:
+            for params in search.suggest(4):
+                search.observe(params, run_backtest(params).sharpe)
+    """
+
+    # Above this many combinations, score a random sample instead of all
+    MAX_CANDIDATES = 2000
+
+    def __init__(
+        self,
+        param_values: dict[str, list[Any]],
+        n_initial: int = 5,
+        length_scale: float = 0.3,
+        noise: float = 1e-2,
+        xi: float = 0.01,
+        rng: random.Random | None = None,
+    ):
+        """Initialize the search.
+
+        Args:
+            param_values: Candidate values for each parameter
+            n_initial: Number of random suggestions before using the model
+            length_scale: RBF kernel length scale in encoded units
+            noise: Observation noise added to the kernel diagonal
+            xi: Exploration margin for expected improvement
+            rng: Random generator (default: a new unseeded generator)
+        """
+        self.keys = list(param_values.keys())
+        self.param_values = {k: list(v) for k, v in param_values.items()}
+        self.n_initial = max(1, n_initial)
+        self.length_scale = length_scale
+        self.noise = noise
+        self.xi = xi
+        self.rng = rng or random.Random()
+
+        self._observed: dict[tuple, float | None] = {}
+        self._pending: set[tuple] = set()
+
+        self.space_size = 1
+        for values in self.param_values.values():
+            self.space_size *= len(values)
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def suggest(self, n: int = 1) -> list[dict[str, Any]]:
+        """Suggest up to n unevaluated combinations.
+
+        Batches use the "kriging believer" heuristic: each chosen point is
+        temporarily observed at its predicted mean before picking the next.
+        """
+        suggestions: list[tuple] = []
+        believed: dict[tuple, float] = {}
+
+        for _ in range(n):
+            candidates = self._candidates(exclude=set(suggestions))
+            if not candidates:
+                break
+
+            if len(self._observed) + len(suggestions) < self.n_initial:
+                choice = self.rng.choice(candidates)
+            else:
+                choice = self._best_candidate(candidates, believed)
+            suggestions.append(choice)
+
+            if len(self._observed) + len(suggestions) > self.n_initial:
+                mean, _ = self._predict([choice], believed)
+                believed[choice] = float(mean[0])
+
+        self._pending.update(suggestions)
+        return [dict(zip(self.keys, combo, strict=True)) for combo in suggestions]
+
+    def observe(self, params: dict[str, Any], value: float | None) -> None:
+        """Record the objective value for a combination (None if it failed)."""
+        combo = self._combo(params)
+        self._pending.discard(combo)
+        self._observed[combo] = value
+
+    @property
+    def exhausted(self) -> bool:
+        """True when every combination has been suggested."""
+        return len(self._observed) + len(self._pending) >= self.space_size
+
+    # -------------------------------------------------------------------------
+    # Candidate generation
+    # -------------------------------------------------------------------------
+
+    def _combo(self, params: dict[str, Any]) -> tuple:
+        return tuple(params[k] for k in self.keys)
+
+    def _candidates(self, exclude: set[tuple]) -> list[tuple]:
+        taken = set(self._observed) | self._pending | exclude
+        if self.space_size <= self.MAX_CANDIDATES:
+            return [c for c in self._enumerate() if c not in taken]
+
+        # A dict keeps draw order, so a seeded rng gives the same candidates
+        candidates: dict[tuple, None] = {}
+        attempts = 0
+        while len(candidates) < self.MAX_CANDIDATES and attempts < self.MAX_CANDIDATES * 5:
+            combo = tuple(self.rng.choice(self.param_values[k]) for k in self.keys)
+            if combo not in taken:
+                candidates[combo] = None
+            attempts += 1
+        return list(candidates)
+
+    def _enumerate(self):
+        return itertools.product(*(self.param_values[k] for k in self.keys))
+
+    # -------------------------------------------------------------------------
+    # Surrogate model
+    # -------------------------------------------------------------------------
+
+    def _encode(self, combos: list[tuple]) -> np.ndarray:
+        rows = []
+        for combo in combos:
+            row: list[float] = []
+            for key, value in zip(self.keys, combo, strict=True):
+                values = self.param_values[key]
+                index = values.index(value)
+                if isinstance(value, (bool, str)):
+                    row.extend(1.0 if i == index else 0.0 for i in range(len(values)))
+                else:
+                    row.append(index / (len(values) - 1) if len(values) > 1 else 0.0)
+            rows.append(row)
+        return np.asarray(rows, dtype=float)
+
+    def _kernel(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        sq_dist = ((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1)
+        kernel: np.ndarray = np.exp(-0.5 * sq_dist / self.length_scale**2)
+        return kernel
+
+    def _training_data(self, believed: dict[tuple, float]) -> tuple[list[tuple], np.ndarray]:
+        successful = [v for v in self._observed.values() if v is not None]
+        floor = min(successful) if successful else 0.0
+        combos = list(self._observed) + list(believed)
+        values = [v if v is not None else floor for v in self._observed.values()]
+        values += list(believed.values())
+        return combos, np.asarray(values, dtype=float)
+
+    def _predict(
+        self,
+        combos: list[tuple],
+        believed: dict[tuple, float],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Posterior mean and standard deviation (in objective units)."""
+        train_combos, y = self._training_data(believed)
+        if not train_combos:
+            return np.zeros(len(combos)), np.ones(len(combos))
+
+        y_mean = y.mean()
+        y_std = y.std() or 1.0
+        y_norm = (y - y_mean) / y_std
+
+        x_train = self._encode(train_combos)
+        x_test = self._encode(combos)
+
+        k = self._kernel(x_train, x_train) + self.noise * np.eye(len(train_combos))
+        chol = np.linalg.cholesky(k + 1e-9 * np.eye(len(train_combos)))
+        alpha = np.linalg.solve(chol.T, np.linalg.solve(chol, y_norm))
+
+        k_star = self._kernel(x_test, x_train)
+        mean = k_star @ alpha
+        v = np.linalg.solve(chol, k_star.T)
+        var = np.clip(1.0 - (v**2).sum(axis=0), 1e-12, None)
+
+        return mean * y_std + y_mean, np.sqrt(var) * y_std
+
+    def _best_candidate(self, candidates: list[tuple], believed: dict[tuple, float]) -> tuple:
+        mean, std = self._predict(candidates, believed)
+        _, y = self._training_data(believed)
+        best = y.max() if len(y) else 0.0
+
+        improvement = mean - best - self.xi
+        z = improvement / std
+        cdf = 0.5 * (1.0 + _erf(z / math.sqrt(2.0)))
+        pdf = np.exp(-0.5 * z**2) / math.sqrt(2.0 * math.pi)
+        expected_improvement = improvement * cdf + std * pdf
+
+        return candidates[int(np.argmax(expected_improvement))]
+
+
+_erf = np.vectorize(math.erf, otypes=[float])
+
+
+def halving_schedule(
+    start_date: str,
+    end_date: str,
+    n_candidates: int,
+    eta: int = 3,
+    min_days: int = 365,
+    max_rungs: int = 3,
+) -> list[tuple[str, str, int]]:
+    """Build the rungs for successive halving over a date range.
+
+    Each rung evaluates 1/eta as many candidates as the previous one on a
+    range eta times longer. All ranges end at end_date, so early rungs
+    screen on the most recent data, and the last rung is the full range.
+
+    Args:
+        start_date: Full range start (YYYY-MM-DD)
+        end_date: Full range end (YYYY-MM-DD)
+        n_candidates: Candidates evaluated on the first (shortest) rung
+        eta: Reduction factor between rungs
+        min_days: Shortest allowed screening range
+        max_rungs: Maximum number of rungs including the full range
+
+    Returns:
+        List of (rung_start, rung_end, n_candidates) from shortest to full range
+    """
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    span = (end - start).days
+
+    extra_rungs = 0
+    while extra_rungs + 1 < max_rungs and span / eta ** (extra_rungs + 1) >= min_days:
+        extra_rungs += 1
+
+    rungs = []
+    for r in range(extra_rungs + 1):
+        days = span // eta ** (extra_rungs - r)
+        rung_start = start_date if r == extra_rungs else (end - timedelta(days=days)).isoformat()
+        rungs.append((rung_start, end_date, max(1, n_candidates // eta**r)))
+    return rungs
+
+
+def halving_budget(n_candidates: int, eta: int, n_rungs: int) -> int:
+    """Total backtests a halving schedule will run."""
+    return sum(max(1, n_candidates // eta**r) for r in range(n_rungs))
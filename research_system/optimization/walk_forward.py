@@ -9,10 +9,24 @@ This module implements true walk-forward optimization:
 
 The key insight: parameters are re-optimized at each step using
 only data available at that point in time.
+
+Consecutive in-sample ranges overlap heavily, so by default each period
+after the first is warm-started from the previous period's best parameter
+sets (within the same evaluation budget). An evaluation ledger shared
+across periods ensures an identical (params, range) pair is never
+backtested twice; note that with an expanding window every in-sample range
+is different, so the ledger rarely hits there and warm-starting alone does
+not reduce the backtest count.
+
+WalkForwardConfig.reduced_budget (opt-in) additionally shrinks the budget
+of warm-started periods to the share of new data in their range. This is a
+heuristic: it saves most backtests of later periods, but searches less and
+can therefore pick different parameters than a full-budget run.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
@@ -20,6 +34,7 @@ from typing import Any
 import logging
 
 from research_system.optimization.optimizer import (
+    EvaluationLedger,
     OptimizationMethod,
     OptimizationResult,
     ParameterOptimizer,
@@ -50,6 +65,11 @@ class WalkForwardConfig:
     max_evaluations: int = 50  # Max parameter combinations per optimization
     optimization_method: OptimizationMethod = OptimizationMethod.RANDOM
     objective: str = "sharpe"  # Metric to optimize
+    max_workers: int = 1  # Parameter evaluations to run concurrently
+    incremental: bool = True  # Warm-start each period from the previous one
+    warm_start_top_k: int = 5  # Best previous-period params to re-evaluate first
+    reduced_budget: bool = False  # Heuristic: shrink warm-started budgets to the new-data share
+    runtime_parameters: bool = False  # Pass params via config.json instead of regenerating code
 
     def get_periods(self) -> list[tuple[str, str, str, str]]:
         """Generate (opt_start, opt_end, test_start, test_end) periods.
@@ -129,6 +149,10 @@ class WalkForwardResult:
     # Parameter stability
     parameter_stability: float | None = None  # 0-1, how stable params are across periods
 
+    # Optimization cost
+    total_evaluations: int = 0  # In-sample evaluations across all periods
+    reused_evaluations: int = 0  # Evaluations served from the ledger
+
     success: bool = False
     error: str | None = None
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
@@ -144,6 +168,11 @@ class WalkForwardResult:
                 "test_years": self.config.test_years,
                 "expanding_window": self.config.expanding_window,
                 "max_evaluations": self.config.max_evaluations,
+                "max_workers": self.config.max_workers,
+                "incremental": self.config.incremental,
+                "warm_start_top_k": self.config.warm_start_top_k,
+                "reduced_budget": self.config.reduced_budget,
+                "runtime_parameters": self.config.runtime_parameters,
             },
             "periods": [
                 {
@@ -171,6 +200,8 @@ class WalkForwardResult:
             "consistency": self.consistency,
             "is_vs_oos_degradation": self.is_vs_oos_degradation,
             "parameter_stability": self.parameter_stability,
+            "total_evaluations": self.total_evaluations,
+            "reused_evaluations": self.reused_evaluations,
             "success": self.success,
             "error": self.error,
             "timestamp": self.timestamp,
@@ -210,16 +241,18 @@ class WalkForwardRunner:
         self,
         backtest_executor=None,
         code_generator=None,
+        prescreener=None,
     ):
         """Initialize walk-forward runner.
 
         Args:
             backtest_executor: BacktestExecutor for running backtests
             code_generator: V4CodeGenerator for generating code
+            prescreener: VectorizedScreener for the prescreen method
         """
         self.backtest_executor = backtest_executor
         self.code_generator = code_generator
-        self.optimizer = ParameterOptimizer(backtest_executor, code_generator)
+        self.optimizer = ParameterOptimizer(backtest_executor, code_generator, prescreener=prescreener)
 
     def run(
         self,
@@ -253,6 +286,11 @@ class WalkForwardRunner:
             return result
 
         logger.info(f"Running walk-forward with {len(periods)} periods")
+        self.optimizer.runtime_parameters = config.runtime_parameters
+
+        # Evaluations of this strategy, shared across periods
+        ledger = EvaluationLedger()
+        previous_range: tuple[str, str] | None = None
 
         # Run each period
         for i, (opt_start, opt_end, test_start, test_end) in enumerate(periods):
@@ -262,6 +300,13 @@ class WalkForwardRunner:
                 f"Test {test_start} to {test_end}"
             )
 
+            warm_start = None
+            max_evaluations = config.max_evaluations
+            if config.incremental and previous_range is not None:
+                warm_start = ledger.top(*previous_range, config.warm_start_top_k, config.objective)
+                if warm_start and config.reduced_budget:
+                    max_evaluations = self._incremental_budget(config, opt_start, opt_end, len(warm_start))
+
             period_result = self._run_period(
                 strategy=strategy,
                 period_id=period_id,
@@ -270,8 +315,15 @@ class WalkForwardRunner:
                 test_start=test_start,
                 test_end=test_end,
                 config=config,
+                ledger=ledger,
+                warm_start=warm_start,
+                max_evaluations=max_evaluations,
             )
             result.periods.append(period_result)
+            previous_range = (opt_start, opt_end)
+
+        result.total_evaluations = sum(p.evaluations_attempted for p in result.periods)
+        result.reused_evaluations = ledger.hits
 
         # Aggregate results
         self._aggregate_results(result)
@@ -290,6 +342,9 @@ class WalkForwardRunner:
         test_start: str,
         test_end: str,
         config: WalkForwardConfig,
+        ledger: EvaluationLedger | None = None,
+        warm_start: list[dict[str, Any]] | None = None,
+        max_evaluations: int | None = None,
     ) -> WalkForwardPeriod:
         """Run a single walk-forward period.
 
@@ -301,6 +356,9 @@ class WalkForwardRunner:
             test_start: Test start date
             test_end: Test end date
             config: Walk-forward config
+            ledger: Evaluation ledger shared across periods
+            warm_start: Parameter sets to evaluate before searching
+            max_evaluations: Evaluation budget (default: config.max_evaluations)
 
         Returns:
             WalkForwardPeriod with results
@@ -318,14 +376,17 @@ class WalkForwardRunner:
             strategy=strategy,
             start_date=opt_start,
             end_date=opt_end,
-            max_evaluations=config.max_evaluations,
+            max_evaluations=max_evaluations or config.max_evaluations,
             method=config.optimization_method,
             objective=config.objective,
+            max_workers=config.max_workers,
+            ledger=ledger,
+            warm_start=warm_start,
         )
+        period.evaluations_attempted = opt_result.total_evaluated
 
         if not opt_result.success:
             period.error = f"Optimization failed: {opt_result.error}"
-            period.evaluations_attempted = opt_result.total_evaluated
 
             # Capture first actual backtest error for debugging
             for evaluation in opt_result.evaluations:
@@ -357,6 +418,26 @@ class WalkForwardRunner:
 
         return period
 
+    @staticmethod
+    def _incremental_budget(
+        config: WalkForwardConfig,
+        opt_start: str,
+        opt_end: str,
+        n_warm: int,
+    ) -> int:
+        """Evaluation budget for a warm-started period under reduced_budget.
+
+        The previous period already searched all but the newest test_years
+        of this range, so exploration is scaled by the share of new data
+        (1/4 of the budget for a 4-year range, 1/5 for 5 years, ...). With
+        an expanding window the total grows logarithmically in the number
+        of periods instead of linearly.
+        """
+        range_years = int(opt_end[:4]) - int(opt_start[:4]) + 1
+        new_share = min(1.0, config.test_years / max(1, range_years))
+        explore = math.ceil(config.max_evaluations * new_share)
+        return min(config.max_evaluations, n_warm + explore)
+
     def _test_parameters(
         self,
         strategy: dict[str, Any],
@@ -387,17 +468,8 @@ class WalkForwardRunner:
 
             return MockResult()
 
-        # Inject parameters into strategy
-        import copy
-
-        strategy_copy = copy.deepcopy(strategy)
-        if "parameters" not in strategy_copy:
-            strategy_copy["parameters"] = {}
-        strategy_copy["parameters"].update(params)
-        strategy_copy["parameters"]["_optimized"] = params
-
-        # Generate code
-        code_result = self.code_generator.generate(strategy_copy)
+        # Generate code (or reuse the optimizer's parameterized algorithm)
+        code_result, runtime_values = self.optimizer.prepare_code(strategy, params)
         if not code_result.success:
             @dataclass
             class FailedResult:
@@ -410,11 +482,8 @@ class WalkForwardRunner:
             return FailedResult(error=f"Code generation failed: {code_result.error}")
 
         # Run backtest
-        return self.backtest_executor.run_single(
-            code=code_result.code,
-            start_date=start_date,
-            end_date=end_date,
-            strategy_id=f"{strategy.get('id', 'wf')}_oos",
+        return self.optimizer.run_prepared(
+            code_result, runtime_values, start_date, end_date, f"{strategy.get('id', 'wf')}_oos"
         )
 
     def _aggregate_results(self, result: WalkForwardResult) -> None:
@@ -10,48 +10,37 @@ Uses QuantConnect API to set backtest dates directly, bypassing the cloud
 project's default date settings which override SetStartDate/SetEndDate in code.
 """
 
-import hashlib
 import json
 import subprocess
 import re
 import time
-import requests
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+from research_system.validation.qc_api import get_qc_client
+
 
 class QCApi:
-    """QuantConnect API client with proper authentication."""
+    """QuantConnect API client with proper authentication.
 
-    BASE_URL = "https://www.quantconnect.com/api/v2"
+    Requests go through the shared pooled client in
+    research_system.validation.qc_api.
+    """
 
     def __init__(self, credentials_path: Path = None):
         """Initialize with credentials from lean config."""
-        if credentials_path is None:
-            credentials_path = Path.home() / ".lean" / "credentials"
-
-        with open(credentials_path) as f:
-            creds = json.load(f)
-
-        self.user_id = creds["user-id"]
-        self.api_token = creds["api-token"]
+        self.client = get_qc_client(credentials_path)
+        creds = self.client.credentials()
+        if creds is None:
+            raise FileNotFoundError(f"No QC credentials found at {self.client.credentials_path}")
 
-    def _get_auth(self):
-        """Generate timestamped authentication."""
-        timestamp = str(int(time.time()))
-        token_hash = hashlib.sha256(
-            f"{self.api_token}:{timestamp}".encode()
-        ).hexdigest()
-        return (self.user_id, token_hash), {"Timestamp": timestamp}
+        self.user_id, self.api_token = creds
 
-    def _request(self, method: str, endpoint: str, **kwargs):
+    def _request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict:
         """Make authenticated API request."""
-        auth, headers = self._get_auth()
-        url = f"{self.BASE_URL}/{endpoint}"
-        resp = requests.request(method, url, auth=auth, headers=headers, **kwargs)
-        return resp.json()
+        return self.client.request(endpoint, params, method=method, data=data) or {}
 
     def list_projects(self) -> List[Dict]:
         """List all projects."""
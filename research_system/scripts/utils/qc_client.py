@@ -7,6 +7,9 @@ Wraps the LEAN CLI to:
 - Retrieve results
 - Manage Object Store data
 
+Backtest status and results are read over the shared pooled REST client
+(research_system.validation.qc_api) once the project ID is known.
+
 Requires: lean-cli (pip install lean)
 """
 
@@ -18,6 +21,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+from research_system.validation.qc_api import get_qc_client
+
 from .logging_config import get_logger
 
 logger = get_logger("qc-client")
@@ -52,6 +57,8 @@ class QCClient:
             project_prefix: Prefix for QC project names (default: rv_ for research validation)
         """
         self.project_prefix = project_prefix
+        self.api = get_qc_client()
+        self._project_ids: Dict[str, str] = {}  # backtest ID -> project ID
         self._verify_lean_cli()
 
     def _verify_lean_cli(self):
@@ -149,12 +156,30 @@ class QCClient:
         match = re.search(r"Backtest id:\s*(\S+)", stdout)
         if match:
             backtest_id = match.group(1)
+            project_match = re.search(r"Project ID:\s*(\d+)", stdout)
+            if project_match:
+                self._project_ids[backtest_id] = project_match.group(1)
             logger.info(f"Backtest started: {backtest_id}")
             return backtest_id
 
         logger.error("Could not parse backtest ID from output")
         return None
 
+    def get_backtest_status(self, backtest_id: str) -> Optional[str]:
+        """
+        Get backtest status over the REST API.
+
+        Args:
+            backtest_id: Backtest ID started by run_backtest
+
+        Returns:
+            "Completed", "RuntimeError", "Running", or None if unknown
+        """
+        project_id = self._project_ids.get(backtest_id)
+        if not project_id:
+            return None
+        return self.api.backtest_status(project_id, backtest_id)
+
     def get_backtest_results(
         self,
         project_path: Path,
@@ -170,6 +195,20 @@ class QCClient:
         Returns:
             BacktestResult if successful
         """
+        project_id = self._project_ids.get(backtest_id)
+        if project_id:
+            backtest = self.api.read_backtest(project_id, backtest_id)
+            if backtest is not None:
+                return self._parse_backtest_result(
+                    {
+                        "Statistics": backtest.get("statistics", {}),
+                        "ProjectId": project_id,
+                        "Name": backtest.get("name", ""),
+                        "Status": "Completed" if backtest.get("completed") else backtest.get("status", ""),
+                    },
+                    backtest_id,
+                )
+
         args = ["cloud", "backtest", str(project_path), "--backtest", backtest_id]
 
         success, stdout, stderr = self._run_command(args)
@@ -325,12 +364,17 @@ def run_backtest_and_wait(
     if not backtest_id:
         return None
 
-    # Poll for completion
+    # Poll for completion (cheap REST status check, results fetched once)
     start_time = time.time()
     while time.time() - start_time < timeout_seconds:
-        result = client.get_backtest_results(project_path, backtest_id)
-        if result and result.status == "Completed":
-            return result
+        status = client.get_backtest_status(backtest_id)
+        if status == "RuntimeError":
+            logger.error(f"Backtest {backtest_id} failed with a runtime error")
+            return None
+        if status in ("Completed", None):
+            result = client.get_backtest_results(project_path, backtest_id)
+            if result and result.status == "Completed":
+                return result
 
         logger.debug(f"Waiting for backtest completion... ({int(time.time() - start_time)}s)")
         time.sleep(10)
@@ -17,22 +17,19 @@ Usage:
     result = runner.run("STRAT-309")
 """
 
-import base64
-import hashlib
 import json
 import re
 import shutil
 import subprocess
 import tempfile
 import time
-import urllib.parse
-import urllib.request
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from research_system.scripts.utils.logging_config import get_logger
+from research_system.validation.qc_api import get_qc_client
 from research_system.scripts.status.generate_reports import refresh_all_reports
 
 logger = get_logger("full_pipeline")
@@ -755,7 +752,7 @@ Common fixes:
             logger.info(f"Providing error feedback to LLM: {previous_error[:100]}...")
 
         try:
-            response = self.llm_client.generate_sonnet(prompt)
+            response = self.llm_client.generate_sonnet(prompt, caller="codegen.pipeline")
             code = response.content
 
             # Check for LLM errors (Issue #22 fix)
@@ -1908,53 +1905,12 @@ Common fixes:
         return project_id, backtest_id
 
     def _get_qc_credentials(self) -> Optional[tuple]:
-        """Load QC API credentials from ~/.lean/credentials."""
-        creds_file = Path.home() / ".lean" / "credentials"
-        if not creds_file.exists():
-            return None
-
-        try:
-            creds = json.loads(creds_file.read_text())
-            user_id = creds.get("user-id")
-            api_token = creds.get("api-token")
-            if user_id and api_token:
-                return (user_id, api_token)
-        except Exception:
-            pass
-        return None
+        """Load QC API credentials from ~/.lean/credentials (cached)."""
+        return get_qc_client().credentials()
 
     def _qc_api_request(self, endpoint: str, params: Dict = None, method: str = "GET") -> Optional[Dict]:
-        """Make an authenticated request to the QC API."""
-        creds = self._get_qc_credentials()
-        if not creds:
-            return None
-
-        user_id, api_token = creds
-
-        try:
-            timestamp = str(int(time.time()))
-            hash_data = f"{api_token}:{timestamp}"
-            hash_value = hashlib.sha256(hash_data.encode()).hexdigest()
-
-            if params:
-                query_string = urllib.parse.urlencode(params)
-                url = f"https://www.quantconnect.com/api/v2/{endpoint}?{query_string}"
-            else:
-                url = f"https://www.quantconnect.com/api/v2/{endpoint}"
-
-            auth_string = f"{user_id}:{hash_value}"
-            auth_bytes = base64.b64encode(auth_string.encode()).decode()
-
-            request = urllib.request.Request(url, method=method)
-            request.add_header("Authorization", f"Basic {auth_bytes}")
-            request.add_header("Timestamp", timestamp)
-
-            response = urllib.request.urlopen(request, timeout=30)
-            return json.loads(response.read().decode())
-
-        except Exception as e:
-            logger.debug(f"QC API request failed: {e}")
-            return None
+        """Make an authenticated request to the QC API over the shared pooled client."""
+        return get_qc_client().request(endpoint, params, method=method)
 
     def _get_backtest_status(self, project_id: str, backtest_id: str) -> Optional[str]:
         """
@@ -11,23 +11,38 @@ Workspace structure consumed:
     validations/{STRAT-NNN}/walk_forward_results.yaml
     learnings/*.yaml
     ideas/*.yaml
+
+Parsed strategies (with their metrics) and learnings are cached in
+.state/context_cache.json keyed on the mtime and size of the files they
+came from, so repeated aggregation only re-parses what changed (see
+context_cache.py).
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from research_system.synthesis.context_cache import ContextCache, fingerprint
+
 if TYPE_CHECKING:
     from research_system.core.v4.workspace import Workspace
 
 logger = logging.getLogger(__name__)
 
+# Files under validations/{STRAT-NNN}/ that feed StrategyWithMetrics
+VALIDATION_FILES = (
+    "backtest_results.yaml",
+    "backtest_results.json",
+    "walk_forward_results.yaml",
+    "determination.json",
+)
+
 
 # =============================================================================
 # DATA CLASSES
@@ -110,8 +125,17 @@ class WorkspaceContextAggregator:
         ctx = WorkspaceContextAggregator(ws).aggregate()
     """
 
-    def __init__(self, workspace: Workspace) -> None:
+    def __init__(self, workspace: Workspace, cache: bool = True) -> None:
+        """
+        Args:
+            workspace: Workspace to read
+            cache: Reuse parsed strategies and learnings from
+                .state/context_cache.json when their files are unchanged
+        """
         self.workspace = workspace
+        self.use_cache = cache
+        self._cache: ContextCache | None = None
+        self._cache_keys: set[str] = set()
 
     # ------------------------------------------------------------------
     # Public API
@@ -119,10 +143,21 @@ class WorkspaceContextAggregator:
 
     def aggregate(self) -> WorkspaceContext:
         """Read all workspace data and build context."""
+        # Fresh cache per call so entries written by other processes are seen
+        self._cache = ContextCache.for_workspace(self.workspace.path) if self.use_cache else None
+        self._cache_keys = set()
+
         validated = self._load_strategies("validated")
         invalidated = self._load_strategies("invalidated")
         pending = self._load_strategies("pending")
         learnings = self._load_learnings()
+
+        if self._cache is not None:
+            self._cache.save(keep=self._cache_keys)
+            logger.debug(
+                "Context cache: %d reused, %d parsed",
+                self._cache.hits, self._cache.misses,
+            )
         available_data = self._load_available_data()
         summary_stats = self._build_summary_stats(validated, invalidated, pending)
 
@@ -148,14 +183,53 @@ class WorkspaceContextAggregator:
         strategies: list[StrategyWithMetrics] = []
         for yaml_file in sorted(status_dir.glob("*.yaml")):
             try:
-                strat = self._parse_strategy_file(yaml_file, status)
+                strat = self._load_strategy(yaml_file, status)
                 if strat is not None:
-                    self._enrich_with_validation(strat)
                     strategies.append(strat)
             except Exception:
                 logger.warning("Skipping malformed strategy file: %s", yaml_file, exc_info=True)
         return strategies
 
+    def _load_strategy(self, path: Path, status: str) -> StrategyWithMetrics | None:
+        """Load one strategy with its metrics, from the cache when unchanged.
+
+        The fingerprint covers the strategy file and its validation files.
+        Files are stat'ed before they are read, so a file changing
+        mid-parse leaves an entry that fails validation next time rather
+        than a stale one.
+        """
+        cache = self._cache
+        if cache is None:
+            strat = self._parse_strategy_file(path, status)
+            if strat is not None:
+                self._enrich_with_validation(strat)
+            return strat
+
+        key = f"strategies/{status}/{path.name}"
+        self._cache_keys.add(key)
+        file_fp = fingerprint([path])
+
+        entry = cache.peek(key)
+        if entry is not None:
+            cached = entry.get("data")
+            strategy_id = cached.get("id") if isinstance(cached, dict) else None
+            data = cache.get(key, self._strategy_fingerprint(file_fp, strategy_id))
+            if data is not ContextCache.MISS:
+                return StrategyWithMetrics(**data) if data else None
+
+        strat = self._parse_strategy_file(path, status)
+        fp = self._strategy_fingerprint(file_fp, strat.id if strat else None)
+        if strat is not None:
+            self._enrich_with_validation(strat)
+        cache.put(key, fp, asdict(strat) if strat else None)
+        return strat
+
+    def _strategy_fingerprint(self, file_fp: list, strategy_id: str | None) -> list:
+        if strategy_id is None:
+            return file_fp
+        val_dir = self.workspace.validations_path / strategy_id
+        return file_fp + fingerprint(val_dir / name for name in VALIDATION_FILES)
+
     def _parse_strategy_file(self, path: Path, status: str) -> StrategyWithMetrics | None:
         """Parse a single strategy YAML file into a StrategyWithMetrics."""
         with open(path) as fh:
@@ -350,39 +424,61 @@ class WorkspaceContextAggregator:
         learnings: list[Learning] = []
         for yaml_file in sorted(learnings_dir.glob("*.yaml")):
             try:
-                with open(yaml_file) as fh:
-                    data = yaml.safe_load(fh)
-
-                if not isinstance(data, dict):
-                    continue
-
-                # Support both flat learning docs and docs with a learnings list
-                raw_learnings = data.get("learnings", [])
-                strategy_id = data.get("strategy_id", yaml_file.stem)
-
-                if isinstance(raw_learnings, list):
-                    for item in raw_learnings:
-                        if not isinstance(item, dict):
-                            continue
-                        learnings.append(Learning(
-                            strategy_id=str(strategy_id),
-                            category=item.get("category", "unknown"),
-                            description=item.get("insight") or item.get("description", ""),
-                            action=item.get("recommendation") or item.get("action", ""),
-                        ))
-                else:
-                    # Single-learning file
-                    learnings.append(Learning(
-                        strategy_id=str(strategy_id),
-                        category=data.get("category", "unknown"),
-                        description=data.get("insight") or data.get("description", ""),
-                        action=data.get("recommendation") or data.get("action", ""),
-                    ))
-
+                learnings.extend(self._load_learnings_file(yaml_file))
             except Exception:
                 logger.warning("Skipping malformed learnings file: %s", yaml_file, exc_info=True)
         return learnings
 
+    def _load_learnings_file(self, path: Path) -> list[Learning]:
+        """Load one learnings file, from the cache when unchanged."""
+        cache = self._cache
+        if cache is None:
+            return self._parse_learnings_file(path)
+
+        key = f"learnings/{path.name}"
+        self._cache_keys.add(key)
+        fp = fingerprint([path])
+        data = cache.get(key, fp)
+        if data is not ContextCache.MISS:
+            return [Learning(**item) for item in data]
+
+        learnings = self._parse_learnings_file(path)
+        cache.put(key, fp, [asdict(item) for item in learnings])
+        return learnings
+
+    @staticmethod
+    def _parse_learnings_file(path: Path) -> list[Learning]:
+        """Parse a learnings YAML file (flat or with a learnings list)."""
+        with open(path) as fh:
+            data = yaml.safe_load(fh)
+
+        if not isinstance(data, dict):
+            return []
+
+        # Support both flat learning docs and docs with a learnings list
+        raw_learnings = data.get("learnings", [])
+        strategy_id = data.get("strategy_id", path.stem)
+
+        if not isinstance(raw_learnings, list):
+            # Single-learning file
+            return [Learning(
+                strategy_id=str(strategy_id),
+                category=data.get("category", "unknown"),
+                description=data.get("insight") or data.get("description", ""),
+                action=data.get("recommendation") or data.get("action", ""),
+            )]
+
+        return [
+            Learning(
+                strategy_id=str(strategy_id),
+                category=item.get("category", "unknown"),
+                description=item.get("insight") or item.get("description", ""),
+                action=item.get("recommendation") or item.get("action", ""),
+            )
+            for item in raw_learnings
+            if isinstance(item, dict)
+        ]
+
     # ------------------------------------------------------------------
     # Data registry
     # ------------------------------------------------------------------
@@ -0,0 +1,152 @@
+"""Persistent snapshot cache for workspace context aggregation.
+
+Every `research synthesize` / `research ideate` aggregates the whole
+workspace: each strategy YAML, its validation results and every learnings
+file. Almost none of it changes between runs, and parsing YAML dominates
+start-up time on a large workspace.
+
+The cache stores the parsed form of each source (a strategy with its
+metrics, or the learnings from one file) as plain JSON, together with a
+fingerprint of the files it was built from: (mtime_ns, size) per file, or
+None for a file that didn't exist. An entry is reused only while every
+fingerprint still matches, so editing a strategy, re-running its
+validation or deleting a results file re-parses just that strategy.
+
+The cache is one JSON file, .state/context_cache.json, replaced atomically
+when anything changed. It is purely derived data: a missing, unreadable or
+older-version file simply starts a fresh cache.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from research_system.core.fileio import write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Cache file, relative to the workspace root
+CACHE_FILE = Path(".state") / "context_cache.json"
+
+# Bump when the cached representation changes
+CACHE_VERSION = 1
+
+_MISSING = object()
+
+
+def fingerprint(paths: Iterable[Path]) -> list[list[int] | None]:
+    """(mtime_ns, size) of each path, None for paths that don't exist."""
+    result: list[list[int] | None] = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            result.append(None)
+        else:
+            result.append([stat.st_mtime_ns, stat.st_size])
+    return result
+
+
+class ContextCache:
+    """Key -> (fingerprint, data) store persisted as one JSON file.
+
+    Example:
+        cache = ContextCache.for_workspace(workspace.path)
+        fp = fingerprint([strategy_file])
+        data = cache.get("strategies/validated/STRAT-001.yaml", fp)
+        if data is ContextCache.MISS:
+            data = parse(strategy_file)
+            cache.put("strategies/validated/STRAT-001.yaml", fp, data)
+        cache.save(keep=seen_keys)
+    """
+
+    MISS = _MISSING
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file holding the cache (created on first save)
+        """
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_workspace(cls, workspace_path: Path) -> ContextCache:
+        """Create a cache in the standard location under a workspace."""
+        return cls(Path(workspace_path) / CACHE_FILE)
+
+    def get(self, key: str, fp: Any) -> Any:
+        """Cached data for key if its fingerprint matches fp, else MISS."""
+        entry = self._load().get(key)
+        if entry is None or entry.get("fp") != fp:
+            self.misses += 1
+            return self.MISS
+        self.hits += 1
+        return entry.get("data")
+
+    def peek(self, key: str) -> dict[str, Any] | None:
+        """Raw entry for key ({"fp": ..., "data": ...}) without validation."""
+        return self._load().get(key)
+
+    def put(self, key: str, fp: Any, data: Any) -> None:
+        """Store data built from files with fingerprint fp."""
+        self._load()[key] = {"fp": fp, "data": data}
+        self._dirty = True
+
+    def save(self, keep: Iterable[str] | None = None) -> None:
+        """Write the cache if anything changed.
+
+        Args:
+            keep: If given, drop entries whose key is not in it (sources
+                that no longer exist)
+        """
+        entries = self._load()
+        if keep is not None:
+            keep = set(keep)
+            stale = [key for key in entries if key not in keep]
+            for key in stale:
+                del entries[key]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.path, json.dumps(
+                {"version": CACHE_VERSION, "entries": entries},
+                separators=(",", ":"),
+                default=str,
+            ))
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write context cache {self.path}: {e}")
+            return
+        self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, dict[str, Any]] = {}
+        if self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == CACHE_VERSION:
+                    entries = data.get("entries", {})
+                else:
+                    logger.info(f"Ignoring context cache {self.path} from another version")
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Could not read context cache {self.path}: {e}")
+
+        self._entries = entries
+        return entries
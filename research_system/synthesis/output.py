@@ -125,6 +125,7 @@ def save_idea_as_strategy(
             pass
         raise
 
+    workspace.refresh_strategy(strategy_id, status="pending")
     logger.info("Saved strategy %s to %s", strategy_id, filepath)
     return filepath
 
@@ -15,6 +15,13 @@ Different personas receive different metrics emphasis:
     edge-hunter          -- Entry types, trade frequency patterns
     macro-strategist     -- Cross-asset patterns, regime data from windows
     quant-archaeologist  -- Failed strategies with reasons, learnings
+
+The strategy listings are identical for every persona in a run, so
+build_cached_system() puts them in a workspace context block at the start
+of the system prompt, marked as a prompt caching breakpoint. The user
+prompts are then built with shared_context=True and refer to that block
+instead of repeating it, leaving only the persona-specific emphasis to be
+billed at full price on each call.
 """
 
 from __future__ import annotations
@@ -22,7 +29,9 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from research_system.llm.client import text_block
 
 if TYPE_CHECKING:
     from research_system.synthesis.context import StrategyWithMetrics, WorkspaceContext
@@ -36,6 +45,9 @@ logger = logging.getLogger(__name__)
 PERSONAS_DIR = Path(__file__).parent.parent / "agents" / "personas"
 PROMPTS_DIR = Path(__file__).parent.parent / "agents" / "prompts"
 
+# Stands in for strategy listings that live in the shared context block
+_SHARED_CONTEXT_REF = "(listed in the Workspace Context section above)"
+
 # ---------------------------------------------------------------------------
 # JSON output schemas embedded in prompts
 # ---------------------------------------------------------------------------
@@ -208,15 +220,74 @@ CRITICAL INSTRUCTIONS:
 - Stay in character as this persona throughout
 - Be specific - reference strategy IDs, specific metrics, concrete actions"""
 
+    # -----------------------------------------------------------------
+    # Shared workspace context (cacheable prefix)
+    # -----------------------------------------------------------------
+
+    def build_context_block(self, context: WorkspaceContext) -> str:
+        """Render the workspace context shared by every persona in a run.
+
+        Output depends only on the context, so repeated calls produce
+        byte-identical text and hit the provider's prompt cache.
+        """
+        stats = context.summary_stats
+        sections: list[str] = [
+            "# Workspace Context\n",
+            "## Summary\n",
+            f"- Validated strategies: {stats.get('validated_count', 0)}",
+            f"- Invalidated strategies: {stats.get('invalidated_count', 0)}",
+            f"- Pending strategies: {stats.get('pending_count', 0)}",
+        ]
+        if "avg_sharpe" in stats:
+            sections.append(f"- Average Sharpe (validated): {stats['avg_sharpe']:.2f}")
+        if "best_sharpe" in stats:
+            sections.append(f"- Best Sharpe: {stats['best_sharpe']:.2f}")
+        if "worst_drawdown" in stats:
+            sections.append(f"- Worst drawdown: {stats['worst_drawdown'] * 100:.1f}%")
+
+        sections.append("\n## Validated Strategies\n")
+        sections.append(self._format_strategies(context.validated))
+        sections.append("\n## Invalidated Strategies\n")
+        sections.append(self._format_strategies(context.invalidated))
+        sections.append("\n## Pending (Untested) Strategies\n")
+        sections.append(self._format_strategies(context.pending))
+        sections.append("\n## Custom Data Sources\n")
+        sections.append(self._format_available_data(context.available_data))
+
+        return "\n".join(sections)
+
+    def build_cached_system(
+        self, persona: str, context: WorkspaceContext
+    ) -> list[dict[str, Any]]:
+        """Build a system prompt as content blocks with a cacheable prefix.
+
+        The workspace context block comes first and carries the cache
+        breakpoint; the persona definition follows it, so every persona
+        shares the same cached prefix.
+        """
+        return [
+            text_block(self.build_context_block(context), cache=True),
+            text_block(self.build_system_prompt(persona)),
+        ]
+
     # -----------------------------------------------------------------
     # Ideation prompts
     # -----------------------------------------------------------------
 
-    def build_ideation_prompt(self, persona: str, context: WorkspaceContext) -> str:
+    def build_ideation_prompt(
+        self, persona: str, context: WorkspaceContext, shared_context: bool = False
+    ) -> str:
         """Build user prompt for ideation with results-aware context.
 
         Fills the ``generate_ideas`` template with live strategy data and
         customises the emphasis for the given ideation persona.
+
+        Args:
+            persona: Ideation persona name
+            context: Aggregated workspace context
+            shared_context: Strategy listings are in the system prompt's
+                context block (see build_cached_system); refer to it instead
+                of repeating them.
         """
         template = self._prompts.get("generate_ideas", "")
 
@@ -229,6 +300,12 @@ CRITICAL INSTRUCTIONS:
             "invalidated_entries": self._format_strategies(context.invalidated),
             "untested_entries": self._format_strategies(context.pending),
         }
+        if shared_context:
+            for key in (
+                "custom_data_sources", "validated_entries",
+                "invalidated_entries", "untested_entries",
+            ):
+                replacements[key] = _SHARED_CONTEXT_REF
 
         rendered = self._render_template(template, replacements)
 
@@ -304,12 +381,20 @@ CRITICAL INSTRUCTIONS:
     # Synthesis prompts
     # -----------------------------------------------------------------
 
-    def build_synthesis_prompt(self, persona: str, context: WorkspaceContext) -> str:
+    def build_synthesis_prompt(
+        self, persona: str, context: WorkspaceContext, shared_context: bool = False
+    ) -> str:
         """Build user prompt for synthesis with persona-specific metrics.
 
         Uses ``synthesize_strategies`` template as base, then appends
         per-persona data sections so each persona gets the metrics most
         relevant to its role.
+
+        Args:
+            persona: Synthesis persona name
+            context: Aggregated workspace context
+            shared_context: Strategy listings are in the system prompt's
+                context block; refer to it instead of repeating them.
         """
         template = self._prompts.get("synthesize_strategies", "")
 
@@ -320,6 +405,9 @@ CRITICAL INSTRUCTIONS:
             "validated_ideas": self._format_strategies(context.pending),
             "custom_data_sources": self._format_available_data(context.available_data),
         }
+        if shared_context:
+            for key in ("validated_strategies", "validated_ideas", "custom_data_sources"):
+                replacements[key] = _SHARED_CONTEXT_REF
 
         rendered = self._render_template(template, replacements)
 
@@ -422,11 +510,14 @@ CRITICAL INSTRUCTIONS:
         self,
         context: WorkspaceContext,
         persona_responses: dict[str, str],
+        shared_context: bool = False,
     ) -> str:
         """Build prompt for synthesis-director to integrate all persona outputs.
 
         The director sees all other persona responses and must synthesize,
-        rank, and select 1-3 best recommendations.
+        rank, and select 1-3 best recommendations. With shared_context the
+        workspace summary and strategy listings are left to the system
+        prompt's context block.
         """
         sections: list[str] = [
             "# Synthesis Director: Integration Task\n",
@@ -439,29 +530,8 @@ CRITICAL INSTRUCTIONS:
             "",
         ]
 
-        # Workspace summary
-        sections.append("## Workspace Summary\n")
-        stats = context.summary_stats
-        sections.append(f"- Validated strategies: {stats.get('validated_count', 0)}")
-        sections.append(f"- Invalidated strategies: {stats.get('invalidated_count', 0)}")
-        sections.append(f"- Pending strategies: {stats.get('pending_count', 0)}")
-        if "avg_sharpe" in stats:
-            sections.append(f"- Average Sharpe (validated): {stats['avg_sharpe']:.2f}")
-        if "best_sharpe" in stats:
-            sections.append(f"- Best Sharpe: {stats['best_sharpe']:.2f}")
-        if "worst_drawdown" in stats:
-            sections.append(f"- Worst drawdown: {stats['worst_drawdown'] * 100:.1f}%")
-        sections.append("")
-
-        # All validated strategies (brief)
-        sections.append("## Validated Strategies\n")
-        sections.append(self._format_strategies(context.validated))
-        sections.append("")
-
-        # Invalidated strategies (brief)
-        sections.append("## Invalidated Strategies\n")
-        sections.append(self._format_strategies(context.invalidated))
-        sections.append("")
+        if not shared_context:
+            sections.extend(self._director_workspace_sections(context))
 
         # Each persona's response
         sections.append("## Specialist Analyses\n")
@@ -489,6 +559,32 @@ CRITICAL INSTRUCTIONS:
 
         return "\n".join(sections)
 
+    def _director_workspace_sections(self, context: WorkspaceContext) -> list[str]:
+        """Workspace summary and strategy listings for the director prompt."""
+        stats = context.summary_stats
+        sections: list[str] = ["## Workspace Summary\n"]
+        sections.append(f"- Validated strategies: {stats.get('validated_count', 0)}")
+        sections.append(f"- Invalidated strategies: {stats.get('invalidated_count', 0)}")
+        sections.append(f"- Pending strategies: {stats.get('pending_count', 0)}")
+        if "avg_sharpe" in stats:
+            sections.append(f"- Average Sharpe (validated): {stats['avg_sharpe']:.2f}")
+        if "best_sharpe" in stats:
+            sections.append(f"- Best Sharpe: {stats['best_sharpe']:.2f}")
+        if "worst_drawdown" in stats:
+            sections.append(f"- Worst drawdown: {stats['worst_drawdown'] * 100:.1f}%")
+        sections.append("")
+
+        # All validated strategies (brief)
+        sections.append("## Validated Strategies\n")
+        sections.append(self._format_strategies(context.validated))
+        sections.append("")
+
+        # Invalidated strategies (brief)
+        sections.append("## Invalidated Strategies\n")
+        sections.append(self._format_strategies(context.invalidated))
+        sections.append("")
+        return sections
+
     # ==================================================================
     # Formatting helpers
     # ==================================================================
@@ -3,6 +3,9 @@
 Provides two modes:
 - ideate(): 3 ideation personas -> quality gate -> 1-3 strategies
 - synthesize(): 5 specialist personas -> synthesis-director -> recommendations
+
+Every call in a run shares the same workspace context block as a cached
+system prompt prefix (see PromptBuilder.build_cached_system).
 """
 
 from __future__ import annotations
@@ -14,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from research_system.llm.concurrency import fan_out
 from research_system.synthesis.context import (
     WorkspaceContext,
     WorkspaceContextAggregator,
@@ -77,11 +81,32 @@ class SynthesisRunner:
         runner = SynthesisRunner(workspace, LLMClient())
         result = runner.ideate()       # Generate 1-3 new strategies
         result = runner.synthesize()   # Full cross-strategy analysis
+
+    Independent personas run concurrently (up to max_workers at once), so a
+    synthesis run takes about as long as its slowest persona plus the
+    director. Results are always recorded in persona order.
     """
 
-    def __init__(self, workspace: Workspace, llm_client: LLMClient | None = None):
+    def __init__(
+        self,
+        workspace: Workspace,
+        llm_client: LLMClient | None = None,
+        max_workers: int | None = None,
+        persona_timeout: float | None = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            workspace: V4 workspace to read context from and save into
+            llm_client: LLM client (None = offline)
+            max_workers: Personas run at once (default: api.max_concurrent_personas)
+            persona_timeout: Seconds before a persona is abandoned
+                (default: api.persona_timeout_seconds)
+        """
         self.workspace = workspace
         self.llm_client = llm_client
+        self.max_workers = max_workers
+        self.persona_timeout = persona_timeout
         self.prompt_builder = PromptBuilder()
         self.aggregator = WorkspaceContextAggregator(workspace)
 
@@ -113,11 +138,19 @@ class SynthesisRunner:
         # Build quality gate with available data
         gate = QualityGate(available_data=context.available_data)
 
-        # Run each ideation persona
+        # Run the ideation personas concurrently
+        personas = PromptBuilder.IDEATION_PERSONAS
+        logger.info(f"Running {len(personas)} ideation personas...")
+        outcomes = self._run_personas(
+            personas, lambda persona: self._run_ideation_persona(persona, context)
+        )
+
         all_ideas: list[GeneratedIdea] = []
-        for persona in PromptBuilder.IDEATION_PERSONAS:
-            logger.info(f"Running ideation persona: {persona}")
-            ideas, response_text = self._run_ideation_persona(persona, context)
+        for persona, outcome in zip(personas, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                result.errors.append(f"Ideation persona {persona} failed: {outcome}")
+                outcome = ([], f"Error: {outcome}")
+            ideas, response_text = outcome
             result.persona_responses[persona] = response_text
             all_ideas.extend(ideas)
             logger.info(f"  {persona} generated {len(ideas)} ideas")
@@ -178,10 +211,16 @@ class SynthesisRunner:
             result.errors.append("No validated strategies found. Run validation first.")
             return result
 
-        # Phase 1: Run specialist personas in sequence
-        for persona in PromptBuilder.SYNTHESIS_PERSONAS:
-            logger.info(f"Running synthesis persona: {persona}")
-            response = self._run_synthesis_persona(persona, context)
+        # Phase 1: Run specialist personas concurrently
+        personas = PromptBuilder.SYNTHESIS_PERSONAS
+        logger.info(f"Running {len(personas)} synthesis personas...")
+        outcomes = self._run_personas(
+            personas, lambda persona: self._run_synthesis_persona(persona, context)
+        )
+        for persona, response in zip(personas, outcomes, strict=True):
+            if isinstance(response, BaseException):
+                result.errors.append(f"Synthesis persona {persona} failed: {response}")
+                response = f"Error: {response}"
             result.persona_responses[persona] = response
             logger.info(f"  {persona} complete")
 
@@ -217,18 +256,39 @@ class SynthesisRunner:
 
         return result
 
+    def _run_personas(self, personas: list[str], run) -> list[Any]:
+        """Run independent personas concurrently, returning outcomes in persona order.
+
+        The first persona runs alone so its call writes the shared system
+        prefix to the prompt cache; the rest then fan out and read it instead
+        of each paying the cache-write price for the same prefix.
+
+        A persona that raises or exceeds persona_timeout yields the exception.
+        """
+        api_config = self.workspace.config.api
+        max_workers = self.max_workers or api_config.max_concurrent_personas
+        timeout = self.persona_timeout
+        if timeout is None:
+            timeout = api_config.persona_timeout_seconds
+        first = fan_out(run, personas[:1], max_workers=1, timeout=timeout)
+        rest = fan_out(run, personas[1:], max_workers=max_workers, timeout=timeout)
+        return first + rest
+
     def _run_ideation_persona(
         self, persona: str, context: WorkspaceContext
     ) -> tuple[list[GeneratedIdea], str]:
         """Run a single ideation persona and parse its output."""
-        system_prompt = self.prompt_builder.build_system_prompt(persona)
-        user_prompt = self.prompt_builder.build_ideation_prompt(persona, context)
+        system_prompt = self.prompt_builder.build_cached_system(persona, context)
+        user_prompt = self.prompt_builder.build_ideation_prompt(
+            persona, context, shared_context=True
+        )
 
         try:
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
                 max_tokens=4000,
+                caller=f"synthesis.ideate.{persona}",
             )
             ideas = parse_ideas_from_response(response.content, persona)
             return ideas, response.content
@@ -238,14 +298,17 @@ class SynthesisRunner:
 
     def _run_synthesis_persona(self, persona: str, context: WorkspaceContext) -> str:
         """Run a single synthesis persona and return raw response."""
-        system_prompt = self.prompt_builder.build_system_prompt(persona)
-        user_prompt = self.prompt_builder.build_synthesis_prompt(persona, context)
+        system_prompt = self.prompt_builder.build_cached_system(persona, context)
+        user_prompt = self.prompt_builder.build_synthesis_prompt(
+            persona, context, shared_context=True
+        )
 
         try:
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
                 max_tokens=4000,
+                caller=f"synthesis.{persona}",
             )
             return response.content
         except Exception as e:
@@ -256,16 +319,19 @@ class SynthesisRunner:
         self, context: WorkspaceContext, persona_responses: dict[str, str]
     ) -> str:
         """Run the synthesis-director with all persona responses."""
-        system_prompt = self.prompt_builder.build_system_prompt(
-            PromptBuilder.SYNTHESIS_DIRECTOR
+        system_prompt = self.prompt_builder.build_cached_system(
+            PromptBuilder.SYNTHESIS_DIRECTOR, context
+        )
+        user_prompt = self.prompt_builder.build_director_prompt(
+            context, persona_responses, shared_context=True
         )
-        user_prompt = self.prompt_builder.build_director_prompt(context, persona_responses)
 
         try:
             response = self.llm_client.generate(
                 system=system_prompt,
                 user=user_prompt,
                 max_tokens=8000,
+                caller="synthesis.director",
             )
             return response.content
         except Exception as e:
@@ -28,6 +28,9 @@ from research_system.validation.backtest import (
     WalkForwardResult,
     WalkForwardWindow,
 )
+from research_system.validation.qc_api import QCApiClient, get_qc_client
+from research_system.validation.result_cache import BacktestResultCache
+from research_system.validation.scheduler import CloudJobOutcome, CloudJobScheduler
 from research_system.validation.runner import (
     Runner,
     RunResult,
@@ -69,6 +72,11 @@ __all__ = [
     "BacktestResult",
     "WalkForwardResult",
     "WalkForwardWindow",
+    "BacktestResultCache",
+    "CloudJobScheduler",
+    "CloudJobOutcome",
+    "QCApiClient",
+    "get_qc_client",
     # Runner
     "Runner",
     "V4Runner",
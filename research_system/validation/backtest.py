@@ -10,15 +10,15 @@ Extracted from scripts/validate/full_pipeline.py for V4 integration.
 
 from __future__ import annotations
 
-import base64
-import hashlib
 import json
+import queue
 import re
 import shutil
 import subprocess
+import threading
 import time
-import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -26,6 +26,11 @@ from typing import Any
 
 import logging
 
+from research_system.core.fileio import write_atomic
+from research_system.validation.qc_api import get_qc_client
+from research_system.validation.result_cache import BacktestResultCache
+from research_system.validation.scheduler import NODE_BUSY_PATTERNS, CloudJobScheduler
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +91,11 @@ class BacktestResult:
             "engine_crash": self.engine_crash,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BacktestResult:
+        """Create from a dictionary produced by to_dict()."""
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
 
 @dataclass
 class WalkForwardWindow:
@@ -183,6 +193,10 @@ class BacktestExecutor:
         num_windows: int = 1,
         timeout: int = 600,
         reuse_project: bool = True,
+        max_concurrent: int = 1,
+        result_cache: BacktestResultCache | None = None,
+        cloud_nodes: int | None = None,
+        scheduler: CloudJobScheduler | None = None,
     ):
         """Initialize backtest executor.
 
@@ -194,6 +208,15 @@ class BacktestExecutor:
             timeout: Backtest execution timeout in seconds (default: 600)
             reuse_project: If True, reuse a single QC cloud project to avoid
                 100/day project creation limit. Only applies to cloud mode.
+            max_concurrent: Maximum number of backtests in flight at once.
+                Walk-forward windows run concurrently when > 1, and reuse mode
+                keeps one project slot per in-flight backtest.
+            result_cache: Optional cache of results keyed on the date-injected
+                code, window and engine mode. None disables caching.
+            cloud_nodes: Route cloud backtests through a CloudJobScheduler with
+                this node budget. None keeps the direct synchronous path.
+            scheduler: Existing scheduler to share with other executors
+                (overrides cloud_nodes)
         """
         self.workspace_path = Path(workspace_path)
         self.validations_path = self.workspace_path / "validations"
@@ -201,10 +224,33 @@ class BacktestExecutor:
         self.reuse_project = reuse_project and not use_local
         self.num_windows = num_windows
         self.timeout = timeout
+        self.max_concurrent = max(1, max_concurrent)
+        self.result_cache = result_cache
+
+        # Cloud job scheduler (node budget, batched polling, adaptive backoff)
+        self.scheduler = scheduler
+        if self.scheduler is None and cloud_nodes and not use_local:
+            self.scheduler = CloudJobScheduler(
+                max_nodes=cloud_nodes,
+                status_fn=self._get_backtest_status,
+                delete_fn=self._delete_backtest,
+            )
 
         # Fixed project directory for reuse mode
         self._runner_project_dir = self.validations_path / "_runner"
 
+        # Bounded pool of reusable project slots (_runner, _runner_1, ...).
+        # LIFO so sequential runs keep reusing the first slot.
+        self._project_slots: queue.LifoQueue[Path] = queue.LifoQueue()
+        for index in reversed(range(self.max_concurrent)):
+            self._project_slots.put(self._project_slot_dir(index))
+        self._project_slot_count = self.max_concurrent
+        self._project_slot_lock = threading.Lock()
+
+        # Number of backtests currently executing through this executor
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
         # Select windows based on num_windows
         if num_windows >= 5:
             self.windows = self.ALL_WINDOWS
@@ -222,6 +268,7 @@ class BacktestExecutor:
         start_date: str,
         end_date: str,
         strategy_id: str = "temp",
+        parameters: dict[str, Any] | None = None,
     ) -> BacktestResult:
         """Execute a single backtest.
 
@@ -230,13 +277,72 @@ class BacktestExecutor:
             start_date: Start date (YYYY-MM-DD)
             end_date: End date (YYYY-MM-DD)
             strategy_id: Strategy ID for file naming
+            parameters: Values written to the project's config.json
+                "parameters" block, read by the algorithm via get_parameter()
 
         Returns:
             BacktestResult with metrics or error
         """
-        if self.reuse_project:
-            return self._run_single_reuse(code, start_date, end_date, strategy_id)
-        return self._run_single_new_project(code, start_date, end_date, strategy_id)
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(
+                self._inject_dates(code, start_date, end_date), start_date, end_date, self.use_local, parameters
+            )
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Backtest cache hit for {strategy_id} ({start_date} to {end_date})")
+                return cached
+
+        with self._track_in_flight():
+            if self.reuse_project:
+                with self._acquire_project_slot() as project_dir:
+                    result = self._run_single_reuse(
+                        code, start_date, end_date, strategy_id, project_dir=project_dir, parameters=parameters
+                    )
+            else:
+                result = self._run_single_new_project(code, start_date, end_date, strategy_id, parameters)
+
+        if self.result_cache is not None and cache_key is not None:
+            self.result_cache.put(cache_key, result)
+        return result
+
+    def _project_slot_dir(self, index: int) -> Path:
+        """Get the reusable project directory for a slot index."""
+        if index == 0:
+            return self._runner_project_dir
+        return self.validations_path / f"_runner_{index}"
+
+    def reserve_project_slots(self, count: int) -> None:
+        """Grow the reusable project slot pool to at least count slots.
+
+        Callers running several walk-forwards through this executor at once
+        (e.g. Runner.run_all with jobs > 1) reserve one slot per backtest
+        they may have in flight, so no two backtests share a project dir.
+        """
+        with self._project_slot_lock:
+            for index in range(self._project_slot_count, count):
+                self._project_slots.put(self._project_slot_dir(index))
+            self._project_slot_count = max(self._project_slot_count, count)
+
+    @contextmanager
+    def _acquire_project_slot(self):
+        """Check out a reusable project directory, blocking until one is free."""
+        project_dir = self._project_slots.get()
+        try:
+            yield project_dir
+        finally:
+            self._project_slots.put(project_dir)
+
+    @contextmanager
+    def _track_in_flight(self):
+        """Count a backtest as in flight for the duration of the block."""
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
 
     def _run_single_new_project(
         self,
@@ -244,10 +350,12 @@ class BacktestExecutor:
         start_date: str,
         end_date: str,
         strategy_id: str,
+        parameters: dict[str, Any] | None = None,
     ) -> BacktestResult:
         """Execute a backtest by creating a new project each time (legacy mode)."""
         # Create project directory
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        # Microsecond resolution keeps concurrent runs of the same window apart
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
         project_name = f"{strategy_id}_{start_date[:4]}_{end_date[:4]}_{timestamp}"
         project_dir = self.validations_path / strategy_id / project_name
         project_dir.mkdir(parents=True, exist_ok=True)
@@ -258,9 +366,7 @@ class BacktestExecutor:
         main_py.write_text(modified_code)
 
         # Create config.json
-        config = {"algorithm-language": "Python", "parameters": {}}
-        config_file = project_dir / "config.json"
-        config_file.write_text(json.dumps(config))
+        self._write_project_config(project_dir, parameters)
 
         max_retries = 3
         for attempt in range(max_retries):
@@ -285,25 +391,27 @@ class BacktestExecutor:
         start_date: str,
         end_date: str,
         strategy_id: str,
+        project_dir: Path | None = None,
+        parameters: dict[str, Any] | None = None,
     ) -> BacktestResult:
         """Execute a backtest by reusing a single QC cloud project.
 
         This avoids the 100 projects/day creation limit by overwriting
-        main.py in a fixed project directory each time.
+        main.py in a fixed project directory each time. When only the
+        parameters change between runs, main.py is left untouched so the
+        pushed project does not need recompiling.
         """
-        project_dir = self._runner_project_dir
+        project_dir = project_dir or self._runner_project_dir
         project_dir.mkdir(parents=True, exist_ok=True)
 
-        # Overwrite algorithm code with date injection
+        # Overwrite algorithm code with date injection (skipped if unchanged)
         main_py = project_dir / "main.py"
         modified_code = self._inject_dates(code, start_date, end_date)
-        main_py.write_text(modified_code)
+        if not main_py.exists() or main_py.read_text() != modified_code:
+            main_py.write_text(modified_code)
 
-        # Ensure config.json exists
-        config_file = project_dir / "config.json"
-        if not config_file.exists():
-            config = {"algorithm-language": "Python", "parameters": {}}
-            config_file.write_text(json.dumps(config))
+        # Rewrite config.json so parameters from a previous run never leak
+        self._write_project_config(project_dir, parameters)
 
         max_retries = 3
         for attempt in range(max_retries):
@@ -319,6 +427,28 @@ class BacktestExecutor:
 
         return BacktestResult(success=False, error="Backtest failed after all retries")
 
+    @staticmethod
+    def _write_project_config(project_dir: Path, parameters: dict[str, Any] | None) -> None:
+        """Set the parameter values in a LEAN project's config.json.
+
+        Only "parameters" is replaced. Other keys of an existing config,
+        such as the cloud-id/local-id the lean CLI adds after the first
+        push, are kept so a reused project stays linked to its cloud copy.
+        """
+        config_file = project_dir / "config.json"
+        config: dict[str, Any] = {"algorithm-language": "Python"}
+        if config_file.exists():
+            try:
+                existing = json.loads(config_file.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Rewriting unreadable {config_file}: {e}")
+            else:
+                if isinstance(existing, dict):
+                    config = existing
+        # LEAN parameters are strings; the algorithm casts them back
+        config["parameters"] = {name: str(value) for name, value in (parameters or {}).items()}
+        write_atomic(config_file, json.dumps(config))
+
     def run_walk_forward(
         self,
         code: str,
@@ -327,6 +457,10 @@ class BacktestExecutor:
     ) -> WalkForwardResult:
         """Execute walk-forward validation with multiple time windows.
 
+        When max_concurrent > 1, windows run concurrently (each in its own
+        project slot). Results are still recorded in window order and the
+        run stops at the first rate-limited or crashed window.
+
         Args:
             code: Python algorithm code
             strategy_id: Strategy ID
@@ -339,30 +473,135 @@ class BacktestExecutor:
             windows = self.windows
 
         wf_result = WalkForwardResult(strategy_id=strategy_id)
-        total_windows = len(windows)
+        results = self._run_windows(code, strategy_id, windows)
+
+        if self._record_window_results(wf_result, windows, results):
+            return wf_result
+
+        # Aggregate results
+        self._aggregate_walk_forward_results(wf_result)
+        return wf_result
+
+    def _run_windows(
+        self,
+        code: str,
+        strategy_id: str,
+        windows: list[tuple[str, str]],
+        first_window: int = 1,
+        total_windows: int | None = None,
+    ) -> list[BacktestResult | None]:
+        """Run windows sequentially or concurrently depending on max_concurrent."""
+        if self.max_concurrent > 1 and len(windows) > 1:
+            return self._run_windows_concurrent(code, strategy_id, windows, first_window, total_windows)
+        return self._run_windows_sequential(code, strategy_id, windows, first_window, total_windows)
+
+    def _run_windows_sequential(
+        self,
+        code: str,
+        strategy_id: str,
+        windows: list[tuple[str, str]],
+        first_window: int = 1,
+        total_windows: int | None = None,
+    ) -> list[BacktestResult | None]:
+        """Run windows one after another, stopping at a rate limit or crash.
+
+        Returns:
+            One entry per window; None for windows skipped after a stop.
+        """
+        total_windows = total_windows or len(windows)
+        results: list[BacktestResult | None] = [None] * len(windows)
 
         for i, (start_date, end_date) in enumerate(windows):
-            window_num = i + 1
+            window_num = first_window + i
             print(f"    Window {window_num}/{total_windows}: {start_date} to {end_date}...", end="", flush=True)
             logger.info(f"Running window {window_num}/{total_windows}: {start_date} to {end_date}")
 
             window_start = time.time()
             result = self.run_single(code, start_date, end_date, strategy_id)
-            window_elapsed = time.time() - window_start
+            print(f" {self._window_status(result)} ({time.time() - window_start:.0f}s)")
 
-            # Print result on same line
-            if result.success:
-                print(f" done ({window_elapsed:.0f}s)")
-            elif result.rate_limited:
-                print(f" rate limited ({window_elapsed:.0f}s)")
-            elif result.engine_crash:
-                print(f" engine crash ({window_elapsed:.0f}s)")
-            else:
-                print(f" failed ({window_elapsed:.0f}s)")
+            results[i] = result
+            if result.rate_limited or result.engine_crash:
+                break
+
+        return results
+
+    def _run_windows_concurrent(
+        self,
+        code: str,
+        strategy_id: str,
+        windows: list[tuple[str, str]],
+        first_window: int = 1,
+        total_windows: int | None = None,
+    ) -> list[BacktestResult | None]:
+        """Run up to max_concurrent windows at once.
+
+        Windows are submitted in order. Once any window is rate limited or
+        crashes the engine, windows that have not started yet are skipped.
+
+        Returns:
+            One entry per window, in window order; None for skipped windows.
+        """
+        total_windows = total_windows or len(windows)
+        stop = threading.Event()
+
+        def run_window(i: int, start_date: str, end_date: str) -> BacktestResult | None:
+            if stop.is_set():
+                return None
+            window_num = first_window + i
+            logger.info(f"Running window {window_num}/{total_windows}: {start_date} to {end_date}")
+
+            window_start = time.time()
+            result = self.run_single(code, start_date, end_date, strategy_id)
+            if result.rate_limited or result.engine_crash:
+                stop.set()
+
+            print(
+                f"    Window {window_num}/{total_windows}: {start_date} to {end_date}... "
+                f"{self._window_status(result)} ({time.time() - window_start:.0f}s)",
+                flush=True,
+            )
+            return result
+
+        workers = min(self.max_concurrent, len(windows))
+        print(f"    Running {len(windows)} windows, {workers} at a time...", flush=True)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wf-window") as pool:
+            futures = [
+                pool.submit(run_window, i, start_date, end_date)
+                for i, (start_date, end_date) in enumerate(windows)
+            ]
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def _window_status(result: BacktestResult) -> str:
+        """Short status label for a window's progress line."""
+        if result.success:
+            return "done"
+        if result.rate_limited:
+            return "rate limited"
+        if result.engine_crash:
+            return "engine crash"
+        return "failed"
+
+    def _record_window_results(
+        self,
+        wf_result: WalkForwardResult,
+        windows: list[tuple[str, str]],
+        results: list[BacktestResult | None],
+        first_window: int = 1,
+    ) -> bool:
+        """Append window results in order and apply early-stop determinations.
+
+        Returns:
+            True if a rate-limited or crashed window ended the walk-forward.
+        """
+        for i, ((start_date, end_date), result) in enumerate(zip(windows, results, strict=True)):
+            if result is None:
+                break
 
             wf_result.windows.append(
                 WalkForwardWindow(
-                    window_id=i + 1,
+                    window_id=first_window + i,
                     start_date=start_date,
                     end_date=end_date,
                     result=result,
@@ -374,18 +613,16 @@ class BacktestExecutor:
                 wf_result.determination = "RETRY_LATER"
                 wf_result.determination_reason = "Rate limited during walk-forward - retry when nodes available"
                 wf_result.is_transient = True
-                return wf_result
+                return True
 
             # If engine crashed, mark as blocked (permanent - needs investigation)
             if result.engine_crash:
                 wf_result.determination = "BLOCKED"
                 wf_result.determination_reason = "LEAN engine crash"
                 wf_result.is_transient = False
-                return wf_result
+                return True
 
-        # Aggregate results
-        self._aggregate_walk_forward_results(wf_result)
-        return wf_result
+        return False
 
     def _is_correctable_error(self, error: str) -> bool:
         """Check if error is potentially correctable by LLM.
@@ -505,65 +742,37 @@ class BacktestExecutor:
             windows = self.windows
 
         wf_result = WalkForwardResult(strategy_id=strategy_id)
-        current_code = code
-        total_attempts = 1
         total_windows = len(windows)
+        if not windows:
+            self._aggregate_walk_forward_results(wf_result)
+            return wf_result, 1
 
-        for i, (start_date, end_date) in enumerate(windows):
-            window_num = i + 1
-            print(f"    Window {window_num}/{total_windows}: {start_date} to {end_date}...", end="", flush=True)
-            logger.info(f"Running window {window_num}/{total_windows}: {start_date} to {end_date}")
-
-            window_start = time.time()
+        # Only try correction on first window
+        start_date, end_date = windows[0]
+        print(f"    Window 1/{total_windows}: {start_date} to {end_date}...", end="", flush=True)
+        logger.info(f"Running window 1/{total_windows}: {start_date} to {end_date}")
 
-            # Only try correction on first window
-            if i == 0:
-                result, attempts = self.run_single_with_correction(
-                    current_code,
-                    start_date,
-                    end_date,
-                    strategy_id,
-                    strategy,
-                    code_generator,
-                    max_attempts=max_correction_attempts,
-                )
-                total_attempts = attempts
-            else:
-                result = self.run_single(current_code, start_date, end_date, strategy_id)
-
-            window_elapsed = time.time() - window_start
+        window_start = time.time()
+        first_result, total_attempts = self.run_single_with_correction(
+            code,
+            start_date,
+            end_date,
+            strategy_id,
+            strategy,
+            code_generator,
+            max_attempts=max_correction_attempts,
+        )
+        print(f" {self._window_status(first_result)} ({time.time() - window_start:.0f}s)")
 
-            # Print result on same line
-            if result.success:
-                print(f" done ({window_elapsed:.0f}s)")
-            elif result.rate_limited:
-                print(f" rate limited ({window_elapsed:.0f}s)")
-            elif result.engine_crash:
-                print(f" engine crash ({window_elapsed:.0f}s)")
-            else:
-                print(f" failed ({window_elapsed:.0f}s)")
+        if self._record_window_results(wf_result, windows[:1], [first_result]):
+            return wf_result, total_attempts
 
-            wf_result.windows.append(
-                WalkForwardWindow(
-                    window_id=i + 1,
-                    start_date=start_date,
-                    end_date=end_date,
-                    result=result,
-                )
+        remaining = windows[1:]
+        if remaining:
+            results = self._run_windows(
+                code, strategy_id, remaining, first_window=2, total_windows=total_windows
             )
-
-            # If rate limited, stop and retry later (transient - don't block)
-            if result.rate_limited:
-                wf_result.determination = "RETRY_LATER"
-                wf_result.determination_reason = "Rate limited during walk-forward - retry when nodes available"
-                wf_result.is_transient = True
-                return wf_result, total_attempts
-
-            # If engine crashed, mark as blocked (permanent - needs investigation)
-            if result.engine_crash:
-                wf_result.determination = "BLOCKED"
-                wf_result.determination_reason = "LEAN engine crash"
-                wf_result.is_transient = False
+            if self._record_window_results(wf_result, remaining, results, first_window=2):
                 return wf_result, total_attempts
 
         # Aggregate results
@@ -676,6 +885,9 @@ class BacktestExecutor:
                 error=f"No lean.json found. Run 'lean init' in your workspace directory to set up QuantConnect backtesting. See the README for details.",
             )
 
+        if self.scheduler is not None and not self.use_local:
+            return self._execute_scheduled_backtest(self.scheduler, project_dir, strategy_id)
+
         # Build command
         if self.use_local:
             cmd = ["lean", "backtest", str(project_dir), "--download-data"]
@@ -694,20 +906,16 @@ class BacktestExecutor:
             cwd=str(self.workspace_path),
         )
 
-        # Save debug output
-        debug_file = self.validations_path / strategy_id / "last_lean_output.txt"
-        debug_file.parent.mkdir(parents=True, exist_ok=True)
-        debug_file.write_text(
-            f"=== RETURNCODE: {result.returncode} ===\n\n"
-            f"=== STDOUT ===\n{result.stdout}\n\n"
-            f"=== STDERR ===\n{result.stderr}"
-        )
+        self._save_debug_output(strategy_id, result.returncode, result.stdout, result.stderr)
 
         # Check for rate limiting (normalize whitespace to handle word-wrapped output)
         output_lower = " ".join((result.stdout + result.stderr).split()).lower()
-        rate_limit_patterns = ["no spare nodes", "rate limit", "too many", "throttl", "quota", "capacity limit", "maximum number of projects"]
-        if any(pattern in output_lower for pattern in rate_limit_patterns):
-            cleaned = self._cleanup_all_running_backtests()
+        if any(pattern in output_lower for pattern in NODE_BUSY_PATTERNS):
+            # With sibling backtests in flight, the running jobs are our own
+            # windows - back off instead of cancelling them.
+            with self._in_flight_lock:
+                has_siblings = self._in_flight > 1
+            cleaned = 0 if has_siblings else self._cleanup_all_running_backtests()
             if cleaned > 0:
                 time.sleep(30)
                 return None  # Retry
@@ -742,6 +950,44 @@ class BacktestExecutor:
 
         return self._parse_lean_output(result.stdout, result.stderr, result.returncode)
 
+    def _execute_scheduled_backtest(
+        self, scheduler: CloudJobScheduler, project_dir: Path, strategy_id: str
+    ) -> BacktestResult:
+        """Execute a cloud backtest through the job scheduler.
+
+        The scheduler owns node-busy retries and completion polling, so this
+        never asks the caller's retry loop to try again.
+        """
+        outcome = scheduler.run(project_dir, cwd=self.workspace_path, timeout=self.timeout)
+        self._save_debug_output(strategy_id, outcome.returncode, outcome.stdout, outcome.stderr)
+
+        if outcome.node_unavailable:
+            return BacktestResult(
+                success=False,
+                error="QC nodes unavailable - clean up stuck jobs",
+                raw_output=outcome.stdout,
+                rate_limited=True,
+            )
+
+        if outcome.status == "Timeout":
+            return BacktestResult(
+                success=False,
+                error="Backtest timed out",
+                rate_limited=True,
+            )
+
+        return self._parse_lean_output(outcome.stdout, outcome.stderr, outcome.returncode or 0)
+
+    def _save_debug_output(self, strategy_id: str, returncode: int | None, stdout: str, stderr: str) -> None:
+        """Save the last LEAN CLI output for a strategy."""
+        debug_file = self.validations_path / strategy_id / "last_lean_output.txt"
+        debug_file.parent.mkdir(parents=True, exist_ok=True)
+        debug_file.write_text(
+            f"=== RETURNCODE: {returncode} ===\n\n"
+            f"=== STDOUT ===\n{stdout}\n\n"
+            f"=== STDERR ===\n{stderr}"
+        )
+
     def _inject_dates(self, code: str, start_date: str, end_date: str) -> str:
         """Inject start/end dates into algorithm code."""
         start_parts = start_date.split("-")
@@ -921,20 +1167,8 @@ class BacktestExecutor:
     # =========================================================================
 
     def _get_qc_credentials(self) -> tuple[str, str] | None:
-        """Load QC API credentials from ~/.lean/credentials."""
-        creds_file = Path.home() / ".lean" / "credentials"
-        if not creds_file.exists():
-            return None
-
-        try:
-            creds = json.loads(creds_file.read_text())
-            user_id = creds.get("user-id")
-            api_token = creds.get("api-token")
-            if user_id and api_token:
-                return (user_id, api_token)
-        except Exception:
-            pass
-        return None
+        """Load QC API credentials from ~/.lean/credentials (cached)."""
+        return get_qc_client().credentials()
 
     def _qc_api_request(
         self,
@@ -942,36 +1176,8 @@ class BacktestExecutor:
         params: dict[str, Any] | None = None,
         method: str = "GET",
     ) -> dict[str, Any] | None:
-        """Make authenticated request to QC API."""
-        creds = self._get_qc_credentials()
-        if not creds:
-            return None
-
-        user_id, api_token = creds
-
-        try:
-            timestamp = str(int(time.time()))
-            hash_data = f"{api_token}:{timestamp}"
-            hash_value = hashlib.sha256(hash_data.encode()).hexdigest()
-
-            if params:
-                query_string = urllib.parse.urlencode(params)
-                url = f"https://www.quantconnect.com/api/v2/{endpoint}?{query_string}"
-            else:
-                url = f"https://www.quantconnect.com/api/v2/{endpoint}"
-
-            auth_string = f"{user_id}:{hash_value}"
-            auth_bytes = base64.b64encode(auth_string.encode()).decode()
-
-            request = urllib.request.Request(url, method=method)
-            request.add_header("Authorization", f"Basic {auth_bytes}")
-            request.add_header("Timestamp", timestamp)
-
-            response = urllib.request.urlopen(request, timeout=30)
-            return json.loads(response.read().decode())
-        except Exception as e:
-            logger.debug(f"QC API request failed: {e}")
-            return None
+        """Make authenticated request to QC API over the shared pooled client."""
+        return get_qc_client().request(endpoint, params, method=method)
 
     def _extract_backtest_ids(self, stdout: str) -> tuple[str | None, str | None]:
         """Extract project ID and backtest ID from LEAN output."""
@@ -1063,13 +1269,15 @@ class BacktestExecutor:
         except Exception:
             pass
 
-        projects = projects[:max_projects]
+        project_ids = [str(p.get("projectId", "")) for p in projects[:max_projects]]
+        project_ids = [proj_id for proj_id in project_ids if proj_id]
 
-        for proj in projects:
-            proj_id = str(proj.get("projectId", ""))
-            if proj_id:
-                cleaned = self._cleanup_stuck_backtests(proj_id, max_age_seconds)
-                total_cleaned += cleaned
+        # Projects are independent; check a few at once over warm connections
+        if project_ids:
+            with ThreadPoolExecutor(max_workers=min(4, len(project_ids)), thread_name_prefix="qc-cleanup") as pool:
+                total_cleaned = sum(
+                    pool.map(lambda proj_id: self._cleanup_stuck_backtests(proj_id, max_age_seconds), project_ids)
+                )
 
         if total_cleaned > 0:
             logger.info(f"Cleaned up {total_cleaned} stuck backtests")
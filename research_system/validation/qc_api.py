@@ -0,0 +1,331 @@
+"""Shared QuantConnect REST API client.
+
+This module provides the one QC API client used by the backtest executor
+and the validation/develop scripts:
+- QCApiClient: Authenticated requests over pooled keep-alive HTTPS
+  connections, with cached credentials, retry with jittered backoff and
+  per-endpoint timing metrics
+- get_qc_client: Process-wide shared client
+
+Connections are kept per thread (http.client connections are not thread
+safe), so concurrent callers each reuse their own warm connection instead
+of paying a TLS handshake per request.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import http.client
+import json
+import logging
+import random
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+QC_API_HOST = "www.quantconnect.com"
+QC_API_PREFIX = "/api/v2"
+
+# HTTP statuses worth retrying
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Endpoint actions that are safe to repeat. Anything else (create, update,
+# delete, ...) is only retried when the request cannot have been acted on:
+# the connection failed before it was sent, or the API answered 429.
+IDEMPOTENT_ACTIONS = {"read", "list"}
+
+
+class _RequestNotSent(Exception):
+    """The connection failed before any of the request was sent."""
+
+
+class QCApiClient:
+    """QuantConnect REST API client with keep-alive connection pooling.
+
+    Requests return the decoded JSON response, or None when credentials
+    are missing or the request ultimately fails. Callers check
+    data.get("success") as before.
+
+    Example:
+        client = get_qc_client()
+        data = client.request("backtests/read", {"projectId": pid, "backtestId": bid})
+        print(client.stats())
+    """
+
+    def __init__(
+        self,
+        credentials_path: Path | None = None,
+        host: str = QC_API_HOST,
+        timeout: float = 30,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ):
+        """Initialize the client.
+
+        Args:
+            credentials_path: LEAN credentials file (default: ~/.lean/credentials)
+            host: API host
+            timeout: Socket timeout per request in seconds
+            max_retries: Retries after the first attempt for transient failures
+            backoff_base: First retry delay in seconds (doubled per retry, jittered)
+            backoff_max: Longest retry delay in seconds
+        """
+        self.credentials_path = Path(credentials_path) if credentials_path else default_credentials_path()
+        self.host = host
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._credentials: tuple[str, str] | None = None
+        self._credentials_mtime: float | None = None
+        self._auth_cache: tuple[str, str, str] | None = None  # (timestamp, token, header)
+        self._metrics: dict[str, dict[str, float]] = {}
+
+    # -------------------------------------------------------------------------
+    # Credentials and authentication
+    # -------------------------------------------------------------------------
+
+    def credentials(self) -> tuple[str, str] | None:
+        """Get (user_id, api_token), re-reading the file only when it changes."""
+        try:
+            mtime = self.credentials_path.stat().st_mtime
+        except OSError:
+            return None
+
+        with self._lock:
+            if self._credentials_mtime != mtime:
+                self._credentials = None
+                self._credentials_mtime = mtime
+                try:
+                    creds = json.loads(self.credentials_path.read_text())
+                    user_id = creds.get("user-id")
+                    api_token = creds.get("api-token")
+                    if user_id and api_token:
+                        self._credentials = (str(user_id), str(api_token))
+                except (OSError, ValueError):
+                    pass
+            return self._credentials
+
+    def _auth_headers(self, user_id: str, api_token: str) -> dict[str, str]:
+        """Build auth headers; the hash only changes once per second."""
+        timestamp = str(int(time.time()))
+        with self._lock:
+            cached = self._auth_cache
+        if cached and cached[0] == timestamp and cached[1] == api_token:
+            header = cached[2]
+        else:
+            hash_value = hashlib.sha256(f"{api_token}:{timestamp}".encode()).hexdigest()
+            header = "Basic " + base64.b64encode(f"{user_id}:{hash_value}".encode()).decode()
+            with self._lock:
+                self._auth_cache = (timestamp, api_token, header)
+        return {"Authorization": header, "Timestamp": timestamp}
+
+    # -------------------------------------------------------------------------
+    # Requests
+    # -------------------------------------------------------------------------
+
+    def request(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        method: str = "GET",
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Make an authenticated request to the QC API.
+
+        Args:
+            endpoint: API endpoint (e.g. "backtests/read")
+            params: Query string parameters
+            method: HTTP method
+            data: Form-encoded body parameters
+
+        Returns:
+            Decoded JSON response, or None on failure
+
+        Transient failures are retried for read/list endpoints. A create,
+        update or delete is retried only if it never reached the server,
+        so a retry can't e.g. launch a second backtest.
+        """
+        creds = self.credentials()
+        if not creds:
+            return None
+
+        path = f"{QC_API_PREFIX}/{endpoint}"
+        if params:
+            path += "?" + urllib.parse.urlencode(params)
+        body = urllib.parse.urlencode(data).encode() if data else None
+
+        idempotent = endpoint.rstrip("/").rsplit("/", 1)[-1] in IDEMPOTENT_ACTIONS
+        started = time.perf_counter()
+        result = None
+        attempt = 0
+        while True:
+            headers = self._auth_headers(*creds)
+            if body is not None:
+                headers["Content-Type"] = "application/x-www-form-urlencoded"
+            retryable = True
+            try:
+                status, payload = self._send(method, path, body, headers)
+            except _RequestNotSent as e:
+                self._drop_connection()
+                failure = f"{type(e.__cause__).__name__}: {e.__cause__}"
+            except (OSError, http.client.HTTPException) as e:
+                # The server may have received and acted on the request
+                self._drop_connection()
+                failure = f"{type(e).__name__}: {e}"
+                retryable = idempotent
+            else:
+                if status not in RETRY_STATUSES:
+                    try:
+                        result = json.loads(payload.decode())
+                    except ValueError as e:
+                        logger.debug(f"QC API request {endpoint} returned invalid JSON: {e}")
+                    break
+                failure = f"HTTP {status}"
+                retryable = idempotent or status == 429
+
+            if not retryable:
+                logger.debug(f"QC API request {endpoint} failed: {failure} (not retried: not idempotent)")
+                break
+            if attempt == self.max_retries:
+                logger.debug(f"QC API request {endpoint} failed: {failure}")
+                break
+            self._sleep_backoff(attempt)
+            attempt += 1
+
+        self._record(endpoint, time.perf_counter() - started, attempt, result is None)
+        return result
+
+    def _send(self, method: str, path: str, body: bytes | None, headers: dict[str, str]) -> tuple[int, bytes]:
+        connection = self._connection()
+        if connection.sock is None:
+            try:
+                connection.connect()
+            except (OSError, http.client.HTTPException) as e:
+                raise _RequestNotSent(str(e)) from e
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        if response.getheader("Connection", "").lower() == "close":
+            self._drop_connection()
+        return response.status, payload
+
+    def _connection(self) -> http.client.HTTPSConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = http.client.HTTPSConnection(self.host, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def _drop_connection(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        self._local.connection = None
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                connection.close()
+
+    def _sleep_backoff(self, attempt: int) -> None:
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        time.sleep(random.uniform(delay / 2, delay))
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def _record(self, endpoint: str, seconds: float, retries: int, error: bool) -> None:
+        with self._lock:
+            metrics = self._metrics.setdefault(
+                endpoint, {"requests": 0, "errors": 0, "retries": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            metrics["requests"] += 1
+            metrics["errors"] += int(error)
+            metrics["retries"] += retries
+            metrics["total_seconds"] += seconds
+            metrics["max_seconds"] = max(metrics["max_seconds"], seconds)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Get per-endpoint request counts and timings."""
+        with self._lock:
+            return {
+                endpoint: {
+                    **metrics,
+                    "avg_seconds": metrics["total_seconds"] / metrics["requests"] if metrics["requests"] else 0.0,
+                }
+                for endpoint, metrics in self._metrics.items()
+            }
+
+    # -------------------------------------------------------------------------
+    # Endpoint helpers
+    # -------------------------------------------------------------------------
+
+    def list_projects(self) -> list[dict[str, Any]]:
+        """List all projects."""
+        data = self.request("projects/read")
+        if data and data.get("success"):
+            projects: list[dict[str, Any]] = data.get("projects", [])
+            return projects
+        return []
+
+    def list_backtests(self, project_id: str) -> list[dict[str, Any]]:
+        """List all backtests for a project."""
+        data = self.request("backtests/list", {"projectId": project_id})
+        if data and data.get("success"):
+            backtests: list[dict[str, Any]] = data.get("backtests", [])
+            return backtests
+        return []
+
+    def read_backtest(self, project_id: str, backtest_id: str) -> dict[str, Any] | None:
+        """Read a backtest (status, statistics, error)."""
+        data = self.request("backtests/read", {"projectId": project_id, "backtestId": backtest_id})
+        if data and data.get("success"):
+            backtest: dict[str, Any] = data.get("backtest", {})
+            return backtest
+        return None
+
+    def backtest_status(self, project_id: str, backtest_id: str) -> str | None:
+        """Get "Completed", "RuntimeError", "Running", or None if unavailable."""
+        backtest = self.read_backtest(project_id, backtest_id)
+        if backtest is None:
+            return None
+        if backtest.get("completed"):
+            return "Completed"
+        if backtest.get("error"):
+            return "RuntimeError"
+        return "Running"
+
+    def delete_backtest(self, project_id: str, backtest_id: str) -> bool:
+        """Delete/cancel a backtest."""
+        data = self.request(
+            "backtests/delete", {"projectId": project_id, "backtestId": backtest_id}, method="POST"
+        )
+        return bool(data and data.get("success"))
+
+
+def default_credentials_path() -> Path:
+    """Get the LEAN CLI credentials file (~/.lean/credentials)."""
+    return Path.home() / ".lean" / "credentials"
+
+
+_shared_clients: dict[Path, QCApiClient] = {}
+_shared_lock = threading.Lock()
+
+
+def get_qc_client(credentials_path: Path | None = None) -> QCApiClient:
+    """Get the process-wide client for a credentials file."""
+    path = Path(credentials_path) if credentials_path else default_credentials_path()
+    with _shared_lock:
+        client = _shared_clients.get(path)
+        if client is None:
+            client = QCApiClient(credentials_path=path)
+            _shared_clients[path] = client
+        return client
@@ -0,0 +1,227 @@
+"""Content-addressed cache of backtest results.
+
+Identical algorithm code run over the same window in the same engine mode
+produces the same backtest, so there is no reason to pay for it twice.
+This is common with optimizer repeats, `research run --force` re-runs and
+overlapping walk-forward windows.
+
+Entries are keyed on the SHA-256 of the date-injected main.py plus the
+window dates and engine mode, and are stored as one JSON file per key
+under the workspace's .state/backtest_cache/ directory.
+
+Only successful results are cached. Rate limits, engine crashes and
+timeouts are transient and must always be retried.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from research_system.core.fileio import write_atomic
+
+if TYPE_CHECKING:
+    from research_system.validation.backtest import BacktestResult
+
+logger = logging.getLogger(__name__)
+
+# Cache directory, relative to the workspace root
+CACHE_DIR = Path(".state") / "backtest_cache"
+
+
+class BacktestResultCache:
+    """Persistent on-disk cache of BacktestResult keyed on code and window.
+
+    Eviction is age-based (entries older than max_age_days are dropped on
+    read and on prune) and size-based (the oldest entries beyond
+    max_entries are dropped). put() prunes once every PRUNE_EVERY stores,
+    so the cache can briefly exceed max_entries.
+
+    Example:
+        cache = BacktestResultCache.for_workspace(workspace.path)
+        key = cache.make_key(injected_code, "2012-01-01", "2017-12-31", use_local=False)
+        result = cache.get(key)
+        if result is None:
+            result = run_backtest(...)
+            cache.put(key, result)
+    """
+
+    # Prune the directory once every this many stores
+    PRUNE_EVERY = 100
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = 5000,
+        max_age_days: float = 30,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_entries: Maximum number of entries kept on disk
+            max_age_days: Entries older than this are treated as misses
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_days * 86400
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_workspace(
+        cls,
+        workspace_path: Path,
+        max_entries: int = 5000,
+        max_age_days: float = 30,
+    ) -> BacktestResultCache:
+        """Create a cache in the standard location under a workspace."""
+        return cls(Path(workspace_path) / CACHE_DIR, max_entries, max_age_days)
+
+    @staticmethod
+    def make_key(
+        code: str,
+        start_date: str,
+        end_date: str,
+        use_local: bool,
+        parameters: dict[str, Any] | None = None,
+    ) -> str:
+        """Build the cache key for a backtest.
+
+        Args:
+            code: Date-injected algorithm code (the exact main.py contents)
+            start_date: Start date (YYYY-MM-DD)
+            end_date: End date (YYYY-MM-DD)
+            use_local: True for local Docker, False for QC cloud
+            parameters: config.json parameter values, if any
+
+        Returns:
+            Hex SHA-256 digest identifying the backtest
+        """
+        code_hash = hashlib.sha256(code.encode()).hexdigest()
+        mode = "local" if use_local else "cloud"
+        key = f"{code_hash}|{start_date}|{end_date}|{mode}"
+        if parameters:
+            key += "|" + json.dumps({k: str(v) for k, v in parameters.items()}, sort_keys=True)
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> BacktestResult | None:
+        """Look up a cached result.
+
+        Returns:
+            The cached BacktestResult, or None on a miss or expired entry.
+        """
+        from research_system.validation.backtest import BacktestResult
+
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text())
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+
+        if time.time() - entry.get("stored_at", 0) > self.max_age_seconds:
+            self._remove(path)
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return BacktestResult.from_dict(entry.get("result", {}))
+
+    def put(self, key: str, result: BacktestResult) -> bool:
+        """Store a result. Only successful results are cached.
+
+        Returns:
+            True if the result was stored.
+        """
+        if not result.success:
+            return False
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        entry = {"stored_at": time.time(), "result": result.to_dict()}
+
+        write_atomic(self._entry_path(key), json.dumps(entry))
+
+        with self._lock:
+            self.stores += 1
+            prune = self.stores % self.PRUNE_EVERY == 1
+        if prune:
+            self.prune()
+        return True
+
+    def prune(self) -> int:
+        """Drop expired entries, then the oldest entries beyond max_entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+
+        now = time.time()
+        entries.sort()
+        excess = len(entries) - self.max_entries
+        removed = 0
+        for i, (mtime, path) in enumerate(entries):
+            if (i < excess or now - mtime > self.max_age_seconds) and self._remove(path):
+                removed += 1
+
+        if removed:
+            self._count("evictions", removed)
+            logger.debug(f"Evicted {removed} backtest cache entries")
+        return removed
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed.
+        """
+        if not self.cache_dir.exists():
+            return 0
+        removed = sum(1 for path in self.cache_dir.glob("*.json") if self._remove(path))
+        self._count("evictions", removed)
+        return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Get hit/miss counters for this cache instance."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
@@ -13,6 +13,9 @@ Pipeline steps:
 from __future__ import annotations
 
 import json
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -20,12 +23,15 @@ from typing import Any
 
 import yaml
 
+from research_system.codegen.cache import CodeGenCache
 from research_system.codegen.v4_generator import V4CodeGenerator, V4CodeGenResult
+from research_system.core.fileio import write_atomic
 from research_system.validation.backtest import (
     BacktestExecutor,
     BacktestResult,
     WalkForwardResult,
 )
+from research_system.validation.result_cache import BacktestResultCache
 
 import logging
 
@@ -61,6 +67,56 @@ class RunResult:
         }
 
 
+class _PrefixedStdout:
+    """sys.stdout proxy that prefixes lines printed by strategy worker threads.
+
+    Threads that called start() have their output collected per thread and
+    written a whole line at a time, prefixed with the strategy ID, so the
+    progress of concurrently running strategies stays readable. Other
+    threads write straight through.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start(self, prefix: str) -> None:
+        self._local.prefix = prefix
+        self._local.partial = ""
+
+    def finish(self) -> None:
+        partial = getattr(self._local, "partial", "")
+        if partial:
+            self._emit([partial])
+        self._local.prefix = None
+        self._local.partial = ""
+
+    def write(self, text: str) -> int:
+        if getattr(self._local, "prefix", None) is None:
+            with self._lock:
+                written: int = self._target.write(text)
+                return written
+        *lines, self._local.partial = (self._local.partial + text).split("\n")
+        if lines:
+            self._emit(lines)
+        return len(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            self._target.flush()
+
+    def _emit(self, lines: list[str]) -> None:
+        prefix = self._local.prefix
+        with self._lock:
+            for line in lines:
+                self._target.write(f"[{prefix}] {line}\n")
+            self._target.flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self._target, name)
+
+
 class Runner:
     """Orchestrates the complete V4 validation pipeline.
 
@@ -80,6 +136,8 @@ class Runner:
         use_local: bool = False,
         num_windows: int = 1,
         reuse_project: bool = True,
+        max_concurrent: int | None = None,
+        use_cache: bool = True,
     ):
         """Initialize the V4 runner.
 
@@ -89,17 +147,35 @@ class Runner:
             use_local: Use local Docker instead of QC cloud
             num_windows: Number of walk-forward windows (1, 2, or 5)
             reuse_project: Reuse a single QC cloud project (avoids 100/day limit)
+            max_concurrent: Walk-forward windows to run at once
+                (default: backtest.max_concurrent from config)
+            use_cache: Reuse cached generated code and backtest results
+                (both also require backtest.cache_enabled in config)
         """
         self.workspace = workspace
         self.llm_client = llm_client
         self.use_local = use_local
         self.num_windows = num_windows
 
-        # Initialize code generator
-        self.code_generator = V4CodeGenerator(llm_client)
-
         # Load config for gates
         self._config = workspace.config
+        backtest_config = self._config.backtest
+        caching = use_cache and backtest_config.cache_enabled
+
+        # Generated code is memoized on strategy contents, but only stored
+        # once it has backtested successfully (see run()), so code that
+        # fails to compile or run is never replayed
+        self.codegen_cache = CodeGenCache.for_workspace(workspace.path) if caching else None
+        self.code_generator = V4CodeGenerator(llm_client)
+
+        # Result cache for identical code/window/engine backtests
+        self.result_cache = None
+        if caching:
+            self.result_cache = BacktestResultCache.for_workspace(
+                workspace.path,
+                max_entries=backtest_config.cache_max_entries,
+                max_age_days=backtest_config.cache_max_age_days,
+            )
 
         # Initialize backtest executor
         self.backtest_executor = BacktestExecutor(
@@ -107,10 +183,16 @@ class Runner:
             use_local=use_local,
             cleanup_on_start=not use_local,
             num_windows=num_windows,
-            timeout=self._config.backtest.timeout,
+            timeout=backtest_config.timeout,
             reuse_project=reuse_project,
+            max_concurrent=max_concurrent or backtest_config.max_concurrent,
+            result_cache=self.result_cache,
+            cloud_nodes=None if use_local else backtest_config.cloud_nodes,
         )
 
+        # Serializes strategy file moves between status directories
+        self._status_lock = threading.Lock()
+
     def run(
         self,
         strategy_id: str,
@@ -129,6 +211,9 @@ class Runner:
             skip_verify: If True, skip verification check
             force: If True, re-run blocked strategies by moving them back to pending
 
+        With force or force_llm, code is always generated afresh rather
+        than taken from the codegen cache.
+
         Returns:
             RunResult with pipeline outcome
         """
@@ -185,6 +270,7 @@ class Runner:
             return self._dry_run(strategy_id, strategy)
 
         # Step 2: Generate code (or use existing if --skip-codegen)
+        cache_code = not (force or force_llm or skip_codegen)
         if skip_codegen:
             existing_code_path = self.workspace.validations_path / strategy_id / "backtest.py"
             if existing_code_path.exists():
@@ -208,7 +294,7 @@ class Runner:
             max_codegen_attempts = 3
             code_result = None
             for codegen_attempt in range(1, max_codegen_attempts + 1):
-                code_result = self._generate_code(strategy, force_llm)
+                code_result = self._generate_code(strategy, force_llm, use_cache=cache_code)
                 if code_result.success:
                     break
                 # Only retry if the failure is an extraction issue (LLM ran but output wasn't parseable)
@@ -282,6 +368,10 @@ class Runner:
                 error=wf_result.determination_reason,
             )
 
+        # The code ran unmodified: remember it for identical strategies
+        if cache_code and correction_attempts == 1 and code_result is not None:
+            self._remember_code(strategy, force_llm, code_result)
+
         # Re-aggregate with OOS-specific logic for 2-window mode
         if self.num_windows == 2:
             self.backtest_executor._aggregate_oos_results(wf_result)
@@ -353,17 +443,24 @@ class Runner:
         force_llm: bool = False,
         skip_verify: bool = False,
         skip_codegen: bool = False,
+        jobs: int = 1,
     ) -> list[RunResult]:
         """Run pipeline for all pending strategies.
 
+        With jobs > 1, up to that many strategies go through the pipeline
+        at once, so code generation for one strategy overlaps backtests of
+        others. Each in-flight backtest gets its own project slot, status
+        moves are serialized, and result files are written atomically.
+
         Args:
             dry_run: If True, show what would happen without executing
             force_llm: Force LLM code generation
             skip_verify: Skip verification check
             skip_codegen: Skip code generation, use existing backtest.py
+            jobs: Number of strategies to process concurrently
 
         Returns:
-            List of RunResult for each strategy
+            List of RunResult for each strategy, in pending order
         """
         # Get all pending strategies
         strategies = self.workspace.list_strategies(status="pending")
@@ -372,20 +469,25 @@ class Runner:
             return []
 
         print(f"Found {len(strategies)} pending strategies")
-        results = []
+        run_kwargs = dict(dry_run=dry_run, force_llm=force_llm, skip_verify=skip_verify, skip_codegen=skip_codegen)
 
-        for i, strat in enumerate(strategies, 1):
-            strategy_id = strat["id"]
-            print(f"\n[{i}/{len(strategies)}] Processing {strategy_id}: {strat.get('name', 'Unknown')}")
+        jobs = min(max(1, jobs), len(strategies))
+        if jobs > 1 and not dry_run:
+            results = self._run_all_concurrent(strategies, jobs, run_kwargs)
+        else:
+            results = []
+            for i, strat in enumerate(strategies, 1):
+                strategy_id = strat["id"]
+                print(f"\n[{i}/{len(strategies)}] Processing {strategy_id}: {strat.get('name', 'Unknown')}")
 
-            result = self.run(strategy_id, dry_run=dry_run, force_llm=force_llm, skip_verify=skip_verify, skip_codegen=skip_codegen)
-            results.append(result)
+                result = self.run(strategy_id, **run_kwargs)
+                results.append(result)
 
-            # Summary for this strategy
-            if result.success:
-                print(f"  -> {result.determination}")
-            else:
-                print(f"  -> FAILED: {result.error}")
+                # Summary for this strategy
+                if result.success:
+                    print(f"  -> {result.determination}")
+                else:
+                    print(f"  -> FAILED: {result.error}")
 
         # Final summary
         print(f"\n{'='*50}")
@@ -402,32 +504,101 @@ class Runner:
 
         return results
 
+    def _run_all_concurrent(
+        self,
+        strategies: list[dict[str, Any]],
+        jobs: int,
+        run_kwargs: dict[str, Any],
+    ) -> list[RunResult]:
+        """Run strategies on a pool of jobs workers.
+
+        Output from each worker is prefixed with its strategy ID.
+
+        Returns:
+            One RunResult per strategy, in the order given
+        """
+        # One project slot per backtest any worker may have in flight
+        self.backtest_executor.reserve_project_slots(jobs * self.backtest_executor.max_concurrent)
+
+        total = len(strategies)
+        completed = 0
+        progress_lock = threading.Lock()
+        stdout = _PrefixedStdout(sys.stdout)
+
+        def run_one(strat: dict[str, Any]) -> RunResult:
+            nonlocal completed
+            strategy_id = strat["id"]
+            stdout.start(strategy_id)
+            try:
+                print(f"Processing {strategy_id}: {strat.get('name', 'Unknown')}")
+                try:
+                    result = self.run(strategy_id, **run_kwargs)
+                except Exception as e:
+                    logger.exception(f"Pipeline crashed for {strategy_id}")
+                    result = RunResult(
+                        strategy_id=strategy_id,
+                        success=False,
+                        determination="FAILED",
+                        error=f"{type(e).__name__}: {e}",
+                    )
+            finally:
+                stdout.finish()
+
+            with progress_lock:
+                completed += 1
+                outcome = result.determination if result.success else f"FAILED: {result.error}"
+                print(f"[{completed}/{total}] {strategy_id} -> {outcome}")
+            return result
+
+        print(f"Processing {total} strategies, {jobs} at a time")
+        original_stdout = sys.stdout
+        sys.stdout = stdout
+        try:
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="strategy") as pool:
+                return list(pool.map(run_one, strategies))
+        finally:
+            sys.stdout = original_stdout
+
     def _load_strategy(self, strategy_id: str) -> dict[str, Any] | None:
         """Load strategy from workspace."""
         return self.workspace.get_strategy(strategy_id)
 
     def _get_strategy_status(self, strategy_id: str) -> str | None:
         """Get current status of a strategy."""
-        for status in ["pending", "validated", "invalidated", "blocked"]:
-            path = self.workspace.strategies_path / status / f"{strategy_id}.yaml"
-            if path.exists():
-                return status
-        return None
+        return self.workspace.strategy_status(strategy_id)
 
     def _generate_code(
         self,
         strategy: dict[str, Any],
         force_llm: bool = False,
+        use_cache: bool = True,
     ) -> V4CodeGenResult:
-        """Generate backtest code for strategy."""
+        """Generate backtest code for strategy.
+
+        With use_cache, code that previously backtested successfully for
+        an identical strategy is reused.
+        """
+        if use_cache and self.codegen_cache is not None:
+            cached = self.codegen_cache.get(CodeGenCache.make_key(strategy, force_llm))
+            if cached is not None:
+                return cached
         return self.code_generator.generate(strategy, force_llm=force_llm)
 
+    def _remember_code(
+        self,
+        strategy: dict[str, Any],
+        force_llm: bool,
+        code_result: V4CodeGenResult,
+    ) -> None:
+        """Cache code that has backtested successfully."""
+        if self.codegen_cache is not None:
+            self.codegen_cache.put(CodeGenCache.make_key(strategy, force_llm), code_result)
+
     def _save_code(self, strategy_id: str, code: str) -> None:
         """Save generated code to validations directory."""
         val_dir = self.workspace.validations_path / strategy_id
         val_dir.mkdir(parents=True, exist_ok=True)
-        code_file = val_dir / "backtest.py"
-        code_file.write_text(code)
+        write_atomic(val_dir / "backtest.py", code)
 
     def _apply_gates(self, wf_result: WalkForwardResult) -> list[dict[str, Any]]:
         """Apply validation gates from config.
@@ -548,23 +719,26 @@ class Runner:
 
     def _update_status(self, strategy_id: str, new_status: str) -> None:
         """Move strategy to new status directory."""
-        current_status = self._get_strategy_status(strategy_id)
-        if current_status and current_status != new_status:
-            try:
-                self.workspace.move_strategy(strategy_id, current_status, new_status)
-                logger.info(f"Moved {strategy_id} from {current_status} to {new_status}")
-            except Exception as e:
-                logger.error(f"Failed to move strategy: {e}")
+        with self._status_lock:
+            current_status = self._get_strategy_status(strategy_id)
+            if current_status and current_status != new_status:
+                try:
+                    self.workspace.move_strategy(strategy_id, current_status, new_status)
+                    logger.info(f"Moved {strategy_id} from {current_status} to {new_status}")
+                except Exception as e:
+                    logger.error(f"Failed to move strategy: {e}")
 
     def _reset_strategy_status(self, strategy_id: str) -> None:
         """Reset the status field inside the strategy YAML to 'pending'."""
         path = self.workspace.strategies_path / "pending" / f"{strategy_id}.yaml"
-        if path.exists():
+        with self._status_lock:
+            if not path.exists():
+                return
             try:
                 data = yaml.safe_load(path.read_text())
                 if isinstance(data, dict) and data.get("status") != "pending":
                     data["status"] = "pending"
-                    path.write_text(yaml.dump(data, default_flow_style=False))
+                    write_atomic(path, yaml.dump(data, default_flow_style=False))
                     logger.info(f"Reset {strategy_id} YAML status to pending")
             except Exception as e:
                 logger.error(f"Failed to reset strategy status: {e}")
@@ -575,12 +749,10 @@ class Runner:
         val_dir.mkdir(parents=True, exist_ok=True)
 
         # Save full result as JSON
-        result_file = val_dir / "run_result.json"
-        result_file.write_text(json.dumps(result.to_dict(), indent=2))
+        write_atomic(val_dir / "run_result.json", json.dumps(result.to_dict(), indent=2))
 
         # Save determination summary
-        determination_file = val_dir / "determination.json"
-        determination_file.write_text(json.dumps({
+        write_atomic(val_dir / "determination.json", json.dumps({
             "strategy_id": strategy_id,
             "determination": result.determination,
             "timestamp": result.timestamp,
@@ -590,7 +762,6 @@ class Runner:
 
         # Save backtest results as YAML for human readability
         if result.backtest:
-            backtest_file = val_dir / "backtest_results.yaml"
             yaml_data = {
                 "strategy_id": strategy_id,
                 "aggregate_sharpe": result.backtest.aggregate_sharpe,
@@ -611,7 +782,7 @@ class Runner:
                     for w in result.backtest.windows
                 ],
             }
-            backtest_file.write_text(yaml.dump(yaml_data, default_flow_style=False))
+            write_atomic(val_dir / "backtest_results.yaml", yaml.dump(yaml_data, default_flow_style=False))
 
     def _dry_run(self, strategy_id: str, strategy: dict[str, Any]) -> RunResult:
         """Show what would happen without executing."""
@@ -0,0 +1,364 @@
+"""Cloud backtest job scheduler.
+
+This module provides an asyncio-based scheduler for QuantConnect cloud
+backtests:
+- CloudJobScheduler: Launches `lean cloud backtest --push` jobs within a
+  node budget, polls all in-flight jobs in one loop and backs off
+  adaptively when QC reports that no nodes are free
+- CloudJobOutcome: Raw outcome of a scheduled job
+
+Callers are ordinary threads (the Runner, optimizer workers, concurrent
+walk-forward windows). They call run() and block until their job
+finishes, while the scheduler's event loop runs in a background thread.
+Because every caller goes through the same queue, the node budget is
+enforced across all of them, and a "no spare nodes" response pauses
+every launch instead of each thread sleeping on its own timer.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Output patterns meaning QC has no node free to run the job
+NODE_BUSY_PATTERNS = [
+    "no spare nodes",
+    "rate limit",
+    "too many",
+    "throttl",
+    "quota",
+    "capacity limit",
+    "maximum number of projects",
+]
+
+
+@dataclass
+class CloudJobOutcome:
+    """Outcome of a scheduled cloud backtest job."""
+
+    returncode: int | None
+    stdout: str = ""
+    stderr: str = ""
+    status: str | None = None  # Final QC status if the job had to be polled
+    project_id: str | None = None
+    backtest_id: str | None = None
+    node_unavailable: bool = False  # Gave up waiting for a free node
+    attempts: int = 1
+    queued_seconds: float = 0.0
+    run_seconds: float = 0.0
+
+
+class CloudJobScheduler:
+    """Run cloud backtests within a node budget.
+
+    Node accounting is additive-increase / multiplicative-decrease: the
+    scheduler starts by assuming all max_nodes are free, drops its
+    estimate to the number of jobs actually running when QC answers "no
+    spare nodes", and raises it by one after each job that completes.
+    A node-busy response also pauses all launches for an exponentially
+    growing, jittered backoff, and the job is retried until
+    max_queue_wait has passed.
+
+    Jobs whose LEAN CLI call returns while the backtest is still running
+    are watched by a single poll loop that checks every watched job each
+    poll_interval seconds.
+
+    Example:
+        scheduler = CloudJobScheduler(max_nodes=2, status_fn=executor._get_backtest_status)
+        outcome = scheduler.run(project_dir, cwd=workspace_path, timeout=600)
+        scheduler.shutdown()
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = 1,
+        status_fn: Callable[[str, str], str | None] | None = None,
+        delete_fn: Callable[[str, str], bool] | None = None,
+        poll_interval: float = 10.0,
+        initial_backoff: float = 15.0,
+        max_backoff: float = 120.0,
+        max_queue_wait: float = 1800.0,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_nodes: QC backtest nodes available to these jobs
+            status_fn: Returns "Completed", "RuntimeError", "Running" or None
+                for a (project_id, backtest_id)
+            delete_fn: Cancels a (project_id, backtest_id)
+            poll_interval: Seconds between polls of in-flight jobs
+            initial_backoff: First pause after a node-busy response
+            max_backoff: Longest pause between launch attempts
+            max_queue_wait: Give up on a job after waiting this long for a node
+        """
+        self.max_nodes = max(1, max_nodes)
+        self.status_fn = status_fn
+        self.delete_fn = delete_fn
+        self.poll_interval = poll_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.max_queue_wait = max_queue_wait
+
+        # Event loop state (only touched from the loop thread once started)
+        self._capacity = self.max_nodes
+        self._running = 0
+        self._paused_until = 0.0
+        self._busy_streak = 0
+        self._node_free: asyncio.Condition | None = None
+        self._watched: dict[tuple[str, str], tuple[asyncio.Future, float]] = {}
+        self._poll_task: asyncio.Task | None = None
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+        self.submitted = 0
+        self.completed = 0
+        self.node_busy_events = 0
+        self.peak_running = 0
+
+    # -------------------------------------------------------------------------
+    # Thread-facing API
+    # -------------------------------------------------------------------------
+
+    def run(self, project_dir: Path, cwd: Path, timeout: float = 600) -> CloudJobOutcome:
+        """Run a cloud backtest for a project, blocking until it finishes.
+
+        Safe to call from any number of threads.
+
+        Args:
+            project_dir: LEAN project directory to push and backtest
+            cwd: Working directory for the LEAN CLI (the workspace root)
+            timeout: Seconds allowed for the CLI call and for polling
+
+        Returns:
+            CloudJobOutcome with the CLI output and final status
+        """
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self.submit(project_dir, cwd, timeout), loop)
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Stop the event loop thread. Pending jobs are abandoned."""
+        with self._start_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        loop.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Get scheduler counters."""
+        return {
+            "max_nodes": self.max_nodes,
+            "capacity": self._capacity,
+            "running": self._running,
+            "peak_running": self.peak_running,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "node_busy_events": self.node_busy_events,
+        }
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="cloud-scheduler", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    # -------------------------------------------------------------------------
+    # Coroutine API
+    # -------------------------------------------------------------------------
+
+    async def submit(self, project_dir: Path, cwd: Path, timeout: float = 600) -> CloudJobOutcome:
+        """Run a cloud backtest for a project within the node budget."""
+        self.submitted += 1
+        queued_at = time.monotonic()
+        attempts = 0
+
+        while True:
+            await self._acquire_node()
+            attempts += 1
+            started_at = time.monotonic()
+            try:
+                outcome = await self._launch(project_dir, cwd, timeout)
+                outcome.attempts = attempts
+                outcome.queued_seconds = started_at - queued_at
+
+                if self._is_node_busy(outcome):
+                    self._on_node_busy()
+                    if time.monotonic() - queued_at >= self.max_queue_wait:
+                        outcome.node_unavailable = True
+                        return outcome
+                    continue
+
+                self._busy_streak = 0
+                if outcome.project_id and outcome.backtest_id and self.status_fn is not None:
+                    outcome.status = await self._await_completion(
+                        outcome.project_id, outcome.backtest_id, started_at + timeout
+                    )
+
+                outcome.run_seconds = time.monotonic() - started_at
+                self.completed += 1
+                self._capacity = min(self.max_nodes, self._capacity + 1)
+                return outcome
+            finally:
+                await self._release_node()
+
+    # -------------------------------------------------------------------------
+    # Node budget
+    # -------------------------------------------------------------------------
+
+    def _condition(self) -> asyncio.Condition:
+        # Created on first use so it belongs to the scheduler's event loop
+        if self._node_free is None:
+            self._node_free = asyncio.Condition()
+        return self._node_free
+
+    async def _acquire_node(self) -> None:
+        node_free = self._condition()
+        async with node_free:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._running < self._capacity:
+                    break
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(node_free.wait(), timeout=wait if wait > 0 else None)
+            self._running += 1
+            self.peak_running = max(self.peak_running, self._running)
+
+    async def _release_node(self) -> None:
+        node_free = self._condition()
+        async with node_free:
+            self._running -= 1
+            node_free.notify_all()
+
+    def _on_node_busy(self) -> None:
+        """Shrink the capacity estimate and pause all launches."""
+        self.node_busy_events += 1
+        self._busy_streak += 1
+        # Jobs still running (excluding this one) are what QC can hold right now
+        self._capacity = max(1, self._running - 1)
+        delay = min(self.max_backoff, self.initial_backoff * 2 ** (self._busy_streak - 1))
+        delay *= random.uniform(0.5, 1.0)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        logger.info(
+            f"No free QC node; capacity now {self._capacity}/{self.max_nodes}, "
+            f"pausing launches for {delay:.0f}s"
+        )
+
+    @staticmethod
+    def _is_node_busy(outcome: CloudJobOutcome) -> bool:
+        # Normalize whitespace to handle word-wrapped output
+        output = " ".join((outcome.stdout + outcome.stderr).split()).lower()
+        return any(pattern in output for pattern in NODE_BUSY_PATTERNS)
+
+    # -------------------------------------------------------------------------
+    # Job execution
+    # -------------------------------------------------------------------------
+
+    async def _launch(self, project_dir: Path, cwd: Path, timeout: float) -> CloudJobOutcome:
+        """Run `lean cloud backtest --push` for a project."""
+        cmd = ["lean", "cloud", "backtest", str(project_dir), "--push"]
+        logger.info(f"Running: {' '.join(cmd)}")
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return CloudJobOutcome(returncode=None, status="Timeout")
+
+        stdout_text = stdout.decode(errors="replace")
+        project_id, backtest_id = self._extract_ids(stdout_text)
+        return CloudJobOutcome(
+            returncode=process.returncode,
+            stdout=stdout_text,
+            stderr=stderr.decode(errors="replace"),
+            project_id=project_id,
+            backtest_id=backtest_id,
+        )
+
+    @staticmethod
+    def _extract_ids(stdout: str) -> tuple[str | None, str | None]:
+        project_match = re.search(r"Project ID:\s*(\d+)", stdout)
+        backtest_match = re.search(r"Backtest id:\s*([a-f0-9]+)", stdout)
+        return (
+            project_match.group(1) if project_match else None,
+            backtest_match.group(1) if backtest_match else None,
+        )
+
+    async def _await_completion(self, project_id: str, backtest_id: str, deadline: float) -> str | None:
+        """Wait for a backtest via the shared poll loop.
+
+        Returns the first status seen if it is already final, otherwise the
+        status reported by the poll loop ("Timeout" past the deadline).
+        """
+        status_fn = self.status_fn
+        if status_fn is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        status = await loop.run_in_executor(None, status_fn, project_id, backtest_id)
+        if status != "Running":
+            return status
+
+        future: asyncio.Future[str | None] = loop.create_future()
+        self._watched[(project_id, backtest_id)] = (future, deadline)
+        if self._poll_task is None or self._poll_task.done():
+            self._poll_task = asyncio.ensure_future(self._poll_loop())
+        return await future
+
+    async def _poll_loop(self) -> None:
+        """Poll every watched job each interval until none are left."""
+        status_fn = self.status_fn
+        if status_fn is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        while self._watched:
+            await asyncio.sleep(self.poll_interval)
+
+            keys = list(self._watched)
+            statuses = await asyncio.gather(
+                *(loop.run_in_executor(None, status_fn, *key) for key in keys),
+                return_exceptions=True,
+            )
+
+            now = time.monotonic()
+            for key, status in zip(keys, statuses, strict=True):
+                future, deadline = self._watched[key]
+                if status in ("Completed", "RuntimeError"):
+                    final = status
+                elif now >= deadline:
+                    final = "Timeout"
+                    if self.delete_fn is not None:
+                        await loop.run_in_executor(None, self.delete_fn, *key)
+                else:
+                    continue
+                del self._watched[key]
+                if not future.done():
+                    future.set_result(final)
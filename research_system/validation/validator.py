@@ -328,12 +328,10 @@ class Validator:
             return None
 
         # Find current strategy file
-        for status_dir in ["pending", "validated", "invalidated", "blocked"]:
-            current_path = self.workspace.strategies_path / status_dir / f"{strategy_id}.yaml"
-            if current_path.exists():
-                break
-        else:
+        status_dir = self.workspace.strategy_status(strategy_id)
+        if status_dir is None:
             return None
+        current_path = self.workspace.strategy_path(strategy_id, status_dir)
 
         # Determine target directory
         target_dir = "validated" if passed else "invalidated"
@@ -353,6 +351,8 @@ class Validator:
         with open(target_path, "w") as f:
             yaml.dump(data, f, default_flow_style=False, sort_keys=False)
 
+        self.workspace.refresh_strategy(strategy_id, status_dir)
+        self.workspace.refresh_strategy(strategy_id, target_dir)
         return str(target_path)
 
 
@@ -133,3 +133,184 @@ class TestCatalog:
 
         assert len(results) >= 1
         assert any("Momentum" in r["name"] for r in results)
+
+
+class TestCatalogIndex:
+    """Tests for the incrementally maintained catalog index."""
+
+    def test_writes_append_to_log(self, temp_workspace):
+        """Adds and updates append log records instead of rewriting the index."""
+        catalog = Catalog(temp_workspace.catalog_path)
+        e1 = catalog.add(entry_type="indicator", name="Ind1", source_files=["a.py"], tags=["breadth"])
+        catalog.add(entry_type="strategy", name="Strat1", source_files=["b.py"], tags=["breadth", "momentum"])
+        catalog.update_status(e1.id, "VALIDATED", validation_ref="validations/IND-001")
+
+        log_lines = (temp_workspace.catalog_path / "index.log").read_text().splitlines()
+        assert len(log_lines) == 3
+
+        fresh = Catalog(temp_workspace.catalog_path)
+        assert fresh.query().by_tags(["breadth", "momentum"], match_all=True).ids() == ["STRAT-001"]
+        assert fresh.query().by_tags(["breadth"]).count() == 2
+        assert fresh.query().by_status("VALIDATED").with_validation().ids() == [e1.id]
+        assert fresh.stats().by_status == {"UNTESTED": 1, "VALIDATED": 1}
+
+    def test_torn_log_line_ignored(self, temp_workspace):
+        """A partial record left by a crash doesn't break loading or later writes."""
+        catalog = Catalog(temp_workspace.catalog_path)
+        catalog.add(entry_type="idea", name="Idea1", source_files=[])
+        with open(temp_workspace.catalog_path / "index.log", "a") as f:
+            f.write('{"op":"put","entry":{"id":"IDEA-0')
+
+        fresh = Catalog(temp_workspace.catalog_path)
+        assert fresh.list_ids() == ["IDEA-001"]
+        fresh.add(entry_type="idea", name="Idea2", source_files=[])
+
+        assert Catalog(temp_workspace.catalog_path).list_ids() == ["IDEA-001", "IDEA-002"]
+
+    def test_external_changes_trigger_rebuild(self, temp_workspace):
+        """Entry files added or removed by other tools are picked up."""
+        import json
+
+        catalog = Catalog(temp_workspace.catalog_path)
+        e1 = catalog.add(entry_type="indicator", name="Ind1", source_files=["a.py"])
+        catalog.stats()
+
+        external = {"id": "IND-007", "name": "Manual", "type": "indicator", "status": "UNTESTED"}
+        (temp_workspace.catalog_path / "entries" / "IND-007.json").write_text(json.dumps(external))
+        (temp_workspace.catalog_path / "entries" / f"{e1.id}.json").unlink()
+
+        assert catalog.list_ids() == ["IND-007"]
+        assert catalog.get_next_id("indicator") == "IND-008"
+
+    def test_compaction_and_counter(self, temp_workspace, monkeypatch):
+        """The log is folded into the snapshot and IDs keep counting past 999."""
+        import json
+        from research_system.core import catalog_index
+
+        monkeypatch.setattr(catalog_index, "COMPACT_AFTER", 3)
+        catalog = Catalog(temp_workspace.catalog_path)
+        catalog.add(entry_type="tool", name="T", source_files=[], entry_id="TOOL-999")
+        catalog.add(entry_type="tool", name="T2", source_files=[])
+        catalog.add(entry_type="tool", name="T3", source_files=[])
+
+        assert (temp_workspace.catalog_path / "index.log").read_text() == ""
+        snapshot = json.loads((temp_workspace.catalog_path / "index.json").read_text())
+        assert snapshot["total_entries"] == 3
+        assert Catalog(temp_workspace.catalog_path).list_ids() == ["TOOL-1000", "TOOL-1001", "TOOL-999"]
+
+
+class TestCatalogSearch:
+    """Tests for full-text catalog search."""
+
+    def _populate(self, catalog):
+        catalog.add(entry_type="indicator", name="McClellan Oscillator", source_files=["a.py"],
+                    summary="Breadth oscillator from advancing and declining issues", tags=["breadth"])
+        catalog.add(entry_type="strategy", name="Momentum Rotation", source_files=["b.py"],
+                    summary="Rotate into sectors with the strongest momentum", tags=["momentum"])
+        catalog.add(entry_type="idea", name="Breadth Thrust", source_files=["c.py"],
+                    hypothesis="Breadth thrusts precede momentum in small caps", tags=["breadth"])
+
+    def test_ranked_and_prefix(self, temp_workspace):
+        """Name matches rank first; word* matches prefixes; all words must match."""
+        catalog = Catalog(temp_workspace.catalog_path)
+        self._populate(catalog)
+
+        assert [e["name"] for e in catalog.search("momentum")] == ["Momentum Rotation", "Breadth Thrust"]
+        assert [e["id"] for e in catalog.search("oscil*")] == ["IND-001"]
+        assert catalog.search("oscil") == []
+        assert [e["id"] for e in catalog.search("breadth small")] == ["IDEA-001"]
+
+    def test_field_and_filters(self, temp_workspace):
+        """field:word, fields and type/status filters narrow the results."""
+        catalog = Catalog(temp_workspace.catalog_path)
+        self._populate(catalog)
+
+        assert [e["id"] for e in catalog.search("name:breadth")] == ["IDEA-001"]
+        assert [e["id"] for e in catalog.search("momentum", fields=["name"])] == ["STRAT-001"]
+        assert [e["id"] for e in catalog.search("breadth", entry_type="indicator")] == ["IND-001"]
+
+        catalog.update_status("IDEA-001", "IN_PROGRESS")
+        assert [e["id"] for e in catalog.search("breadth", status="IN_PROGRESS")] == ["IDEA-001"]
+
+    def test_other_instance_sees_updates(self, temp_workspace):
+        """Entries added by another Catalog show up in search without a rebuild."""
+        reader = Catalog(temp_workspace.catalog_path)
+        assert reader.search("momentum") == []
+
+        self._populate(Catalog(temp_workspace.catalog_path))
+        assert len(reader.search("momentum")) == 2
+
+
+class TestCatalogManagerSearch:
+    """Tests for the SQLite full-text index."""
+
+    def test_search_entries(self, tmp_path):
+        """Entries are searchable with ranking, prefixes and column filters."""
+        from research_system.db import CatalogManager
+
+        with CatalogManager(tmp_path) as manager:
+            with manager._db.transaction() as cursor:
+                cursor.executemany(
+                    "INSERT INTO entries (id, type, name, description, status) VALUES (?, ?, ?, ?, ?)",
+                    [
+                        ("STRAT-001", "STRAT", "Momentum Rotation", "Sector rotation", "UNTESTED"),
+                        ("STRAT-002", "STRAT", "Breadth Thrust", "Momentum after breadth thrusts", "VALIDATED"),
+                    ],
+                )
+                cursor.execute("INSERT INTO entry_tags (entry_id, tag) VALUES ('STRAT-002', 'breadth')")
+            assert manager.rebuild_search_index() == 2
+
+            assert [e.id for e in manager.search_entries("momentum")] == ["STRAT-001", "STRAT-002"]
+            assert [e.id for e in manager.search_entries("rot*")] == ["STRAT-001"]
+            assert [e.id for e in manager.search_entries("tags:breadth")] == ["STRAT-002"]
+            assert manager.search_entries("momentum", fields=["description"])[0].id == "STRAT-002"
+            assert manager.search_entries('"unbalanced (quote') == []
+
+
+class TestDatabaseConnection:
+    """Tests for the SQLite connection layer."""
+
+    def test_wal_and_concurrent_writers(self, tmp_path):
+        """Threads get their own connections and can all write without lock errors."""
+        import threading
+        from research_system.db import init_database
+
+        db = init_database(tmp_path / "catalog.db")
+        assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    with db.transaction() as cursor:
+                        cursor.execute(
+                            "INSERT INTO entries (id, type, name) VALUES (?, 'STRAT', ?)",
+                            (f"STRAT-{n}-{i}", f"Worker {n}"),
+                        )
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 160
+        assert len(db._connections) == 9  # 8 workers + this thread
+        db.close()
+        assert db._connections == []
+
+    def test_init_is_idempotent(self, tmp_path):
+        """Re-initializing an existing database keeps its data."""
+        from research_system.db import get_schema_version, init_database
+
+        with init_database(tmp_path / "catalog.db") as db:
+            with db.transaction() as cursor:
+                cursor.execute("INSERT INTO entries (id, type, name) VALUES ('STRAT-001', 'STRAT', 'S')")
+
+        with init_database(tmp_path / "catalog.db") as db:
+            assert db.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 1
+            assert get_schema_version(db) == 1
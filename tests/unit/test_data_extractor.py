@@ -5,6 +5,7 @@ import json
 import pytest
 from pathlib import Path
 
+from research_system.ingest import profiling
 from research_system.ingest.data_extractor import (
     DataFileExtractor,
     DataFileInfo,
@@ -87,6 +88,55 @@ class TestCSVParsing:
         assert "date" in result.file_info.columns
         assert result.file_info.row_count == 2
 
+    def test_profiles_large_csv_from_head_and_tail(self, extractor, temp_dir):
+        """Count rows by lines and take the date range from the last row."""
+        csv_path = temp_dir / "large.csv"
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["date", "close", "note"])
+            for i in range(5000):
+                writer.writerow([f"row-{i:05d}", i, "" if i % 2 else "x"])
+
+        extractor.PROFILE_ROWS = 100
+        result = extractor.extract(csv_path)
+        info = result.file_info
+
+        assert result.success is True
+        assert info.row_count == 5000
+        assert info.date_range == ("row-00000", "row-04999")
+        assert len(info.sample_rows) == 5
+        assert info.profiled_rows == 200
+        assert info.column_stats["close"].min == 0.0
+        assert info.column_stats["close"].max == 4999.0
+        assert info.column_stats["note"].numeric is False
+        assert info.column_stats["note"].null_count == 100
+
+    def test_head_and_tail_do_not_overlap(self, extractor, temp_dir):
+        """A file just past the head limit profiles each row exactly once."""
+        csv_path = temp_dir / "medium.csv"
+        with open(csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["date", "close", "note"])
+            for i in range(1500):
+                writer.writerow([f"row-{i:05d}", i, "" if i % 2 else "x"])
+
+        result = extractor.extract(csv_path)
+        info = result.file_info
+
+        assert extractor.PROFILE_ROWS == 1000
+        assert info.row_count == 1500
+        assert info.profiled_rows == 1500
+        assert info.date_range == ("row-00000", "row-01499")
+        assert info.column_stats["note"].null_count == 750
+
+    def test_counts_final_line_without_newline(self, temp_dir):
+        """Count a last line that has no trailing newline."""
+        path = temp_dir / "rows.csv"
+        path.write_bytes(b"a\n1\n2")
+        assert profiling.count_lines(path) == 3
+        path.write_bytes(b"")
+        assert profiling.count_lines(path) == 0
+
 
 class TestJSONParsing:
     """Test JSON data file parsing."""
@@ -130,6 +180,62 @@ class TestJSONParsing:
         result = extractor.extract(json_path)
         assert result.success is False
 
+    def test_streams_large_array(self, extractor, temp_dir, monkeypatch):
+        """Decode arrays across many small reads with exact statistics."""
+        monkeypatch.setattr(profiling, "JSON_READ_SIZE", 7)
+        json_path = temp_dir / "data.json"
+        rows = [{"date": f"2024-01-{d:02d}", "value": d * 1.5, "flag": None} for d in range(1, 31)]
+        json_path.write_text(json.dumps(rows, indent=2))
+
+        extractor.PROFILE_BLOCK_ROWS = 4
+        result = extractor.extract(json_path)
+        info = result.file_info
+
+        assert result.success is True
+        assert info.row_count == 30
+        assert info.sample_rows == rows[:5]
+        assert info.date_range == ("2024-01-01", "2024-01-30")
+        assert info.column_stats["value"].min == 1.5
+        assert info.column_stats["value"].max == 45.0
+        assert info.column_stats["flag"].null_count == 30
+
+    def test_rejects_malformed_array(self, extractor, temp_dir):
+        """Report a truncated array as a parse failure."""
+        json_path = temp_dir / "truncated.json"
+        json_path.write_text('[{"date": "2024-01-01", "value": 1}, {"date": ')
+
+        result = extractor.extract(json_path)
+        assert result.success is False
+
+
+class TestParquetParsing:
+    """Test Parquet profiling from file metadata."""
+
+    @pytest.fixture
+    def extractor(self):
+        return DataFileExtractor(llm_client=None)
+
+    def test_profiles_from_row_group_statistics(self, extractor, temp_dir):
+        """Take row count, ranges and null counts from the footer."""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        table = pa.table({
+            "date": [f"2024-01-{d:02d}" for d in range(1, 21)],
+            "close": [float(d) if d % 5 else None for d in range(1, 21)],
+        })
+        path = temp_dir / "prices.parquet"
+        pq.write_table(table, path, row_group_size=6)
+
+        result = extractor.extract(path)
+        info = result.file_info
+
+        assert result.success is True
+        assert info.row_count == 20
+        assert len(info.sample_rows) == 5
+        assert info.date_range == ("2024-01-01", "2024-01-20")
+        assert info.column_stats["close"].null_count == 4
+        assert info.column_stats["close"].max == 19.0
+
 
 class TestIsDataJSON:
     """Test is_data_json detection function."""
@@ -176,6 +282,15 @@ class TestIsDataJSON:
 
         assert is_data_json(json_path) is False
 
+    def test_detects_data_json_beyond_first_read(self, temp_dir):
+        """Detect data files larger than a single read."""
+        json_path = temp_dir / "big.json"
+        with open(json_path, 'w') as f:
+            json.dump([{"date": "2024-01-01", "value": i} for i in range(20000)], f)
+
+        assert json_path.stat().st_size > 65536
+        assert is_data_json(json_path) is True
+
 
 class TestDateColumnDetection:
     """Test date column detection logic."""
@@ -79,6 +79,60 @@ class TestDataRegistry:
         assert results["available_data"].available
         assert not results["missing_data"].available
 
+    def test_alias_resolution_and_resolve_many(self, temp_workspace):
+        """IDs and normalized aliases resolve in one batch, with QC Native fallback."""
+        import json
+
+        registry = DataRegistry(temp_workspace.data_registry_path)
+        registry.ensure_structure()
+        registry.registry_file.write_text(json.dumps({"data_sources": [
+            {"id": "breadth_mcclellan", "name": "McClellan", "aliases": ["McClellan-Oscillator"]},
+            {"id": "mcclellan_oscillator", "name": "Shadowed by the alias above"},
+        ]}))
+
+        results = registry.resolve_many(["McClellan Oscillator", "breadth_mcclellan", "spy_prices", "nope"])
+
+        assert results["McClellan Oscillator"].id == "breadth_mcclellan"
+        assert results["breadth_mcclellan"].name == "McClellan"
+        assert results["spy_prices"].is_auto_recognized
+        assert results["nope"] is None
+
+    def test_index_reloads_when_file_changes(self, temp_workspace):
+        """Edits to registry.json, by this or another instance, are picked up."""
+        import json
+        import os
+
+        registry = DataRegistry(temp_workspace.data_registry_path)
+        registry.add(source_id="first_source", name="First", data_type="price_data")
+        assert registry.get("first_source") is not None
+
+        other = DataRegistry(temp_workspace.data_registry_path)
+        other.add(source_id="second_source", name="Second", data_type="price_data")
+        assert registry.get("second_source") is not None
+
+        data = json.loads(registry.registry_file.read_text())
+        data["data_sources"][0]["aliases"] = ["renamed"]
+        registry.registry_file.write_text(json.dumps(data))
+        stat = registry.registry_file.stat()
+        os.utime(registry.registry_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert registry.get("renamed").id == "first_source"
+
+    @pytest.mark.parametrize("source_id, expected", [
+        ("spy_prices", True),
+        ("SPY-Prices", True),
+        ("missing_data", False),
+        ("__data", False),
+        ("daily_returns", True),
+        ("ema_20", True),
+        ("sma50day", True),
+        ("rsi14x", False),
+        ("vix_index", True),
+        ("unknown_dataset", False),
+    ])
+    def test_is_qc_native_pattern(self, source_id, expected):
+        """The compiled QC Native matcher recognizes the documented patterns."""
+        assert DataRegistry.is_qc_native_pattern(source_id) is expected
+
 
 class TestDataSource:
     """Tests for DataSource class."""
@@ -0,0 +1,32 @@
+"""Tests for atomic file writes."""
+
+import pytest
+from unittest.mock import patch
+
+from research_system.core.fileio import write_atomic
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic."""
+
+    def test_replaces_content(self, tmp_path):
+        """Existing content is replaced and no temp file is left behind."""
+        path = tmp_path / "data.json"
+        path.write_text("old")
+
+        write_atomic(path, "new")
+
+        assert path.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
+
+    def test_failure_keeps_original(self, tmp_path):
+        """A failed rename leaves the target untouched and cleans up."""
+        path = tmp_path / "data.json"
+        path.write_text("old")
+
+        with patch("research_system.core.fileio.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_atomic(path, "new")
+
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["data.json"]
@@ -3,7 +3,10 @@
 import pytest
 import json
 
-from research_system.llm.client import LLMClient, LLMResponse, Backend
+from research_system.llm.client import LLMClient, LLMResponse, Backend, content_text, text_block
+from research_system.llm.cache import ResponseCache
+from research_system.llm.concurrency import fan_out
+from research_system.llm.telemetry import TelemetryLog, estimate_cost, percentile, summarize
 
 
 class TestLLMClient:
@@ -100,3 +103,341 @@ class TestLLMClient:
         result = client.extract_json(response)
 
         assert result is None
+
+
+class TestResponseCache:
+    """Tests for the persistent LLM response cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ResponseCache(tmp_path / "llm_cache.sqlite")
+
+    @pytest.fixture
+    def client(self, monkeypatch, cache):
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE, cache=cache)
+        # Pretend an API backend is available and count the calls
+        client._backend = Backend.API
+        client.api_calls = 0
+
+        def fake_api(user, system, max_tokens, model, temperature):
+            client.api_calls += 1
+            return LLMResponse(
+                content=f"answer {client.api_calls}",
+                model=model,
+                usage={"input_tokens": 10, "output_tokens": 5},
+                backend="api",
+            )
+
+        monkeypatch.setattr(client, "_generate_api", fake_api)
+        return client
+
+    def test_repeat_request_served_from_cache(self, client, cache):
+        """Test identical deterministic requests only hit the backend once."""
+        first = client.generate("prompt", system="sys")
+        second = client.generate("prompt", system="sys")
+
+        assert client.api_calls == 1
+        assert not first.cached
+        assert second.cached
+        assert second.content == first.content
+        assert second.usage == first.usage
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_key_covers_full_request(self, client):
+        """Test any change to the request is a miss."""
+        client.generate("prompt")
+        client.generate("prompt", system="sys")
+        client.generate("prompt", max_tokens=100)
+        client.generate("prompt", model=LLMClient.MODEL_HAIKU)
+
+        assert client.api_calls == 4
+
+    def test_nonzero_temperature_not_cached(self, client, cache):
+        """Test sampled requests always go to the backend."""
+        client.generate("prompt", temperature=0.7)
+        client.generate("prompt", temperature=0.7)
+
+        assert client.api_calls == 2
+        assert cache.stats()["stores"] == 0
+
+    def test_bypass_skips_read_but_refreshes(self, client):
+        """Test use_cache=False forces a backend call and stores the new answer."""
+        client.generate("prompt")
+        fresh = client.generate("prompt", use_cache=False)
+        again = client.generate("prompt")
+
+        assert client.api_calls == 2
+        assert not fresh.cached
+        assert again.content == "answer 2"
+
+    def test_errors_not_cached(self, client, cache, monkeypatch):
+        """Test offline/error responses are not stored."""
+        monkeypatch.setattr(
+            client, "_generate_api",
+            lambda *args: LLMResponse(content="Error: boom", model="m", offline=True),
+        )
+        client.generate("prompt")
+
+        assert cache.stats()["stores"] == 0
+
+    def test_persists_across_instances(self, client, tmp_path):
+        """Test entries survive a new cache on the same file."""
+        client.generate("prompt")
+        client.cache.close()
+
+        reopened = ResponseCache(tmp_path / "llm_cache.sqlite")
+        key = ResponseCache.make_key("prompt", None, 4000, LLMClient.MODEL_SONNET, 0.0)
+        assert reopened.get(key)["content"] == "answer 1"
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Test entries older than the TTL are dropped."""
+        cache = ResponseCache(tmp_path / "llm_cache.sqlite", ttl_days=1)
+        cache.put("k", content="old", model="m")
+        cache._conn.execute("UPDATE responses SET created_at = created_at - 2 * 86400")
+
+        assert cache.get("k") is None
+        assert cache.stats()["evictions"] == 1
+
+    def test_prune_keeps_most_recently_used(self, tmp_path):
+        """Test size eviction drops least recently used entries."""
+        cache = ResponseCache(tmp_path / "llm_cache.sqlite", max_entries=2)
+        for i, key in enumerate(["a", "b", "c"]):
+            cache.put(key, content=key, model="m")
+            cache._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (i, key))
+        cache._conn.execute("UPDATE responses SET accessed_at = 10 WHERE key = 'a'")
+
+        assert cache.prune() == 1
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_lookup_does_not_create_file(self, tmp_path):
+        """Test misses against a fresh workspace leave no file behind."""
+        cache = ResponseCache.for_workspace(tmp_path)
+
+        assert cache.get("missing") is None
+        assert not (tmp_path / ".state").exists()
+
+
+class TestFanOut:
+    """Tests for concurrent fan-out of LLM calls."""
+
+    def test_results_in_input_order(self):
+        """Test results follow input order, not completion order."""
+        import time
+
+        def slow_echo(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 10
+
+        assert fan_out(slow_echo, [1, 2, 3, 4], max_workers=4) == [10, 20, 30, 40]
+
+    def test_exceptions_returned_in_place(self):
+        """Test a failing call does not affect the others."""
+        def maybe_fail(item):
+            if item == "bad":
+                raise ValueError("boom")
+            return item
+
+        results = fan_out(maybe_fail, ["a", "bad", "c"])
+
+        assert results[0] == "a"
+        assert isinstance(results[1], ValueError)
+        assert results[2] == "c"
+
+    def test_timeout_per_call(self):
+        """Test a call exceeding the timeout yields TimeoutError."""
+        import time
+
+        results = fan_out(lambda s: time.sleep(s) or s, [0.0, 1.0], timeout=0.2)
+
+        assert results[0] == 0.0
+        assert isinstance(results[1], TimeoutError)
+
+
+class TestPromptCaching:
+    """Tests for structured content blocks and prompt caching."""
+
+    def test_text_block_cache_marker(self):
+        """Test text_block adds a cache_control breakpoint on request."""
+        assert text_block("a") == {"type": "text", "text": "a"}
+        assert text_block("a", cache=True)["cache_control"] == {"type": "ephemeral"}
+
+    def test_api_passes_blocks_and_reports_cache_usage(self, monkeypatch):
+        """Test blocks reach the API unchanged and cache token counts are kept."""
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE)
+        client._backend = Backend.API
+        client._client = MagicMock()
+        client._client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            model="m",
+            usage=SimpleNamespace(
+                input_tokens=20,
+                output_tokens=5,
+                cache_creation_input_tokens=0,
+                cache_read_input_tokens=3000,
+            ),
+        )
+        system = [text_block("shared context", cache=True), text_block("persona")]
+
+        response = client.generate("task", system=system)
+
+        kwargs = client._client.messages.create.call_args.kwargs
+        assert kwargs["system"] == system
+        assert response.usage["cache_read_input_tokens"] == 3000
+
+    def test_cli_flattens_blocks(self, monkeypatch):
+        """Test the CLI backend receives the blocks as plain text."""
+        from types import SimpleNamespace
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE)
+        client._backend = Backend.CLI
+        client._cli_path = "claude"
+        captured = {}
+
+        def fake_run(cmd, input, **kwargs):
+            captured["input"] = input
+            return SimpleNamespace(returncode=0, stdout="ok", stderr="")
+
+        monkeypatch.setattr("research_system.llm.client.subprocess.run", fake_run)
+        client.generate("task", system=[text_block("shared", cache=True), text_block("persona")])
+
+        assert captured["input"] == "shared\n\npersona\n\n---\n\ntask"
+        assert content_text(None) == ""
+
+
+class TestTelemetry:
+    """Tests for per-call LLM telemetry."""
+
+    def _api_client(self, monkeypatch, tmp_path):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE, telemetry=TelemetryLog(tmp_path / "calls.jsonl"))
+        client._backend = Backend.API
+        client._client = MagicMock()
+        client._client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            model=LLMClient.MODEL_SONNET,
+            usage=SimpleNamespace(input_tokens=1000, output_tokens=100),
+        )
+        return client
+
+    def test_api_call_recorded(self, monkeypatch, tmp_path):
+        """Test an API call writes one record with exact usage and cost."""
+        client = self._api_client(monkeypatch, tmp_path)
+
+        client.generate("prompt", caller="ingest.extract", retries=2)
+
+        [record] = client.telemetry.read()
+        assert record.caller == "ingest.extract"
+        assert record.subsystem == "ingest"
+        assert record.backend == "api"
+        assert record.input_tokens == 1000
+        assert record.output_tokens == 100
+        assert record.retries == 2
+        assert not record.tokens_estimated
+        assert not record.cache_hit
+        assert record.cost_usd == pytest.approx(0.0045)
+
+    def test_failed_call_recorded_without_tokens(self, monkeypatch, tmp_path):
+        """Test a failed call is marked failed and costs nothing."""
+        client = self._api_client(monkeypatch, tmp_path)
+        client._client.messages.create.side_effect = RuntimeError("overloaded")
+
+        response = client.generate("y" * 400, caller="ingest.extract")
+
+        assert response.offline
+        [record] = client.telemetry.read()
+        assert not record.success
+        assert record.input_tokens == 0
+        assert record.output_tokens == 0
+        assert not record.tokens_estimated
+        assert record.cost_usd == 0.0
+
+    def test_cache_hit_recorded(self, monkeypatch, tmp_path):
+        """Test a response cache hit is recorded as free and flagged."""
+        client = self._api_client(monkeypatch, tmp_path)
+        client.cache = ResponseCache(tmp_path / "cache.sqlite")
+
+        client.generate("prompt")
+        client.generate("prompt")
+
+        first, second = client.telemetry.read()
+        assert not first.cache_hit
+        assert second.cache_hit
+        assert second.cost_usd == 0.0
+        assert second.caller == "untagged"
+
+    def test_cli_tokens_estimated(self, monkeypatch, tmp_path):
+        """Test the CLI backend's missing usage is estimated from text length."""
+        from types import SimpleNamespace
+
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE, telemetry=TelemetryLog(tmp_path / "calls.jsonl"))
+        client._backend = Backend.CLI
+        client._cli_path = "claude"
+        monkeypatch.setattr(
+            "research_system.llm.client.subprocess.run",
+            lambda cmd, input, **kwargs: SimpleNamespace(returncode=0, stdout="x" * 40, stderr=""),
+        )
+
+        client.generate("y" * 400, caller="codegen.generate")
+
+        [record] = client.telemetry.read()
+        assert record.tokens_estimated
+        assert record.input_tokens == 100
+        assert record.output_tokens == 10
+
+    def test_offline_not_recorded(self, tmp_path, monkeypatch):
+        """Test offline mode makes no call and records nothing."""
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        client = LLMClient(backend=Backend.OFFLINE, telemetry=TelemetryLog(tmp_path / "calls.jsonl"))
+
+        client.generate("prompt")
+
+        assert client.telemetry.read() == []
+
+    def test_rotation_keeps_all_records_readable(self, tmp_path):
+        """Test size-based rotation and reading back across rotated files."""
+        from research_system.llm.telemetry import make_record
+
+        telemetry = TelemetryLog(tmp_path / "calls.jsonl", max_bytes=600, backup_count=10)
+        for i in range(10):
+            telemetry.record(make_record(f"ingest.{i}", "m", "api", 0.1, None))
+
+        assert len(telemetry.files()) > 1
+        assert [r.caller for r in telemetry.read()] == [f"ingest.{i}" for i in range(10)]
+
+    def test_summarize_by_subsystem(self, tmp_path):
+        """Test aggregation excludes cache hits from latency percentiles."""
+        from research_system.llm.telemetry import make_record
+
+        usage = {"input_tokens": 10, "output_tokens": 5}
+        records = [
+            make_record("synthesis.edge-hunter", "m", "api", t, usage) for t in (1, 2, 3, 4)
+        ] + [make_record("synthesis.director", "m", "api", 0.001, usage, cache_hit=True)]
+
+        stats = summarize(records)["synthesis"]
+
+        assert stats["calls"] == 5
+        assert stats["cache_hits"] == 1
+        assert stats["p50_ms"] == 2000
+        assert stats["p95_ms"] == 4000
+        assert stats["input_tokens"] == 40
+
+    def test_cost_and_percentile_helpers(self):
+        """Test cost estimation with cache tokens and percentile edge cases."""
+        cost = estimate_cost(LLMClient.MODEL_SONNET, 0, 0, cache_read_input_tokens=1_000_000)
+        assert cost == pytest.approx(0.3)
+        assert estimate_cost("unknown-model", 10, 10) is None
+        assert percentile([], 50) == 0.0
+        assert percentile([5.0], 95) == 5.0
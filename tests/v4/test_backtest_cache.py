@@ -0,0 +1,193 @@
+"""Tests for the backtest result cache.
+
+This module tests:
+1. Cache key construction
+2. Hit/miss behaviour and counters
+3. Age and size-based eviction
+4. BacktestExecutor integration
+"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from research_system.validation.backtest import BacktestExecutor, BacktestResult
+from research_system.validation.result_cache import BacktestResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BacktestResultCache(tmp_path / "cache")
+
+
+# =============================================================================
+# TEST CACHE KEYS
+# =============================================================================
+
+
+class TestCacheKey:
+    """Test cache key construction."""
+
+    def test_same_inputs_same_key(self):
+        a = BacktestResultCache.make_key("code", "2012-01-01", "2017-12-31", False)
+        b = BacktestResultCache.make_key("code", "2012-01-01", "2017-12-31", False)
+        assert a == b
+
+    def test_key_depends_on_code_window_and_mode(self):
+        base = BacktestResultCache.make_key("code", "2012-01-01", "2017-12-31", False)
+        assert BacktestResultCache.make_key("code2", "2012-01-01", "2017-12-31", False) != base
+        assert BacktestResultCache.make_key("code", "2013-01-01", "2017-12-31", False) != base
+        assert BacktestResultCache.make_key("code", "2012-01-01", "2018-12-31", False) != base
+        assert BacktestResultCache.make_key("code", "2012-01-01", "2017-12-31", True) != base
+
+
+# =============================================================================
+# TEST GET / PUT
+# =============================================================================
+
+
+class TestCacheGetPut:
+    """Test storing and retrieving results."""
+
+    def test_round_trip(self, cache):
+        result = BacktestResult(success=True, cagr=0.12, sharpe=1.4, max_drawdown=0.2, total_trades=40)
+        assert cache.put("k", result)
+
+        cached = cache.get("k")
+        assert cached is not None
+        assert cached.success
+        assert cached.cagr == 0.12
+        assert cached.sharpe == 1.4
+        assert cached.total_trades == 40
+
+    def test_failed_results_not_cached(self, cache):
+        assert not cache.put("k", BacktestResult(success=False, rate_limited=True))
+        assert not cache.put("k", BacktestResult(success=False, error="Lean exited with code 1"))
+        assert cache.get("k") is None
+
+    def test_counters(self, cache):
+        cache.get("missing")
+        cache.put("k", BacktestResult(success=True, sharpe=1.0))
+        cache.get("k")
+        cache.get("k")
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_corrupt_entry_is_a_miss(self, cache):
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "k.json").write_text("{not json")
+        assert cache.get("k") is None
+
+
+# =============================================================================
+# TEST EVICTION
+# =============================================================================
+
+
+class TestCacheEviction:
+    """Test age and size-based eviction."""
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = BacktestResultCache(tmp_path / "cache", max_age_days=1)
+        cache.put("k", BacktestResult(success=True, sharpe=1.0))
+
+        with patch("research_system.validation.result_cache.time.time", return_value=time.time() + 2 * 86400):
+            assert cache.get("k") is None
+        assert not (cache.cache_dir / "k.json").exists()
+
+    def test_size_limit_evicts_oldest(self, tmp_path):
+        cache = BacktestResultCache(tmp_path / "cache", max_entries=2)
+        cache.PRUNE_EVERY = 2
+        for i, key in enumerate(["a", "b"]):
+            cache.put(key, BacktestResult(success=True, sharpe=float(i)))
+            old = time.time() - 100 + i
+            os.utime(cache.cache_dir / f"{key}.json", (old, old))
+
+        cache.put("c", BacktestResult(success=True, sharpe=2.0))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_put_prunes_every_n_stores(self, tmp_path):
+        cache = BacktestResultCache(tmp_path / "cache", max_entries=1)
+        cache.PRUNE_EVERY = 3
+        for key in ["a", "b", "c"]:
+            cache.put(key, BacktestResult(success=True))
+        assert len(list(cache.cache_dir.glob("*.json"))) == 3
+
+        cache.put("d", BacktestResult(success=True))
+        assert len(list(cache.cache_dir.glob("*.json"))) == 1
+
+    def test_clear(self, cache):
+        cache.put("a", BacktestResult(success=True))
+        cache.put("b", BacktestResult(success=True))
+        assert cache.clear() == 2
+        assert cache.get("a") is None
+
+
+# =============================================================================
+# TEST EXECUTOR INTEGRATION
+# =============================================================================
+
+
+class TestExecutorCaching:
+    """Test BacktestExecutor consults the cache before running."""
+
+    CODE = "self.set_start_date(2020, 1, 1)\nself.set_end_date(2021, 1, 1)\n"
+
+    def _executor(self, tmp_path, cache, use_local=False):
+        return BacktestExecutor(
+            workspace_path=tmp_path, use_local=use_local, cleanup_on_start=False, result_cache=cache,
+        )
+
+    def test_second_run_is_served_from_cache(self, tmp_path, cache):
+        executor = self._executor(tmp_path, cache)
+        mock_result = BacktestResult(success=True, cagr=0.1, sharpe=1.2)
+
+        with patch.object(executor, "_execute_backtest", return_value=mock_result) as mock_exec:
+            first = executor.run_single(self.CODE, "2012-01-01", "2017-12-31", "STRAT-A")
+            second = executor.run_single(self.CODE, "2012-01-01", "2017-12-31", "STRAT-B")
+
+        assert mock_exec.call_count == 1
+        assert first.sharpe == second.sharpe == 1.2
+        assert cache.stats()["hits"] == 1
+
+    def test_different_window_misses(self, tmp_path, cache):
+        executor = self._executor(tmp_path, cache)
+        mock_result = BacktestResult(success=True, cagr=0.1, sharpe=1.2)
+
+        with patch.object(executor, "_execute_backtest", return_value=mock_result) as mock_exec:
+            executor.run_single(self.CODE, "2012-01-01", "2017-12-31")
+            executor.run_single(self.CODE, "2018-01-01", "2023-12-31")
+
+        assert mock_exec.call_count == 2
+
+    def test_engine_mode_is_part_of_key(self, tmp_path, cache):
+        mock_result = BacktestResult(success=True, cagr=0.1, sharpe=1.2)
+        cloud = self._executor(tmp_path, cache, use_local=False)
+        local = self._executor(tmp_path, cache, use_local=True)
+
+        with patch.object(cloud, "_execute_backtest", return_value=mock_result):
+            cloud.run_single(self.CODE, "2012-01-01", "2017-12-31")
+        with patch.object(local, "_execute_backtest", return_value=mock_result) as mock_exec:
+            local.run_single(self.CODE, "2012-01-01", "2017-12-31")
+
+        assert mock_exec.call_count == 1
+
+    def test_no_cache_always_runs(self, tmp_path):
+        executor = self._executor(tmp_path, None)
+        mock_result = BacktestResult(success=True, cagr=0.1, sharpe=1.2)
+
+        with patch.object(executor, "_execute_backtest", return_value=mock_result) as mock_exec:
+            executor.run_single(self.CODE, "2012-01-01", "2017-12-31")
+            executor.run_single(self.CODE, "2012-01-01", "2017-12-31")
+
+        assert mock_exec.call_count == 2
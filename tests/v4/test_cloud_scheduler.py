@@ -0,0 +1,213 @@
+"""Tests for the cloud backtest job scheduler.
+
+This module tests:
+1. Node budget across concurrent callers
+2. Adaptive backoff on node-busy responses
+3. Batched completion polling
+4. BacktestExecutor integration
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from research_system.validation.backtest import BacktestExecutor
+from research_system.validation.scheduler import CloudJobOutcome, CloudJobScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = CloudJobScheduler(max_nodes=2, poll_interval=0.01, initial_backoff=0.01, max_backoff=0.02)
+    yield scheduler
+    scheduler.shutdown()
+
+
+def fake_launch(outcomes, delay=0.02):
+    """Build a _launch replacement returning outcomes in call order."""
+    calls = []
+    lock = threading.Lock()
+
+    async def launch(project_dir, cwd, timeout):
+        with lock:
+            calls.append(project_dir)
+            outcome = outcomes[min(len(calls), len(outcomes)) - 1]
+        await asyncio.sleep(delay)
+        return CloudJobOutcome(**outcome)
+
+    return launch, calls
+
+
+OK = {"returncode": 0, "stdout": "Sharpe Ratio 1.2"}
+BUSY = {"returncode": 1, "stdout": "Error: No spare nodes available"}
+
+
+# =============================================================================
+# TEST NODE BUDGET
+# =============================================================================
+
+
+class TestNodeBudget:
+    """Test that jobs from many threads share the node budget."""
+
+    def test_running_jobs_never_exceed_max_nodes(self, scheduler, tmp_path):
+        launch, calls = fake_launch([OK])
+
+        with patch.object(scheduler, "_launch", launch):
+            with ThreadPoolExecutor(max_workers=6) as pool:
+                outcomes = list(pool.map(lambda i: scheduler.run(tmp_path / str(i), tmp_path), range(6)))
+
+        assert len(calls) == 6
+        assert all(o.returncode == 0 for o in outcomes)
+        stats = scheduler.stats()
+        assert stats["peak_running"] == 2
+        assert stats["completed"] == 6
+        assert stats["running"] == 0
+
+
+# =============================================================================
+# TEST ADAPTIVE BACKOFF
+# =============================================================================
+
+
+class TestNodeBusyBackoff:
+    """Test retry and capacity adjustment on node-busy responses."""
+
+    def test_busy_job_is_retried_until_it_runs(self, scheduler, tmp_path):
+        launch, calls = fake_launch([BUSY, BUSY, OK])
+
+        with patch.object(scheduler, "_launch", launch):
+            outcome = scheduler.run(tmp_path, tmp_path)
+
+        assert outcome.attempts == 3
+        assert not outcome.node_unavailable
+        assert scheduler.stats()["node_busy_events"] == 2
+
+    def test_busy_shrinks_capacity_and_success_restores_it(self, tmp_path):
+        scheduler = CloudJobScheduler(max_nodes=4, initial_backoff=0.01, max_backoff=0.02)
+        try:
+            launch, _ = fake_launch([BUSY, OK, OK])
+            with patch.object(scheduler, "_launch", launch):
+                scheduler.run(tmp_path, tmp_path)
+            # Dropped to 1 on the busy response, +1 after the completed job
+            assert scheduler.stats()["capacity"] == 2
+        finally:
+            scheduler.shutdown()
+
+    def test_gives_up_after_max_queue_wait(self, tmp_path):
+        scheduler = CloudJobScheduler(max_nodes=1, initial_backoff=0.01, max_backoff=0.01, max_queue_wait=0.05)
+        try:
+            launch, calls = fake_launch([BUSY])
+            with patch.object(scheduler, "_launch", launch):
+                outcome = scheduler.run(tmp_path, tmp_path)
+        finally:
+            scheduler.shutdown()
+
+        assert outcome.node_unavailable
+        assert len(calls) > 1
+
+
+# =============================================================================
+# TEST COMPLETION POLLING
+# =============================================================================
+
+
+class TestCompletionPolling:
+    """Test that running jobs are polled by the shared loop."""
+
+    def test_running_jobs_are_polled_to_completion(self, tmp_path):
+        polls = {"a": 0, "b": 0}
+
+        def status_fn(project_id, backtest_id):
+            polls[backtest_id] += 1
+            return "Completed" if polls[backtest_id] >= 3 else "Running"
+
+        scheduler = CloudJobScheduler(max_nodes=2, status_fn=status_fn, poll_interval=0.01)
+        outcomes = {
+            "a": {"returncode": 0, "project_id": "1", "backtest_id": "a"},
+            "b": {"returncode": 0, "project_id": "2", "backtest_id": "b"},
+        }
+
+        async def launch(project_dir, cwd, timeout):
+            return CloudJobOutcome(**outcomes[project_dir.name])
+
+        try:
+            with patch.object(scheduler, "_launch", launch):
+                with ThreadPoolExecutor(max_workers=2) as pool:
+                    results = list(pool.map(lambda n: scheduler.run(tmp_path / n, tmp_path), ["a", "b"]))
+        finally:
+            scheduler.shutdown()
+
+        assert [r.status for r in results] == ["Completed", "Completed"]
+        assert polls == {"a": 3, "b": 3}
+
+    def test_poll_deadline_times_out_and_deletes(self, tmp_path):
+        delete_fn = MagicMock(return_value=True)
+        scheduler = CloudJobScheduler(
+            status_fn=lambda p, b: "Running", delete_fn=delete_fn, poll_interval=0.01
+        )
+
+        async def launch(project_dir, cwd, timeout):
+            return CloudJobOutcome(returncode=0, project_id="1", backtest_id="abc")
+
+        try:
+            with patch.object(scheduler, "_launch", launch):
+                outcome = scheduler.run(tmp_path, tmp_path, timeout=0.05)
+        finally:
+            scheduler.shutdown()
+
+        assert outcome.status == "Timeout"
+        delete_fn.assert_called_once_with("1", "abc")
+
+
+# =============================================================================
+# TEST EXECUTOR INTEGRATION
+# =============================================================================
+
+
+class TestExecutorScheduling:
+    """Test BacktestExecutor routes cloud backtests through the scheduler."""
+
+    def _executor(self, tmp_path, **kwargs):
+        (tmp_path / "lean.json").write_text("{}")
+        return BacktestExecutor(workspace_path=tmp_path, use_local=False, cleanup_on_start=False, **kwargs)
+
+    def test_cloud_nodes_creates_scheduler(self, tmp_path):
+        executor = self._executor(tmp_path, cloud_nodes=3)
+        assert executor.scheduler is not None
+        assert executor.scheduler.max_nodes == 3
+
+    def test_no_scheduler_by_default_or_locally(self, tmp_path):
+        assert self._executor(tmp_path).scheduler is None
+        local = BacktestExecutor(workspace_path=tmp_path, use_local=True, cleanup_on_start=False, cloud_nodes=3)
+        assert local.scheduler is None
+
+    def test_config_leaves_scheduler_off_unless_configured(self):
+        from research_system.core.v4.config import BacktestConfig
+
+        assert BacktestConfig().cloud_nodes is None
+        assert BacktestConfig(cloud_nodes=4).cloud_nodes == 4
+
+    def test_node_unavailable_maps_to_rate_limited(self, tmp_path):
+        scheduler = MagicMock()
+        scheduler.run.return_value = CloudJobOutcome(returncode=1, stdout="No spare nodes", node_unavailable=True)
+        executor = self._executor(tmp_path, scheduler=scheduler)
+
+        result = executor.run_single("code", "2020-01-01", "2020-12-31", "STRAT-001")
+
+        assert not result.success
+        assert result.rate_limited
+        assert scheduler.run.call_count == 1  # No extra retries around the scheduler
+
+    def test_completed_output_is_parsed(self, tmp_path):
+        scheduler = MagicMock()
+        scheduler.run.return_value = CloudJobOutcome(returncode=0, stdout="out", status="Completed")
+        executor = self._executor(tmp_path, scheduler=scheduler)
+
+        with patch.object(executor, "_parse_lean_output") as mock_parse:
+            executor.run_single("code", "2020-01-01", "2020-12-31", "STRAT-001")
+
+        mock_parse.assert_called_once_with("out", "", 0)
+        assert (tmp_path / "validations" / "STRAT-001" / "last_lean_output.txt").exists()
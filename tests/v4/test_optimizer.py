@@ -5,6 +5,7 @@ This module tests:
 2. Grid search combinations
 3. Random search combinations
 4. Optimization result handling
+5. Adaptive search (Bayesian, successive halving)
 """
 
 import pytest
@@ -348,6 +349,62 @@ class TestParameterInjection:
         assert result["parameters"]["_optimized"] == params
 
 
+class TestRuntimeParameters:
+    """Test passing parameters via config.json instead of regenerating code."""
+
+    @pytest.fixture
+    def strategy(self):
+        return {
+            "id": "STRAT-RT",
+            "name": "Runtime",
+            "strategy_type": "momentum",
+            "parameters": {"lookback_period": 126, "top_n": 3},
+        }
+
+    def _optimizer(self):
+        from research_system.codegen.strategy_generator import CodeGenerator
+        from research_system.validation.backtest import BacktestResult
+
+        executor = MagicMock()
+        executor.run_single.return_value = BacktestResult(success=True, sharpe=1.0)
+        generator = CodeGenerator()
+        optimizer = ParameterOptimizer(executor, generator, runtime_parameters=True)
+        return optimizer, executor, generator
+
+    def test_code_generated_once_for_all_combinations(self, strategy):
+        optimizer, executor, generator = self._optimizer()
+
+        with patch.object(generator, "generate", wraps=generator.generate) as generate:
+            for lookback in (63, 126, 252):
+                optimizer._evaluate_parameters(
+                    strategy, {"lookback_period": lookback, "top_n": 2}, "2012-01-01", "2017-12-31"
+                )
+
+        assert generate.call_count == 1
+        codes = {c.kwargs["code"] for c in executor.run_single.call_args_list}
+        assert len(codes) == 1
+        assert 'self._param("lookback_period"' in codes.pop()
+        assert [c.kwargs["parameters"]["lookback_period"] for c in executor.run_single.call_args_list] == [63, 126, 252]
+
+    def test_structural_parameter_falls_back_to_inlined_code(self, strategy):
+        optimizer, executor, _ = self._optimizer()
+
+        code_result, runtime_values = optimizer.prepare_code(strategy, {"lookback_period": 63, "threshold": 0.1})
+
+        assert runtime_values is None
+        assert "self._param" not in code_result.code
+        assert "self._lookback = 63" in code_result.code
+
+    def test_disabled_by_default(self, strategy):
+        from research_system.codegen.strategy_generator import CodeGenerator
+
+        optimizer = ParameterOptimizer(MagicMock(), CodeGenerator())
+        code_result, runtime_values = optimizer.prepare_code(strategy, {"lookback_period": 63})
+
+        assert runtime_values is None
+        assert "self._lookback = 63" in code_result.code
+
+
 # =============================================================================
 # TEST WITH MOCKED BACKTEST
 # =============================================================================
@@ -420,3 +477,458 @@ class TestOptimizationWithMockedBacktest:
         assert result.best_params == {"period": 20}
         assert result.best_sharpe == 2.0
         assert result.total_evaluated == 3
+
+
+class TestParallelEvaluation:
+    """Test concurrent parameter evaluation."""
+
+    STRATEGY = {
+        "id": "TEST-001",
+        "tunable_parameters": {
+            "parameters": {
+                "period": {"type": "int", "default": 15, "min": 5, "max": 40, "step": 5},
+            }
+        },
+    }
+
+    def _optimizer(self, sharpe_for, delay_for=None, max_workers=1):
+        import threading
+        import time
+
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def mock_generate(strategy):
+            result = MagicMock()
+            result.success = True
+            result.code = str(strategy["parameters"]["period"])
+            return result
+
+        def mock_run_single(code, start_date, end_date, strategy_id):
+            period = int(code)
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(delay_for(period) if delay_for else 0.01)
+            with lock:
+                state["active"] -= 1
+            result = MagicMock()
+            result.success = True
+            result.sharpe = sharpe_for(period)
+            result.cagr = 0.1
+            result.max_drawdown = 0.1
+            result.error = None
+            return result
+
+        executor = MagicMock()
+        executor.run_single = mock_run_single
+        generator = MagicMock()
+        generator.generate = mock_generate
+        return ParameterOptimizer(executor, generator, max_workers=max_workers), state
+
+    def test_parallel_matches_sequential(self):
+        """Concurrent evaluation finds the same best params as sequential."""
+        sharpe_for = lambda p: {20: 2.0, 30: 2.0}.get(p, 1.0)
+        seq, _ = self._optimizer(sharpe_for)
+        par, state = self._optimizer(sharpe_for, delay_for=lambda p: 0.05 if p == 20 else 0.01, max_workers=4)
+
+        seq_result = seq.optimize(self.STRATEGY, "2020-01-01", "2020-12-31", method=OptimizationMethod.GRID)
+        par_result = par.optimize(self.STRATEGY, "2020-01-01", "2020-12-31", method=OptimizationMethod.GRID)
+
+        assert state["peak"] > 1
+        # Tie between 20 and 30 goes to the earlier combination in both modes
+        assert seq_result.best_params == par_result.best_params == {"period": 20}
+        assert [e.params for e in par_result.evaluations] == [e.params for e in seq_result.evaluations]
+        assert par_result.total_evaluated == 8
+
+    def test_running_best_is_streamed(self):
+        """on_evaluation reports each completion with the running best."""
+        optimizer, _ = self._optimizer(lambda p: p / 10, max_workers=3)
+        seen = []
+
+        optimizer.optimize(
+            self.STRATEGY, "2020-01-01", "2020-12-31",
+            method=OptimizationMethod.GRID,
+            on_evaluation=lambda n, ev, best: seen.append((n, best.sharpe)),
+        )
+
+        assert [n for n, _ in seen] == list(range(1, 9))
+        best_sharpes = [b for _, b in seen]
+        assert best_sharpes == sorted(best_sharpes)
+        assert best_sharpes[-1] == 4.0
+
+    def test_max_workers_override(self):
+        """max_workers passed to optimize() overrides the default."""
+        optimizer, state = self._optimizer(lambda p: 1.0)
+        optimizer.optimize(
+            self.STRATEGY, "2020-01-01", "2020-12-31",
+            method=OptimizationMethod.GRID, max_workers=1,
+        )
+        assert state["peak"] == 1
+
+
+# =============================================================================
+# TEST ADAPTIVE SEARCH
+# =============================================================================
+
+
+class TestAdaptiveSearch:
+    """Test Bayesian search, successive halving and strided grid truncation."""
+
+    STRATEGY = {
+        "id": "TEST-001",
+        "tunable_parameters": {
+            "parameters": {
+                "fast": {"type": "int", "default": 10, "min": 2, "max": 60, "step": 2},
+                "slow": {"type": "int", "default": 100, "min": 50, "max": 240, "step": 10},
+            }
+        },
+    }
+
+    @staticmethod
+    def _sharpe(fast, slow):
+        # Smooth surface peaking at fast=30, slow=150
+        return 2.0 - ((fast - 30) / 30) ** 2 - ((slow - 150) / 100) ** 2
+
+    def _optimizer(self, calls):
+        def mock_generate(strategy):
+            result = MagicMock()
+            result.success = True
+            result.code = f"{strategy['parameters']['fast']},{strategy['parameters']['slow']}"
+            return result
+
+        def mock_run_single(code, start_date, end_date, strategy_id):
+            fast, slow = (int(v) for v in code.split(","))
+            calls.append((fast, slow, start_date, end_date))
+            result = MagicMock()
+            result.success = True
+            result.sharpe = self._sharpe(fast, slow)
+            result.cagr = 0.1
+            result.max_drawdown = 0.1
+            result.error = None
+            return result
+
+        executor = MagicMock()
+        executor.run_single = mock_run_single
+        generator = MagicMock()
+        generator.generate = mock_generate
+        return ParameterOptimizer(executor, generator, seed=7)
+
+    def test_grid_truncation_spans_whole_product(self):
+        """A truncated grid varies every parameter, not just the last one."""
+        tunable = TunableParameters(**self.STRATEGY["tunable_parameters"])
+
+        combinations = ParameterOptimizer()._generate_grid_combinations(tunable, 12)
+
+        assert len(combinations) == 12
+        assert len({c["fast"] for c in combinations}) == 12
+        assert combinations[0] == {"fast": 2, "slow": 50}
+
+    @pytest.mark.parametrize(
+        "lengths, n",
+        [((20, 10, 10, 10, 5), 5000), ((10, 10), 10), ((30, 20), 12)],
+    )
+    def test_grid_truncation_covers_every_axis(self, lengths, n):
+        """Each parameter of a truncated grid takes all (or n) of its values."""
+        tunable = TunableParameters(
+            parameters={
+                f"p{i}": {"type": "int", "default": 0, "min": 0, "max": length - 1, "step": 1}
+                for i, length in enumerate(lengths)
+            }
+        )
+
+        combinations = ParameterOptimizer()._generate_grid_combinations(tunable, n)
+
+        assert len(combinations) == n
+        assert len({tuple(c.values()) for c in combinations}) == n
+        for i, length in enumerate(lengths):
+            assert len({c[f"p{i}"] for c in combinations}) == min(length, n)
+
+    def test_bayesian_finds_near_optimum_within_budget(self):
+        """Bayesian search gets close to the peak with few evaluations."""
+        calls = []
+        optimizer = self._optimizer(calls)
+
+        result = optimizer.optimize(
+            self.STRATEGY, "2015-01-01", "2019-12-31",
+            max_evaluations=25, method=OptimizationMethod.BAYESIAN,
+        )
+
+        assert result.success
+        assert result.total_evaluated == len(calls) == 25
+        assert len({(f, s) for f, s, _, _ in calls}) == 25
+        assert result.best_sharpe > 1.9
+        assert result.method == OptimizationMethod.BAYESIAN
+
+    def test_bayesian_batches_with_workers(self):
+        """Concurrent Bayesian search still respects the budget."""
+        calls = []
+        optimizer = self._optimizer(calls)
+
+        result = optimizer.optimize(
+            self.STRATEGY, "2015-01-01", "2019-12-31",
+            max_evaluations=10, method=OptimizationMethod.BAYESIAN, max_workers=4,
+        )
+
+        assert result.total_evaluated == len(calls) == 10
+        assert len({(f, s) for f, s, _, _ in calls}) == 10
+
+    def test_halving_schedule(self):
+        """Rungs grow by eta, end at the range end and finish on the full range."""
+        from research_system.optimization.search import halving_schedule
+
+        rungs = halving_schedule("2012-01-01", "2020-12-31", 27, eta=3, min_days=365)
+
+        assert [n for _, _, n in rungs] == [27, 9, 3]
+        assert all(end == "2020-12-31" for _, end, _ in rungs)
+        assert rungs[-1][0] == "2012-01-01"
+        assert rungs[0][0] > rungs[1][0] > rungs[2][0]
+
+    def test_halving_schedule_short_range_is_single_rung(self):
+        """Ranges too short to screen collapse to one full-range rung."""
+        from research_system.optimization.search import halving_schedule
+
+        assert halving_schedule("2019-01-01", "2019-12-31", 10) == [("2019-01-01", "2019-12-31", 10)]
+
+    def test_successive_halving_is_reproducible_with_seed(self):
+        """The optimizer seed fixes the candidates successive halving draws."""
+        runs = []
+        for _ in range(2):
+            calls = []
+            self._optimizer(calls).optimize(
+                self.STRATEGY, "2012-01-01", "2019-12-31",
+                max_evaluations=20, method=OptimizationMethod.SUCCESSIVE_HALVING,
+            )
+            runs.append(calls)
+
+        assert runs[0] == runs[1]
+
+    def test_successive_halving_promotes_top_candidates(self):
+        """Only promoted candidates reach the full range, within budget."""
+        calls = []
+        optimizer = self._optimizer(calls)
+
+        result = optimizer.optimize(
+            self.STRATEGY, "2012-01-01", "2020-12-31",
+            max_evaluations=40, method=OptimizationMethod.SUCCESSIVE_HALVING,
+        )
+
+        assert result.success
+        assert len(calls) <= 40
+        full_range = [c for c in calls if c[2] == "2012-01-01"]
+        screened = [c for c in calls if c[2] != "2012-01-01"]
+        assert len(screened) > len(full_range) > 0
+
+        # Best params come from a full-range evaluation and beat every screened-out candidate
+        assert (result.best_params["fast"], result.best_params["slow"]) in {(f, s) for f, s, _, _ in full_range}
+        assert result.best_sharpe == max(self._sharpe(f, s) for f, s, _, _ in calls)
+
+
+# =============================================================================
+# TEST EVALUATION LEDGER
+# =============================================================================
+
+
+class TestEvaluationLedger:
+    """Test reuse of evaluations across optimization runs."""
+
+    STRATEGY = TestParallelEvaluation.STRATEGY
+
+    def test_identical_params_and_range_are_not_rerun(self):
+        """A second run over the same range is served from the ledger."""
+        from research_system.optimization.optimizer import EvaluationLedger
+
+        optimizer, state = TestParallelEvaluation()._optimizer(lambda p: p / 10)
+        calls = []
+        run_single = optimizer.backtest_executor.run_single
+        optimizer.backtest_executor.run_single = lambda **kw: calls.append(kw) or run_single(**kw)
+        ledger = EvaluationLedger()
+
+        first = optimizer.optimize(self.STRATEGY, "2020-01-01", "2020-12-31", method=OptimizationMethod.GRID, ledger=ledger)
+        second = optimizer.optimize(self.STRATEGY, "2020-01-01", "2020-12-31", method=OptimizationMethod.GRID, ledger=ledger)
+        optimizer.optimize(self.STRATEGY, "2021-01-01", "2021-12-31", method=OptimizationMethod.GRID, ledger=ledger)
+
+        assert len(calls) == 16  # 8 per distinct range
+        assert ledger.hits == 8
+        assert second.best_params == first.best_params
+
+    def test_failures_are_not_recorded(self):
+        """Failed evaluations are retried on the next run."""
+        from research_system.optimization.optimizer import EvaluationLedger
+
+        ledger = EvaluationLedger()
+        ledger.record(ParameterEvaluation(params={"p": 1}, success=False, start_date="a", end_date="b"))
+
+        assert ledger.get({"p": 1}, "a", "b") is None
+        assert len(ledger) == 0
+
+    def test_warm_start_counts_against_budget(self):
+        """Warm-start params are evaluated first and within max_evaluations."""
+        optimizer, _ = TestParallelEvaluation()._optimizer(lambda p: p / 10)
+
+        result = optimizer.optimize(
+            self.STRATEGY, "2020-01-01", "2020-12-31",
+            max_evaluations=4, method=OptimizationMethod.RANDOM,
+            warm_start=[{"period": 40}, {"period": 5}],
+        )
+
+        assert result.total_evaluated == 4
+        assert [e.params for e in result.evaluations[:2]] == [{"period": 40}, {"period": 5}]
+        assert len({e.params["period"] for e in result.evaluations}) == 4
+        assert result.best_params == {"period": 40}
+
+
+# =============================================================================
+# TEST LOCAL PRE-SCREENING
+# =============================================================================
+
+
+class TestPrescreen:
+    """Test the vectorized screener and the prescreen search method."""
+
+    @staticmethod
+    def _write_prices(directory, symbol, closes, start="2018-01-01"):
+        import numpy as np
+
+        dates = np.busday_offset(np.datetime64(start, "D"), np.arange(len(closes)), roll="forward")
+        directory.mkdir(parents=True, exist_ok=True)
+        lines = ["Date,Open,High,Low,Close,Volume"]
+        lines += [f"{d},{c},{c},{c},{c},1000" for d, c in zip(dates, closes)]
+        (directory / f"{symbol}.csv").write_text("\n".join(lines) + "\n")
+
+    @pytest.fixture
+    def prices(self, tmp_path):
+        """Price cache with one rising, one falling and one flat symbol."""
+        import numpy as np
+        from research_system.optimization import PriceCache
+
+        days = 1000
+        directory = tmp_path / "data" / "ohlcv"
+        self._write_prices(directory, "QQQ", 100 * 1.001 ** np.arange(days))
+        self._write_prices(directory, "IWM", 100 * 0.999 ** np.arange(days))
+        self._write_prices(directory, "SHY", np.full(days, 100.0))
+        return PriceCache.for_workspace(tmp_path)
+
+    def test_panel_forward_fills_missing_days(self, tmp_path):
+        """Symbols are aligned on the union of dates, NaN before their first bar."""
+        import numpy as np
+        from research_system.optimization import PriceCache
+
+        self._write_prices(tmp_path, "AAA", [1.0, 2.0, 3.0, 4.0])
+        self._write_prices(tmp_path, "BBB", [10.0, 20.0], start="2018-01-03")
+        cache = PriceCache(tmp_path)
+
+        panel = cache.panel(["AAA", "BBB"], "2018-01-04")
+
+        assert panel.closes.shape == (4, 2)
+        assert np.isnan(panel.closes[:2, 1]).all()
+        assert list(panel.closes[:, 0]) == [1.0, 2.0, 3.0, 4.0]
+        assert list(panel.closes[2:, 1]) == [10.0, 20.0]
+        assert cache.panel(["AAA", "MISSING"], "2018-01-04") is None
+
+    def test_momentum_holds_the_rising_symbol(self, prices):
+        """Momentum holds the rising symbol; a lookback beyond the data never trades."""
+        from research_system.optimization import VectorizedScreener
+
+        strategy = {"strategy_type": "momentum", "universe": ["QQQ", "IWM"], "parameters": {}}
+        combinations = [
+            {"lookback_period": 2000, "top_n": 1},
+            {"lookback_period": 20, "top_n": 1},
+            {"lookback_period": 20, "top_n": 2},
+        ]
+
+        result = VectorizedScreener(prices, cost_bps=0).screen(
+            strategy, combinations, "2018-06-01", "2021-12-31"
+        )
+
+        assert result.top(1) == [{"lookback_period": 20, "top_n": 1}]
+        assert result.cagr[0] == 0.0
+        assert result.cagr[1] > 0.2
+        assert result.max_drawdown[1] < 1e-9
+        # With top_n=2 the falling symbol is filtered by the positive-momentum rule
+        assert result.cagr[2] == pytest.approx(result.cagr[1])
+
+    def test_unsupported_strategies_are_not_screened(self, prices):
+        """Templates without a model, or symbols without prices, return None."""
+        from research_system.optimization import VectorizedScreener
+
+        screener = VectorizedScreener(prices)
+        combinations = [{"lookback_period": 20}]
+
+        assert screener.screen({"strategy_type": "covered_call"}, combinations, "2018-06-01", "2021-12-31") is None
+        assert screener.screen(
+            {"strategy_type": "momentum", "universe": ["XLE"]}, combinations, "2018-06-01", "2021-12-31"
+        ) is None
+
+    def test_zero_parameter_values_are_kept(self, prices):
+        """An explicit 0 is simulated as 0, not replaced by the default."""
+        from research_system.optimization import VectorizedScreener
+
+        strategy = {"strategy_type": "momentum", "universe": ["QQQ", "IWM"], "parameters": {}}
+        combinations = [
+            {"lookback_period": 20, "top_n": 1, "leverage": 0},
+            {"lookback_period": 20, "top_n": 1},
+        ]
+
+        result = VectorizedScreener(prices, cost_bps=0).screen(
+            strategy, combinations, "2018-06-01", "2021-12-31"
+        )
+
+        assert result.cagr[0] == 0.0
+        assert result.cagr[1] > 0.2
+
+    def test_unmodelled_parameters_are_not_screened(self, prices):
+        """A tunable the model doesn't simulate falls back to LEAN-only search."""
+        from research_system.optimization import VectorizedScreener
+
+        strategy = {"strategy_type": "momentum", "universe": ["QQQ", "IWM"], "parameters": {}}
+        screener = VectorizedScreener(prices)
+
+        assert screener.screen(
+            strategy, [{"lookback_period": 20, "stop_loss": 0.05}], "2018-06-01", "2021-12-31"
+        ) is None
+        assert screener.screen(
+            strategy, [{"lookback_period": 20, "threshold": 0.01}], "2018-06-01", "2021-12-31"
+        ) is not None
+
+    def test_prescreen_backtests_only_the_best_candidates(self):
+        """The optimizer screens the whole grid locally and confirms the top few."""
+        import numpy as np
+        from research_system.optimization import ScreenResult
+
+        class Screener:
+            def screen(self, strategy, combinations, start_date, end_date):
+                sharpe = np.array([2.0 - abs(c["fast"] - 30) / 30 for c in combinations])
+                zeros = np.zeros(len(combinations))
+                return ScreenResult(params=combinations, sharpe=sharpe, cagr=zeros, max_drawdown=zeros)
+
+        calls = []
+        optimizer = TestAdaptiveSearch()._optimizer(calls)
+        optimizer.prescreener = Screener()
+
+        result = optimizer.optimize(
+            TestAdaptiveSearch.STRATEGY, "2015-01-01", "2019-12-31",
+            max_evaluations=50, method=OptimizationMethod.PRESCREEN,
+        )
+
+        assert result.success
+        assert result.prescreened == 30 * 20
+        # A fifth of the budget, above the PRESCREEN_CONFIRM minimum
+        assert len(calls) == 10
+        assert {fast for fast, _, _, _ in calls} == {30}
+        assert result.best_params["fast"] == 30
+        assert result.to_dict()["prescreened"] == 600
+
+    def test_prescreen_without_screener_falls_back_to_random(self):
+        """Without a prescreener the full budget goes to random search."""
+        calls = []
+        optimizer = TestAdaptiveSearch()._optimizer(calls)
+
+        result = optimizer.optimize(
+            TestAdaptiveSearch.STRATEGY, "2015-01-01", "2019-12-31",
+            max_evaluations=10, method=OptimizationMethod.PRESCREEN,
+        )
+
+        assert result.success
+        assert result.prescreened == 0
+        assert len(calls) == 10
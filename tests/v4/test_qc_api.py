@@ -0,0 +1,230 @@
+"""Tests for the shared QC REST API client.
+
+This module tests:
+1. Credential caching
+2. Connection reuse and retry with backoff
+3. Request metrics
+4. Call sites using the shared client
+"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from research_system.validation.qc_api import QCApiClient, get_qc_client
+
+
+class FakeResponse:
+    def __init__(self, status, payload, connection_header=""):
+        self.status = status
+        self._payload = payload
+        self._connection_header = connection_header
+
+    def read(self):
+        return json.dumps(self._payload).encode() if not isinstance(self._payload, bytes) else self._payload
+
+    def getheader(self, name, default=None):
+        return self._connection_header if name == "Connection" else default
+
+
+class FakeConnection:
+    """Stands in for http.client.HTTPSConnection, replaying scripted responses."""
+
+    instances = []
+    connect_errors = []
+
+    def __init__(self, host, timeout=None):
+        self.host = host
+        self.requests = []
+        self.closed = False
+        self.sock = None
+        FakeConnection.instances.append(self)
+
+    def connect(self):
+        if FakeConnection.connect_errors:
+            raise FakeConnection.connect_errors.pop(0)
+        self.sock = object()
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests.append((method, path, body, headers))
+        response = FakeConnection.script.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        self._response = response
+
+    def getresponse(self):
+        return self._response
+
+    def close(self):
+        self.closed = True
+        self.sock = None
+
+
+@pytest.fixture
+def credentials(tmp_path):
+    path = tmp_path / "credentials"
+    path.write_text(json.dumps({"user-id": "123", "api-token": "secret"}))
+    return path
+
+
+@pytest.fixture
+def fake_http():
+    FakeConnection.instances = []
+    FakeConnection.script = []
+    FakeConnection.connect_errors = []
+    with patch("research_system.validation.qc_api.http.client.HTTPSConnection", FakeConnection):
+        yield FakeConnection
+
+
+@pytest.fixture
+def client(credentials):
+    return QCApiClient(credentials_path=credentials, backoff_base=0.001, backoff_max=0.001)
+
+
+# =============================================================================
+# TEST CREDENTIALS
+# =============================================================================
+
+
+class TestCredentials:
+    """Test credential loading and caching."""
+
+    def test_credentials_read_once(self, client, credentials):
+        with patch.object(type(credentials), "read_text", wraps=credentials.read_text) as read:
+            assert client.credentials() == ("123", "secret")
+            assert client.credentials() == ("123", "secret")
+        assert read.call_count == 1
+
+    def test_credentials_reloaded_when_file_changes(self, client, credentials):
+        client.credentials()
+        credentials.write_text(json.dumps({"user-id": "456", "api-token": "new"}))
+        stat = credentials.stat()
+        os.utime(credentials, (stat.st_atime, stat.st_mtime + 10))
+
+        assert client.credentials() == ("456", "new")
+
+    def test_missing_credentials_skip_request(self, tmp_path, fake_http):
+        client = QCApiClient(credentials_path=tmp_path / "missing")
+        assert client.request("projects/read") is None
+        assert fake_http.instances == []
+
+
+# =============================================================================
+# TEST REQUESTS
+# =============================================================================
+
+
+class TestRequests:
+    """Test pooled requests and retries."""
+
+    def test_connection_is_reused(self, client, fake_http):
+        fake_http.script = [FakeResponse(200, {"success": True})] * 3
+
+        for _ in range(3):
+            assert client.request("projects/read") == {"success": True}
+
+        assert len(fake_http.instances) == 1
+        assert len(fake_http.instances[0].requests) == 3
+
+    def test_auth_and_query_string(self, client, fake_http):
+        fake_http.script = [FakeResponse(200, {"success": True})]
+
+        client.request("backtests/read", {"projectId": "1", "backtestId": "abc"})
+
+        method, path, body, headers = fake_http.instances[0].requests[0]
+        assert method == "GET"
+        assert path == "/api/v2/backtests/read?projectId=1&backtestId=abc"
+        assert headers["Authorization"].startswith("Basic ")
+        assert headers["Timestamp"].isdigit()
+
+    def test_form_body(self, client, fake_http):
+        fake_http.script = [FakeResponse(200, {"success": True})]
+
+        client.request("compile/create", method="POST", data={"projectId": 7})
+
+        _, _, body, headers = fake_http.instances[0].requests[0]
+        assert body == b"projectId=7"
+        assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+
+    def test_retries_transient_failures(self, client, fake_http):
+        fake_http.script = [
+            ConnectionResetError("reset"),
+            FakeResponse(503, {}),
+            FakeResponse(200, {"success": True}),
+        ]
+
+        assert client.request("projects/read") == {"success": True}
+        # The broken connection was dropped and replaced
+        assert len(fake_http.instances) == 2
+        assert fake_http.instances[0].closed
+        assert client.stats()["projects/read"]["retries"] == 2
+
+    def test_gives_up_after_max_retries(self, client, fake_http):
+        fake_http.script = [FakeResponse(503, {})] * 4
+
+        assert client.request("projects/read") is None
+        stats = client.stats()["projects/read"]
+        assert stats["errors"] == 1
+        assert stats["retries"] == 3
+
+    def test_creates_are_not_retried_once_sent(self, client, fake_http):
+        """A failed create may have been acted on, so it is not repeated."""
+        for failure in (FakeResponse(503, {}), ConnectionResetError("reset")):
+            fake_http.script = [failure, FakeResponse(200, {"success": True})]
+
+            assert client.request("backtests/create", method="POST", data={"projectId": 7}) is None
+            assert len(fake_http.script) == 1
+
+    def test_creates_are_retried_when_never_sent(self, client, fake_http):
+        """Connection failures and 429s can't have launched anything."""
+        fake_http.connect_errors = [ConnectionRefusedError("refused")]
+        fake_http.script = [FakeResponse(429, {}), FakeResponse(200, {"success": True})]
+
+        assert client.request("backtests/create", method="POST", data={"projectId": 7}) == {"success": True}
+        assert client.stats()["backtests/create"]["retries"] == 2
+
+    def test_client_errors_are_not_retried(self, client, fake_http):
+        fake_http.script = [FakeResponse(401, {"success": False, "errors": ["auth"]})]
+
+        assert client.request("projects/read") == {"success": False, "errors": ["auth"]}
+        assert fake_http.script == []
+
+    def test_metrics_per_endpoint(self, client, fake_http):
+        fake_http.script = [FakeResponse(200, {"success": True})] * 3
+
+        client.request("projects/read")
+        client.request("projects/read")
+        client.request("backtests/list", {"projectId": "1"})
+
+        stats = client.stats()
+        assert stats["projects/read"]["requests"] == 2
+        assert stats["backtests/list"]["requests"] == 1
+        assert stats["projects/read"]["avg_seconds"] >= 0
+
+
+# =============================================================================
+# TEST SHARED CLIENT
+# =============================================================================
+
+
+class TestSharedClient:
+    """Test call sites share one client."""
+
+    def test_get_qc_client_is_shared(self, credentials):
+        assert get_qc_client(credentials) is get_qc_client(credentials)
+
+    def test_executor_uses_shared_client(self, tmp_path):
+        from research_system.validation.backtest import BacktestExecutor
+
+        executor = BacktestExecutor(workspace_path=tmp_path, cleanup_on_start=False)
+        shared = MagicMock()
+        shared.request.return_value = {"success": True, "backtest": {"completed": True}}
+
+        with patch("research_system.validation.backtest.get_qc_client", return_value=shared):
+            assert executor._get_backtest_status("1", "abc") == "Completed"
+
+        shared.request.assert_called_once_with(
+            "backtests/read", {"projectId": "1", "backtestId": "abc"}, method="GET"
+        )
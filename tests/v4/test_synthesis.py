@@ -308,6 +308,49 @@ class TestWorkspaceContextAggregator:
         ctx = WorkspaceContextAggregator(workspace).aggregate()
         assert ctx.validated[0].determination_reason == "Consistent Sharpe > 1.0 across all windows"
 
+    def test_unchanged_sources_served_from_cache(self, workspace):
+        """A second aggregation reuses parsed strategies and learnings."""
+        from unittest.mock import patch
+
+        validated_dir = workspace.strategies_path / "validated"
+        validated_dir.mkdir(parents=True, exist_ok=True)
+        for i in (1, 2):
+            with open(validated_dir / f"STRAT-00{i}.yaml", "w") as f:
+                yaml.dump({"id": f"STRAT-00{i}", "name": f"S{i}", "entry": {"type": "technical"}}, f)
+        with open(workspace.learnings_path / "STRAT-001.yaml", "w") as f:
+            yaml.dump({"strategy_id": "STRAT-001", "learnings": [{"category": "regime", "insight": "x"}]}, f)
+
+        first = WorkspaceContextAggregator(workspace).aggregate()
+        assert (workspace.state_path / "context_cache.json").exists()
+
+        with patch("research_system.synthesis.context.yaml.safe_load") as load:
+            second = WorkspaceContextAggregator(workspace).aggregate()
+        load.assert_not_called()
+        assert second.validated == first.validated
+        assert second.learnings == first.learnings
+
+    def test_changed_sources_reparsed(self, workspace):
+        """Editing validation results or deleting a strategy invalidates its entry."""
+        validated_dir = workspace.strategies_path / "validated"
+        validated_dir.mkdir(parents=True, exist_ok=True)
+        for i in (1, 2):
+            with open(validated_dir / f"STRAT-00{i}.yaml", "w") as f:
+                yaml.dump({"id": f"STRAT-00{i}", "name": f"S{i}"}, f)
+        WorkspaceContextAggregator(workspace).aggregate()
+
+        val_dir = workspace.validations_path / "STRAT-001"
+        val_dir.mkdir(parents=True, exist_ok=True)
+        with open(val_dir / "backtest_results.json", "w") as f:
+            json.dump({"sharpe_ratio": 1.25}, f)
+        (validated_dir / "STRAT-002.yaml").unlink()
+
+        ctx = WorkspaceContextAggregator(workspace).aggregate()
+        assert [s.id for s in ctx.validated] == ["STRAT-001"]
+        assert ctx.validated[0].sharpe == pytest.approx(1.25)
+
+        cached = json.loads((workspace.state_path / "context_cache.json").read_text())
+        assert list(cached["entries"]) == ["strategies/validated/STRAT-001.yaml"]
+
 
 # =============================================================================
 # QUALITY GATE
@@ -719,6 +762,58 @@ class TestPromptBuilder:
         assert "architect analysis here" in prompt
         assert "regime analysis here" in prompt
 
+    def _context_with_strategy(self) -> WorkspaceContext:
+        return WorkspaceContext(
+            validated=[
+                StrategyWithMetrics(
+                    id="STRAT-001",
+                    name="Cached Strat",
+                    status="validated",
+                    hypothesis="A testable hypothesis",
+                    entry_type="technical",
+                    instruments=["SPY"],
+                    sharpe=1.5,
+                )
+            ],
+            invalidated=[],
+            pending=[],
+            learnings=[],
+            available_data=["equities"],
+            summary_stats={"validated_count": 1, "entry_type_distribution": {"technical": 1}},
+        )
+
+    def test_cached_system_shares_prefix_across_personas(self):
+        """Every persona gets the same cacheable context block first."""
+        builder = PromptBuilder()
+        ctx = self._context_with_strategy()
+
+        systems = [
+            builder.build_cached_system(persona, ctx)
+            for persona in PromptBuilder.SYNTHESIS_PERSONAS + [PromptBuilder.SYNTHESIS_DIRECTOR]
+        ]
+
+        first_blocks = {json.dumps(system[0], sort_keys=True) for system in systems}
+        assert len(first_blocks) == 1
+        assert systems[0][0]["cache_control"] == {"type": "ephemeral"}
+        assert "STRAT-001" in systems[0][0]["text"]
+        # The persona definition follows the cached prefix
+        assert "CRITICAL INSTRUCTIONS" in systems[0][1]["text"]
+        assert "cache_control" not in systems[0][1]
+
+    def test_shared_context_prompts_do_not_repeat_listings(self):
+        """With shared_context the user prompts reference the context block."""
+        builder = PromptBuilder()
+        ctx = self._context_with_strategy()
+
+        prompts = [
+            builder.build_ideation_prompt("edge-hunter", ctx, shared_context=True),
+            builder.build_synthesis_prompt("data-integrator", ctx, shared_context=True),
+            builder.build_director_prompt(ctx, {"data-integrator": "ok"}, shared_context=True),
+        ]
+
+        for prompt in prompts:
+            assert "Cached Strat" not in prompt
+
 
 # =============================================================================
 # RUNNER
@@ -847,6 +942,161 @@ class TestSynthesisRunner:
         # All persona responses recorded
         assert len(result.persona_responses) == 6
 
+    def test_personas_run_concurrently_in_order(self, workspace):
+        """Independent personas overlap, but results keep persona order."""
+        import threading
+        import time
+
+        class SlowClient(MockLLMClient):
+            def __init__(self):
+                super().__init__(response_content="{}")
+                self.lock = threading.Lock()
+                self.active = 0
+                self.peak = 0
+
+            def generate(self, **kwargs):
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                # Reverse completion order relative to persona order
+                persona_index = len(self.calls)
+                self.calls.append(kwargs)
+                time.sleep(0.05 * (3 - persona_index))
+                with self.lock:
+                    self.active -= 1
+                return LLMResponse(content="{}", model="mock")
+
+        client = SlowClient()
+        runner = SynthesisRunner(workspace, llm_client=client, max_workers=3)
+        result = runner.ideate()
+
+        # The first persona warms the cache alone; the other two overlap
+        assert client.peak == 2
+        assert list(result.persona_responses) == PromptBuilder.IDEATION_PERSONAS
+
+    def test_first_persona_warms_cache_before_fan_out(self, workspace):
+        """The remaining personas start only after the first call returns."""
+        import threading
+        import time
+
+        class OrderingClient(MockLLMClient):
+            def __init__(self):
+                super().__init__(response_content="{}")
+                self.lock = threading.Lock()
+                self.events = []
+
+            def generate(self, **kwargs):
+                with self.lock:
+                    index = len(self.calls)
+                    self.calls.append(kwargs)
+                    self.events.append(("start", index))
+                time.sleep(0.05)
+                with self.lock:
+                    self.events.append(("end", index))
+                return LLMResponse(content="{}", model="mock")
+
+        validated_dir = workspace.strategies_path / "validated"
+        validated_dir.mkdir(parents=True, exist_ok=True)
+        with open(validated_dir / "STRAT-001.yaml", "w") as f:
+            yaml.dump({"id": "STRAT-001", "name": "Validated Strategy"}, f)
+
+        client = OrderingClient()
+        SynthesisRunner(workspace, llm_client=client, max_workers=5).synthesize()
+
+        assert client.events[:2] == [("start", 0), ("end", 0)]
+        assert len(client.calls) == 6
+
+    def test_max_workers_one_is_sequential(self, workspace):
+        """A fan-out limit of 1 runs one persona at a time."""
+        import threading
+
+        class CountingClient(MockLLMClient):
+            def __init__(self):
+                super().__init__(response_content="{}")
+                self.lock = threading.Lock()
+                self.active = 0
+                self.peak = 0
+
+            def generate(self, **kwargs):
+                with self.lock:
+                    self.active += 1
+                    self.peak = max(self.peak, self.active)
+                    self.active -= 1
+                return super().generate(**kwargs)
+
+        client = CountingClient()
+        SynthesisRunner(workspace, llm_client=client, max_workers=1).ideate()
+
+        assert client.peak == 1
+        assert len(client.calls) == 3
+
+    def test_all_calls_share_cached_context_prefix(self, workspace):
+        """Persona and director calls send the same cacheable system prefix."""
+        strat_data = {
+            "id": "STRAT-001",
+            "name": "Validated Strategy",
+            "hypothesis": {"thesis": "A testable hypothesis for validation"},
+            "entry": {"type": "technical"},
+        }
+        validated_dir = workspace.strategies_path / "validated"
+        validated_dir.mkdir(parents=True, exist_ok=True)
+        with open(validated_dir / "STRAT-001.yaml", "w") as f:
+            yaml.dump(strat_data, f)
+
+        client = MockLLMClient(response_content="{}")
+        SynthesisRunner(workspace, llm_client=client).synthesize()
+
+        prefixes = {json.dumps(call["system"][0], sort_keys=True) for call in client.calls}
+        assert len(client.calls) == 6
+        assert len(prefixes) == 1
+        assert "STRAT-001" in client.calls[0]["system"][0]["text"]
+
+    def test_persona_timeout_recorded_as_error(self, workspace):
+        """A persona exceeding the timeout is abandoned and reported."""
+        import time
+
+        import threading
+
+        class HangingClient(MockLLMClient):
+            """Hangs on the first call only."""
+
+            lock = threading.Lock()
+
+            def generate(self, **kwargs):
+                with self.lock:
+                    first = not self.calls
+                    self.calls.append(kwargs)
+                if first:
+                    time.sleep(1.0)
+                return LLMResponse(content="{}", model="mock")
+
+        runner = SynthesisRunner(
+            workspace, llm_client=HangingClient(response_content="{}"),
+            max_workers=3, persona_timeout=0.2,
+        )
+        start = time.monotonic()
+        result = runner.ideate()
+
+        assert time.monotonic() - start < 0.9
+        assert any("timed out" in e.lower() for e in result.errors)
+        assert len(result.persona_responses) == 3
+
+    def test_persona_runner_reads_same_settings(self):
+        """PersonaRunner takes its fan-out defaults from the api settings."""
+        from research_system.agents.runner import PersonaRunner
+        from research_system.core.v4.config import Config
+
+        config = Config.model_validate(
+            {"api": {"max_concurrent_personas": 2, "persona_timeout_seconds": 45}}
+        )
+        runner = PersonaRunner(config=config)
+        assert runner.max_workers == 2
+        assert runner.persona_timeout == 45
+
+        runner = PersonaRunner(max_workers=1, persona_timeout=5, config=config)
+        assert runner.max_workers == 1
+        assert runner.persona_timeout == 5
+
 
 # =============================================================================
 # STRATEGY WITH METRICS
@@ -596,6 +596,36 @@ class TestReuseProject:
         assert "First" not in content2
         assert "Second" in content2
 
+    def test_reuse_keeps_cloud_link_in_config(self, tmp_path):
+        """Only parameters are replaced; keys added by the lean CLI survive."""
+        import json
+        from unittest.mock import patch
+
+        executor = BacktestExecutor(
+            workspace_path=tmp_path, use_local=False, cleanup_on_start=False,
+            reuse_project=True,
+        )
+        config_file = tmp_path / "validations" / "_runner" / "config.json"
+        config_file.parent.mkdir(parents=True)
+        config_file.write_text(json.dumps({
+            "algorithm-language": "Python",
+            "parameters": {"lookback_period": "63"},
+            "cloud-id": 12345,
+            "local-id": 678,
+        }))
+
+        mock_result = BacktestResult(success=True, cagr=0.10, sharpe=0.5)
+        with patch.object(executor, '_execute_backtest', return_value=mock_result):
+            executor.run_single(
+                "class Algo: pass", "2012-01-01", "2023-12-31", "STRAT-TEST",
+                parameters={"top_n": 2},
+            )
+
+        config = json.loads(config_file.read_text())
+        assert config["cloud-id"] == 12345
+        assert config["local-id"] == 678
+        assert config["parameters"] == {"top_n": "2"}
+
     def test_legacy_mode_creates_unique_dirs(self, tmp_path):
         """Legacy mode (reuse_project=False) creates unique project dirs."""
         from unittest.mock import patch
@@ -611,3 +641,126 @@ class TestReuseProject:
 
         # _runner dir should NOT exist
         assert not (tmp_path / "validations" / "_runner").exists()
+
+    def test_parameters_written_to_config(self, tmp_path):
+        """Parameters go to config.json; unchanged main.py is not rewritten."""
+        import json
+        from unittest.mock import patch
+
+        executor = BacktestExecutor(
+            workspace_path=tmp_path, use_local=False, cleanup_on_start=False,
+            reuse_project=True,
+        )
+        runner_dir = tmp_path / "validations" / "_runner"
+
+        mock_result = BacktestResult(success=True, cagr=0.10, sharpe=0.5)
+        with patch.object(executor, '_execute_backtest', return_value=mock_result):
+            executor.run_single("class Algo: pass", "2012-01-01", "2023-12-31", "S", parameters={"top_n": 2})
+            mtime = (runner_dir / "main.py").stat().st_mtime_ns
+            executor.run_single("class Algo: pass", "2012-01-01", "2023-12-31", "S", parameters={"top_n": 4})
+            assert (runner_dir / "main.py").stat().st_mtime_ns == mtime
+            assert json.loads((runner_dir / "config.json").read_text())["parameters"] == {"top_n": "4"}
+
+            # Parameters from an earlier run do not leak into the next one
+            executor.run_single("class Algo: pass", "2012-01-01", "2023-12-31", "S")
+            assert json.loads((runner_dir / "config.json").read_text())["parameters"] == {}
+
+
+class TestConcurrentWindows:
+    """Test concurrent walk-forward window execution."""
+
+    def _executor(self, tmp_path, max_concurrent):
+        return BacktestExecutor(
+            workspace_path=tmp_path, use_local=False, cleanup_on_start=False,
+            reuse_project=True, max_concurrent=max_concurrent,
+        )
+
+    def test_default_is_sequential(self, tmp_path):
+        """max_concurrent defaults to a single project slot."""
+        executor = BacktestExecutor(workspace_path=tmp_path, use_local=False, cleanup_on_start=False)
+        assert executor.max_concurrent == 1
+        with executor._acquire_project_slot() as project_dir:
+            assert project_dir == tmp_path / "validations" / "_runner"
+
+    def test_slots_are_distinct_and_bounded(self, tmp_path):
+        """Each in-flight backtest checks out its own project slot."""
+        executor = self._executor(tmp_path, 3)
+        with executor._acquire_project_slot() as a, executor._acquire_project_slot() as b, \
+                executor._acquire_project_slot() as c:
+            assert len({a, b, c}) == 3
+            assert executor._project_slots.empty()
+        assert executor._project_slots.qsize() == 3
+
+    def test_windows_overlap_and_keep_order(self, tmp_path):
+        """Windows run at the same time and results stay in window order."""
+        import threading
+        import time
+        from unittest.mock import patch
+
+        executor = self._executor(tmp_path, 5)
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        dirs_used = set()
+
+        def fake_execute(project_dir, strategy_id, attempt, max_retries):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                dirs_used.add(project_dir)
+            start_year = int((project_dir / "main.py").read_text().split("set_start_date(")[1][:4])
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return BacktestResult(success=True, cagr=start_year / 100000, sharpe=1.0)
+
+        code = "self.set_start_date(2020, 1, 1)\nself.set_end_date(2021, 1, 1)\n"
+        with patch.object(executor, "_execute_backtest", side_effect=fake_execute):
+            wf = executor.run_walk_forward(code, "STRAT-TEST", windows=BacktestExecutor.ALL_WINDOWS)
+
+        assert peak > 1
+        assert len(dirs_used) == peak
+        assert [w.window_id for w in wf.windows] == [1, 2, 3, 4, 5]
+        assert [w.start_date for w in wf.windows] == [s for s, _ in BacktestExecutor.ALL_WINDOWS]
+        assert [round(w.result.cagr * 100000) for w in wf.windows] == [2012, 2014, 2016, 2018, 2020]
+        assert wf.aggregate_sharpe == 1.0
+
+    def test_rate_limit_stops_remaining_windows(self, tmp_path):
+        """A rate-limited window stops windows that have not started yet."""
+        from unittest.mock import patch
+
+        executor = self._executor(tmp_path, 2)
+        calls = []
+
+        def fake_run_single(code, start_date, end_date, strategy_id="temp"):
+            calls.append(start_date)
+            if start_date == "2012-01-01":
+                return BacktestResult(success=False, rate_limited=True, error="no spare nodes")
+            return BacktestResult(success=True, cagr=0.1, sharpe=1.0)
+
+        with patch.object(executor, "run_single", side_effect=fake_run_single):
+            wf = executor.run_walk_forward("code", "STRAT-TEST", windows=BacktestExecutor.ALL_WINDOWS)
+
+        assert wf.determination == "RETRY_LATER"
+        assert wf.is_transient
+        assert len(wf.windows) == 1
+        assert len(calls) < len(BacktestExecutor.ALL_WINDOWS)
+
+    def test_engine_crash_in_later_window_blocks(self, tmp_path):
+        """Windows before a crash are kept, and the crash blocks the strategy."""
+        from unittest.mock import patch
+
+        executor = self._executor(tmp_path, 3)
+
+        def fake_run_single(code, start_date, end_date, strategy_id="temp"):
+            if start_date == "2014-01-01":
+                return BacktestResult(success=False, engine_crash=True, error="LEAN engine crash")
+            return BacktestResult(success=True, cagr=0.1, sharpe=1.0)
+
+        with patch.object(executor, "run_single", side_effect=fake_run_single):
+            wf = executor.run_walk_forward("code", "STRAT-TEST", windows=BacktestExecutor.ALL_WINDOWS)
+
+        assert wf.determination == "BLOCKED"
+        assert not wf.is_transient
+        assert [w.window_id for w in wf.windows] == [1, 2]
@@ -5,10 +5,14 @@ This module tests:
 2. Code generation produces valid Python
 3. LLM fallback for complex strategies
 4. QC API fixes applied correctly
+5. Generation cache
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from research_system.codegen.cache import CodeGenCache
 from research_system.codegen.strategy_generator import (
     CodeGenerator,
     CodeGenResult,
@@ -359,3 +363,140 @@ class TestConvenienceFunction:
         result = generate_code(strategy)
         assert isinstance(result, CodeGenResult)
         assert result.success
+
+
+# =============================================================================
+# TEST CODE GENERATION CACHE
+# =============================================================================
+
+
+class TestCodeGenCache:
+    """Test memoized code generation."""
+
+    @pytest.fixture
+    def strategy(self):
+        return {
+            "id": "STRAT-TEST",
+            "name": "Test",
+            "strategy_type": "momentum",
+            "parameters": {"lookback_period": 126, "top_n": 3},
+        }
+
+    def test_key_is_canonical(self, strategy):
+        """Test key ignores dict ordering but not parameter values."""
+        reordered = {k: strategy[k] for k in reversed(list(strategy))}
+        changed = {**strategy, "parameters": {"lookback_period": 63, "top_n": 3}}
+
+        assert CodeGenCache.make_key(strategy) == CodeGenCache.make_key(reordered)
+        assert CodeGenCache.make_key(strategy) != CodeGenCache.make_key(changed)
+        assert CodeGenCache.make_key(strategy) != CodeGenCache.make_key(strategy, force_llm=True)
+
+    def test_repeat_generation_hits_memory(self, strategy):
+        """Test the second identical request skips rendering."""
+        generator = CodeGenerator(llm_client=None, cache=CodeGenCache())
+        first = generator.generate(strategy)
+
+        with patch.object(generator, "_generate_from_template") as render:
+            second = generator.generate(dict(strategy))
+
+        render.assert_not_called()
+        assert second.code == first.code
+        assert second is not first
+        assert generator.cache.stats()["memory_hits"] == 1
+
+    def test_disk_tier_survives_new_generator(self, strategy, tmp_path):
+        """Test a fresh process reuses code from the workspace cache."""
+        CodeGenerator(cache=CodeGenCache.for_workspace(tmp_path)).generate(strategy)
+
+        cache = CodeGenCache.for_workspace(tmp_path)
+        generator = CodeGenerator(cache=cache)
+        with patch.object(generator, "_generate_from_template") as render:
+            result = generator.generate(strategy)
+
+        render.assert_not_called()
+        assert result.success
+        assert cache.stats()["disk_hits"] == 1
+        assert list((tmp_path / ".state" / "codegen_cache").glob("*.json"))
+
+    def test_failures_are_not_cached(self, tmp_path):
+        """Test failed generation is retried on the next call."""
+        cache = CodeGenCache(tmp_path)
+        cache.put("key", CodeGenResult(success=False, error="boom"))
+
+        assert cache.get("key") is None
+
+    def test_memory_tier_is_bounded(self):
+        """Test the LRU evicts the least recently used entry."""
+        cache = CodeGenCache(max_memory_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, CodeGenResult(success=True, code=key))
+        cache.get("a")
+        cache.put("c", CodeGenResult(success=True, code="c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").code == "a"
+
+
+# =============================================================================
+# TEST RUNTIME PARAMETERS
+# =============================================================================
+
+
+class TestRuntimeParameterCodegen:
+    """Test templates reading tuned parameters from config.json."""
+
+    @pytest.fixture
+    def strategy(self):
+        return {
+            "id": "STRAT-TEST",
+            "name": "Test",
+            "strategy_type": "momentum",
+            "parameters": {"lookback_period": 126, "top_n": 3, "threshold": 0.05},
+        }
+
+    def test_numeric_parameters_read_at_runtime(self, strategy):
+        result = CodeGenerator().generate(strategy, runtime_parameters=["lookback_period", "top_n"])
+
+        assert result.runtime_parameters == ["lookback_period", "top_n"]
+        assert 'self._lookback = self._param("lookback_period", 126, int)' in result.code
+        assert "def _param(self, name, default, cast):" in result.code
+        compile(result.code, "main.py", "exec")
+
+    def test_float_parameter_with_integral_value_reads_floats(self, strategy):
+        """The cast follows the declared type, not the rendered value's type."""
+        import re
+        import textwrap
+
+        strategy["parameters"]["leverage"] = 1
+        strategy["tunable_parameters"] = {
+            "parameters": {
+                "leverage": {"type": "float", "default": 1.0, "min": 1.0, "max": 2.0, "step": 0.25},
+                "top_n": {"type": "int", "default": 3, "min": 1, "max": 5, "step": 1},
+            }
+        }
+
+        result = CodeGenerator().generate(strategy, runtime_parameters=["leverage", "top_n"])
+
+        assert 'self._param("leverage", 1.0, float)' in result.code
+        assert 'self._param("top_n", 3, int)' in result.code
+
+        helper = re.search(r"    def _param\(.*?(?=\n\S|\n    def |\Z)", result.code, re.S).group(0)
+        namespace = {}
+        exec(textwrap.dedent(helper), namespace)
+        algorithm = MagicMock()
+        algorithm.get_parameter.return_value = "1.5"
+        assert namespace["_param"](algorithm, "leverage", 1.0, float) == 1.5
+        assert namespace["_param"](algorithm, "top_n", 3, int) == 1
+
+    def test_structural_parameters_stay_inlined(self, strategy):
+        result = CodeGenerator().generate(strategy, runtime_parameters=["threshold"])
+
+        assert result.runtime_parameters == []
+        assert "self._threshold = 0.05" in result.code
+
+    def test_default_output_has_no_runtime_reads(self, strategy):
+        result = CodeGenerator().generate(strategy)
+
+        assert result.runtime_parameters == []
+        assert "_param" not in result.code
+        assert "self._lookback = 126" in result.code
@@ -334,6 +334,78 @@ class TestInboxProcessing:
 
         assert summary.total_files == 3
 
+    def test_process_inbox_concurrent_keeps_input_order(self, processor, workspace):
+        """Test jobs > 1 overlaps extraction but assigns IDs in file order."""
+        import threading
+        import time
+
+        names = [f"strat{i}.txt" for i in range(6)]
+        for name in names:
+            (workspace.inbox_path / name).write_text(f"{name} content")
+
+        processor.llm_client = None
+        original_extract = processor._extract_strategy
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_extract(content, filename):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            # Earlier files finish last
+            time.sleep(0.02 * (len(names) - names.index(filename)))
+            with lock:
+                active -= 1
+            return original_extract(content, filename)
+
+        accepted = IngestionQuality(
+            specificity=SpecificityScore(
+                has_entry_rules=True,
+                has_exit_rules=True,
+                has_position_sizing=True,
+                has_universe_definition=True,
+            ),
+            trust_score=TrustScore(
+                economic_rationale=20,
+                implementation_realism=15,
+                source_credibility=10,
+                novelty=5,
+            ),
+        )
+        progress = []
+        with patch.object(processor, "_extract_strategy", side_effect=slow_extract), \
+                patch.object(processor, "_score_quality", return_value=accepted):
+            summary = processor.process_inbox(
+                jobs=3, progress=lambda i, total, r: progress.append((i, r.filename))
+            )
+
+        assert peak > 1
+        assert [r.filename for r in summary.results] == names
+        assert [r.strategy_id for r in summary.results] == [f"STRAT-{i:03d}" for i in range(1, 7)]
+        assert progress == list(enumerate(names, 1))
+        assert summary.accepted == 6
+        assert not any(workspace.inbox_path.iterdir())
+
+    def test_process_files_concurrent_error_isolated(self, processor, workspace):
+        """Test a worker failure becomes that file's error result."""
+        (workspace.inbox_path / "a.txt").write_text("a")
+        (workspace.inbox_path / "b.txt").write_text("b")
+        processor.llm_client = None
+
+        def read(file_path):
+            if file_path.name == "a.txt":
+                raise OSError("boom")
+            return "b"
+
+        with patch.object(processor, "_read_file_content", side_effect=read):
+            summary = processor.process_inbox(dry_run=True, jobs=2)
+
+        first, second = summary.results
+        assert "boom" in first.error
+        assert first.decision is None
+        assert second.decision is not None
+
 
 # =============================================================================
 # TEST QUALITY SCORING
@@ -743,6 +815,235 @@ class TestFileArchiving:
         assert len(archive_files) == 1
 
 
+# =============================================================================
+# TEST DEDUPLICATION
+# =============================================================================
+
+
+class TestDeduplication:
+    """Test the content-hash dedup index."""
+
+    @pytest.fixture
+    def accepted_quality(self):
+        return IngestionQuality(
+            specificity=SpecificityScore(
+                has_entry_rules=True,
+                has_exit_rules=True,
+                has_position_sizing=True,
+                has_universe_definition=True,
+            ),
+            trust_score=TrustScore(
+                economic_rationale=20,
+                implementation_realism=15,
+                source_credibility=10,
+                novelty=5,
+            ),
+        )
+
+    def _ingest(self, processor, quality, **kwargs):
+        with patch.object(processor, "_score_quality", return_value=quality), \
+                patch.object(processor, "_extract_strategy", wraps=processor._extract_strategy) as extract:
+            summary = processor.process_inbox(**kwargs)
+        return summary, extract.call_count
+
+    def test_exact_duplicate_skips_extraction(
+        self, processor, workspace, sample_strategy_text, accepted_quality
+    ):
+        """Re-dropped content is resolved from the index without extraction."""
+        processor.llm_client = None
+        (workspace.inbox_path / "talk.txt").write_text(sample_strategy_text)
+        first, _ = self._ingest(processor, accepted_quality)
+        assert first.results[0].strategy_id == "STRAT-001"
+
+        (workspace.inbox_path / "talk-copy.txt").write_text(sample_strategy_text)
+        second, extract_calls = self._ingest(processor, accepted_quality)
+
+        [result] = second.results
+        assert extract_calls == 0
+        assert result.duplicate_of == "STRAT-001"
+        assert "talk.txt" in result.error
+        assert second.duplicates == 1 and second.errors == 0
+        assert list((workspace.archive_path / "duplicates").iterdir())
+        assert not (workspace.strategies_path / "pending" / "STRAT-002.yaml").exists()
+
+    def test_index_persists_across_processors(
+        self, workspace, config, sample_strategy_text, accepted_quality
+    ):
+        """A new processor (new run) sees entries from earlier runs."""
+        (workspace.inbox_path / "talk.txt").write_text(sample_strategy_text)
+        self._ingest(IngestProcessor(workspace, config), accepted_quality)
+
+        (workspace.inbox_path / "again.txt").write_text(sample_strategy_text)
+        summary, _ = self._ingest(IngestProcessor(workspace, config), accepted_quality)
+
+        assert summary.results[0].duplicate_of == "STRAT-001"
+
+    def test_near_duplicate_needs_threshold(
+        self, workspace, config, sample_strategy_text, accepted_quality
+    ):
+        """Re-formatted copies are caught only with a near-duplicate threshold."""
+        reformatted = sample_strategy_text.upper().replace("\n", "\n\n").replace(".", " .")
+        near_config = config.model_copy(deep=True)
+        near_config.ingestion.near_duplicate_threshold = 0.9
+
+        (workspace.inbox_path / "talk.txt").write_text(sample_strategy_text)
+        self._ingest(IngestProcessor(workspace, near_config), accepted_quality)
+        (workspace.inbox_path / "talk-v2.txt").write_text(reformatted)
+
+        exact_only, _ = self._ingest(IngestProcessor(workspace, config), accepted_quality, dry_run=True)
+        assert exact_only.results[0].duplicate_of is None
+
+        near, extract_calls = self._ingest(IngestProcessor(workspace, near_config), accepted_quality)
+        [result] = near.results
+        assert extract_calls == 0
+        assert result.duplicate_of == "STRAT-001"
+        assert "Near-duplicate" in result.error
+
+    def test_duplicates_within_concurrent_batch(
+        self, processor, workspace, sample_strategy_text, accepted_quality
+    ):
+        """Identical files in one concurrent batch create only one strategy."""
+        processor.llm_client = None
+        (workspace.inbox_path / "a.txt").write_text(sample_strategy_text)
+        (workspace.inbox_path / "b.txt").write_text(sample_strategy_text)
+
+        summary, _ = self._ingest(processor, accepted_quality, jobs=2)
+
+        first, second = summary.results
+        assert first.strategy_id == "STRAT-001"
+        assert second.duplicate_of == "STRAT-001"
+        assert summary.accepted == 1 and summary.duplicates == 1
+
+    def test_deleted_strategy_is_not_a_duplicate(
+        self, processor, workspace, sample_strategy_text, accepted_quality
+    ):
+        """An index entry whose strategy was deleted doesn't block re-ingest."""
+        processor.llm_client = None
+        (workspace.inbox_path / "talk.txt").write_text(sample_strategy_text)
+        first, _ = self._ingest(processor, accepted_quality)
+        Path(first.results[0].saved_path).unlink()
+
+        (workspace.inbox_path / "talk-copy.txt").write_text(sample_strategy_text)
+        second, extract_calls = self._ingest(processor, accepted_quality)
+
+        [result] = second.results
+        assert extract_calls == 1
+        assert result.duplicate_of is None
+        assert result.success
+        match = processor.content_index.lookup(result.content_hash)
+        assert match.strategy_id == result.strategy_id
+
+    def test_force_bypasses_index(
+        self, processor, workspace, sample_strategy_text, accepted_quality
+    ):
+        """--force re-ingests content even when the index has it."""
+        processor.llm_client = None
+        (workspace.inbox_path / "talk.txt").write_text(sample_strategy_text)
+        self._ingest(processor, accepted_quality)
+
+        (workspace.inbox_path / "talk-copy.txt").write_text(sample_strategy_text)
+        summary, extract_calls = self._ingest(processor, accepted_quality, force=True)
+
+        [result] = summary.results
+        assert extract_calls == 1
+        assert result.duplicate_of is None
+        assert result.strategy_id == "STRAT-002"
+
+    def test_dedup_disabled(self, workspace, sample_strategy_text):
+        """With ingestion.dedup off no index is used."""
+        config = get_default_config()
+        config.ingestion.dedup = False
+
+        assert IngestProcessor(workspace, config).content_index is None
+
+
+# =============================================================================
+# TEST LONG DOCUMENTS
+# =============================================================================
+
+
+class TestLongDocuments:
+    """Test chunked relevance screening for documents over the prompt budget."""
+
+    def test_chunk_text_respects_limit_and_paragraphs(self):
+        """Chunks stay under the limit and keep paragraphs whole when possible."""
+        from research_system.ingest.chunking import chunk_text
+
+        paragraphs = [(f"para {i} " + "word " * 50).strip() for i in range(40)]
+        chunks = chunk_text("\n\n".join(paragraphs), max_chars=1000)
+
+        assert all(len(c.text) <= 1000 for c in chunks)
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+        assert "\n\n".join(c.text for c in chunks) == "\n\n".join(paragraphs)
+
+    def test_chunk_text_splits_oversized_paragraph(self):
+        """A single paragraph longer than the limit is split on whitespace."""
+        from research_system.ingest.chunking import chunk_text
+
+        chunks = chunk_text("word " * 1000, max_chars=300)
+
+        assert len(chunks) > 1
+        assert all(len(c.text) <= 300 for c in chunks)
+        assert sum(c.text.count("word") for c in chunks) == 1000
+
+    def test_html_read_as_visible_text(self, tmp_path):
+        """HTML is streamed into visible text blocks."""
+        from research_system.ingest.chunking import iter_sections
+
+        html_file = tmp_path / "post.html"
+        html_file.write_text(
+            "<html><head><title>t</title><style>p {color: red}</style></head>"
+            "<body><h1>Momentum</h1><p>Buy the <b>top</b> decile.</p>"
+            "<script>var x = 1;</script><p>Hold one month.</p></body></html>"
+        )
+
+        blocks = [text for _, text in iter_sections(html_file)]
+
+        assert blocks == ["Momentum", "Buy the top decile.", "Hold one month."]
+
+    def test_long_document_extracts_relevant_chunks_only(self, processor, mock_llm_client):
+        """Irrelevant chunks are screened out before the Sonnet extraction."""
+        from research_system.ingest import strategy_processor as sp
+        from research_system.llm.client import LLMClient, LLMResponse
+
+        relevant = "RULES: buy SPY when RSI below 30, sell above 70. " * 200
+        filler = "The host talks about the weather and their podcast sponsors. " * 150
+        content = "\n\n".join([filler, relevant, filler, filler, relevant, filler] * 3)
+        assert len(content) > sp.MAX_EXTRACTION_CHARS
+
+        def haiku(user, system, max_tokens, caller):
+            score = 9 if "RULES" in user else 1
+            return LLMResponse(content=json.dumps({"score": score}), model="haiku")
+
+        mock_llm_client.generate_haiku.side_effect = haiku
+        mock_llm_client.generate_sonnet.return_value = LLMResponse(content="{}", model="sonnet")
+        mock_llm_client.extract_json.side_effect = lambda r: LLMClient.extract_json(None, r)
+
+        processor._extract_strategy(content, "episode.txt")
+
+        chunks = sp.chunk_text(content, sp.CHUNK_CHARS)
+        assert mock_llm_client.generate_haiku.call_count == len(chunks)
+        prompt = mock_llm_client.generate_sonnet.call_args.kwargs["user"]
+        assert "RULES" in prompt
+        assert "weather" not in prompt
+        assert len(prompt) < sp.MAX_EXTRACTION_CHARS + 2000
+
+    def test_failed_relevance_call_keeps_chunk(self, processor, mock_llm_client):
+        """A chunk whose relevance call raises is still sent to extraction."""
+        from research_system.ingest import strategy_processor as sp
+        from research_system.llm.client import LLMResponse
+
+        content = "\n\n".join(f"section {i} " + "text " * 3000 for i in range(5))
+        mock_llm_client.generate_haiku.side_effect = RuntimeError("rate limited")
+        mock_llm_client.generate_sonnet.return_value = LLMResponse(content="{}", model="sonnet")
+        mock_llm_client.extract_json.return_value = None
+
+        processor._extract_strategy(content, "paper.txt")
+
+        prompt = mock_llm_client.generate_sonnet.call_args.kwargs["user"]
+        assert "section 0" in prompt
+
+
 # =============================================================================
 # TEST RESULT CLASSES
 # =============================================================================
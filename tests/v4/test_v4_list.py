@@ -181,6 +181,94 @@ class TestGetStrategy:
         assert invalidated["_status"] == "invalidated"
 
 
+# =============================================================================
+# TESTS: Strategy index
+# =============================================================================
+
+
+class TestStrategyIndex:
+    """Tests for the persistent strategy index behind listing and lookup."""
+
+    def test_sort_and_paginate(self, workspace_with_strategies):
+        """Sorting and paging are applied by the index."""
+        ws = workspace_with_strategies
+        by_id = ws.list_strategies(sort="id", descending=False)
+        assert [s["id"] for s in by_id] == [f"STRAT-00{i}" for i in range(1, 6)]
+
+        page = ws.list_strategies(limit=2, offset=1)
+        newest = [s["id"] for s in ws.list_strategies()]
+        assert [s["id"] for s in page] == newest[1:3]
+
+        with pytest.raises(ValueError):
+            ws.list_strategies(sort="size")
+
+    def test_index_persists_across_instances(self, workspace_with_strategies):
+        """A new workspace instance reuses the index without re-parsing."""
+        from unittest.mock import patch
+        from research_system.core.v4.workspace import Workspace
+
+        workspace_with_strategies.list_strategies()
+        assert (workspace_with_strategies.state_path / "strategy_index.sqlite").exists()
+
+        fresh = Workspace(workspace_with_strategies.path)
+        with patch("research_system.core.v4.strategy_index.yaml.safe_load") as load:
+            assert len(fresh.list_strategies()) == 5
+            assert fresh.strategy_status("STRAT-003") == "validated"
+        load.assert_not_called()
+
+    def test_picks_up_external_changes(self, workspace_with_strategies):
+        """Files edited, added or removed outside the workspace are re-indexed."""
+        ws = workspace_with_strategies
+        ws.list_strategies()
+
+        path = ws.strategies_path / "pending" / "STRAT-001.yaml"
+        data = yaml.safe_load(path.read_text())
+        data["name"] = "Renamed Crossover Strategy"
+        path.write_text(yaml.dump(data))
+        (ws.strategies_path / "validated" / "STRAT-003.yaml").unlink()
+        (ws.strategies_path / "blocked" / "STRAT-006.yaml").write_text(
+            yaml.dump({"id": "STRAT-006", "name": "New", "tags": ["momentum"]})
+        )
+
+        result = {s["id"]: s for s in ws.list_strategies()}
+        assert result["STRAT-001"]["name"] == "Renamed Crossover Strategy"
+        assert "STRAT-003" not in result
+        assert result["STRAT-006"]["created"] is None
+        assert {s["id"] for s in ws.list_strategies(tags=["momentum"])} == {"STRAT-001", "STRAT-006"}
+        assert ws.status()["strategies"]["blocked"] == 2
+
+    def test_move_and_external_move_tracked(self, workspace_with_strategies):
+        """Lookup follows move_strategy and files moved behind its back."""
+        import shutil
+
+        ws = workspace_with_strategies
+        ws.move_strategy("STRAT-001", "pending", "validated")
+        assert ws.get_strategy("STRAT-001")["_status"] == "validated"
+        assert [s["id"] for s in ws.list_strategies(status="validated", sort="id", descending=False)] == [
+            "STRAT-001", "STRAT-003"
+        ]
+
+        shutil.move(
+            str(ws.strategies_path / "validated" / "STRAT-001.yaml"),
+            str(ws.strategies_path / "blocked" / "STRAT-001.yaml"),
+        )
+        assert ws.strategy_status("STRAT-001") == "blocked"
+        assert ws.get_strategy("STRAT-001")["_status"] == "blocked"
+
+    def test_duplicate_file_resolves_by_lifecycle_order(self, workspace_with_strategies):
+        """A strategy copied into two status directories resolves to the earlier stage."""
+        import shutil
+
+        ws = workspace_with_strategies
+        shutil.copy(
+            ws.strategies_path / "validated" / "STRAT-003.yaml",
+            ws.strategies_path / "blocked" / "STRAT-003.yaml",
+        )
+        ws.list_strategies()
+
+        assert ws.strategy_status("STRAT-003") == "validated"
+
+
 # =============================================================================
 # TESTS: CLI command
 # =============================================================================
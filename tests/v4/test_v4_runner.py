@@ -404,6 +404,86 @@ class TestBatchProcessing:
         captured = capsys.readouterr()
         assert "No pending strategies" in captured.out
 
+    def _mock_pipeline(self, runner, sharpe_by_id, delay=0.02):
+        """Replace codegen and backtests with fast fakes."""
+        import threading
+        import time
+
+        from research_system.codegen.v4_generator import V4CodeGenResult
+
+        state = {"in_flight": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def run_walk_forward(code, strategy_id):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(delay)
+            with lock:
+                state["in_flight"] -= 1
+            return WalkForwardResult(
+                strategy_id=strategy_id,
+                aggregate_sharpe=sharpe_by_id[strategy_id],
+                consistency=0.8,
+                max_drawdown=0.1,
+                aggregate_cagr=0.12,
+            )
+
+        runner._generate_code = MagicMock(return_value=V4CodeGenResult(success=True, code="code", method="template"))
+        runner.backtest_executor.run_walk_forward = run_walk_forward
+        return state
+
+    def test_run_all_concurrent(self, runner, multiple_strategies, v4_workspace, capsys):
+        """Test run_all with jobs > 1 runs strategies at once and keeps results ordered."""
+        sharpes = {"STRAT-001": 1.5, "STRAT-002": 0.2, "STRAT-003": 1.8}
+        state = self._mock_pipeline(runner, sharpes)
+
+        pending = [s["id"] for s in v4_workspace.list_strategies(status="pending")]
+        results = runner.run_all(skip_verify=True, jobs=3)
+
+        assert [r.strategy_id for r in results] == pending
+        assert {r.strategy_id: r.determination for r in results} == {
+            "STRAT-001": "VALIDATED",
+            "STRAT-002": "INVALIDATED",
+            "STRAT-003": "VALIDATED",
+        }
+        assert state["peak"] > 1
+
+        strategies_path = v4_workspace.strategies_path
+        assert (strategies_path / "validated" / "STRAT-001.yaml").exists()
+        assert (strategies_path / "invalidated" / "STRAT-002.yaml").exists()
+        assert not list((strategies_path / "pending").glob("*.yaml"))
+        for strategy_id in sharpes:
+            val_dir = v4_workspace.validations_path / strategy_id
+            assert json.loads((val_dir / "run_result.json").read_text())["strategy_id"] == strategy_id
+            assert not list(val_dir.glob("*.tmp"))
+
+        captured = capsys.readouterr()
+        assert "[STRAT-002] Processing STRAT-002" in captured.out
+        assert "Invalidated: 1" in captured.out
+
+    def test_run_all_concurrent_reserves_project_slots(self, multiple_strategies, v4_workspace):
+        """Test each concurrent strategy gets its own project slots."""
+        with patch("research_system.validation.backtest.BacktestExecutor._cleanup_all_stuck_backtests"):
+            runner = Runner(workspace=v4_workspace, llm_client=None, use_local=False, max_concurrent=2)
+        self._mock_pipeline(runner, {"STRAT-001": 1.5, "STRAT-002": 1.5, "STRAT-003": 1.5}, delay=0)
+
+        runner.run_all(skip_verify=True, jobs=3)
+
+        assert runner.backtest_executor._project_slots.qsize() == 6
+
+    def test_run_all_concurrent_isolates_crashes(self, runner, multiple_strategies):
+        """Test an exception in one strategy does not stop the others."""
+        self._mock_pipeline(runner, {"STRAT-001": 1.5, "STRAT-003": 1.5})
+
+        results = runner.run_all(skip_verify=True, jobs=2)
+
+        by_id = {r.strategy_id: r for r in results}
+        assert by_id["STRAT-001"].determination == "VALIDATED"
+        assert by_id["STRAT-003"].determination == "VALIDATED"
+        assert by_id["STRAT-002"].determination == "FAILED"
+        assert "KeyError" in by_id["STRAT-002"].error
+
 
 # =============================================================================
 # TEST FORCE FLAG FOR BLOCKED STRATEGIES
@@ -492,6 +572,70 @@ class TestForceBlockedRetry:
         assert (v4_workspace.strategies_path / "pending" / "STRAT-011.yaml").exists()
 
 
+# =============================================================================
+# TEST CODE GENERATION CACHE
+# =============================================================================
+
+
+class TestCodegenCache:
+    """Test that only code which backtested successfully is reused."""
+
+    def _pipeline(self, runner, determination=""):
+        from research_system.codegen.v4_generator import V4CodeGenResult
+
+        generate = MagicMock(return_value=V4CodeGenResult(success=True, code="code", method="llm"))
+        runner.code_generator.generate = generate
+        runner.backtest_executor.run_walk_forward = MagicMock(return_value=WalkForwardResult(
+            strategy_id="STRAT-001",
+            determination=determination,
+            aggregate_sharpe=1.5,
+            consistency=0.8,
+            max_drawdown=0.1,
+            aggregate_cagr=0.12,
+        ))
+        return generate
+
+    def _reset(self, v4_workspace):
+        for status in ("validated", "blocked"):
+            for path in (v4_workspace.strategies_path / status).glob("*.yaml"):
+                path.rename(v4_workspace.strategies_path / "pending" / path.name)
+
+    def test_code_cached_after_successful_backtest(self, runner, sample_strategy, v4_workspace):
+        generate = self._pipeline(runner)
+
+        runner.run("STRAT-001", skip_verify=True)
+        self._reset(v4_workspace)
+        runner.run("STRAT-001", skip_verify=True)
+
+        assert generate.call_count == 1
+
+    def test_code_not_cached_after_failed_backtest(self, runner, sample_strategy, v4_workspace):
+        generate = self._pipeline(runner, determination="BLOCKED")
+
+        runner.run("STRAT-001", skip_verify=True)
+        self._reset(v4_workspace)
+        runner.run("STRAT-001", skip_verify=True)
+
+        assert generate.call_count == 2
+
+    def test_force_bypasses_cache(self, runner, sample_strategy, v4_workspace):
+        generate = self._pipeline(runner)
+
+        runner.run("STRAT-001", skip_verify=True)
+        self._reset(v4_workspace)
+        runner.run("STRAT-001", skip_verify=True, force=True)
+
+        assert generate.call_count == 2
+
+    def test_cache_follows_cache_enabled(self, v4_workspace):
+        v4_workspace.config.backtest.cache_enabled = False
+
+        runner = Runner(workspace=v4_workspace, llm_client=None, use_local=True)
+
+        assert runner.codegen_cache is None
+        assert runner.result_cache is None
+
+
 # =============================================================================
 # TEST WINDOW CONSISTENCY GATE
 # =============================================================================
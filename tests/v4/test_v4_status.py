@@ -298,6 +298,41 @@ class TestV4StatusActions:
 # =============================================================================
 
 
+class TestV4StatusLLM:
+    """Tests for the 'research status llm' report."""
+
+    def test_reports_calls_by_subsystem(self, v4_workspace, capsys):
+        """Aggregates recorded calls per subsystem."""
+        from research_system.cli.main import cmd_status
+        from research_system.llm.telemetry import TelemetryLog, make_record
+
+        telemetry = TelemetryLog.for_workspace(v4_workspace.path)
+        usage = {"input_tokens": 1000, "output_tokens": 200}
+        for seconds in (1.0, 2.0, 9.0):
+            telemetry.record(make_record(
+                "synthesis.director", "claude-sonnet-4-20250514", "api", seconds, usage
+            ))
+        telemetry.record(make_record("ingest.extract", "claude-3-haiku-20240307", "api", 0.5, usage))
+
+        args = SimpleNamespace(v4_workspace=str(v4_workspace.path), report="llm")
+        assert cmd_status(args) == 0
+
+        out = capsys.readouterr().out
+        assert "LLM Call Telemetry" in out
+        lines = [line for line in out.splitlines() if line.startswith(("synthesis", "ingest"))]
+        # Slowest subsystem first
+        assert lines[0].split()[:2] == ["synthesis", "3"]
+        assert lines[1].split()[:2] == ["ingest", "1"]
+
+    def test_no_calls_recorded(self, v4_workspace, capsys):
+        """Says so when nothing has been recorded."""
+        from research_system.cli.main import cmd_status
+
+        args = SimpleNamespace(v4_workspace=str(v4_workspace.path), report="llm")
+        assert cmd_status(args) == 0
+        assert "No LLM calls recorded" in capsys.readouterr().out
+
+
 class TestV4StatusErrors:
     """Tests for error handling."""
 
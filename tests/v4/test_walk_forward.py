@@ -5,6 +5,7 @@ This module tests:
 2. WalkForwardRunner execution flow
 3. Result aggregation
 4. Parameter stability calculation
+5. Incremental (warm-started) optimization across periods
 """
 
 import pytest
@@ -343,6 +344,97 @@ class TestParameterStability:
         assert result.parameter_stability < 1.0
 
 
+# =============================================================================
+# TEST INCREMENTAL WALK-FORWARD
+# =============================================================================
+
+
+class TestIncrementalWalkForward:
+    """Test warm-started optimization with a shared evaluation ledger."""
+
+    STRATEGY = {
+        "id": "TEST-001",
+        "tunable_parameters": {
+            "parameters": {
+                "period": {"type": "int", "default": 20, "min": 5, "max": 200, "step": 5},
+            }
+        },
+    }
+
+    def _runner(self, calls):
+        def mock_generate(strategy):
+            result = MagicMock()
+            result.success = True
+            result.code = str(strategy["parameters"]["period"])
+            return result
+
+        def mock_run_single(code, start_date, end_date, strategy_id):
+            calls.append((int(code), start_date, end_date, strategy_id))
+            result = MagicMock()
+            result.success = True
+            result.sharpe = 2.0 - abs(int(code) - 100) / 100
+            result.cagr = 0.1
+            result.max_drawdown = 0.1
+            result.error = None
+            return result
+
+        executor = MagicMock()
+        executor.run_single = mock_run_single
+        generator = MagicMock()
+        generator.generate = mock_generate
+        return WalkForwardRunner(executor, generator)
+
+    def _config(self, incremental, reduced_budget=False):
+        return WalkForwardConfig(
+            start_year=2012,
+            end_year=2019,
+            initial_train_years=3,
+            max_evaluations=20,
+            incremental=incremental,
+            reduced_budget=reduced_budget,
+        )
+
+    def test_warm_start_keeps_full_budget_by_default(self):
+        """Without reduced_budget every period gets max_evaluations."""
+        calls = []
+
+        result = self._runner(calls).run(self.STRATEGY, self._config(incremental=True))
+
+        assert result.success
+        assert all(p.evaluations_attempted == 20 for p in result.periods)
+
+    def test_reduced_budget_uses_fewer_backtests(self):
+        """With reduced_budget, later periods explore with a smaller budget."""
+        full_calls, incremental_calls = [], []
+
+        full = self._runner(full_calls).run(self.STRATEGY, self._config(incremental=False))
+        incremental = self._runner(incremental_calls).run(
+            self.STRATEGY, self._config(incremental=True, reduced_budget=True)
+        )
+
+        assert full.success and incremental.success
+        assert full.total_evaluations == 5 * 20
+        assert incremental.periods[0].evaluations_attempted == 20
+        assert all(p.evaluations_attempted < 20 for p in incremental.periods[1:])
+        assert len(incremental_calls) < len(full_calls) * 0.6
+
+    def test_previous_best_is_evaluated_first(self):
+        """Each period starts from the previous period's top parameter sets."""
+        calls = []
+        result = self._runner(calls).run(self.STRATEGY, self._config(incremental=True))
+
+        period_2 = [c for c in calls if c[1:3] == ("2012-01-01", "2015-12-31")]
+        assert period_2[0][0] == result.periods[0].optimized_params["period"]
+
+    def test_budget_scales_with_new_data_share(self):
+        """Exploration budget is the new-data share of max_evaluations."""
+        config = WalkForwardConfig(max_evaluations=50, test_years=1)
+
+        assert WalkForwardRunner._incremental_budget(config, "2012-01-01", "2015-12-31", 5) == 5 + 13
+        assert WalkForwardRunner._incremental_budget(config, "2012-01-01", "2021-12-31", 5) == 5 + 5
+        assert WalkForwardRunner._incremental_budget(config, "2012-01-01", "2012-12-31", 5) == 50
+
+
 # =============================================================================
 # TEST WALK-FORWARD RESULT
 # =============================================================================